@@ -0,0 +1,113 @@
+# -*- coding: utf-8 -*-
+"""
+:Module:         benchmarks.bench_faults
+:Synopsis:       Measures the time-to-completion and request amplification of the bulk getters under injected faults
+:Usage:          ``python benchmarks/bench_faults.py [--profile throttled] [--backoff-factor 0.5]``
+:Example:        ``python benchmarks/bench_faults.py --profile bursts --profile resets --json faults.json``
+:Created By:     Jeff Shurtliff
+:Last Modified:  Jeff Shurtliff
+:Modified Date:  17 Oct 2026
+"""
+
+import io
+import os
+import sys
+import json
+import time
+import argparse
+import contextlib
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+sys.path.insert(0, os.path.abspath(os.path.dirname(__file__)))
+
+from mock_server import MockJiveServer, FAULT_PROFILES                      # noqa: E402
+from khorosjx import core, groups, users                                    # noqa: E402
+
+
+def get_scenarios(server):
+    """This function returns the bulk getter scenarios as (name, function) tuples."""
+    emails = [person['emails'][0]['value'] for person in server.people]
+    people_ids = [person['id'] for person in server.people]
+
+    def _resolve_user_ids():
+        # Only count the User IDs that match the synthetic data so that incorrect results are not reported as records
+        users.clear_user_id_cache()
+        user_ids = users.resolve_user_ids(emails)
+        return [email for email, user_id in zip(emails, people_ids) if user_ids.get(email) == user_id]
+
+    return [
+        ('groups.get_all_groups', lambda: groups.get_all_groups()),
+        ('groups.get_all_groups(max_workers=4)', lambda: groups.get_all_groups(max_workers=4)),
+        ('core.get_all_paginated_results(people)',
+         lambda: core.get_all_paginated_results(f"{server.base_url}/people", 'people')),
+        ('core.get_data_many(people)', lambda: core.get_data_many('people', people_ids, use_cache=False)),
+        ('users.resolve_user_ids', _resolve_user_ids),
+    ]
+
+
+def run_scenario(server, function, expected_records=None):
+    """This function runs a scenario once and returns its measurements, capturing the retry messages."""
+    server.reset_stats()
+    output, error = io.StringIO(), None
+    start_time = time.perf_counter()
+    with contextlib.redirect_stdout(output):
+        try:
+            records = len(function())
+        except Exception as exc:
+            records, error = 0, f"{type(exc).__name__}: {exc}"
+    duration = time.perf_counter() - start_time
+    return {
+        'seconds': duration,
+        'requests': server.total_requests,
+        'retries': output.getvalue().count('Retrying in'),
+        'faults': dict(server.fault_counts),
+        'records': records,
+        'complete': error is None and (expected_records is None or records == expected_records),
+        'error': error
+    }
+
+
+def main():
+    """This function parses the command-line arguments and runs each scenario under each failure profile."""
+    parser = argparse.ArgumentParser(description='Benchmark the khorosjx retry paths under injected faults')
+    parser.add_argument('--profile', action='append', choices=sorted(FAULT_PROFILES), default=None,
+                        help='The failure profile(s) to run (Default: all profiles)')
+    parser.add_argument('--people', type=int, default=1000, help='The number of synthetic users')
+    parser.add_argument('--groups', type=int, default=500, help='The number of synthetic security groups')
+    parser.add_argument('--latency', type=float, default=0.0, help='The delay in seconds applied to every response')
+    parser.add_argument('--backoff-factor', type=float, default=None, help='The retry policy backoff factor')
+    parser.add_argument('--seed', type=int, default=0, help='The seed used to select the injected faults')
+    parser.add_argument('--json', default=None, help='The file to which the results should be written as JSON')
+    args = parser.parse_args()
+
+    if args.backoff_factor is not None:
+        core.set_retry_policy(backoff_factor=args.backoff_factor)
+    profiles = ['baseline'] + [name for name in (args.profile or sorted(FAULT_PROFILES)) if name != 'baseline']
+
+    results, baseline = {}, {}
+    header = f"{'profile':<11}{'scenario':<42}{'seconds':>9}{'reqs':>7}{'amplif.':>9}{'retries':>9}  result"
+    print(header)
+    print('-' * len(header))
+    with MockJiveServer(people=args.people, groups=args.groups, latency=args.latency, seed=args.seed) as server:
+        core.connect(server.url, ('benchmark', 'benchmark'))
+        for profile in profiles:
+            server.faults = FAULT_PROFILES[profile]
+            for name, function in get_scenarios(server):
+                result = run_scenario(server, function, baseline.get(name, {}).get('records'))
+                if profile == 'baseline':
+                    baseline[name] = result
+                result['amplification'] = result['requests'] / max(baseline[name]['requests'], 1)
+                results.setdefault(profile, {})[name] = result
+                status = 'ok' if result['complete'] else (result['error'] or 'incomplete')
+                print(f"{profile:<11}{name:<42}{result['seconds']:>9.2f}{result['requests']:>7}"
+                      f"{result['amplification']:>9.2f}{result['retries']:>9}  {status}")
+        core.close_session()
+
+    if args.json:
+        with open(args.json, 'w') as file:
+            json.dump({'settings': vars(args), 'results': results}, file, indent=2)
+    return results
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,49 @@
+# -*- coding: utf-8 -*-
+"""
+:Module:         benchmarks.bench_field_paths
+:Synopsis:       Measures the per-record cost of parsing API responses with core.get_fields_from_api_response
+:Usage:          ``python benchmarks/bench_field_paths.py [--records 100000]``
+:Example:        ``python benchmarks/bench_field_paths.py --records 100000 --dataset people``
+:Created By:     Jeff Shurtliff
+:Last Modified:  Jeff Shurtliff
+:Modified Date:  17 Oct 2026
+"""
+
+import os
+import sys
+import time
+import argparse
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+sys.path.insert(0, os.path.abspath(os.path.dirname(__file__)))
+
+from mock_server import generate_person, generate_idea              # noqa: E402
+from khorosjx import core                                           # noqa: E402
+from khorosjx.utils.classes import Content                          # noqa: E402
+
+
+def run_benchmark(records, dataset='people', repeat=3):
+    """This function parses the generated records and returns the best per-record cost in microseconds."""
+    generator = generate_idea if dataset == 'idea' else generate_person
+    json_records = [generator(index) for index in range(records)]
+    fields = Content.datasets.get(dataset)
+    timings = []
+    for _ in range(repeat):
+        start_time = time.perf_counter()
+        for json_record in json_records:
+            core.get_fields_from_api_response(json_record, dataset, quiet=True)
+        timings.append(time.perf_counter() - start_time)
+    best_time = min(timings)
+    print(f"{dataset}: {records:,} records x {len(fields)} fields in {best_time:.3f}s "
+          f"({best_time / records * 1e6:.2f} us per record)")
+    return best_time / records * 1e6
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[1])
+    parser.add_argument('--records', type=int, default=100000, help='The number of records to parse')
+    parser.add_argument('--dataset', choices=('people', 'idea'), default=None, help='The dataset to benchmark')
+    parser.add_argument('--repeat', type=int, default=3, help='The number of times to repeat the measurement')
+    args = parser.parse_args()
+    for dataset_name in ([args.dataset] if args.dataset else ['people', 'idea']):
+        run_benchmark(args.records, dataset_name, args.repeat)
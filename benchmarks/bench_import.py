@@ -0,0 +1,66 @@
+# -*- coding: utf-8 -*-
+"""
+:Module:         benchmarks.bench_import
+:Synopsis:       Measures the time taken to import the khorosjx package and verifies that no network I/O is performed
+:Usage:          ``python benchmarks/bench_import.py [--runs 10]``
+:Example:        ``python benchmarks/bench_import.py --runs 20 --module khorosjx.core``
+:Created By:     Jeff Shurtliff
+:Last Modified:  Jeff Shurtliff
+:Modified Date:  17 Oct 2026
+"""
+
+import os
+import sys
+import json
+import argparse
+import subprocess
+from statistics import median
+
+# Define the code run in each fresh interpreter, which records any attempted network connections during the import
+IMPORT_SCRIPT = """
+import json, socket, sys, time
+attempts = []
+def _record(*args, **kwargs):
+    attempts.append(repr(args[1:] or args)[:80])
+    raise OSError('Network access is blocked by the import benchmark')
+socket.socket.connect = socket.socket.connect_ex = _record
+socket.getaddrinfo = socket.create_connection = _record
+start_time = time.perf_counter()
+import {module}
+duration = time.perf_counter() - start_time
+time.sleep({wait})
+print(json.dumps({{'seconds': duration, 'network_attempts': attempts, 'modules': len(sys.modules)}}))
+"""
+
+
+def run_import(module, wait=0.0, environment=None):
+    """This function imports a module in a fresh interpreter and returns its measurements."""
+    script = IMPORT_SCRIPT.format(module=module, wait=wait)
+    package_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+    env = dict(os.environ, PYTHONPATH=package_path, **(environment or {}))
+    output = subprocess.run([sys.executable, '-c', script], capture_output=True, text=True, env=env, check=True)
+    return json.loads(output.stdout.strip().splitlines()[-1])
+
+
+def main():
+    """This function parses the command-line arguments and runs the import benchmark."""
+    parser = argparse.ArgumentParser(description='Benchmark the time taken to import khorosjx')
+    parser.add_argument('--runs', type=int, default=10, help='The number of fresh interpreters to measure')
+    parser.add_argument('--module', default='khorosjx', help='The module to import')
+    parser.add_argument('--version-check', action='store_true',
+                        help='Opt in to the background version check (KHOROSJX_VERSION_CHECK=1) during the import')
+    args = parser.parse_args()
+
+    environment = {'KHOROSJX_VERSION_CHECK': '1'} if args.version_check else {'KHOROSJX_VERSION_CHECK': ''}
+    wait = 0.5 if args.version_check else 0.0
+    results = [run_import(args.module, wait, environment) for _ in range(args.runs)]
+    timings = [result['seconds'] * 1000 for result in results]
+    network_attempts = sum(len(result['network_attempts']) for result in results)
+    print(f"import {args.module}: median {median(timings):.1f} ms, min {min(timings):.1f} ms, "
+          f"max {max(timings):.1f} ms over {args.runs} runs ({results[0]['modules']} modules loaded)")
+    print(f"Network connection attempts: {network_attempts}")
+    return 1 if network_attempts and not args.version_check else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
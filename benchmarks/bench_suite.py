@@ -0,0 +1,164 @@
+# -*- coding: utf-8 -*-
+"""
+:Module:         benchmarks.bench_suite
+:Synopsis:       Measures the pagination, batching, coalescing, parsing and dataframe paths against a local API stand-in
+:Usage:          ``python benchmarks/bench_suite.py [--latency 0.01] [--repeat 3] [--json results.json]``
+:Example:        ``python benchmarks/bench_suite.py --latency 0.02 --scenario groups --json before.json``
+:Created By:     Jeff Shurtliff
+:Last Modified:  Jeff Shurtliff
+:Modified Date:  17 Oct 2026
+"""
+
+import os
+import sys
+import json
+import time
+import resource
+import argparse
+import tracemalloc
+from statistics import median
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+sys.path.insert(0, os.path.abspath(os.path.dirname(__file__)))
+
+from mock_server import MockJiveServer, generate_person, generate_idea      # noqa: E402
+from khorosjx import core, groups, news, users                              # noqa: E402
+from khorosjx.content import ideas                                          # noqa: E402
+from khorosjx.places import spaces                                          # noqa: E402
+
+
+def get_peak_rss():
+    """This function returns the peak resident set size of the process in megabytes."""
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak_rss / (1024 * 1024) if sys.platform == 'darwin' else peak_rss / 1024
+
+
+def count_records(result):
+    """This function returns the number of records in a list, dataframe or dictionary result."""
+    return len(result) if hasattr(result, '__len__') else 0
+
+
+def get_scenarios(server):
+    """This function returns the benchmark scenarios as (group, name, function) tuples."""
+    emails = [person['emails'][0]['value'] for person in server.people]
+    people_ids = [person['id'] for person in server.people]
+    parse_people = [generate_person(index) for index in range(10000)]
+    parse_ideas = [generate_idea(index) for index in range(10000)]
+
+    def _resolve_user_ids():
+        # Only count the User IDs that match the synthetic data so that incorrect results are not reported as records
+        users.clear_user_id_cache()
+        user_ids = users.resolve_user_ids(emails)
+        return [email for email, user_id in zip(emails, people_ids) if user_ids.get(email) == user_id]
+
+    def _get_hot_people(coalesce=True):
+        core.set_request_coalescing(coalesce)
+        with ThreadPoolExecutor(16) as executor:
+            records = list(executor.map(lambda index: core.get_data('people', people_ids[index % 10], use_cache=False),
+                                        range(400)))
+        core.set_request_coalescing(True)
+        return records
+
+    return [
+        ('pagination', 'groups.get_all_groups', lambda: groups.get_all_groups()),
+        ('pagination', 'groups.get_all_groups(max_workers=4)', lambda: groups.get_all_groups(max_workers=4)),
+        ('pagination', 'groups.get_group_memberships', lambda: groups.get_group_memberships(1)),
+        ('pagination', 'news.get_subscribers', lambda: news.get_subscribers(1, 1)),
+        ('pagination', 'spaces.get_space_content_permissions', lambda: spaces.get_space_content_permissions(1)),
+        ('pagination', 'core.get_all_paginated_results(people)',
+         lambda: core.get_all_paginated_results(f"{server.base_url}/people", 'people')),
+        ('pagination', 'core.get_all_paginated_results(people, max_workers=4)',
+         lambda: core.get_all_paginated_results(f"{server.base_url}/people", 'people', max_workers=4)),
+        ('batching', 'users.resolve_user_ids', _resolve_user_ids),
+        ('batching', 'core.get_data_many(people)',
+         lambda: core.get_data_many('people', people_ids, use_cache=False)),
+        ('coalescing', 'core.get_data(hot people, 16 threads)', _get_hot_people),
+        ('coalescing', 'core.get_data(hot people, 16 threads, no coalescing)', lambda: _get_hot_people(False)),
+        ('parsing', 'core.get_fields_from_api_response(people)',
+         lambda: [core.get_fields_from_api_response(record, 'people', quiet=True) for record in parse_people]),
+        ('parsing', 'core.get_fields_from_api_response(idea)',
+         lambda: [core.get_fields_from_api_response(record, 'idea', quiet=True) for record in parse_ideas]),
+        ('dataframe', 'groups.get_all_groups(dataframe)', lambda: groups.get_all_groups(return_type='dataframe')),
+        ('dataframe', 'ideas.get_ideas_for_space(dataframe)',
+         lambda: ideas.get_ideas_for_space(1, return_type='dataframe')),
+        ('dataframe', 'news.get_subscribers(dataframe)',
+         lambda: news.get_subscribers(1, 1, return_type='dataframe', only_id=False)),
+    ]
+
+
+def run_scenario(server, function, repeat=3):
+    """This function runs a scenario and returns its measurements.
+
+    The timed runs are performed without memory tracing so that the tracing overhead does not affect the latency,
+    and a final run is performed with :py:mod:`tracemalloc` enabled to measure the peak heap usage.
+    """
+    timings, request_counts, bytes_sent, records = [], [], [], 0
+    for _ in range(repeat):
+        server.reset_stats()
+        start_time = time.perf_counter()
+        records = count_records(function())
+        timings.append(time.perf_counter() - start_time)
+        request_counts.append(server.total_requests)
+        bytes_sent.append(server.bytes_sent)
+    tracemalloc.start()
+    function()
+    _, peak_memory = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    duration, requests = median(timings), median(request_counts)
+    return {
+        'latency_ms': duration * 1000,
+        'min_latency_ms': min(timings) * 1000,
+        'requests': requests,
+        'requests_per_sec': requests / duration if duration else 0,
+        'records': records,
+        'records_per_sec': records / duration if duration else 0,
+        'response_mb': median(bytes_sent) / (1024 * 1024),
+        'peak_heap_mb': peak_memory / (1024 * 1024),
+        'peak_rss_mb': get_peak_rss()
+    }
+
+
+def print_results(results):
+    """This function prints the benchmark results as a table."""
+    header = f"{'scenario':<58}{'ms':>10}{'reqs':>7}{'req/s':>9}{'records':>9}{'rec/s':>11}{'heap MB':>9}"
+    print(header)
+    print('-' * len(header))
+    for name, result in results.items():
+        print(f"{name:<58}{result['latency_ms']:>10.1f}{result['requests']:>7.0f}{result['requests_per_sec']:>9.0f}"
+              f"{result['records']:>9}{result['records_per_sec']:>11.0f}{result['peak_heap_mb']:>9.1f}")
+    print(f"\nPeak RSS: {get_peak_rss():.1f} MB")
+
+
+def main():
+    """This function parses the command-line arguments and runs the benchmark suite."""
+    parser = argparse.ArgumentParser(description='Benchmark khorosjx against a local Jive Core API v3 stand-in')
+    parser.add_argument('--latency', type=float, default=0.0, help='The delay in seconds applied to every response')
+    parser.add_argument('--jitter', type=float, default=0.0, help='The maximum random delay added to the latency')
+    parser.add_argument('--people', type=int, default=2000, help='The number of synthetic users')
+    parser.add_argument('--groups', type=int, default=500, help='The number of synthetic security groups')
+    parser.add_argument('--contents', type=int, default=1500, help='The number of synthetic content items')
+    parser.add_argument('--repeat', type=int, default=3, help='The number of times to run each scenario')
+    parser.add_argument('--scenario', default=None, help='Only run the scenarios containing this value')
+    parser.add_argument('--json', default=None, help='The file to which the results should be written as JSON')
+    args = parser.parse_args()
+
+    with MockJiveServer(people=args.people, groups=args.groups, contents=args.contents, entitlements=args.groups,
+                        latency=args.latency, jitter=args.jitter) as server:
+        core.connect(server.url, ('benchmark', 'benchmark'))
+        results = {}
+        for group, name, function in get_scenarios(server):
+            if args.scenario and args.scenario not in f"{group} {name}":
+                continue
+            results[name] = dict(run_scenario(server, function, args.repeat), group=group)
+        core.close_session()
+
+    print_results(results)
+    if args.json:
+        with open(args.json, 'w') as file:
+            json.dump({'settings': vars(args), 'results': results}, file, indent=2)
+    return results
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,487 @@
+# -*- coding: utf-8 -*-
+"""
+:Module:         benchmarks.mock_server
+:Synopsis:       Local stand-in for the Jive Core API v3 with synthetic data, latency and fault injection
+:Usage:          ``from mock_server import MockJiveServer``
+:Example:        ``with MockJiveServer(people=5000, latency=0.02) as server: khorosjx.core.connect(server.url, creds)``
+:Created By:     Jeff Shurtliff
+:Last Modified:  Jeff Shurtliff
+:Modified Date:  17 Oct 2026
+"""
+
+import re
+import json
+import time
+import random
+import socket
+import struct
+import threading
+from collections import Counter
+from urllib.parse import urlsplit, parse_qs, unquote
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# Define the path prefix of the v3 API
+API_PREFIX = '/api/core/v3'
+
+# Define the timestamps used in the synthetic data
+PUBLISHED_DATE = '2021-01-01T00:00:00.000+0000'
+UPDATED_DATE = '2021-06-01T00:00:00.000+0000'
+
+
+def generate_person(index):
+    """This function generates a record resembling a person returned by the ``people`` endpoint."""
+    return {
+        'id': str(index), 'followerCount': index % 17, 'published': PUBLISHED_DATE, 'updated': UPDATED_DATE,
+        'displayName': f"User {index}", 'mentionName': f"user{index}",
+        'name': {'formatted': f"User {index}", 'givenName': 'User', 'familyName': str(index)},
+        'emails': [{'value': f"user{index}@example.com", 'type': 'work', 'primary': True}],
+        'followingCount': index % 23, 'directReportCount': 0, 'initialLogin': '2021-01-02T00:00:00.000+0000',
+        'jive': {'lastAuthenticated': UPDATED_DATE, 'username': f"user{index}", 'status': 'registered',
+                 'enabled': True, 'externalIdentities': [{'identityType': 'SAML', 'identity': f"user{index}"}]},
+        'resources': {'html': {'ref': f"https://community.example.com/people/user{index}"}},
+        'type': 'person', 'typeCode': 3
+    }
+
+
+def generate_idea(index):
+    """This function generates a record resembling an idea returned by the ``contents`` endpoint."""
+    return {
+        'id': str(index), 'subject': f"Idea {index}", 'followerCount': 1, 'replyCount': 2, 'favoriteCount': 0,
+        'viewCount': 40, 'voteCount': 7, 'commentCount': 2, 'published': PUBLISHED_DATE, 'updated': UPDATED_DATE,
+        'tags': ['benchmark'], 'contentID': str(index + 1000),
+        'author': {'id': str(index % 500), 'name': {'formatted': 'Author'},
+                   'emails': [{'value': 'author@example.com'}]},
+        'content': {'text': '<body><p>Idea</p></body>', 'type': 'text/html'}, 'parent': '/places/1',
+        'status': 'published', 'visibleToExternalContributors': False, 'type': 'idea', 'typeCode': 3227383,
+        'lastActivityDate': 1622505600000, 'score': 7, 'stage': 'Active', 'authorshipPolicy': 'open'
+    }
+
+
+def generate_document(index):
+    """This function generates a record resembling a document returned by the ``contents`` endpoint."""
+    return {
+        'id': str(index), 'entityType': 102, 'followerCount': 1, 'likeCount': 3, 'published': PUBLISHED_DATE,
+        'tags': ['benchmark'], 'updated': UPDATED_DATE, 'contentID': str(index + 1000), 'subject': f"Document {index}",
+        'author': {'id': str(index % 500), 'name': {'formatted': 'Author'},
+                   'emails': [{'value': 'author@example.com'}]},
+        'content': {'text': '<body><p>Document</p></body>', 'type': 'text/html'}, 'parent': '/places/1',
+        'status': 'published', 'viewCount': 12, 'visibleToExternalContributors': False, 'type': 'document',
+        'typeCode': 102
+    }
+
+
+def generate_video(index):
+    """This function generates a record resembling a native video returned by the ``contents`` endpoint."""
+    return {
+        'id': str(index), 'followerCount': 0, 'followed': False, 'likeCount': 1, 'published': PUBLISHED_DATE,
+        'tags': [], 'updated': UPDATED_DATE, 'contentID': str(index + 1000), 'subject': f"Video {index}",
+        'author': {'id': str(index % 500)}, 'content': {'text': '<body></body>'}, 'parent': '/places/1',
+        'contentVideos': [], 'status': 'published', 'viewCount': 8, 'duration': 95, 'externalID': f"ext{index}",
+        'height': 360, 'width': 640, 'type': 'video', 'typeCode': 1100
+    }
+
+
+def generate_group(index):
+    """This function generates a record resembling a group returned by the ``securityGroups`` endpoint."""
+    return {
+        'id': str(index), 'published': PUBLISHED_DATE, 'updated': UPDATED_DATE, 'administratorCount': 1,
+        'memberCount': 25, 'name': f"Group {index}", 'description': f"Security group {index}", 'federated': False,
+        'type': 'securityGroup', 'typeCode': 500
+    }
+
+
+def generate_place(index):
+    """This function generates a record resembling a space returned by the ``places`` endpoint."""
+    return {
+        'id': str(index), 'followerCount': 3, 'followed': False, 'published': PUBLISHED_DATE, 'tags': [],
+        'updated': UPDATED_DATE, 'placeID': str(index), 'contentTypes': ['document', 'idea', 'video'],
+        'description': f"Space {index}", 'displayName': f"space-{index}", 'name': f"Space {index}",
+        'parent': '/places/1', 'status': 'Active', 'viewCount': 100, 'childCount': 0, 'locale': 'en',
+        'inheritsAppliedEntitlements': False, 'type': 'space', 'typeCode': 14,
+        'resources': {'html': {'ref': f"https://community.example.com/community/space-{index}"}}
+    }
+
+
+def generate_publication(index):
+    """This function generates a record resembling a publication returned by the ``publications`` endpoint."""
+    return {
+        'id': str(index), 'published': PUBLISHED_DATE, 'updated': UPDATED_DATE, 'subscriptions': [],
+        'name': f"Publication {index}", 'author': {'id': '1'}, 'displayOrder': index, 'subscriberCount': 0,
+        'associationCount': 1, 'receiveEmails': False, 'subscribersType': 'people', 'beingProcessed': False,
+        'type': 'publication', 'typeCode': 900
+    }
+
+
+def generate_entitlement(index):
+    """This function generates a record resembling a permission returned by the ``appliedEntitlements`` endpoint."""
+    return {
+        'id': str(index), 'type': 'appliedEntitlement', 'entitlements': ['VIEW', 'CREATE'],
+        'subject': {'id': str(index), 'type': 'securityGroup'}, 'object': {'id': '1', 'type': 'space'},
+        'subjectType': 'securityGroup', 'objectType': 'space'
+    }
+
+
+class FaultProfile(object):
+    """This class defines the rates at which the API stand-in injects failures into its responses.
+
+    Each rate is the probability (between ``0`` and ``1``) that a request receives the corresponding fault, where a
+    ``502`` or ``503`` error starts a burst in which the following requests also fail until ``error_burst`` errors
+    have been returned.
+    """
+    def __init__(self, reset_rate=0.0, slow_rate=0.0, slow_delay=2.0, throttle_rate=0.0, retry_after=1,
+                 error_rate=0.0, error_burst=3, error_statuses=(502, 503), truncate_rate=0.0):
+        self.reset_rate = reset_rate
+        self.slow_rate, self.slow_delay = slow_rate, slow_delay
+        self.throttle_rate, self.retry_after = throttle_rate, retry_after
+        self.error_rate, self.error_burst, self.error_statuses = error_rate, error_burst, tuple(error_statuses)
+        self.truncate_rate = truncate_rate
+
+    def __repr__(self):
+        rates = ', '.join(f"{name}={value}" for name, value in vars(self).items() if value)
+        return f"FaultProfile({rates})"
+
+    def choose_fault(self, random_generator):
+        """This method randomly selects the fault (if any) to inject into a response."""
+        value = random_generator.random()
+        for fault, rate in (('reset', self.reset_rate), ('slow', self.slow_rate), ('throttle', self.throttle_rate),
+                            ('error', self.error_rate), ('truncate', self.truncate_rate)):
+            if value < rate:
+                return fault
+            value -= rate
+        return None
+
+
+# Define the failure profiles used by the fault injection benchmarks
+FAULT_PROFILES = {
+    'baseline': FaultProfile(),
+    'resets': FaultProfile(reset_rate=0.05),
+    'slow': FaultProfile(slow_rate=0.05, slow_delay=1.0),
+    'throttled': FaultProfile(throttle_rate=0.05, retry_after=1),
+    'bursts': FaultProfile(error_rate=0.02, error_burst=3),
+    'truncated': FaultProfile(truncate_rate=0.05),
+    'mixed': FaultProfile(reset_rate=0.01, slow_rate=0.01, slow_delay=1.0, throttle_rate=0.01, error_rate=0.01,
+                          truncate_rate=0.01)
+}
+
+
+class _QuietHTTPServer(ThreadingHTTPServer):
+    """This class is a threaded HTTP server which does not report the connection errors caused by injected faults."""
+    daemon_threads = True
+
+    def handle_error(self, request, client_address):
+        pass
+
+
+class MockJiveServer(object):
+    """This class runs a threaded HTTP server which implements the subset of the Jive Core API v3 used by khorosjx.
+
+    The paginated endpoints honor the ``count``, ``startIndex``, ``fields`` and ``filter`` query string parameters
+    and return a ``links.next`` URL while more records remain. Every response is delayed by the ``latency`` value
+    plus a random amount up to the ``jitter`` value, and the number of requests per endpoint is recorded. Failures
+    are injected into the responses according to the :py:class:`FaultProfile` supplied in the ``faults`` argument.
+    """
+    def __init__(self, people=1000, groups=200, places=50, contents=1000, publications=20, entitlements=200,
+                 members_per_group=250, latency=0.0, jitter=0.0, faults=None, seed=0, host='127.0.0.1', port=0):
+        self.latency, self.jitter = latency, jitter
+        self.faults = faults
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._burst_remaining = 0
+        self.request_counts = Counter()
+        self.fault_counts = Counter()
+        self.bytes_sent = 0
+
+        # Generate the synthetic data
+        content_generators = (generate_document, generate_idea, generate_video)
+        self.people = [generate_person(index) for index in range(1, people + 1)]
+        self.groups = [generate_group(index) for index in range(1, groups + 1)]
+        self.places = [generate_place(index) for index in range(1, places + 1)]
+        self.contents = [content_generators[index % 3](index) for index in range(1, contents + 1)]
+        self.publications = [generate_publication(index) for index in range(1, publications + 1)]
+        self.entitlements = [generate_entitlement(index) for index in range(1, entitlements + 1)]
+        self.members_per_group = members_per_group
+        self._people_index = {}
+        for person in self.people:
+            self._people_index[person['id']] = person
+            self._people_index[f"email/{person['emails'][0]['value']}"] = person
+            self._people_index[f"username/{person['jive']['username']}"] = person
+
+        self._server = _QuietHTTPServer((host, port), self._create_handler())
+        self._thread = None
+
+    @property
+    def url(self):
+        """The URL of the server without the API path, which can be supplied to :py:func:`khorosjx.core.connect`."""
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def base_url(self):
+        """The base URL of the v3 API on the server."""
+        return f"{self.url}{API_PREFIX}"
+
+    def start(self):
+        """This method starts serving requests in a background thread."""
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """This method stops the server."""
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+    @property
+    def total_requests(self):
+        """The total number of requests received since the server started or the statistics were reset."""
+        return sum(self.request_counts.values())
+
+    def reset_stats(self):
+        """This method resets the request statistics."""
+        with self._lock:
+            self.request_counts.clear()
+            self.fault_counts.clear()
+            self.bytes_sent = 0
+            self._burst_remaining = 0
+
+    def _record_request(self, endpoint, body_size):
+        """This method records a request for an endpoint template."""
+        with self._lock:
+            self.request_counts[endpoint] += 1
+            self.bytes_sent += body_size
+
+    def _delay(self):
+        """This method sleeps for the configured latency."""
+        delay = self.latency + (self._random.uniform(0, self.jitter) if self.jitter else 0)
+        if delay > 0:
+            time.sleep(delay)
+
+    def _paginate(self, path, query, records):
+        """This method returns a page of records along with the ``links.next`` URL when more records remain."""
+        count = int(query.get('count', ['25'])[0])
+        start_index = int(query.get('startIndex', ['0'])[0])
+        fields = query.get('fields', ['@all'])[0]
+        page = records[start_index:start_index + count]
+        if fields != '@all':
+            keys = ['id', 'type', 'typeCode'] + fields.split(',')
+            page = [{key: record[key] for key in keys if key in record} for record in page]
+        body = {'itemsPerPage': count, 'list': page, 'startIndex': start_index}
+        if start_index + count < len(records):
+            other_values = '&'.join(f"{key}={value}" for key, values in query.items()
+                                    for value in values if key not in ('count', 'startIndex'))
+            body['links'] = {'next': f"{self.base_url}{path}?{other_values}&count={count}"
+                                     f"&startIndex={start_index + count}"}
+        return body
+
+    def _filter_records(self, records, query):
+        """This method applies the ``filter`` query string parameters supported by the stand-in."""
+        for query_filter in query.get('filter', []):
+            match = re.match(r'^(\w+)\((.*)\)$', query_filter)
+            if not match:
+                continue
+            element, criteria = match.groups()
+            if element == 'type':
+                types = criteria.split(',')
+                records = [record for record in records if record.get('type') in types]
+            elif element == 'author':
+                author_id = criteria.rstrip('/').split('/')[-1]
+                records = [record for record in records if record.get('author', {}).get('id') == author_id]
+        return records
+
+    def _get_members(self, group_id):
+        """This method returns the members of a security group."""
+        offset = (int(group_id) * 7) % max(len(self.people), 1)
+        members = self.people[offset:offset + self.members_per_group]
+        return members + self.people[:self.members_per_group - len(members)]
+
+    def _route_get(self, path, query):
+        """This method returns the endpoint template, status code and body for a GET request."""
+        routes = (
+            (r'/people', 'people', lambda: self._paginate(path, query, self.people)),
+            (r'/people/(\d+)/@following', 'people/{id}/@following',
+             lambda _id: self._paginate(path, query, self.people[:int(_id) % 150])),
+            (r'/people/(\d+)/securityGroups', 'people/{id}/securityGroups',
+             lambda _id: self._paginate(path, query, self.groups[:3])),
+            (r'/people/((?:email/|username/)?[^/]+)', 'people/{lookup}',
+             lambda _lookup: self._people_index.get(unquote(_lookup))),
+            (r'/securityGroups', 'securityGroups', lambda: self._paginate(path, query, self.groups)),
+            (r'/securityGroups/(\d+)', 'securityGroups/{id}',
+             lambda _id: self.groups[int(_id) - 1] if 0 < int(_id) <= len(self.groups) else None),
+            (r'/securityGroups/(\d+)/(members|administrators)', 'securityGroups/{id}/{membership}',
+             lambda _id, _type: self._paginate(path, query, self._get_members(_id) if _type == 'members'
+                                               else self.people[:1])),
+            (r'/places', 'places', lambda: self._paginate(path, query, self.places)),
+            (r'/places/(\d+)', 'places/{id}',
+             lambda _id: self.places[int(_id) - 1] if 0 < int(_id) <= len(self.places) else None),
+            (r'/places/(\d+)/contents', 'places/{id}/contents',
+             lambda _id: self._paginate(path, query, self._filter_records(self.contents, query))),
+            (r'/places/(\d+)/appliedEntitlements', 'places/{id}/appliedEntitlements',
+             lambda _id: self._paginate(path, query, self.entitlements)),
+            (r'/places/(\d+)/permissions', 'places/{id}/permissions',
+             lambda _id: {'contentTypes': ['document', 'idea', 'video']}),
+            (r'/contents', 'contents', lambda: self._paginate(path, query, self._filter_records(self.contents, query))),
+            (r'/contents/(\d+)', 'contents/{id}',
+             lambda _id: self.contents[int(_id) - 1] if 0 < int(_id) <= len(self.contents) else None),
+            (r'/publications', 'publications', lambda: self._paginate(path, query, self.publications)),
+            (r'/publications/(\d+)', 'publications/{id}',
+             lambda _id: self.publications[int(_id) - 1] if 0 < int(_id) <= len(self.publications) else None),
+            (r'/publications/(\d+)/subscriptions/(\d+)/subscribers',
+             'publications/{id}/subscriptions/{id}/subscribers',
+             lambda _pub_id, _sub_id: self._paginate(path, query, self.people)),
+            (r'/version', 'version', lambda: {'jiveVersion': '2019.2.0', 'instanceURL': self.url}),
+        )
+        for pattern, endpoint, handler in routes:
+            match = re.fullmatch(pattern, path)
+            if match:
+                body = handler(*match.groups())
+                if body is None:
+                    return endpoint, 404, {'error': {'status': 404, 'message': 'Not found'}}
+                return endpoint, 200, body
+        return path, 404, {'error': {'status': 404, 'message': 'Not found'}}
+
+    def _execute_batch(self, payload):
+        """This method performs each request in an ``executeBatch`` payload."""
+        results = []
+        for item in payload:
+            request = item.get('request', {})
+            endpoint = urlsplit(request.get('endpoint', ''))
+            path = endpoint.path[len(API_PREFIX):] if endpoint.path.startswith(API_PREFIX) else endpoint.path
+            _, status, body = self._route_get(path, parse_qs(endpoint.query))
+            result = {'key': item.get('key'), 'status': status}
+            result['data' if status == 200 else 'error'] = body
+            results.append(result)
+        return results
+
+    def _route_write(self, method, path, payload):
+        """This method returns the endpoint template, status code and body for a POST, PUT or DELETE request."""
+        if method == 'POST' and path == '/executeBatch':
+            return 'executeBatch', 200, self._execute_batch(payload)
+        if method == 'POST' and re.fullmatch(r'/securityGroups/(\d+)/members', path):
+            return 'securityGroups/{id}/members', 204, None
+        person = re.fullmatch(r'/people/(\d+)', path) and self._people_index.get(path.split('/')[-1])
+        if method == 'PUT' and person:
+            person.update(payload or {})
+            return 'people/{id}', 200, person
+        if method == 'DELETE' and person:
+            return 'people/{id}', 204, None
+        return path, 404, {'error': {'status': 404, 'message': 'Not found'}}
+
+    def _choose_fault(self):
+        """This method identifies the fault (if any) to inject into the next response."""
+        if self.faults is None:
+            return None
+        with self._lock:
+            if self._burst_remaining > 0:
+                self._burst_remaining -= 1
+                fault = 'error'
+            else:
+                fault = self.faults.choose_fault(self._random)
+                if fault == 'error':
+                    self._burst_remaining = self.faults.error_burst - 1
+            if fault:
+                self.fault_counts[fault] += 1
+        return fault
+
+    def _inject_fault(self, handler, fault, data):
+        """This method sends a faulty response and returns ``True`` if the normal response should not be sent."""
+        if fault == 'reset':
+            # Close the connection with a TCP reset rather than sending a response
+            handler.connection.setsockopt(socket.SOL_SOCKET, socket.SO_LINGER, struct.pack('ii', 1, 0))
+            handler.connection.close()
+            handler.close_connection = True
+        elif fault == 'slow':
+            time.sleep(self.faults.slow_delay)
+            return False
+        elif fault == 'throttle':
+            body = json.dumps({'error': {'status': 429, 'message': 'Too many requests'}}).encode('utf-8')
+            self.send_response(handler, 429, body, {'Retry-After': str(self.faults.retry_after)})
+        elif fault == 'error':
+            status = self._random.choice(self.faults.error_statuses)
+            self.send_response(handler, status, json.dumps({'error': {'status': status}}).encode('utf-8'))
+        elif fault == 'truncate':
+            # Send the full Content-Length value but only half of the body before closing the connection
+            handler.send_response(200)
+            handler.send_header('Content-Type', 'application/json')
+            handler.send_header('Content-Length', str(len(data)))
+            handler.end_headers()
+            handler.wfile.write(data[:len(data) // 2])
+            handler.close_connection = True
+        return True
+
+    def handle(self, handler, method):
+        """This method handles a single request from the request handler."""
+        url = urlsplit(handler.path)
+        path = url.path[len(API_PREFIX):] if url.path.startswith(API_PREFIX) else url.path
+        if method == 'GET':
+            endpoint, status, body = self._route_get(path, parse_qs(url.query))
+        else:
+            length = int(handler.headers.get('Content-Length') or 0)
+            payload = json.loads(handler.rfile.read(length) or b'null')
+            endpoint, status, body = self._route_write(method, path, payload)
+        data = json.dumps(body).encode('utf-8') if body is not None else b''
+        self._record_request(f"{method} {endpoint}", len(data))
+        self._delay()
+        fault = self._choose_fault()
+        if fault and self._inject_fault(handler, fault, data):
+            return
+        self.send_response(handler, status, data)
+
+    @staticmethod
+    def send_response(handler, status, data, headers=None):
+        """This method writes a response to the client."""
+        handler.send_response(status)
+        handler.send_header('Content-Type', 'application/json')
+        handler.send_header('Content-Length', str(len(data)))
+        for name, value in (headers or {}).items():
+            handler.send_header(name, value)
+        handler.end_headers()
+        handler.wfile.write(data)
+
+    def _create_handler(self):
+        """This method creates the request handler class bound to the server instance."""
+        server = self
+
+        class _Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+            disable_nagle_algorithm = True
+
+            def log_message(self, *args):
+                pass
+
+            def do_GET(self):
+                server.handle(self, 'GET')
+
+            def do_POST(self):
+                server.handle(self, 'POST')
+
+            def do_PUT(self):
+                server.handle(self, 'PUT')
+
+            def do_DELETE(self):
+                server.handle(self, 'DELETE')
+
+        return _Handler
+
+
+if __name__ == '__main__':
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Run a local stand-in for the Jive Core API v3')
+    parser.add_argument('--port', type=int, default=8080, help='The port on which to listen')
+    parser.add_argument('--latency', type=float, default=0.0, help='The delay in seconds applied to every response')
+    parser.add_argument('--people', type=int, default=1000, help='The number of synthetic users')
+    parser.add_argument('--faults', choices=sorted(FAULT_PROFILES), default=None, help='The failure profile to use')
+    args = parser.parse_args()
+    mock_server = MockJiveServer(people=args.people, latency=args.latency, port=args.port,
+                                 faults=FAULT_PROFILES.get(args.faults))
+    print(f"Serving the Jive Core API v3 stand-in at {mock_server.base_url} (Ctrl+C to stop)")
+    try:
+        mock_server.start()._thread.join()
+    except KeyboardInterrupt:
+        mock_server.stop()
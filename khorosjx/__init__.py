@@ -6,23 +6,96 @@
 :Example:           ``khorosjx.init_helper('/home/user/jxhelper.yml')``
 :Created By:        Jeff Shurtliff
 :Last Modified:     Jeff Shurtliff
-:Modified Date:     24 Mar 2020
+:Modified Date:     17 Oct 2026
 """
 
+import os
+import importlib
+
 from . import core, errors
+from .core import Client
 from .utils import version
 
 # Define all modules that will be imported with the "import *" method
-__all__ = ['core', 'admin', 'content', 'groups', 'news', 'places', 'spaces', 'users']
+__all__ = ['core', 'admin', 'content', 'groups', 'news', 'places', 'spaces', 'users', 'Client']
 
 # Define the package version by pulling from the khorosjx.utils.version module
 __version__ = version.get_full_version()
 
 
+# Define the submodules which are only imported the first time they are accessed (e.g. ``khorosjx.groups``)
+lazy_modules = {'admin', 'aio', 'content', 'export', 'groups', 'news', 'places', 'spaces', 'users', 'utils'}
+
+# Define the module names accepted by the init_module() function and the modules to which they refer
+init_module_paths = {
+    'admin': 'admin',
+    'blogs': 'places.blogs',
+    'content': 'content',
+    'content.base': 'content.base',
+    'docs': 'content.docs',
+    'events': 'content.events',
+    'groups': 'groups',
+    'ideas': 'content.ideas',
+    'news': 'news',
+    'places': 'places',
+    'places.spaces': 'places.spaces',
+    'spaces': 'spaces',
+    'threads': 'content.threads',
+    'users': 'users',
+    'videos': 'content.videos',
+}
+
+
+def __getattr__(name):
+    """This function imports the lazily-loaded submodules the first time they are accessed.
+
+    .. versionadded:: 3.3.0
+
+    :param name: The name of the attribute being accessed
+    :type name: str
+    :returns: The imported submodule
+    :raises: :py:exc:`AttributeError`
+    """
+    if name in lazy_modules:
+        return importlib.import_module(f".{name}", __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    """This function includes the lazily-loaded submodules when listing the attributes of the package.
+
+    .. versionadded:: 3.3.0
+    """
+    return sorted(set(globals()) | lazy_modules)
+
+
+def _get_init_module_path(_module_name):
+    """This function returns the path (relative to the package) of a module that can be imported with the
+       :py:func:`khorosjx.init_module` function.
+
+    .. versionadded:: 3.3.0
+
+    :param _module_name: The name of the module (e.g. ``groups`` or ``spaces``)
+    :type _module_name: str
+    :returns: The relative path of the module (e.g. ``places.spaces``) or ``None`` for the ``core`` module
+    :raises: :py:exc:`khorosjx.errors.exceptions.InvalidKhorosJXModuleError`
+    """
+    if _module_name == "core":
+        print("The module `khorosjx.core` is already imported and will not be imported again.")
+        return None
+    if _module_name not in init_module_paths:
+        raise errors.exceptions.InvalidKhorosJXModuleError
+    return init_module_paths[_module_name]
+
+
 # Define function to initialize additional modules via the primary package
 def init_module(*args):
     """This function imports select modules from the library.
 
+    .. versionchanged:: 3.3.0
+       The primary modules are now also imported automatically the first time they are accessed as attributes of the
+       package (e.g. ``khorosjx.groups``) so calling this function is optional.
+
     :param args: One or more module names to import
     :type args: str, tuple
     :returns: None
@@ -50,40 +123,9 @@ def init_module(*args):
 
     # Import any of the supplied modules
     for mod_entry in arguments:
-        if mod_entry == "core":
-            print("The module `khorosjx.core` is already imported and will not be imported again.")
-        elif mod_entry == "admin":
-            from . import admin
-        elif mod_entry == "blogs":
-            from .places import blogs
-        elif mod_entry == "content":
-            from . import content
-        elif mod_entry == "content.base":
-            from .content import base as content_base
-        elif mod_entry == "docs":
-            from .content import docs
-        elif mod_entry == "events":
-            from .content import events
-        elif mod_entry == "groups":
-            from . import groups
-        elif mod_entry == "ideas":
-            from .content import ideas
-        elif mod_entry == "news":
-            from . import news
-        elif mod_entry == "places":
-            from . import places
-        elif mod_entry == "places.spaces":
-            from .places import spaces
-        elif mod_entry == "spaces":
-            from . import spaces
-        elif mod_entry == "threads":
-            from .content import threads
-        elif mod_entry == "users":
-            from . import users
-        elif mod_entry == "videos":
-            from .content import videos
-        else:
-            raise errors.exceptions.InvalidKhorosJXModuleError
+        module_path = _get_init_module_path(mod_entry)
+        if module_path is not None:
+            importlib.import_module(f".{module_path}", __name__)
     return
 
 
@@ -91,6 +133,10 @@ def init_module(*args):
 def init_helper(file_path, file_type='yaml'):
     """This function initializes a helper configuration file to define package settings including the API connection.
 
+    .. versionchanged:: 3.3.0
+       Any HTTP session, retry, rate limit and cache settings defined in the configuration file are now applied to
+       the API connection.
+
     :param file_path: Path to the helper configuration file
     :type file_path: str
     :param file_type: The type of file utilized as the configuration file (Default: ``yaml``)
@@ -118,7 +164,15 @@ def init_helper(file_path, file_type='yaml'):
     helper_settings = helper.retrieve_helper_settings()
 
     # Establish the API connection
-    core.connect(helper_settings['base_url'], helper_settings['api_credentials'])
+    core.connect(helper_settings['base_url'], helper_settings['api_credentials'],
+                 **helper_settings['session_settings'])
+    core.set_retry_policy(**helper_settings['retry_settings'])
+    core.set_rate_limit(**helper_settings['rate_limit_settings'])
+    cache_settings = dict(helper_settings['cache_settings'])
+    core.set_persistent_cache(cache_settings.pop('persistent_file', None),
+                              cache_settings.pop('persistent_max_entries', None))
+    if cache_settings.pop('enabled', False):
+        core.set_response_cache(**cache_settings)
 
     # Define global variable for the console colors setting
     global use_console_colors
@@ -130,5 +184,6 @@ def init_helper(file_path, file_type='yaml'):
     return
 
 
-# Display a warning if the running version is not the latest stable version found on PyPI
-version.warn_when_not_latest()
+# Display a warning in the background if opted in and the running version is not the latest stable version on PyPI
+if os.environ.get('KHOROSJX_VERSION_CHECK', '').lower() in ('1', 'true', 'yes'):
+    version.warn_when_not_latest(background=True)
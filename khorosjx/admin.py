@@ -6,19 +6,36 @@
 :Example:        Coming Soon
 :Created By:     Jeff Shurtliff
 :Last Modified:  Jeff Shurtliff
-:Modified Date:  22 Sep 2021
+:Modified Date:  17 Oct 2026
 """
 
 from . import core
 
-# Define global variables
-base_url, api_credentials = '', None
+
+def __getattr__(name):
+    """This function forwards the deprecated ``base_url`` and ``api_credentials`` global variables to the active client.
+
+    .. versionadded:: 3.3.0
+
+    .. deprecated:: 3.3.0
+       Use :py:data:`khorosjx.core.base_url` and :py:data:`khorosjx.core.api_credentials` instead.
+
+    :param name: The name of the attribute being accessed
+    :type name: str
+    :returns: The value of the connection setting of the active :py:class:`khorosjx.core.Client` object
+    :raises: :py:exc:`AttributeError`
+    """
+    return core._get_deprecated_connection_attribute(__name__, name)
 
 
 # Define function to verify the connection in the core module
 def verify_core_connection():
     """This function verifies that the core connection information (Base URL and API credentials) has been defined.
 
+    .. versionchanged:: 3.3.0
+       The connection information of the active :py:class:`khorosjx.core.Client` object is now verified rather than
+       the global variables of this module so that each thread or asyncio task can use a different client.
+
     .. versionchanged:: 3.1.0
        Refactored the function to be more pythonic and to avoid depending on a try/except block.
 
@@ -26,13 +43,17 @@ def verify_core_connection():
     :raises: :py:exc:`khorosjx.errors.exceptions.KhorosJXError`,
              :py:exc:`khorosjx.errors.exceptions.NoCredentialsError`
     """
-    if not base_url or not api_credentials:
-        retrieve_connection_info()
+    core.verify_connection()
     return
 
 
 def retrieve_connection_info():
-    """This function initializes and defines the global variables for the connection information.
+    """This function verifies the connection information of the active client.
+
+    .. deprecated:: 3.3.0
+       The global variables of this module are no longer defined by this function, as the connection information is
+       stored in the active :py:class:`khorosjx.core.Client` object. Use :py:func:`khorosjx.core.get_connection_info`
+       instead.
 
     .. versionchanged:: 3.1.0
        Refactored the function to be more efficient.
@@ -41,8 +62,5 @@ def retrieve_connection_info():
     :raises: :py:exc:`khorosjx.errors.exceptions.KhorosJXError`,
              :py:exc:`khorosjx.errors.exceptions.NoCredentialsError`
     """
-    # Define the global variables at this module level
-    global base_url
-    global api_credentials
-    base_url, api_credentials = core.get_connection_info()
+    core._retrieve_deprecated_connection_info(__name__)
     return
@@ -0,0 +1,19 @@
+# -*- coding: utf-8 -*-
+"""
+:Module:            khorosjx.aio
+:Synopsis:          Asynchronous (asyncio) equivalents of the core functions which require the aiohttp package
+:Usage:             ``from khorosjx import aio``
+:Example:           ``user_info = await aio.get_data('people', 'john.doe@example.com', 'email', return_json=True)``
+:Created By:        Jeff Shurtliff
+:Last Modified:     Jeff Shurtliff
+:Modified Date:     17 Oct 2026
+"""
+
+from . import core
+from .core import set_session_options, get_session, close_session, get_request_with_retries, get_data, \
+    post_request_with_retries, put_request_with_retries, delete, get_paginated_results, iter_pages, \
+    iter_linked_pages, iter_paginated_results, get_all_paginated_results
+
+__all__ = ['core', 'set_session_options', 'get_session', 'close_session', 'get_request_with_retries', 'get_data',
+           'post_request_with_retries', 'put_request_with_retries', 'delete', 'get_paginated_results', 'iter_pages',
+           'iter_linked_pages', 'iter_paginated_results', 'get_all_paginated_results']
@@ -0,0 +1,770 @@
+# -*- coding: utf-8 -*-
+"""
+:Module:            khorosjx.aio.core
+:Synopsis:          Collection of asynchronous core functions to work with the Jive Core API v3
+:Usage:             ``from khorosjx.aio import core as aio_core``
+:Example:           ``user_info = await khorosjx.aio.get_data('people', 'john.doe@example.com', 'email')``
+:Created By:        Jeff Shurtliff
+:Last Modified:     Jeff Shurtliff
+:Modified Date:     17 Oct 2026
+"""
+
+import json
+import time
+import asyncio
+from collections import deque
+
+from .. import core, errors
+from ..utils.rate_limit import SharedTokenBucket
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+# Define the positions of the asynchronous HTTP session and semaphore within the sessions of the active client
+client_attributes = {
+    'session': 0,
+    'semaphore': 1
+}
+
+
+def __getattr__(name):
+    """This function returns the asynchronous HTTP session or semaphore (e.g. ``khorosjx.aio.core.session``) of the
+       active :py:class:`khorosjx.core.Client` object for the running event loop, or the asynchronous session
+       settings (i.e. ``khorosjx.aio.core.session_settings``) of the active client.
+
+    .. versionadded:: 3.3.0
+
+    :param name: The name of the attribute being accessed
+    :type name: str
+    :returns: The value of the attribute or ``None`` if no session has been created for the running event loop
+    :raises: :py:exc:`AttributeError`
+    """
+    if name == 'session_settings':
+        return core.get_client().aio_session_settings
+    if name in client_attributes:
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return None
+        session_info = core.get_client().aio_sessions.get(loop)
+        return session_info[client_attributes[name]] if session_info else None
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+class AsyncResponse(object):
+    """This class stores a fully read API response so it can be used after the connection has been released.
+
+    .. versionadded:: 3.3.0
+
+    The ``status_code``, ``text``, ``headers`` and ``url`` attributes and the ``json()`` method mirror those of a
+    :py:class:`requests.Response` object so the response can be passed to the functions in the
+    :py:mod:`khorosjx.errors.handlers` module.
+    """
+    def __init__(self, status_code, content, headers, url, encoding='utf-8'):
+        """This method instantiates the response object.
+
+        :param status_code: The HTTP status code of the response
+        :type status_code: int
+        :param content: The raw body of the response
+        :type content: bytes
+        :param headers: The response headers
+        :param url: The URL that was requested
+        :type url: str
+        :param encoding: The character encoding of the response body (Default: ``utf-8``)
+        :type encoding: str
+        """
+        self.status_code = status_code
+        self.content = content
+        self.headers = headers
+        self.url = url
+        self.encoding = encoding or 'utf-8'
+
+    @property
+    def text(self):
+        """This property returns the decoded body of the response."""
+        return self.content.decode(self.encoding, errors='replace')
+
+    @property
+    def ok(self):
+        """This property indicates whether or not the status code of the response is less than 400."""
+        return self.status_code < 400
+
+    def json(self):
+        """This method returns the body of the response parsed as JSON."""
+        return json.loads(self.text)
+
+
+def _verify_aiohttp():
+    """This function verifies that the optional ``aiohttp`` package is installed.
+
+    .. versionadded:: 3.3.0
+
+    :returns: None
+    :raises: :py:exc:`khorosjx.errors.exceptions.MissingDependencyError`
+    """
+    if aiohttp is None:
+        raise errors.exceptions.MissingDependencyError(
+            "The aiohttp package is required for the khorosjx.aio module. (e.g. pip install khorosjx[aio])")
+    return
+
+
+def set_session_options(limit=None, limit_per_host=None, max_concurrency=None):
+    """This function defines the connection pool and concurrency settings used by the asynchronous HTTP sessions of
+       the active client.
+
+    .. versionadded:: 3.3.0
+
+    .. note:: The settings are stored in the active :py:class:`khorosjx.core.Client` object. The existing session
+              in each event loop is replaced, and the previous session is closed, the next time a session is
+              requested in that event loop. Values that are not supplied retain their current setting.
+
+    :param limit: The maximum number of simultaneous connections in the pool (Default: ``100``)
+    :type limit: int, None
+    :param limit_per_host: The maximum number of simultaneous connections to the same host (Default: ``0``, unlimited)
+    :type limit_per_host: int, None
+    :param max_concurrency: The maximum number of API requests that can be in flight at once (Default: ``100``)
+    :type max_concurrency: int, None
+    :returns: None
+    """
+    new_settings = {
+        'limit': limit,
+        'limit_per_host': limit_per_host,
+        'max_concurrency': max_concurrency
+    }
+    core.get_client().aio_session_settings.update({key: val for key, val in new_settings.items() if val is not None})
+    return
+
+
+def _get_session_key(_client):
+    """This function returns the settings and credentials that an asynchronous HTTP session of a client is based on.
+
+    .. versionadded:: 3.3.0
+
+    A session whose key no longer matches (e.g. after :py:func:`khorosjx.core.set_credentials` has been called) is
+    closed and replaced the next time it is requested.
+
+    :param _client: The client that owns the session
+    :type _client: :py:class:`khorosjx.core.Client`
+    :returns: A tuple containing the credentials, connection pool settings, headers and keep-alive setting
+    """
+    return (_client.api_credentials, tuple(_client.aio_session_settings.items()),
+            tuple(sorted(_client.session_settings['headers'].items())), _client.session_settings['keep_alive'])
+
+
+async def _close_stale_sessions(_client, _loop):
+    """This function closes the sessions of a client that belong to event loops which have been closed, as well as
+       the session of the running event loop if its settings or credentials have changed.
+
+    .. versionadded:: 3.3.0
+
+    Sessions that belong to other event loops which are still open (e.g. in other threads) are left in place.
+
+    :param _client: The client that owns the sessions
+    :type _client: :py:class:`khorosjx.core.Client`
+    :param _loop: The running event loop
+    :type _loop: :py:class:`asyncio.AbstractEventLoop`
+    :returns: None
+    """
+    for _session_loop, (_session, _semaphore, _session_key) in list(_client.aio_sessions.items()):
+        if _session_loop.is_closed() or (_session_loop is _loop and _session_key != _get_session_key(_client)):
+            del _client.aio_sessions[_session_loop]
+            try:
+                await _session.close()
+            except RuntimeError:
+                # The connections of a session whose event loop has closed cannot be closed gracefully
+                pass
+    return
+
+
+async def _get_session_and_semaphore():
+    """This function returns the asynchronous HTTP session and semaphore of the active client for the running event
+       loop, creating them if necessary.
+
+    .. versionadded:: 3.3.0
+
+    :returns: The :py:class:`aiohttp.ClientSession` and :py:class:`asyncio.Semaphore` objects
+    :raises: :py:exc:`khorosjx.errors.exceptions.MissingDependencyError`,
+             :py:exc:`khorosjx.errors.exceptions.NoCredentialsError`
+    """
+    _verify_aiohttp()
+    core.verify_connection()
+    client, loop = core.get_client(), asyncio.get_running_loop()
+    session_info = client.aio_sessions.get(loop)
+    if session_info is None or session_info[0].closed or session_info[2] != _get_session_key(client):
+        await _close_stale_sessions(client, loop)
+        session_settings = client.aio_session_settings
+        connector = aiohttp.TCPConnector(limit=session_settings['limit'],
+                                         limit_per_host=session_settings['limit_per_host'])
+        headers = {'Accept': 'application/json'}
+        headers.update(client.session_settings['headers'])
+        if not client.session_settings['keep_alive']:
+            headers['Connection'] = 'close'
+        session = aiohttp.ClientSession(connector=connector, headers=headers,
+                                        auth=aiohttp.BasicAuth(*client.api_credentials))
+        session_info = (session, asyncio.Semaphore(session_settings['max_concurrency']), _get_session_key(client))
+        client.aio_sessions[loop] = session_info
+    return session_info[0], session_info[1]
+
+
+async def get_session():
+    """This function returns the asynchronous HTTP session for the running event loop, creating it if necessary.
+
+    .. versionadded:: 3.3.0
+
+    Each :py:class:`khorosjx.core.Client` object has its own session for each event loop which uses the credentials
+    of that client. The session is replaced when the credentials or session settings change, and the sessions of
+    event loops that have since been closed are closed when a new session is created.
+
+    :returns: The :py:class:`aiohttp.ClientSession` object
+    :raises: :py:exc:`khorosjx.errors.exceptions.MissingDependencyError`,
+             :py:exc:`khorosjx.errors.exceptions.NoCredentialsError`
+    """
+    session, _ = await _get_session_and_semaphore()
+    return session
+
+
+async def close_session():
+    """This function closes the asynchronous HTTP session of the active client for the running event loop and
+       releases the pooled connections.
+
+    .. versionadded:: 3.3.0
+
+    .. note:: The session should be closed before the event loop ends (e.g. at the end of the coroutine passed to
+              :py:func:`asyncio.run`) so that its connections can be closed gracefully.
+
+    :returns: None
+    """
+    client, loop = core.get_client(), asyncio.get_running_loop()
+    session_info = client.aio_sessions.pop(loop, None)
+    if session_info is not None and not session_info[0].closed:
+        await session_info[0].close()
+    await _close_stale_sessions(client, loop)
+    return
+
+
+async def _perform_request(_method, _url, _verify_ssl=True, **_kwargs):
+    """This function performs a single API request and reads the full response while holding the semaphore.
+
+    .. versionadded:: 3.3.0
+
+    The connect and read timeouts of the active client are applied to the request, which must also complete within
+    the time remaining before the deadline defined with :py:func:`khorosjx.core.request_deadline` (if any).
+
+    :param _method: The HTTP method for the request (e.g. ``GET``)
+    :type _method: str
+    :param _url: The URL to be requested
+    :type _url: str
+    :param _verify_ssl: Determines if API calls should verify SSL certificates (``True`` by default)
+    :type _verify_ssl: bool
+    :returns: The :py:class:`khorosjx.aio.core.AsyncResponse` object
+    """
+    _session, _semaphore = await _get_session_and_semaphore()
+    _ssl = None if _verify_ssl else False
+    async with _semaphore:
+        _remaining_time = core.get_remaining_time()
+        if _remaining_time is not None and _remaining_time <= 0:
+            raise asyncio.TimeoutError()
+        _connect_timeout, _read_timeout = core._get_request_timeout(_remaining_time)
+        _timeout = aiohttp.ClientTimeout(total=_remaining_time, sock_connect=_connect_timeout, sock_read=_read_timeout)
+        async with _session.request(_method, _url, ssl=_ssl, timeout=_timeout, **_kwargs) as _response:
+            _content = await _response.read()
+            return AsyncResponse(_response.status, _content, _response.headers, str(_response.url),
+                                 _response.get_encoding() if _content else 'utf-8')
+
+
+async def _reserve_rate_limit_token(_rate_limiter, _max_wait=None):
+    """This function reserves a token from a client-side rate limiter without blocking the event loop.
+
+    .. versionadded:: 3.3.0
+
+    A :py:class:`khorosjx.utils.rate_limit.SharedTokenBucket` reservation waits on a SQLite transaction and is
+    therefore performed in the default executor of the event loop.
+
+    :param _rate_limiter: The rate limiter of the active client
+    :type _rate_limiter: :py:class:`khorosjx.utils.rate_limit.TokenBucket`
+    :param _max_wait: The number of seconds the caller is able to wait for a token (Default: ``None``, no limit)
+    :type _max_wait: int, float, None
+    :returns: The number of seconds to wait before performing the request or ``None`` if no token was reserved
+    :raises: :py:exc:`sqlite3.Error`
+    """
+    if isinstance(_rate_limiter, SharedTokenBucket):
+        return await asyncio.get_running_loop().run_in_executor(None, _rate_limiter.reserve, _max_wait)
+    return _rate_limiter.reserve(_max_wait)
+
+
+async def _wait_for_rate_limit(_rate_limiter, _method, _url, _event=None, _attempt=0):
+    """This function waits for a token from the client-side rate limiter before an API request is attempted without
+       blocking the event loop.
+
+    .. versionadded:: 3.3.0
+
+    See :py:func:`khorosjx.core._wait_for_rate_limit` for the synchronous equivalent.
+
+    :param _rate_limiter: The rate limiter of the active client
+    :type _rate_limiter: :py:class:`khorosjx.utils.rate_limit.TokenBucket`
+    :param _method: The HTTP method for the request (e.g. ``GET``)
+    :type _method: str
+    :param _url: The URL being requested
+    :type _url: str
+    :param _event: The event dictionary for the request (Optional)
+    :type _event: dict, None
+    :param _attempt: The number of retries that were performed
+    :type _attempt: int
+    :returns: None
+    :raises: :py:exc:`khorosjx.errors.exceptions.DeadlineExceededError`
+    """
+    _wait_time = await _reserve_rate_limit_token(_rate_limiter, core.get_remaining_time())
+    if _wait_time is None:
+        core._raise_deadline_exceeded(_method, _url, _event, _attempt)
+    await asyncio.sleep(_wait_time)
+    return
+
+
+async def _request_with_retries(_method, _url, _verify_ssl=True, _retry_policy=None, **_kwargs):
+    """This function asynchronously performs an API request and retries it according to a retry policy, waiting
+       for the client-side rate limit (if defined) before each attempt.
+
+    .. versionadded:: 3.3.0
+
+    The request is recorded in the request metrics and passed to any request hooks once it has completed. When a
+    deadline has been defined with :py:func:`khorosjx.core.request_deadline`, no attempt or retry is started that
+    cannot complete before the deadline.
+
+    :param _method: The HTTP method for the request (e.g. ``GET``)
+    :type _method: str
+    :param _url: The absolute URL to be requested
+    :type _url: str
+    :param _verify_ssl: Determines if API calls should verify SSL certificates (``True`` by default)
+    :type _verify_ssl: bool
+    :param _retry_policy: The retry policy to use rather than the default :py:data:`khorosjx.core.retry_policy`
+    :type _retry_policy: :py:class:`khorosjx.utils.retry.RetryPolicy`, None
+    :returns: The API response (which may still have a retryable status code once the retries are exhausted)
+    :raises: :py:exc:`khorosjx.errors.exceptions.APIConnectionError`,
+             :py:exc:`khorosjx.errors.exceptions.DeadlineExceededError`,
+             :py:exc:`khorosjx.errors.exceptions.MissingDependencyError`
+    """
+    _verify_aiohttp()
+    _policy = _retry_policy or core.retry_policy
+    _start_time, _attempt = time.monotonic(), 0
+    _event = core._start_request_event(_method, _url)
+    while True:
+        _response = None
+        if core.rate_limiter is not None:
+            await _wait_for_rate_limit(core.rate_limiter, _method, _url, _event, _attempt)
+        core._get_attempt_time(_method, _url, _event, _attempt)
+        try:
+            _response = await _perform_request(_method, _url, _verify_ssl, **_kwargs)
+            if core._is_final_response(_policy, _method, _url, _response, _event, _attempt):
+                return _response
+            _error_msg = f"The {_method} request returned a {_response.status_code} status code."
+        except (aiohttp.ClientError, asyncio.TimeoutError) as _exc:
+            _exc_type = type(_exc).__name__
+            _error_msg = f"The {_method} request failed with the following exception: {_exc_type} - {_exc}"
+
+        # Determine if and when the request should be retried
+        _delay = core._get_retry_delay(_policy, _method, _url, _response, _error_msg, _start_time, _event, _attempt)
+        if _delay is None:
+            return _response
+        _attempt += 1
+        print(f"{_error_msg} Retrying in {_delay:.1f} seconds. (Retry {_attempt} of {_policy.max_retries})")
+        await asyncio.sleep(_delay)
+
+
+async def get_request_with_retries(query_url, return_json=False, verify_ssl=True, retry_policy=None):
+    """This function asynchronously performs a GET request and retries it in case of timeouts, connection issues
+       or retryable status codes.
+
+    .. versionadded:: 3.3.0
+
+    :param query_url: The URI to be queried
+    :type query_url: str
+    :param return_json: Determines whether or not the response should be returned in JSON format (Default: ``False``)
+    :type return_json: bool
+    :param verify_ssl: Determines if API calls should verify SSL certificates (``True`` by default)
+    :type verify_ssl: bool
+    :param retry_policy: The retry policy to use rather than the default :py:data:`khorosjx.core.retry_policy`
+    :type retry_policy: :py:class:`khorosjx.utils.retry.RetryPolicy`, None
+    :returns: The API response from the GET request (optionally in JSON format)
+    :raises: :py:exc:`khorosjx.errors.exceptions.APIConnectionError`,
+             :py:exc:`khorosjx.errors.exceptions.MissingDependencyError`
+    """
+    # Verify that the connection has been established
+    core.verify_connection()
+
+    # Perform the GET request
+    query_url = core.ensure_absolute_url(query_url)
+    response = await _request_with_retries('GET', query_url, verify_ssl, retry_policy)
+
+    # Convert to JSON if specified
+    response = response.json() if return_json else response
+    return response
+
+
+async def get_data(endpoint, lookup_value, identifier='id', return_json=False, ignore_exceptions=False,
+                   all_fields=False, verify_ssl=True):
+    """This function asynchronously returns data for a specific API endpoint.
+
+    .. versionadded:: 3.3.0
+
+    :param endpoint: The API endpoint against which to request data (e.g. ``people``, ``contents``, etc.)
+    :type endpoint: str
+    :param lookup_value: The value to use to look up the endpoint data
+    :type lookup_value: int, str
+    :param identifier: The type of lookup value used to look up the endpoint data (Default: ``id``)
+    :type identifier: str
+    :param return_json: Determines if the data should be returned in default or JSON format (Default: ``False``)
+    :type return_json: bool
+    :param ignore_exceptions: Determines whether nor not exceptions should be ignored (Default: ``False``)
+    :type ignore_exceptions: bool
+    :param all_fields: Determines whether or not the ``fields=@all`` query should be included (Default: ``False``)
+    :type all_fields: bool
+    :param verify_ssl: Determines if API calls should verify SSL certificates (``True`` by default)
+    :type verify_ssl: bool
+    :returns: The API response either as an :py:class:`khorosjx.aio.core.AsyncResponse` object or in JSON format
+    :raises: :py:exc:`khorosjx.errors.exceptions.GETRequestError`
+    """
+    # Verify that the connection has been established
+    core.verify_connection()
+
+    # Construct the query URL for the endpoint and lookup value
+    query_url = core._get_data_query_url(endpoint, lookup_value, identifier, ignore_exceptions, all_fields)
+
+    # Perform the GET request with retries to account for any timeouts
+    response = await get_request_with_retries(query_url, verify_ssl=verify_ssl)
+
+    # Error out if the response isn't successful
+    if response.status_code != 200:
+        error_msg = f"The query failed with a {response.status_code} status code and the following error: " + \
+                    f"{response.text}"
+        if not ignore_exceptions:
+            raise errors.exceptions.GETRequestError(error_msg)
+        print(error_msg)
+        if return_json:
+            return {}
+    response = response.json() if return_json else response
+    return response
+
+
+async def _api_request_with_payload(_url, _json_payload, _request_type, _verify_ssl=True, _retry_policy=None):
+    """This function asynchronously performs an API request while supplying a JSON payload.
+
+    .. versionadded:: 3.3.0
+
+    :param _url: The query URL to be leveraged in the API call
+    :type _url: str
+    :param _json_payload: The payload for the API call in JSON format
+    :type _json_payload: dict
+    :param _request_type: Defines if the API call will be a ``put`` or ``post`` request
+    :type _request_type: str
+    :param _verify_ssl: Determines if API calls should verify SSL certificates (``True`` by default)
+    :type _verify_ssl: bool
+    :param _retry_policy: The retry policy to use rather than the default :py:data:`khorosjx.core.retry_policy`
+    :type _retry_policy: :py:class:`khorosjx.utils.retry.RetryPolicy`, None
+    :returns: The API response
+    :raises: :py:exc:`khorosjx.errors.exceptions.InvalidRequestTypeError`,
+             :py:exc:`khorosjx.errors.exceptions.APIConnectionError`
+    """
+    # Verify that the request type is supported and prepare the query URL
+    if _request_type.lower() not in ('put', 'post'):
+        raise errors.exceptions.InvalidRequestTypeError()
+    _url = core.ensure_absolute_url(_url)
+
+    # Perform the API request
+    _headers = {"Content-Type": "application/json", "Accept": "application/json"}
+    return await _request_with_retries(_request_type.upper(), _url, _verify_ssl, _retry_policy, headers=_headers,
+                                       data=json.dumps(_json_payload, default=str))
+
+
+async def post_request_with_retries(url, json_payload, verify_ssl=True, retry_policy=None):
+    """This function asynchronously performs a POST request and retries it in case of timeouts, connection issues
+       or retryable status codes.
+
+    .. versionadded:: 3.3.0
+
+    Unless the ``retry_non_idempotent`` value of the retry policy is ``True``, the request is only retried when it
+    raises a connection exception or returns a ``429`` status code.
+
+    :param url: The URI to be queried
+    :type url: str
+    :param json_payload: The payload for the POST request in JSON format
+    :type json_payload: dict
+    :param verify_ssl: Determines if API calls should verify SSL certificates (``True`` by default)
+    :type verify_ssl: bool
+    :param retry_policy: The retry policy to use rather than the default :py:data:`khorosjx.core.retry_policy`
+    :type retry_policy: :py:class:`khorosjx.utils.retry.RetryPolicy`, None
+    :returns: The API response from the POST request
+    :raises: :py:exc:`khorosjx.errors.exceptions.APIConnectionError`
+    """
+    return await _api_request_with_payload(url, json_payload, 'post', verify_ssl, retry_policy)
+
+
+async def put_request_with_retries(url, json_payload, verify_ssl=True, retry_policy=None):
+    """This function asynchronously performs a PUT request and retries it in case of timeouts, connection issues
+       or retryable status codes.
+
+    .. versionadded:: 3.3.0
+
+    Unless the ``retry_non_idempotent`` value of the retry policy is ``True``, the request is only retried when it
+    raises a connection exception or returns a ``429`` status code.
+
+    :param url: The URI to be queried
+    :type url: str
+    :param json_payload: The payload for the PUT request in JSON format
+    :type json_payload: dict
+    :param verify_ssl: Determines if API calls should verify SSL certificates (``True`` by default)
+    :type verify_ssl: bool
+    :param retry_policy: The retry policy to use rather than the default :py:data:`khorosjx.core.retry_policy`
+    :type retry_policy: :py:class:`khorosjx.utils.retry.RetryPolicy`, None
+    :returns: The API response from the PUT request
+    :raises: :py:exc:`khorosjx.errors.exceptions.APIConnectionError`
+    """
+    return await _api_request_with_payload(url, json_payload, 'put', verify_ssl, retry_policy)
+
+
+async def delete(uri, return_json=False, verify_ssl=True, retry_policy=None):
+    """This function asynchronously performs a DELETE request against the Core API.
+
+    .. versionadded:: 3.3.0
+
+    :param uri: The URI against which the DELETE request will be issued
+    :type uri: str
+    :param return_json: Determines whether or not the response should be returned in JSON format (Default: ``False``)
+    :type return_json: bool
+    :param verify_ssl: Determines if API calls should verify SSL certificates (``True`` by default)
+    :type verify_ssl: bool
+    :param retry_policy: The retry policy to use rather than the default :py:data:`khorosjx.core.retry_policy`
+    :type retry_policy: :py:class:`khorosjx.utils.retry.RetryPolicy`, None
+    :returns: The API response from the DELETE request (optionally in JSON format)
+    :raises: :py:exc:`khorosjx.errors.exceptions.APIConnectionError`
+    """
+    uri = core.ensure_absolute_url(uri)
+    response = await _request_with_retries('DELETE', uri, verify_ssl, retry_policy)
+    if return_json:
+        response = response.json()
+    return response
+
+
+async def get_paginated_results(query, response_data_type, start_index=0, filter_info=(), query_all=True,
+                                return_fields=None, ignore_exceptions=False, quiet=False, verify_ssl=True):
+    """This function asynchronously performs a GET request for a single paginated response up to 100 records.
+
+    .. versionadded:: 3.3.0
+
+    :param query: The API query without the query string
+    :type query: str
+    :param response_data_type: The dataset of fields that will be in the API response (e.g. ``group_members``)
+    :type response_data_type: str
+    :param start_index: The startIndex value in the API query string (``0`` by default)
+    :type start_index: int, str
+    :param filter_info: A tuple of list of tuples containing the filter element and criteria (Optional)
+    :type filter_info: tuple, list
+    :param query_all: Determines if ``fields=@all`` filter should be included in the query string (Default: ``True``)
+    :type query_all: bool
+    :param return_fields: The fields that should be returned from the API response (Default: all fields in dataset)
+    :type return_fields: list, None
+    :param ignore_exceptions: Determines whether nor not exceptions should be ignored (Default: ``False``)
+    :type ignore_exceptions: bool
+    :param quiet: Silences any errors about being unable to locate API fields (``False`` by default)
+    :type quiet: bool
+    :param verify_ssl: Determines if API calls should verify SSL certificates (``True`` by default)
+    :type verify_ssl: bool
+    :returns: The queried data as a list comprised of dictionaries
+    :raises: :py:exc:`khorosjx.errors.exceptions.GETRequestError`
+    """
+    # Perform the API query to retrieve the information
+    full_query = core._get_paginated_query_url(query, start_index, filter_info, query_all, return_fields)
+    response = await get_request_with_retries(full_query, verify_ssl=verify_ssl)
+
+    # Verify that the query was successful and parse the data
+    aggregate_data = []
+    if errors.handlers.check_api_response(response, ignore_exceptions=ignore_exceptions):
+        for data in response.json()['list']:
+            aggregate_data.append(core.get_fields_from_api_response(data, response_data_type, return_fields, quiet))
+    return aggregate_data
+
+
+async def _iter_sequential_pages(_page_function, _start_index=0, _page_size=100):
+    """This asynchronous generator yields each page of a paginated query in order, requesting one page at a time.
+
+    .. versionadded:: 3.3.0
+
+    :param _page_function: A coroutine function that accepts a ``startIndex`` value and returns a list of records
+    :type _page_function: function
+    :param _start_index: The ``startIndex`` value of the first page (Default: ``0``)
+    :type _start_index: int
+    :param _page_size: The number of records returned in a full page (Default: ``100``)
+    :type _page_size: int
+    :returns: An asynchronous generator that yields a list of records for each page
+    """
+    while True:
+        _page = await _page_function(_start_index)
+        if _page:
+            yield _page
+        if len(_page) < _page_size:
+            return
+        _start_index += _page_size
+
+
+async def _iter_concurrent_pages(_page_function, _max_workers, _start_index=0, _page_size=100):
+    """This asynchronous generator yields each page of a paginated query in order while requesting up to
+       ``_max_workers`` pages concurrently.
+
+    .. versionadded:: 3.3.0
+
+    :param _page_function: A coroutine function that accepts a ``startIndex`` value and returns a list of records
+    :type _page_function: function
+    :param _max_workers: The maximum number of pages to request concurrently
+    :type _max_workers: int
+    :param _start_index: The ``startIndex`` value of the first page (Default: ``0``)
+    :type _start_index: int
+    :param _page_size: The number of records returned in a full page (Default: ``100``)
+    :type _page_size: int
+    :returns: An asynchronous generator that yields a list of records for each page
+    """
+    # Keep a sliding window of requested pages and only extend it while full pages are returned
+    _pending, _next_index = deque(), _start_index
+    try:
+        for _ in range(_max_workers):
+            _pending.append(asyncio.ensure_future(_page_function(_next_index)))
+            _next_index += _page_size
+        while _pending:
+            _page = await _pending.popleft()
+            if len(_page) == _page_size:
+                _pending.append(asyncio.ensure_future(_page_function(_next_index)))
+                _next_index += _page_size
+            if _page:
+                yield _page
+            if len(_page) < _page_size:
+                return
+    finally:
+        for _future in _pending:
+            _future.cancel()
+        # Wait for the cancelled requests to finish so that they do not outlive the generator
+        await asyncio.gather(*_pending, return_exceptions=True)
+
+
+async def iter_pages(page_function, max_workers=1, start_index=0, page_size=100):
+    """This asynchronous generator yields each page of a paginated query in order, optionally requesting up to
+       ``max_workers`` pages concurrently.
+
+    .. versionadded:: 3.3.0
+
+    See :py:func:`khorosjx.core.iter_pages` for the synchronous equivalent.
+
+    :param page_function: A coroutine function that accepts a ``startIndex`` value and returns a list of records
+    :type page_function: function
+    :param max_workers: The maximum number of pages to request concurrently (Default: ``1``)
+    :type max_workers: int
+    :param start_index: The ``startIndex`` value of the first page (Default: ``0``)
+    :type start_index: int
+    :param page_size: The number of records returned in a full page (Default: ``100``)
+    :type page_size: int
+    :returns: An asynchronous generator that yields a list of records for each page
+    """
+    if max_workers <= 1:
+        pages = _iter_sequential_pages(page_function, start_index, page_size)
+    else:
+        pages = _iter_concurrent_pages(page_function, max_workers, start_index, page_size)
+    try:
+        async for page in pages:
+            yield page
+    finally:
+        await pages.aclose()
+
+
+async def iter_linked_pages(query_url, parse_function=None, ignore_exceptions=False, verify_ssl=True, page_size=100):
+    """This asynchronous generator yields each page of a paginated query by following the ``links.next`` URLs in
+       each response.
+
+    .. versionadded:: 3.3.0
+
+    See :py:func:`khorosjx.core.iter_linked_pages` for the synchronous equivalent.
+
+    :param query_url: The full query URL for the first page (including the ``count`` and any filters)
+    :type query_url: str
+    :param parse_function: Function that is applied to each record in the ``list`` of the response (Optional)
+    :type parse_function: function, None
+    :param ignore_exceptions: Determines whether nor not exceptions should be ignored (Default: ``False``)
+    :type ignore_exceptions: bool
+    :param verify_ssl: Determines if API calls should verify SSL certificates (``True`` by default)
+    :type verify_ssl: bool
+    :param page_size: The number of records returned in a full page (``100`` by default)
+    :type page_size: int
+    :returns: An asynchronous generator that yields the list of records for each page
+    :raises: :py:exc:`khorosjx.errors.exceptions.GETRequestError`
+    """
+    while True:
+        response = await get_request_with_retries(query_url, verify_ssl=verify_ssl)
+        if not errors.handlers.check_api_response(response, ignore_exceptions=ignore_exceptions):
+            return
+        json_data = response.json()
+        page = json_data.get('list', [])
+        yield [parse_function(record) for record in page] if parse_function else page
+        if len(page) < page_size:
+            return
+        query_url = core.get_next_link(json_data) or core._get_start_index_url(query_url, len(page))
+
+
+async def iter_paginated_results(query, response_data_type, filter_info=(), query_all=True, return_fields=None,
+                                 ignore_exceptions=False, quiet=False, verify_ssl=True, max_workers=1):
+    """This asynchronous generator yields each record across every page of a paginated query.
+
+    .. versionadded:: 3.3.0
+
+    When the pages are retrieved sequentially the ``links.next`` URLs provided by the server are followed using
+    :py:func:`khorosjx.aio.core.iter_linked_pages`, and otherwise the pages are requested concurrently by
+    ``startIndex`` value using :py:func:`khorosjx.aio.core.iter_pages`.
+
+    :param query: The API query without the query string
+    :type query: str
+    :param response_data_type: The dataset of fields that will be in the API response (e.g. ``group_members``)
+    :type response_data_type: str
+    :param filter_info: A tuple of list of tuples containing the filter element and criteria (Optional)
+    :type filter_info: tuple, list
+    :param query_all: Determines if ``fields=@all`` filter should be included in the query string (Default: ``True``)
+    :type query_all: bool
+    :param return_fields: The fields that should be returned from the API response (Default: all fields in dataset)
+    :type return_fields: list, None
+    :param ignore_exceptions: Determines whether nor not exceptions should be ignored (Default: ``False``)
+    :type ignore_exceptions: bool
+    :param quiet: Silences any errors about being unable to locate API fields (``False`` by default)
+    :type quiet: bool
+    :param verify_ssl: Determines if API calls should verify SSL certificates (``True`` by default)
+    :type verify_ssl: bool
+    :param max_workers: The maximum number of pages to request concurrently (Default: ``1``)
+    :type max_workers: int
+    :returns: An asynchronous generator that yields a dictionary for each record
+    :raises: :py:exc:`khorosjx.errors.exceptions.GETRequestError`
+    """
+    if max_workers <= 1:
+        # Follow the next page links provided by the server when the pages are retrieved sequentially
+        def _parse_function(_data):
+            return core.get_fields_from_api_response(_data, response_data_type, return_fields, quiet)
+        query_url = core._get_paginated_query_url(query, 0, filter_info, query_all, return_fields)
+        pages = iter_linked_pages(query_url, _parse_function, ignore_exceptions, verify_ssl)
+    else:
+        async def _page_function(_start_index):
+            return await get_paginated_results(query, response_data_type, _start_index, filter_info, query_all,
+                                               return_fields, ignore_exceptions, quiet, verify_ssl)
+        pages = iter_pages(_page_function, max_workers)
+    async for page in pages:
+        for record in page:
+            yield record
+
+
+async def get_all_paginated_results(query, response_data_type, filter_info=(), query_all=True, return_fields=None,
+                                    ignore_exceptions=False, quiet=False, verify_ssl=True, max_workers=1):
+    """This function asynchronously retrieves every record across every page of a paginated query.
+
+    .. versionadded:: 3.3.0
+
+    See :py:func:`khorosjx.aio.core.iter_paginated_results` for the parameters.
+
+    :returns: The queried data as a list comprised of dictionaries
+    :raises: :py:exc:`khorosjx.errors.exceptions.GETRequestError`
+    """
+    records = iter_paginated_results(query, response_data_type, filter_info, query_all, return_fields,
+                                     ignore_exceptions, quiet, verify_ssl, max_workers)
+    return [record async for record in records]
@@ -6,16 +6,41 @@
 :Example:           ``content_id = content.base.get_content_id(url, 'document')``
 :Created By:        Jeff Shurtliff
 :Last Modified:     Jeff Shurtliff
-:Modified Date:     24 Mar 2020
+:Modified Date:     17 Oct 2026
 """
 
 import warnings
+import importlib
 
-from . import base, docs, events, ideas, threads, videos
+# Always import the content base module (the other modules are imported the first time they are accessed)
+from . import base
 
 __all__ = ['base', 'docs', 'events', 'ideas', 'threads', 'videos']
 
 
+def __getattr__(name):
+    """This function imports the lazily-loaded submodules the first time they are accessed.
+
+    .. versionadded:: 3.3.0
+
+    :param name: The name of the attribute being accessed
+    :type name: str
+    :returns: The imported submodule
+    :raises: :py:exc:`AttributeError`
+    """
+    if name in __all__:
+        return importlib.import_module(f".{name}", __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    """This function includes the lazily-loaded submodules when listing the attributes of the package.
+
+    .. versionadded:: 3.3.0
+    """
+    return sorted(set(globals()) | set(__all__))
+
+
 # This function is deprecated and is only present until v3.0.0 to retain backward compatibility
 def get_content_id(url, content_type="document"):
     """This function obtains the Content ID for a particular content asset. (Supports all but blog posts)
@@ -61,6 +86,7 @@ def overwrite_doc_body(url, body_html, minor_edit=True, ignore_exceptions=False)
         "khorosjx.content.docs.overwrite_doc_body instead.",
         DeprecationWarning
     )
+    from . import docs
     put_response = docs.overwrite_doc_body(url, body_html, minor_edit, ignore_exceptions)
     return put_response
 
@@ -118,6 +144,7 @@ def get_document_info(lookup_value, lookup_type='doc_id', return_fields=[], igno
         "khorosjx.content.docs.get_document_info instead.",
         DeprecationWarning
     )
+    from . import docs
     doc_info = docs.get_document_info(lookup_value, lookup_type, return_fields, ignore_exceptions)
     return doc_info
 
@@ -166,5 +193,6 @@ def get_document_attachments(lookup_value, lookup_type='doc_id', return_datafram
         "khorosjx.content.docs.get_document_attachments instead.",
         DeprecationWarning
     )
+    from . import docs
     attachment_info = docs.get_document_attachments(lookup_value, lookup_type, return_dataframe)
     return attachment_info
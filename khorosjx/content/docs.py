@@ -6,23 +6,38 @@
 :Example:           ``content_id = docs.get_content_id(url)``
 :Created By:        Jeff Shurtliff
 :Last Modified:     Jeff Shurtliff
-:Modified Date:     22 Sep 2021
+:Modified Date:     17 Oct 2026
 """
 
-import pandas as pd
-
 from .. import core, errors
 from . import base
-from ..utils import core_utils
+from ..utils import core_utils, df_utils
 from ..places import base as places_core
 
-# Define global variables
-base_url, api_credentials = '', None
+
+def __getattr__(name):
+    """This function forwards the deprecated ``base_url`` and ``api_credentials`` global variables to the active client.
+
+    .. versionadded:: 3.3.0
+
+    .. deprecated:: 3.3.0
+       Use :py:data:`khorosjx.core.base_url` and :py:data:`khorosjx.core.api_credentials` instead.
+
+    :param name: The name of the attribute being accessed
+    :type name: str
+    :returns: The value of the connection setting of the active :py:class:`khorosjx.core.Client` object
+    :raises: :py:exc:`AttributeError`
+    """
+    return core._get_deprecated_connection_attribute(__name__, name)
 
 
 def verify_core_connection():
     """This function verifies that the core connection information (Base URL and API credentials) has been defined.
 
+    .. versionchanged:: 3.3.0
+       The connection information of the active :py:class:`khorosjx.core.Client` object is now verified rather than
+       the global variables of this module so that each thread or asyncio task can use a different client.
+
     .. versionchanged:: 3.1.0
        Refactored the function to be more pythonic and to avoid depending on a try/except block.
 
@@ -30,13 +45,17 @@ def verify_core_connection():
     :raises: :py:exc:`khorosjx.errors.exceptions.KhorosJXError`,
              :py:exc:`khorosjx.errors.exceptions.NoCredentialsError`
     """
-    if not base_url or not api_credentials:
-        retrieve_connection_info()
+    core.verify_connection()
     return
 
 
 def retrieve_connection_info():
-    """This function initializes and defines the global variables for the connection information.
+    """This function verifies the connection information of the active client.
+
+    .. deprecated:: 3.3.0
+       The global variables of this module are no longer defined by this function, as the connection information is
+       stored in the active :py:class:`khorosjx.core.Client` object. Use :py:func:`khorosjx.core.get_connection_info`
+       instead.
 
     .. versionchanged:: 3.1.0
        Refactored the function to be more efficient.
@@ -45,10 +64,7 @@ def retrieve_connection_info():
     :raises: :py:exc:`khorosjx.errors.exceptions.KhorosJXError`,
              :py:exc:`khorosjx.errors.exceptions.NoCredentialsError`
     """
-    # Define the global variables at this module level
-    global base_url
-    global api_credentials
-    base_url, api_credentials = core.get_connection_info()
+    core._retrieve_deprecated_connection_info(__name__)
     return
 
 
@@ -87,7 +103,7 @@ def get_url_for_id(doc_id):
     :raises: :py:exc:`TypeError`, :py:exc:`ValueError`
     """
     verify_core_connection()
-    url = base_url.split('api/')[0]
+    url = core.base_url.split('api/')[0]
     url = f"{url}docs/DOC-{doc_id}"
     return url
 
@@ -136,7 +152,7 @@ def create_document(subject, body, place_id, categories=None, tags=None, verify_
     if len(tags) > 0:
         full_dict['tags'] = tags
     payload = core_utils.convert_dict_to_json(full_dict)
-    content_uri = f"{base_url}/contents"
+    content_uri = f"{core.base_url}/contents"
     response = core.post_request_with_retries(content_uri, payload, verify_ssl)
     return response
 
@@ -145,6 +161,10 @@ def create_document(subject, body, place_id, categories=None, tags=None, verify_
 def overwrite_doc_body(url, body_html, minor_edit=True, ignore_exceptions=False, verify_ssl=True):
     """This function overwrites the body of a document with new HTML content.
 
+    .. versionchanged:: 3.3.0
+       Removed the additional attempt following a ``502`` response as retryable status codes are now handled by
+       the retry policy in the :py:func:`khorosjx.core.put_request_with_retries` function.
+
     .. versionchanged:: 2.6.0
        Added the ``verify_ssl`` argument.
 
@@ -164,17 +184,8 @@ def overwrite_doc_body(url, body_html, minor_edit=True, ignore_exceptions=False,
     # Verify that the core connection has been established
     verify_core_connection()
 
-    # Perform the overwrite operation
+    # Perform the overwrite operation and return the response from the PUT query
     put_response = _perform_overwrite_operation(url, body_html, minor_edit, ignore_exceptions, verify_ssl)
-
-    # Check for any 502 errors and try the function one more time if found
-    if put_response.status_code == 502:
-        retry_msg = "Performing the overwrite operation again in an attempt to overcome the 502 " + \
-                    "Bad Gateway / Service Temporarily Unavailable issue that was encountered."
-        print(retry_msg)
-        put_response = _perform_overwrite_operation(url, body_html, minor_edit, ignore_exceptions, verify_ssl)
-
-    # Return the response from the PUT query
     return put_response
 
 
@@ -199,7 +210,7 @@ def _perform_overwrite_operation(_url, _body_html, _minor_edit, _ignore_exceptio
     """
     # Define the script name, Content ID and URI
     _content_id = get_content_id(_url, verify_ssl=_verify_ssl)
-    _content_url = f"{base_url}/contents/{_content_id}"
+    _content_url = f"{core.base_url}/contents/{_content_id}"
 
     # Perform a GET request for the document to obtain its JSON
     _response = core.get_data('contents', _content_id)
@@ -231,6 +242,9 @@ def _perform_overwrite_operation(_url, _body_html, _minor_edit, _ignore_exceptio
 def get_document_info(lookup_value, lookup_type='doc_id', return_fields=None, ignore_exceptions=False, verify_ssl=True):
     """This function obtains the group information for a given document.
 
+    .. versionchanged:: 3.3.0
+       Only the fields needed to populate the ``return_fields`` are requested from the API when they are defined.
+
     .. versionchanged:: 2.6.0
        Added the ``verify_ssl`` argument.
 
@@ -260,7 +274,7 @@ def get_document_info(lookup_value, lookup_type='doc_id', return_fields=None, ig
     doc_info = {}
 
     # Perform the API query to retrieve the group information
-    query_uri = f"{base_url}/contents/{lookup_value}?fields=@all"
+    query_uri = f"{core.base_url}/contents/{lookup_value}?{core.get_fields_filter(return_fields)}"
     response = core.get_request_with_retries(query_uri, verify_ssl=verify_ssl)
 
     # Verify that the query was successful
@@ -274,6 +288,37 @@ def get_document_info(lookup_value, lookup_type='doc_id', return_fields=None, ig
     return doc_info
 
 
+def get_documents_info(content_ids, return_fields=None, ignore_exceptions=False, verify_ssl=True):
+    """This function obtains the information for many documents using batched API calls.
+
+    .. versionadded:: 3.3.0
+
+    :param content_ids: The Content IDs of the documents
+    :type content_ids: list, tuple, set
+    :param return_fields: Specific fields to return if not all of the default fields are needed (Optional)
+    :type return_fields: list, None
+    :param ignore_exceptions: Determines whether nor not exceptions should be ignored, in which case the information
+                              for documents that could not be retrieved is an empty dictionary (Default: ``False``)
+    :type ignore_exceptions: bool
+    :param verify_ssl: Determines if API calls should verify SSL certificates (``True`` by default)
+    :type verify_ssl: bool
+    :returns: A dictionary mapping each Content ID to a dictionary with the document information
+    :raises: :py:exc:`khorosjx.errors.exceptions.GETRequestError`,
+             :py:exc:`khorosjx.errors.exceptions.InvalidDatasetError`
+    """
+    # Verify that the core connection has been established
+    verify_core_connection()
+
+    # Retrieve the documents in batches and parse the data for each document that was found
+    docs_data = core.get_data_many('contents', content_ids, ignore_exceptions=ignore_exceptions, all_fields=True,
+                                   verify_ssl=verify_ssl)
+    docs_info = {}
+    for content_id, doc_json in docs_data.items():
+        docs_info[content_id] = core.get_fields_from_api_response(doc_json, 'document', return_fields) \
+            if doc_json else {}
+    return docs_info
+
+
 # Define function to get the attachments in a document
 def get_document_attachments(lookup_value, lookup_type='doc_id', return_dataframe=False):
     """This function retrieves information on any attachments associated with a document.
@@ -305,7 +350,7 @@ def get_document_attachments(lookup_value, lookup_type='doc_id', return_datafram
             data = []
             for idx in range(0,len(attachment_info)):
                 data.append(list(attachment_info[idx].values()))
-            attachment_info = pd.DataFrame(data, columns=column_names)
+            attachment_info = df_utils.import_pandas().DataFrame(data, columns=column_names)
 
         # Trim the data down to the inner dictionary if there is only one attachment
         elif len(attachment_info) == 1:
@@ -342,6 +387,6 @@ def delete_document(lookup_value, lookup_type='content_id', return_json=False):
     elif lookup_value == "doc_id":
         url = get_url_for_id(lookup_value)
         lookup_value = base.get_content_id(url)
-    content_uri = f"{base_url}/contents/{lookup_value}"
+    content_uri = f"{core.base_url}/contents/{lookup_value}"
     response = core.delete(content_uri, return_json=return_json)
     return response
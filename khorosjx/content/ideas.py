@@ -6,20 +6,37 @@
 :Example:           ``content_id = ideas.get_content_id(url)``
 :Created By:        Jeff Shurtliff
 :Last Modified:     Jeff Shurtliff
-:Modified Date:     22 Sep 2021
+:Modified Date:     17 Oct 2026
 """
 
 from .. import core
 from . import base
-from ..utils import core_utils, df_utils
+from ..utils.classes import Content
 
-# Define global variables
-base_url, api_credentials = '', None
+
+def __getattr__(name):
+    """This function forwards the deprecated ``base_url`` and ``api_credentials`` global variables to the active client.
+
+    .. versionadded:: 3.3.0
+
+    .. deprecated:: 3.3.0
+       Use :py:data:`khorosjx.core.base_url` and :py:data:`khorosjx.core.api_credentials` instead.
+
+    :param name: The name of the attribute being accessed
+    :type name: str
+    :returns: The value of the connection setting of the active :py:class:`khorosjx.core.Client` object
+    :raises: :py:exc:`AttributeError`
+    """
+    return core._get_deprecated_connection_attribute(__name__, name)
 
 
 def verify_core_connection():
     """This function verifies that the core connection information (Base URL and API credentials) has been defined.
 
+    .. versionchanged:: 3.3.0
+       The connection information of the active :py:class:`khorosjx.core.Client` object is now verified rather than
+       the global variables of this module so that each thread or asyncio task can use a different client.
+
     .. versionchanged:: 3.1.0
        Refactored the function to be more pythonic and to avoid depending on a try/except block.
 
@@ -27,13 +44,17 @@ def verify_core_connection():
     :raises: :py:exc:`khorosjx.errors.exceptions.KhorosJXError`,
              :py:exc:`khorosjx.errors.exceptions.NoCredentialsError`
     """
-    if not base_url or not api_credentials:
-        retrieve_connection_info()
+    core.verify_connection()
     return
 
 
 def retrieve_connection_info():
-    """This function initializes and defines the global variables for the connection information.
+    """This function verifies the connection information of the active client.
+
+    .. deprecated:: 3.3.0
+       The global variables of this module are no longer defined by this function, as the connection information is
+       stored in the active :py:class:`khorosjx.core.Client` object. Use :py:func:`khorosjx.core.get_connection_info`
+       instead.
 
     .. versionchanged:: 3.1.0
        Refactored the function to be more efficient.
@@ -42,10 +63,7 @@ def retrieve_connection_info():
     :raises: :py:exc:`khorosjx.errors.exceptions.KhorosJXError`,
              :py:exc:`khorosjx.errors.exceptions.NoCredentialsError`
     """
-    # Define the global variables at this module level
-    global base_url
-    global api_credentials
-    base_url, api_credentials = core.get_connection_info()
+    core._retrieve_deprecated_connection_info(__name__)
     return
 
 
@@ -62,39 +80,58 @@ def get_content_id(url):
     return content_id
 
 
-def get_ideas_for_space(browse_id, return_type='list', ignore_exceptions=False):
-    """This function retrieves ideas for a given space.
+def iter_ideas_for_space(browse_id, ignore_exceptions=False, max_workers=1):
+    """This function lazily yields the ideas for a given space.
+
+    .. versionadded:: 3.3.0
+
+    When the pages are retrieved sequentially the ``links.next`` URLs provided by the server are followed, and
+    otherwise the pages are requested concurrently by ``startIndex`` value.
 
     :param browse_id: The Browse ID of the space to be queried
     :type browse_id: str, int
-    :param return_type: Determines if the data should be returned as a ``list`` (default) or a ``dataframe``
-    :type return_type: str
     :param ignore_exceptions: Determines if exceptions encountered should be ignored (``False`` by default)
     :type  ignore_exceptions: bool
-    :returns: The ideas for the given space in a list or a pandas dataframe
+    :param max_workers: The maximum number of pages to request concurrently (Default: ``1``)
+    :type max_workers: int
+    :returns: A generator that yields a dictionary with the information for each idea
     """
     # Verify that the core connection has been established
     verify_core_connection()
 
-    # Initialize the master list of ideas
-    all_ideas = []
+    # Retrieve and yield each page of ideas
+    query = core.get_query_url('places', browse_id, 'contents')
+    yield from core.iter_paginated_results(query, 'idea', filter_info=('type', 'idea'),
+                                           ignore_exceptions=ignore_exceptions, max_workers=max_workers)
+
+
+def get_ideas_for_space(browse_id, return_type='list', ignore_exceptions=False, max_workers=1, deadline=None,
+                        return_partial=False):
+    """This function retrieves ideas for a given space.
 
-    # Perform the first query to get up to the first 100 ideas
-    start_index = 0
-    endpoint = f"places/{browse_id}/contents"
-    query_string = "filter=type(idea)"
-    ideas = base.get_paginated_content(endpoint, query_string, start_index, 'idea', all_fields=True,
-                                       ignore_exceptions=ignore_exceptions)
-    all_ideas = core_utils.add_to_master_list(ideas, all_ideas)
+    .. versionchanged:: 3.3.0
+       Added the ``max_workers`` parameter and leveraged the :py:func:`khorosjx.content.ideas.iter_ideas_for_space`
+       function so that multiple pages can be retrieved concurrently. Dataframes are now built column by column as
+       each page is retrieved. Added the ``deadline`` and ``return_partial`` parameters.
 
-    # Continue querying for groups until none are returned
-    while len(ideas) > 0:
-        start_index += 100
-        ideas = base.get_paginated_content(endpoint, query_string, start_index, 'idea', all_fields=True,
-                                           ignore_exceptions=ignore_exceptions)
-        all_ideas = core_utils.add_to_master_list(ideas, all_ideas)
+    :param browse_id: The Browse ID of the space to be queried
+    :type browse_id: str, int
+    :param return_type: Determines if the data should be returned as a ``list`` (default) or a ``dataframe``
+    :type return_type: str
+    :param ignore_exceptions: Determines if exceptions encountered should be ignored (``False`` by default)
+    :type  ignore_exceptions: bool
+    :param max_workers: The maximum number of pages to request concurrently (Default: ``1``)
+    :type max_workers: int
+    :param deadline: The number of seconds in which every idea must be retrieved (Default: no deadline)
+    :type deadline: int, float, None
+    :param return_partial: Returns the ideas retrieved before the deadline expired as a
+                           :py:class:`khorosjx.core.PartialResults` list rather than raising an exception
+    :type return_partial: bool
+    :returns: The ideas for the given space in a list or a pandas dataframe
+    :raises: :py:exc:`khorosjx.errors.exceptions.DeadlineExceededError`
+    """
+    # Retrieve every page of ideas
+    all_ideas = iter_ideas_for_space(browse_id, ignore_exceptions, max_workers)
 
     # Return the data as a master list of group dictionaries or a pandas dataframe
-    if return_type == "dataframe":
-        all_ideas = df_utils.convert_dict_list_to_dataframe(all_ideas)
-    return all_ideas
+    return core.collect_results(all_ideas, return_type, Content.datasets.get('idea'), deadline, return_partial)
@@ -6,7 +6,7 @@
 :Example:           ``content_id = videos.get_content_id(url)``
 :Created By:        Jeff Shurtliff
 :Last Modified:     Jeff Shurtliff
-:Modified Date:     22 Sep 2021
+:Modified Date:     17 Oct 2026
 """
 
 import os.path
@@ -14,14 +14,32 @@ import os.path
 from .. import core, errors
 from . import base
 from ..utils import core_utils
+from ..utils.classes import Content
 
-# Define global variables
-base_url, api_credentials = '', None
+
+def __getattr__(name):
+    """This function forwards the deprecated ``base_url`` and ``api_credentials`` global variables to the active client.
+
+    .. versionadded:: 3.3.0
+
+    .. deprecated:: 3.3.0
+       Use :py:data:`khorosjx.core.base_url` and :py:data:`khorosjx.core.api_credentials` instead.
+
+    :param name: The name of the attribute being accessed
+    :type name: str
+    :returns: The value of the connection setting of the active :py:class:`khorosjx.core.Client` object
+    :raises: :py:exc:`AttributeError`
+    """
+    return core._get_deprecated_connection_attribute(__name__, name)
 
 
 def verify_core_connection():
     """This function verifies that the core connection information (Base URL and API credentials) has been defined.
 
+    .. versionchanged:: 3.3.0
+       The connection information of the active :py:class:`khorosjx.core.Client` object is now verified rather than
+       the global variables of this module so that each thread or asyncio task can use a different client.
+
     .. versionchanged:: 3.1.0
        Refactored the function to be more pythonic and to avoid depending on a try/except block.
 
@@ -29,13 +47,17 @@ def verify_core_connection():
     :raises: :py:exc:`khorosjx.errors.exceptions.KhorosJXError`,
              :py:exc:`khorosjx.errors.exceptions.NoCredentialsError`
     """
-    if not base_url or not api_credentials:
-        retrieve_connection_info()
+    core.verify_connection()
     return
 
 
 def retrieve_connection_info():
-    """This function initializes and defines the global variables for the connection information.
+    """This function verifies the connection information of the active client.
+
+    .. deprecated:: 3.3.0
+       The global variables of this module are no longer defined by this function, as the connection information is
+       stored in the active :py:class:`khorosjx.core.Client` object. Use :py:func:`khorosjx.core.get_connection_info`
+       instead.
 
     .. versionchanged:: 3.1.0
        Refactored the function to be more efficient.
@@ -44,10 +66,7 @@ def retrieve_connection_info():
     :raises: :py:exc:`khorosjx.errors.exceptions.KhorosJXError`,
              :py:exc:`khorosjx.errors.exceptions.NoCredentialsError`
     """
-    # Define the global variables at this module level
-    global base_url
-    global api_credentials
-    base_url, api_credentials = core.get_connection_info()
+    core._retrieve_deprecated_connection_info(__name__)
     return
 
 
@@ -129,45 +148,63 @@ def download_video(video_url, output_path, output_name="", default_type="mp4", v
     return
 
 
-def __append_videos(_all_videos, _query, _start_index, _return_fields, _ignore_exceptions):
-    """This function retrieves paginated results and appends them to a master list."""
-    _videos = core.get_paginated_results(_query, 'video', _start_index, filter_info=('type', 'video'),
-                                         return_fields=_return_fields, ignore_exceptions=_ignore_exceptions)
-    _all_videos = core_utils.add_to_master_list(_videos, _all_videos)
-    return _all_videos, len(_videos)
+def iter_native_videos_for_space(browse_id, return_fields=None, ignore_exceptions=False, max_workers=1):
+    """This function lazily yields information on each native (i.e. non-attachment) video for a given space.
+
+    .. versionadded:: 3.3.0
+
+    :param browse_id: The Browse ID associated with the space
+    :type browse_id: int, str
+    :param return_fields: Specific fields to return if not all of the default fields are needed (Optional)
+    :type return_fields: list, None
+    :param ignore_exceptions: Determines whether nor not exceptions should be ignored (Default: ``False``)
+    :type ignore_exceptions: bool
+    :param max_workers: The maximum number of pages to request concurrently (Default: ``1``)
+    :type max_workers: int
+    :returns: A generator that yields a dictionary with the information for each video
+    :raises: :py:exc:`khorosjx.errors.exceptions.InvalidDatasetError`
+    """
+    query = core.get_query_url('places', browse_id, 'contents')
+    yield from core.iter_paginated_results(query, 'video', filter_info=('type', 'video'), return_fields=return_fields,
+                                           ignore_exceptions=ignore_exceptions, max_workers=max_workers)
 
 
-def get_native_videos_for_space(browse_id, return_fields=[], return_type='list', ignore_exceptions=False):
+def get_native_videos_for_space(browse_id, return_fields=None, return_type='list', ignore_exceptions=False,
+                                max_workers=1, deadline=None, return_partial=False):
     """This function returns information on all native (i.e. non-attachment and not third party) for a given space.
 
+    .. versionchanged:: 3.3.0
+       Added the ``max_workers`` parameter and leveraged the
+       :py:func:`khorosjx.content.videos.iter_native_videos_for_space` function so that multiple pages can be
+       retrieved concurrently. The default ``return_fields`` value was also changed to ``None`` and dataframes are
+       now built column by column as each page is retrieved. Added the ``deadline`` and ``return_partial``
+       parameters.
+
     :param browse_id: The Browse ID associated with the space
     :type browse_id: int, str
     :param return_fields: Specific fields to return if not all of the default fields are needed (Optional)
-    :type return_fields: list
+    :type return_fields: list, None
     :param return_type: Determines if the data should be returned in a list or a pandas dataframe (Default: ``list``)
     :type return_type: str
     :param ignore_exceptions: Determines whether nor not exceptions should be ignored (Default: ``False``)
     :type ignore_exceptions: bool
+    :param max_workers: The maximum number of pages to request concurrently (Default: ``1``)
+    :type max_workers: int
+    :param deadline: The number of seconds in which every video must be retrieved (Default: no deadline)
+    :type deadline: int, float, None
+    :param return_partial: Returns the videos retrieved before the deadline expired as a
+                           :py:class:`khorosjx.core.PartialResults` list rather than raising an exception
+    :type return_partial: bool
     :returns: A list of dictionaries or a dataframe containing information for each group
-    :raises: :py:exc:`khorosjx.errors.exceptions.InvalidDatasetError`
+    :raises: :py:exc:`khorosjx.errors.exceptions.InvalidDatasetError`,
+             :py:exc:`khorosjx.errors.exceptions.DeadlineExceededError`
     """
-    # Initialize the master list that will contain all of the video data
-    all_videos = []
-
-    # Perform the first query to get up to the first 100 groups
-    start_index = 0
-    query = core.get_query_url('places', browse_id, 'contents')
-    all_videos, assets_returned = __append_videos(all_videos, query, start_index, return_fields, ignore_exceptions)
-
-    # Continue querying for videos until none are returned
-    while assets_returned > 0:
-        start_index += 100
-        all_videos, assets_returned = __append_videos(all_videos, query, start_index, return_fields, ignore_exceptions)
+    # Retrieve every page of videos
+    all_videos = iter_native_videos_for_space(browse_id, return_fields, ignore_exceptions, max_workers)
 
     # Return the data as a master list of group dictionaries or a pandas dataframe
-    if return_type == "dataframe":
-        all_videos = core_utils.convert_dict_list_to_dataframe(all_videos)
-    return all_videos
+    column_names = return_fields or Content.datasets.get('video')
+    return core.collect_results(all_videos, return_type, column_names, deadline, return_partial)
 
 
 def find_video_attachments(document_attachments):
@@ -6,25 +6,347 @@
 :Example:           ``user_info = khorosjx.core.get_data('people', 'john.doe@example.com', 'email')``
 :Created By:        Jeff Shurtliff
 :Last Modified:     Jeff Shurtliff
-:Modified Date:     23 Sep 2021
+:Modified Date:     17 Oct 2026
 """
 
 import re
 import json
+import time
+import inspect
+import warnings
+import threading
+import functools
+import importlib
+import contextvars
+import http.client
+from collections import deque
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
 
 import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
 
 from . import errors
 from .utils.core_utils import eprint, convert_dict_to_json
 from .utils.classes import Platform, Content
+from .utils.retry import RetryPolicy
+from .utils.rate_limit import TokenBucket, SharedTokenBucket
+from .utils.cache import ResponseCache, PersistentResponseCache, normalize_url
+from .utils.metrics import RequestMetrics, get_endpoint_template
+from .utils.field_paths import extract_fields, get_field_projection
+from .utils.df_utils import ColumnarFrameBuilder
+from .utils.singleflight import SingleFlight
 
 # Define global variables
-base_url, api_credentials = '', None
+request_hooks = {'pre': [], 'post': []}
+request_metrics, metrics_enabled = RequestMetrics(), True
+max_batch_size = 25     # The maximum number of requests permitted in a single executeBatch API call
+
+# Define the connection settings which are stored in each client and the modules which can be accessed from a client
+client_attributes = ('base_url', 'api_credentials', 'session', 'session_settings', 'timeouts', 'retry_policy',
+                     'rate_limiter', 'response_cache', 'persistent_cache', 'in_flight_requests')
+client_modules = ('admin', 'aio', 'content', 'export', 'groups', 'news', 'places', 'spaces', 'users')
+
+
+class Client(object):
+    """This class holds the connection settings, HTTP session, timeouts, retry policy, rate limiter and response caches
+       used to perform API requests against a single environment.
+
+    .. versionadded:: 3.3.0
+
+    Every function in the library can be called as a method of a client, either directly for the functions in the
+    :py:mod:`khorosjx.core` module (e.g. ``client.get_data('people', 1)``) or through the name of its module
+    (e.g. ``client.groups.get_all_groups()``), in which case the function uses the client's connection rather than
+    that of the default client. The module-level functions use the :py:data:`khorosjx.core.default_client` object
+    unless another client has been activated with the :py:meth:`khorosjx.core.Client.activate` method, which only
+    affects the current thread or asyncio task. The request hooks and request metrics are shared by all clients.
+    """
+    def __init__(self, base_url=None, credentials=None, pool_connections=None, pool_maxsize=None, pool_block=None,
+                 keep_alive=None, headers=None):
+        """This method instantiates the client and establishes the connection information when it is supplied.
+
+        :param base_url: The base URL (e.g. ``https://community.example.com``) for the environment (Optional)
+        :type base_url: str, None
+        :param credentials: The username and password of the account to perform the API queries (Optional)
+        :type credentials: tuple, None
+        :param pool_connections: The number of per-host connection pools to cache (Default: ``10``)
+        :type pool_connections: int, None
+        :param pool_maxsize: The maximum number of connections to keep open for a single host (Default: ``10``)
+        :type pool_maxsize: int, None
+        :param pool_block: Determines if requests should wait for a free connection when the pool is full
+                           (Default: ``False``)
+        :type pool_block: bool, None
+        :param keep_alive: Determines if connections should be kept alive and reused between requests
+                           (Default: ``True``)
+        :type keep_alive: bool, None
+        :param headers: Default headers to include in every API request (Optional)
+        :type headers: dict, None
+        :raises: :py:exc:`khorosjx.errors.exceptions.IncompleteCredentialsError`,
+                 :py:exc:`khorosjx.errors.exceptions.CredentialsUnpackingError`,
+                 :py:exc:`khorosjx.errors.exceptions.WrongCredentialTypeError`
+        """
+        self.base_url, self.api_credentials = '', None
+        self.session, self.session_lock = None, threading.Lock()
+        self.session_settings = {
+            'pool_connections': 10,
+            'pool_maxsize': 10,
+            'pool_block': False,
+            'keep_alive': True,
+            'headers': {}
+        }
+        self.timeouts = {'connect': 10.0, 'read': 60.0}
+        self.retry_policy = RetryPolicy()
+        self.rate_limiter = None
+        self.response_cache, self.persistent_cache = None, None
+        self.in_flight_requests = SingleFlight()
+        self.user_id_cache = {}
+        self.aio_sessions = {}
+        self.aio_session_settings = {'limit': 100, 'limit_per_host': 0, 'max_concurrency': 100}
+        if base_url is not None:
+            self.connect(base_url, credentials, pool_connections, pool_maxsize, pool_block, keep_alive, headers)
+
+    def __repr__(self):
+        return f"{type(self).__name__}(base_url={self.base_url!r})"
+
+    def __getattr__(self, name):
+        """This method returns the functions of the core module and the other modules bound to the client."""
+        if name.startswith('_'):
+            raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}")
+        if name in client_modules:
+            return ClientModule(self, importlib.import_module(f"khorosjx.{name}"))
+        function = globals().get(name)
+        if not inspect.isfunction(function) or function.__module__ != __name__:
+            raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}")
+        return self.bind(function)
+
+    def __dir__(self):
+        functions = (name for name, value in globals().items() if inspect.isfunction(value) and
+                     value.__module__ == __name__ and not name.startswith('_'))
+        return sorted(set(super().__dir__()) | set(client_modules) | set(functions))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    @contextmanager
+    def activate(self):
+        """This method uses the client for every function called within the ``with`` block in the current thread or
+           asyncio task, including the module-level functions.
+
+        :returns: A context manager which yields the client
+        """
+        token = _active_client.set(self)
+        try:
+            yield self
+        finally:
+            _active_client.reset(token)
+
+    def bind(self, function):
+        """This method returns a version of a function which uses the client whenever it is called.
+
+        Generators and coroutines returned by the function also use the client each time they are resumed.
+
+        :param function: The function to bind to the client
+        :type function: function
+        :returns: The bound function
+        """
+        @functools.wraps(function)
+        def _bound_function(*args, **kwargs):
+            with self.activate():
+                result = function(*args, **kwargs)
+            if inspect.isgenerator(result):
+                return self._iterate(result)
+            elif inspect.isasyncgen(result):
+                return self._iterate_async(result)
+            elif inspect.iscoroutine(result):
+                return self._await(result)
+            return result
+        return _bound_function
+
+    def _iterate(self, generator):
+        """This method resumes a generator with the client activated and yields its values."""
+        try:
+            while True:
+                with self.activate():
+                    try:
+                        value = next(generator)
+                    except StopIteration as exc:
+                        return exc.value
+                yield value
+        finally:
+            with self.activate():
+                generator.close()
+
+    async def _iterate_async(self, generator):
+        """This method resumes an asynchronous generator with the client activated and yields its values."""
+        try:
+            while True:
+                with self.activate():
+                    try:
+                        value = await generator.__anext__()
+                    except StopAsyncIteration:
+                        return
+                yield value
+        finally:
+            with self.activate():
+                await generator.aclose()
+
+    async def _await(self, coroutine):
+        """This method awaits a coroutine with the client activated and returns its result."""
+        with self.activate():
+            return await coroutine
+
+    def close(self):
+        """This method closes the HTTP session of the client and any pooled connections it holds.
+
+        :returns: None
+        """
+        self.bind(close_session)()
+        return
+
+
+class ClientModule(object):
+    """This class exposes the functions of a module as methods bound to a :py:class:`khorosjx.core.Client` object.
+
+    .. versionadded:: 3.3.0
+    """
+    def __init__(self, client, module):
+        """This method instantiates the bound module.
+
+        :param client: The client to which the functions are bound
+        :type client: :py:class:`khorosjx.core.Client`
+        :param module: The module containing the functions
+        :type module: module
+        """
+        self._client, self._module = client, module
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self._module.__name__!r}, {self._client!r})"
+
+    def __dir__(self):
+        return dir(self._module)
+
+    def __getattr__(self, name):
+        value = getattr(self._module, name)
+        if inspect.ismodule(value) and value.__name__.startswith('khorosjx.'):
+            return ClientModule(self._client, value)
+        if inspect.isfunction(value):
+            return self._client.bind(value)
+        return value
+
+
+class PartialResults(list):
+    """This class is a list of the records that were retrieved before the deadline of a bulk operation expired.
+
+    .. versionadded:: 3.3.0
+
+    It is returned in place of a list by the bulk functions when the ``return_partial`` argument is ``True`` and the
+    ``deadline`` expires, so the ``complete`` attribute is always ``False`` and the ``error`` attribute contains the
+    :py:exc:`khorosjx.errors.exceptions.DeadlineExceededError` exception that interrupted the operation.
+    """
+    complete = False
+
+    def __init__(self, records=(), error=None):
+        """This method instantiates the list of partial results.
+
+        :param records: The records that were retrieved before the deadline expired
+        :type records: list, tuple, generator
+        :param error: The exception that interrupted the operation (Optional)
+        :type error: :py:exc:`khorosjx.errors.exceptions.DeadlineExceededError`, None
+        """
+        super().__init__(records)
+        self.error = error
+
+    def __repr__(self):
+        return f"{type(self).__name__}({super().__repr__()})"
+
+
+# Define the default client used by the module-level functions and the client activated in the current context
+default_client = Client()
+_active_client = contextvars.ContextVar('khorosjx_active_client', default=None)
+
+# Define the monotonic time at which the requests performed in the current context must be completed
+_request_deadline = contextvars.ContextVar('khorosjx_request_deadline', default=None)
+
+
+def get_client():
+    """This function returns the client used by the functions called in the current thread or asyncio task.
+
+    .. versionadded:: 3.3.0
+
+    :returns: The active :py:class:`khorosjx.core.Client` object or :py:data:`khorosjx.core.default_client`
+    """
+    return _active_client.get() or default_client
+
+
+def __getattr__(name):
+    """This function returns the connection settings (e.g. ``khorosjx.core.base_url``) of the active client.
+
+    .. versionadded:: 3.3.0
+
+    :param name: The name of the attribute being accessed
+    :type name: str
+    :returns: The value of the connection setting
+    :raises: :py:exc:`AttributeError`
+    """
+    if name in client_attributes:
+        return getattr(get_client(), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def _get_deprecated_connection_attribute(_module_name, _name):
+    """This function returns a connection setting of the active client for a deprecated module-level global variable.
+
+    .. versionadded:: 3.3.0
+
+    The ``base_url`` and ``api_credentials`` global variables of the other modules (e.g. ``khorosjx.groups.base_url``)
+    are forwarded to this function so that they continue to return the settings of the active client.
+
+    :param _module_name: The name of the module whose global variable is being accessed
+    :type _module_name: str
+    :param _name: The name of the global variable being accessed
+    :type _name: str
+    :returns: The value of the connection setting
+    :raises: :py:exc:`AttributeError`
+    """
+    if _name not in ('base_url', 'api_credentials'):
+        raise AttributeError(f"module {_module_name!r} has no attribute {_name!r}")
+    warnings.warn(
+        f"The {_module_name}.{_name} global variable is deprecated and will be removed in a future release. Use " +
+        f"khorosjx.core.{_name} instead.",
+        DeprecationWarning, stacklevel=3
+    )
+    return getattr(get_client(), _name)
+
+
+def _retrieve_deprecated_connection_info(_module_name):
+    """This function verifies the connection of the active client for a deprecated ``retrieve_connection_info`` call.
+
+    .. versionadded:: 3.3.0
+
+    :param _module_name: The name of the module whose ``retrieve_connection_info`` function was called
+    :type _module_name: str
+    :returns: None
+    :raises: :py:exc:`khorosjx.errors.exceptions.KhorosJXError`,
+             :py:exc:`khorosjx.errors.exceptions.NoCredentialsError`
+    """
+    warnings.warn(
+        f"The {_module_name}.retrieve_connection_info function is deprecated and will be removed in a future " +
+        "release. Use khorosjx.core.get_connection_info instead.",
+        DeprecationWarning, stacklevel=3
+    )
+    verify_connection()
 
 
 def set_base_url(domain_url, version=3, protocol='https', return_url=True):
     """This function gets the base URL for API calls when supplied with a domain URL. (e.g. ``community.example.com``)
 
+    .. versionchanged:: 3.3.0
+       The base URL is now stored in the active :py:class:`khorosjx.core.Client` object.
+
     .. versionchanged:: 3.2.0
        Added the ``return_url`` parameter to determine if the base URL should be returned by the function.
 
@@ -39,8 +361,8 @@ def set_base_url(domain_url, version=3, protocol='https', return_url=True):
     :returns: The base URL for API calls in string format (e.g. ``https://community.example.com/api/core/v3``)
     :raises: :py:exc:`TypeError`, :py:exc:`ValueError`
     """
-    # Define global variable and dictionaries
-    global base_url
+    # Define the dictionaries
+    client = get_client()
     versions = {
         2: '/api/core/v2',
         3: '/api/core/v3'
@@ -58,14 +380,19 @@ def set_base_url(domain_url, version=3, protocol='https', return_url=True):
 
     # Append the appropriate API path to the URL and return the bse URL
     domain_url = re.sub('/$', '', domain_url)
-    base_url = f"{domain_url}{versions.get(version)}"
+    client.base_url = f"{domain_url}{versions.get(version)}"
     if return_url:
-        return base_url
+        return client.base_url
     return
 
 
 def set_credentials(credentials):
-    """This function defines the Core API credentials as global variables and validates them.
+    """This function defines the Core API credentials for the active client and validates them.
+
+    .. versionchanged:: 3.3.0
+       The credentials are now stored in the active :py:class:`khorosjx.core.Client` object, the credentials of an
+       existing HTTP session are updated and any cached API responses are cleared. Any asynchronous HTTP sessions
+       are replaced the next time they are requested.
 
     .. versionchanged:: 3.1.0
        Parenthesis were added to the exception classes and utilized the :py:func:`isinstsance` builtin.
@@ -77,10 +404,8 @@ def set_credentials(credentials):
              :py:exc:`khorosjx.errors.exceptions.CredentialsUnpackingError`,
              :py:exc:`khorosjx.errors.exceptions.WrongCredentialTypeError`
     """
-    # Initialize the global variable
-    global api_credentials
-
-    # Ensure the supplied data can be leveraged and then define the global variable
+    # Ensure the supplied data can be leveraged and then define the credentials of the active client
+    client = get_client()
     if len(credentials) != 2:
         if len(credentials) == 1:
             raise errors.exceptions.IncompleteCredentialsError()
@@ -88,27 +413,624 @@ def set_credentials(credentials):
             raise errors.exceptions.CredentialsUnpackingError()
     elif not isinstance(credentials[0], str) or not isinstance(credentials[1], str):
         raise errors.exceptions.WrongCredentialTypeError()
-    api_credentials = credentials
+    client.api_credentials = credentials
+    if client.session is not None:
+        client.session.auth = credentials
+    clear_response_cache()
     return
 
 
-def connect(base_api_url, credentials):
+def connect(base_api_url, credentials, pool_connections=None, pool_maxsize=None, pool_block=None, keep_alive=None,
+            headers=None):
     """This function establishes the connection information for performing Core API queries.
 
+    .. versionchanged:: 3.3.0
+       Added the optional ``pool_connections``, ``pool_maxsize``, ``pool_block``, ``keep_alive`` and ``headers``
+       parameters to configure the shared HTTP session. The connection is now established for the active
+       :py:class:`khorosjx.core.Client` object, which is the :py:data:`khorosjx.core.default_client` object unless
+       another client has been activated.
+
     :param base_api_url: The base URL (e.g. https://community.example.com) for for environment
     :type base_api_url: str
     :param credentials: The username and password of the account to perform the API queries
     :type credentials: tuple
+    :param pool_connections: The number of per-host connection pools to cache (Default: ``10``)
+    :type pool_connections: int, None
+    :param pool_maxsize: The maximum number of connections to keep open for a single host (Default: ``10``)
+    :type pool_maxsize: int, None
+    :param pool_block: Determines if requests should wait for a free connection when the pool is full rather than
+                       opening a new one (Default: ``False``)
+    :type pool_block: bool, None
+    :param keep_alive: Determines if connections should be kept alive and reused between requests (Default: ``True``)
+    :type keep_alive: bool, None
+    :param headers: Default headers to include in every API request (Optional)
+    :type headers: dict, None
     :returns: None
     """
     set_base_url(base_api_url)
     set_credentials(credentials)
+    set_session_options(pool_connections, pool_maxsize, pool_block, keep_alive, headers)
+    return
+
+
+def set_session_options(pool_connections=None, pool_maxsize=None, pool_block=None, keep_alive=None, headers=None):
+    """This function defines the connection pool settings for the shared HTTP session used in all API requests.
+
+    .. versionadded:: 3.3.0
+
+    Any option that is not supplied retains its current value. The existing session (if any) is closed so that the
+    new settings take effect with the next API request.
+
+    :param pool_connections: The number of per-host connection pools to cache
+    :type pool_connections: int, None
+    :param pool_maxsize: The maximum number of connections to keep open for a single host
+    :type pool_maxsize: int, None
+    :param pool_block: Determines if requests should wait for a free connection when the pool is full
+    :type pool_block: bool, None
+    :param keep_alive: Determines if connections should be kept alive and reused between requests
+    :type keep_alive: bool, None
+    :param headers: Default headers to include in every API request
+    :type headers: dict, None
+    :returns: None
+    :raises: :py:exc:`TypeError`
+    """
+    options = {
+        'pool_connections': pool_connections,
+        'pool_maxsize': pool_maxsize,
+        'pool_block': pool_block,
+        'keep_alive': keep_alive,
+        'headers': headers
+    }
+    for option_name, option_value in options.items():
+        if option_value is not None:
+            if option_name == 'headers' and not isinstance(option_value, dict):
+                raise TypeError("The default session headers must be supplied as a dictionary.")
+            get_client().session_settings[option_name] = option_value
+    close_session()
+    return
+
+
+def _create_session():
+    """This function creates a new HTTP session with a connection pool using the current session settings.
+
+    .. versionadded:: 3.3.0
+
+    :returns: The new :py:class:`requests.Session` object
+    """
+    _client = get_client()
+    _session_settings = _client.session_settings
+    _session = requests.Session()
+    _adapter = HTTPAdapter(pool_connections=_session_settings.get('pool_connections'),
+                           pool_maxsize=_session_settings.get('pool_maxsize'),
+                           pool_block=_session_settings.get('pool_block'))
+    _session.mount('https://', _adapter)
+    _session.mount('http://', _adapter)
+    _session.headers.update({"Accept": "application/json"})
+    _session.headers.update(_session_settings.get('headers'))
+    if not _session_settings.get('keep_alive'):
+        _session.headers['Connection'] = 'close'
+    _session.auth = _client.api_credentials
+    return _session
+
+
+def get_session():
+    """This function returns the shared HTTP session used for API requests, creating it if necessary.
+
+    .. versionadded:: 3.3.0
+
+    :returns: The shared :py:class:`requests.Session` object
+    """
+    client = get_client()
+    if client.session is None:
+        with client.session_lock:
+            if client.session is None:
+                client.session = _create_session()
+    return client.session
+
+
+def close_session():
+    """This function closes the shared HTTP session and any pooled connections it holds.
+
+    .. versionadded:: 3.3.0
+
+    :returns: None
+    """
+    client = get_client()
+    with client.session_lock:
+        if client.session is not None:
+            client.session.close()
+            client.session = None
+    return
+
+
+def set_retry_policy(policy=None, max_retries=None, backoff_factor=None, max_backoff=None, total_timeout=None,
+                     retry_statuses=None, respect_retry_after=None, retry_non_idempotent=None):
+    """This function defines the default retry policy used by all API requests.
+
+    .. versionadded:: 3.3.0
+
+    .. note:: When a ``policy`` object is not supplied, the current default policy is copied and any supplied
+              values are replaced. Values that are not supplied retain their current setting.
+
+    :param policy: A retry policy object to use as the new default (Optional)
+    :type policy: :py:class:`khorosjx.utils.retry.RetryPolicy`, None
+    :param max_retries: The maximum number of retries after the initial attempt
+    :type max_retries: int, None
+    :param backoff_factor: The base number of seconds used to calculate the exponential backoff
+    :type backoff_factor: int, float, None
+    :param max_backoff: The maximum number of seconds to wait between attempts
+    :type max_backoff: int, float, None
+    :param total_timeout: The total number of seconds that may be spent on a request including retries
+    :type total_timeout: int, float, None
+    :param retry_statuses: The HTTP status codes that should be retried (e.g. ``[429, 502, 503, 504]``)
+    :type retry_statuses: list, tuple, set, None
+    :param respect_retry_after: Determines if the ``Retry-After`` response header should be honored
+    :type respect_retry_after: bool, None
+    :param retry_non_idempotent: Determines if ``POST`` and ``PUT`` requests should be retried for every retryable
+                                 status code rather than only ``429``
+    :type retry_non_idempotent: bool, None
+    :returns: None
+    :raises: :py:exc:`TypeError`, :py:exc:`ValueError`
+    """
+    client = get_client()
+    if policy is not None and not isinstance(policy, RetryPolicy):
+        raise TypeError("The retry policy must be a khorosjx.utils.retry.RetryPolicy object.")
+    client.retry_policy = policy or client.retry_policy.copy(max_retries=max_retries, backoff_factor=backoff_factor,
+                                                             max_backoff=max_backoff, total_timeout=total_timeout,
+                                                             retry_statuses=retry_statuses,
+                                                             respect_retry_after=respect_retry_after,
+                                                             retry_non_idempotent=retry_non_idempotent)
+    return
+
+
+def set_timeouts(connect_timeout=None, read_timeout=None):
+    """This function defines the connect and read timeouts applied to every API request.
+
+    .. versionadded:: 3.3.0
+
+    .. note:: A timed out request is retried according to the retry policy. Values that are not supplied retain
+              their current setting, and the timeouts are shortened as necessary so that a request does not
+              continue past the deadline defined with :py:func:`khorosjx.core.request_deadline`.
+
+    :param connect_timeout: The number of seconds to wait for a connection to be established (Default: ``10.0``)
+    :type connect_timeout: int, float, None
+    :param read_timeout: The number of seconds to wait between bytes received from the API (Default: ``60.0``)
+    :type read_timeout: int, float, None
+    :returns: None
+    :raises: :py:exc:`ValueError`
+    """
+    timeouts = get_client().timeouts
+    for timeout_name, timeout_value in (('connect', connect_timeout), ('read', read_timeout)):
+        if timeout_value is not None:
+            if timeout_value <= 0:
+                raise ValueError(f"The {timeout_name} timeout must be greater than zero.")
+            timeouts[timeout_name] = float(timeout_value)
+    return
+
+
+@contextmanager
+def request_deadline(seconds=None):
+    """This function defines a deadline by which every API request performed within the ``with`` block must complete.
+
+    .. versionadded:: 3.3.0
+
+    The deadline applies to the current thread or asyncio task and to the concurrent requests performed on its
+    behalf (e.g. by :py:func:`khorosjx.core.iter_pages`). The timeout of each request is shortened to the time
+    remaining, no retry is attempted that would end after the deadline, and a
+    :py:exc:`khorosjx.errors.exceptions.DeadlineExceededError` exception is raised once it has expired. A nested
+    deadline can only shorten the deadline already in effect.
+
+    :param seconds: The number of seconds from now by which the requests must complete, or ``None`` for no deadline
+    :type seconds: int, float, None
+    :returns: A context manager
+    """
+    if seconds is None:
+        yield
+        return
+    expires, current_deadline = time.monotonic() + seconds, _request_deadline.get()
+    token = _request_deadline.set(expires if current_deadline is None else min(current_deadline, expires))
+    try:
+        yield
+    finally:
+        _request_deadline.reset(token)
+
+
+def get_remaining_time():
+    """This function returns the number of seconds remaining before the deadline defined for the current context.
+
+    .. versionadded:: 3.3.0
+
+    :returns: The remaining number of seconds (which is negative once the deadline has passed) or ``None`` if no
+              deadline has been defined
+    """
+    expires = _request_deadline.get()
+    return None if expires is None else expires - time.monotonic()
+
+
+def _get_request_timeout(_remaining_time=None):
+    """This function returns the connect and read timeouts for a request, shortened to fit within the deadline.
+
+    .. versionadded:: 3.3.0
+
+    :param _remaining_time: The number of seconds remaining before the deadline (Optional)
+    :type _remaining_time: int, float, None
+    :returns: A tuple with the connect and read timeouts in seconds
+    """
+    _timeouts = get_client().timeouts
+    if _remaining_time is None:
+        return _timeouts['connect'], _timeouts['read']
+    return min(_timeouts['connect'], _remaining_time), min(_timeouts['read'], _remaining_time)
+
+
+def _raise_deadline_exceeded(_method, _url, _event=None, _attempt=0):
+    """This function records a request that could not be completed before the deadline and raises an exception.
+
+    .. versionadded:: 3.3.0
+
+    :param _method: The HTTP method for the request (e.g. ``GET``)
+    :type _method: str
+    :param _url: The absolute URL that was requested
+    :type _url: str
+    :param _event: The request information from :py:func:`khorosjx.core._start_request_event` (Optional)
+    :type _event: dict, None
+    :param _attempt: The number of retries that were performed
+    :type _attempt: int
+    :returns: None
+    :raises: :py:exc:`khorosjx.errors.exceptions.DeadlineExceededError`
+    """
+    _error_msg = f"The {_method} request to {_url} could not be completed before the deadline expired."
+    _finish_request_event(_event, None, _attempt, _error_msg)
+    raise errors.exceptions.DeadlineExceededError(_error_msg)
+
+
+def collect_results(records, return_type='list', column_names=None, deadline=None, return_partial=False):
+    """This function consumes the records yielded by a generator into a list or pandas dataframe, optionally within
+       a deadline.
+
+    .. versionadded:: 3.3.0
+
+    When the deadline expires before every record has been retrieved, the
+    :py:exc:`khorosjx.errors.exceptions.DeadlineExceededError` exception is raised unless ``return_partial`` is
+    ``True``, in which case the records retrieved so far are returned in a
+    :py:class:`khorosjx.core.PartialResults` list (or in a dataframe whose ``attrs['partial']`` value is ``True``).
+
+    :param records: The generator (or other iterable) that yields the records
+    :type records: list, tuple, generator
+    :param return_type: Determines if the data should be returned in a list or a pandas dataframe (Default: ``list``)
+    :type return_type: str
+    :param column_names: The column names (i.e. field names) for the dataframe (Default: every field in the data)
+    :type column_names: list, tuple, None
+    :param deadline: The number of seconds in which the records must be retrieved (Default: no deadline)
+    :type deadline: int, float, None
+    :param return_partial: Determines if the records retrieved before the deadline expired should be returned
+                           rather than raising an exception (``False`` by default)
+    :type return_partial: bool
+    :returns: A list (or :py:class:`khorosjx.core.PartialResults` list) of records or a pandas dataframe
+    :raises: :py:exc:`khorosjx.errors.exceptions.DeadlineExceededError`
+    """
+    collector = ColumnarFrameBuilder(column_names) if return_type == 'dataframe' else []
+    deadline_error = None
+    with request_deadline(deadline):
+        try:
+            for record in records:
+                collector.append(record)
+        except errors.exceptions.DeadlineExceededError as exc:
+            if not return_partial:
+                raise
+            deadline_error = exc
+    if return_type == 'dataframe':
+        dataframe = collector.to_dataframe()
+        dataframe.attrs['partial'] = deadline_error is not None
+        return dataframe
+    return PartialResults(collector, deadline_error) if deadline_error is not None else collector
+
+
+def set_rate_limit(requests_per_second=None, burst=None, shared_file=None, bucket_name='default'):
+    """This function defines the client-side rate limit applied to all API requests.
+
+    .. versionadded:: 3.3.0
+
+    .. note:: Supplying a ``shared_file`` path stores the token bucket in a SQLite database so that every process
+              using the same file shares a single rate limit. Supplying ``None`` (or ``0``) for the
+              ``requests_per_second`` value disables the rate limit.
+
+    :param requests_per_second: The sustained number of requests permitted per second (Default: ``None``)
+    :type requests_per_second: int, float, None
+    :param burst: The maximum number of requests that can be made at once (Default: ``requests_per_second``)
+    :type burst: int, float, None
+    :param shared_file: The path to a SQLite database file used to share the rate limit across processes (Optional)
+    :type shared_file: str, None
+    :param bucket_name: The name of the shared bucket within the database file (Default: ``default``)
+    :type bucket_name: str
+    :returns: None
+    :raises: :py:exc:`ValueError`
+    """
+    client = get_client()
+    if not requests_per_second:
+        client.rate_limiter = None
+    elif shared_file:
+        client.rate_limiter = SharedTokenBucket(requests_per_second, burst, shared_file, bucket_name)
+    else:
+        client.rate_limiter = TokenBucket(requests_per_second, burst)
+    return
+
+
+def set_response_cache(max_size=1024, default_ttl=300.0, endpoint_ttls=None):
+    """This function enables (or disables) the in-process cache of successful GET responses.
+
+    .. versionadded:: 3.3.0
+
+    .. note:: Cached responses for a resource are invalidated whenever a PUT, POST or DELETE request is performed
+              against that resource. Supplying ``None`` (or ``0``) for the ``max_size`` value disables the cache.
+
+    :param max_size: The maximum number of responses to cache before evicting the least recently used entry
+                     (Default: ``1024``)
+    :type max_size: int, None
+    :param default_ttl: The number of seconds that a cached response remains valid (Default: ``300.0``)
+    :type default_ttl: int, float
+    :param endpoint_ttls: A mapping of endpoint names to their TTL in seconds (e.g. ``{'people': 900, 'search': 0}``)
+    :type endpoint_ttls: dict, None
+    :returns: None
+    :raises: :py:exc:`ValueError`
+    """
+    get_client().response_cache = ResponseCache(max_size, default_ttl, endpoint_ttls) if max_size else None
+    return
+
+
+def set_persistent_cache(file_path=None, max_entries=None):
+    """This function enables (or disables) the persistent on-disk cache which revalidates GET responses using
+       conditional requests.
+
+    .. versionadded:: 3.3.0
+
+    .. note:: Stored responses are always revalidated with the API using the ``If-None-Match`` and
+              ``If-Modified-Since`` headers, and the stored body is only used when the API returns a ``304``
+              response. Supplying ``None`` for the ``file_path`` value disables the persistent cache.
+
+    :param file_path: The path to the SQLite database file used to store the responses (Optional)
+    :type file_path: str, None
+    :param max_entries: The maximum number of responses to store, or ``None`` for no limit (Default: ``None``)
+    :type max_entries: int, None
+    :returns: None
+    :raises: :py:exc:`sqlite3.Error`
+    """
+    get_client().persistent_cache = PersistentResponseCache(file_path, max_entries) if file_path else None
+    return
+
+
+def set_request_coalescing(enabled=True):
+    """This function enables (or disables) the coalescing of concurrent identical GET requests.
+
+    .. versionadded:: 3.3.0
+
+    .. note:: Request coalescing is enabled by default. While a GET request is in flight, any other thread that
+              requests the same normalized URL with the same credentials waits for that request and receives the
+              same response rather than sending a duplicate request to the API.
+
+    :param enabled: Determines if concurrent identical GET requests should be coalesced (``True`` by default)
+    :type enabled: bool
+    :returns: None
+    """
+    client = get_client()
+    if not enabled:
+        client.in_flight_requests = None
+    elif client.in_flight_requests is None:
+        client.in_flight_requests = SingleFlight()
+    return
+
+
+def get_coalescing_stats():
+    """This function returns the number of GET requests performed and the number of callers that shared them.
+
+    .. versionadded:: 3.3.0
+
+    :returns: A dictionary with the ``calls``, ``shared`` and ``in_flight`` statistics (or an empty dictionary if
+              request coalescing is disabled)
+    """
+    in_flight_requests = get_client().in_flight_requests
+    return in_flight_requests.get_stats() if in_flight_requests is not None else {}
+
+
+def get_cache_stats(persistent=False):
+    """This function returns the statistics for the response cache or the persistent cache.
+
+    .. versionadded:: 3.3.0
+
+    :param persistent: Determines if the statistics for the persistent cache should be returned (``False`` by default)
+    :type persistent: bool
+    :returns: A dictionary of cache statistics (or an empty dictionary if the cache is not enabled)
+    """
+    client = get_client()
+    cache = client.persistent_cache if persistent else client.response_cache
+    return cache.get_stats() if cache is not None else {}
+
+
+def clear_response_cache(persistent=False):
+    """This function removes every response from the response cache and optionally the persistent cache.
+
+    .. versionadded:: 3.3.0
+
+    :param persistent: Determines if the persistent cache should also be cleared (``False`` by default)
+    :type persistent: bool
+    :returns: None
+    """
+    client = get_client()
+    if client.response_cache is not None:
+        client.response_cache.clear()
+    if persistent and client.persistent_cache is not None:
+        client.persistent_cache.clear()
+    return
+
+
+def add_request_hook(callback, stage='post'):
+    """This function registers a callback which is called before or after every API request.
+
+    .. versionadded:: 3.3.0
+
+    Each callback is called with a single dictionary containing the ``method``, ``url`` and ``endpoint`` (i.e. the
+    endpoint template such as ``people/{id}``) of the request. The dictionary passed to the ``post`` callbacks also
+    contains the ``status`` code of the final response (or ``None`` if no response was received), the number of
+    response ``bytes``, the number of ``retries``, the ``duration`` in seconds including any retries and the
+    ``error`` message when the request failed without a response. Exceptions raised by a callback are reported to
+    ``stderr`` and do not interrupt the request. Responses served from the response cache do not call the hooks.
+
+    :param callback: The function to call with the request information
+    :type callback: function
+    :param stage: Determines if the callback is called before (``pre``) or after (``post``) the request
+    :type stage: str
+    :returns: None
+    :raises: :py:exc:`ValueError`
+    """
+    if stage not in request_hooks:
+        raise ValueError(f"The stage '{stage}' is not valid. (Valid stages: {', '.join(request_hooks)})")
+    request_hooks[stage].append(callback)
+    return
+
+
+def remove_request_hook(callback, stage=None):
+    """This function unregisters a callback that was registered with :py:func:`khorosjx.core.add_request_hook`.
+
+    .. versionadded:: 3.3.0
+
+    :param callback: The function that was registered
+    :type callback: function
+    :param stage: The stage from which to remove the callback (Default: all stages)
+    :type stage: str, None
+    :returns: None
+    """
+    for hook_stage, callbacks in request_hooks.items():
+        if stage in (None, hook_stage):
+            while callback in callbacks:
+                callbacks.remove(callback)
+    return
+
+
+def clear_request_hooks():
+    """This function unregisters all of the request callbacks.
+
+    .. versionadded:: 3.3.0
+
+    :returns: None
+    """
+    for callbacks in request_hooks.values():
+        callbacks.clear()
+    return
+
+
+def enable_request_metrics(enabled=True):
+    """This function enables or disables the built-in per-endpoint request metrics.
+
+    .. versionadded:: 3.3.0
+
+    :param enabled: Determines if the request metrics should be collected (``True`` by default)
+    :type enabled: bool
+    :returns: None
+    """
+    global metrics_enabled
+    metrics_enabled = enabled
+    return
+
+
+def get_request_metrics(reset=False):
+    """This function returns a snapshot of the request counts, errors, retries, bytes and latency percentiles for
+       each endpoint.
+
+    .. versionadded:: 3.3.0
+
+    :param reset: Determines if the metrics should be reset after the snapshot is taken (``False`` by default)
+    :type reset: bool
+    :returns: A dictionary mapping each ``METHOD endpoint`` string (e.g. ``GET people/{id}``) to a dictionary with
+              the ``requests``, ``errors``, ``retries``, ``bytes``, ``statuses`` and ``mean_ms``, ``min_ms``,
+              ``p50_ms``, ``p95_ms``, ``p99_ms``, ``max_ms`` and ``total_ms`` latency values in milliseconds
+    """
+    return request_metrics.snapshot(reset)
+
+
+def reset_request_metrics():
+    """This function clears the built-in request metrics.
+
+    .. versionadded:: 3.3.0
+
+    :returns: None
+    """
+    request_metrics.reset()
+    return
+
+
+def _call_request_hooks(_stage, _event):
+    """This function calls the registered callbacks for a stage, reporting any exceptions they raise.
+
+    .. versionadded:: 3.3.0
+
+    :param _stage: The stage of the callbacks to call (``pre`` or ``post``)
+    :type _stage: str
+    :param _event: The request information passed to each callback
+    :type _event: dict
+    :returns: None
+    """
+    for _callback in tuple(request_hooks[_stage]):
+        try:
+            _callback(_event)
+        except Exception as _exc:
+            eprint(f"The {_stage}-request hook {getattr(_callback, '__name__', _callback)} failed with the "
+                   f"following exception: {type(_exc).__name__} - {_exc}")
+    return
+
+
+def _start_request_event(_method, _url):
+    """This function creates the information for an API request and calls the ``pre`` request callbacks.
+
+    .. versionadded:: 3.3.0
+
+    :param _method: The HTTP method for the request (e.g. ``GET``)
+    :type _method: str
+    :param _url: The absolute URL to be requested
+    :type _url: str
+    :returns: A dictionary with the request information or ``None`` if the request is not being instrumented
+    """
+    if not (metrics_enabled or request_hooks['pre'] or request_hooks['post']):
+        return None
+    _event = {'method': _method, 'url': _url, 'endpoint': get_endpoint_template(_url), 'start': time.monotonic()}
+    if request_hooks['pre']:
+        _call_request_hooks('pre', _event)
+    return _event
+
+
+def _finish_request_event(_event, _response=None, _retries=0, _error=None):
+    """This function records the outcome of an API request and calls the ``post`` request callbacks.
+
+    .. versionadded:: 3.3.0
+
+    :param _event: The request information from :py:func:`khorosjx.core._start_request_event`
+    :type _event: dict, None
+    :param _response: The final API response or ``None`` if no response was received
+    :type _response: class, None
+    :param _retries: The number of retries that were performed
+    :type _retries: int
+    :param _error: The error message if the request failed without a response (Optional)
+    :type _error: str, None
+    :returns: None
+    """
+    if _event is None:
+        return
+    _event['duration'] = time.monotonic() - _event.pop('start')
+    _event['status'] = _response.status_code if _response is not None else None
+    _event['bytes'] = len(_response.content or b'') if _response is not None else 0
+    _event['retries'], _event['error'] = _retries, _error
+    if metrics_enabled:
+        request_metrics.record(_event['method'], _event['endpoint'], _event['duration'], _event['status'],
+                               _event['bytes'], _retries, _error)
+    if request_hooks['post']:
+        _call_request_hooks('post', _event)
     return
 
 
 def verify_connection():
     """This function verifies that the base URL and API credentials have been defined.
 
+    .. versionchanged:: 3.3.0
+       The connection information of the active :py:class:`khorosjx.core.Client` object is now verified.
+
     .. versionchanged:: 3.1.0
        Refactored the function to be more pythonic and to avoid depending on a try/except block.
 
@@ -116,7 +1038,8 @@ def verify_connection():
     :raises: :py:exc:`khorosjx.errors.exceptions.KhorosJXError`,
              :py:exc:`khorosjx.errors.exceptions.NoCredentialsError`
     """
-    if not base_url or not api_credentials:
+    client = get_client()
+    if not client.base_url or not client.api_credentials:
         raise errors.exceptions.NoCredentialsError()
     return
 
@@ -124,16 +1047,23 @@ def verify_connection():
 def get_connection_info():
     """This function returns the connection information (Base URL and API credentials) to use in other modules.
 
+    .. versionchanged:: 3.3.0
+       The connection information of the active :py:class:`khorosjx.core.Client` object is now returned.
+
     :returns: Base URL in string format and API credentials within a tuple
     """
     # Verify that the connection has been established and then return the information
     verify_connection()
-    return base_url, api_credentials
+    client = get_client()
+    return client.base_url, client.api_credentials
 
 
 def get_api_info(api_filter="none", verify_ssl=True):
     """This function obtains the API version information for a Jive environment.
 
+    .. versionchanged:: 3.3.0
+       The request is now performed using the shared HTTP session from :py:func:`khorosjx.core.get_session`.
+
     .. versionchanged:: 2.6.0
        Added the ``verify_ssl`` argument.
 
@@ -147,10 +1077,10 @@ def get_api_info(api_filter="none", verify_ssl=True):
     verify_connection()
 
     # Get the query URL to use in the API call
-    query_url = f"{base_url.split('/api')[0]}/api/version"
+    query_url = f"{get_client().base_url.split('/api')[0]}/api/version"
 
     # Perform GET request to obtain the version information
-    response = requests.get(query_url, verify=verify_ssl)
+    response = get_session().get(query_url, verify=verify_ssl, timeout=_get_request_timeout(get_remaining_time()))
     api_data = response.json()
 
     # Define the return filters
@@ -239,6 +1169,7 @@ def ensure_absolute_url(query_url):
     :returns: The query URL that includes a top-level domain
     :raises: :py:exc:`TypeError`
     """
+    base_url = get_client().base_url
     if not base_url:
         raise errors.exceptions.MissingBaseUrlError()
     if query_url and not query_url.startswith('http'):
@@ -246,8 +1177,314 @@ def ensure_absolute_url(query_url):
     return query_url
 
 
-def get_request_with_retries(query_url, return_json=False, verify_ssl=True):
-    """This function performs a GET request with a total of 5 retries in case of timeouts or connection issues.
+def _invalidate_cached_responses(_url):
+    """This function removes any cached responses for a resource that has been modified.
+
+    .. versionadded:: 3.3.0
+
+    :param _url: The URL of the resource that was modified
+    :type _url: str
+    :returns: None
+    """
+    _client = get_client()
+    for _cache in (_client.response_cache, _client.persistent_cache):
+        if _cache is not None:
+            _cache.invalidate(_url)
+    return
+
+
+def _is_cacheable_response(_response):
+    """This function determines if a GET response may be stored in the response caches.
+
+    .. versionadded:: 3.3.0
+
+    :param _response: The API response
+    :returns: Boolean value indicating whether or not the response is a successful JSON response
+    """
+    return _response.status_code == 200 and 'json' in _response.headers.get('Content-Type', '')
+
+
+def _create_response(_url, _status_code, _headers, _content):
+    """This function constructs a response object for data that was not retrieved by a direct API request.
+
+    .. versionadded:: 3.3.0
+
+    :param _url: The URL of the resource
+    :type _url: str
+    :param _status_code: The HTTP status code of the response
+    :type _status_code: int
+    :param _headers: The headers of the response
+    :type _headers: dict
+    :param _content: The body of the response
+    :type _content: bytes
+    :returns: The response as a :py:class:`requests.Response` object
+    """
+    _response = requests.Response()
+    _response.status_code, _response.url = _status_code, _url
+    _response.reason = http.client.responses.get(_status_code, '')
+    _response.headers = CaseInsensitiveDict(_headers)
+    _response._content = _content
+    _response.encoding = requests.utils.get_encoding_from_headers(_response.headers)
+    return _response
+
+
+def _get_with_revalidation(_url, _verify_ssl=True, _retry_policy=None):
+    """This function performs a conditional GET request using the persistent cache and returns the stored response
+       when the API confirms it has not been modified.
+
+    .. versionadded:: 3.3.0
+
+    :param _url: The absolute URL to be requested
+    :type _url: str
+    :param _verify_ssl: Determines if API calls should verify SSL certificates (``True`` by default)
+    :type _verify_ssl: bool
+    :param _retry_policy: The retry policy to use rather than the default :py:data:`khorosjx.core.retry_policy`
+    :type _retry_policy: :py:class:`khorosjx.utils.retry.RetryPolicy`, None
+    :returns: The API response
+    :raises: :py:exc:`khorosjx.errors.exceptions.APIConnectionError`
+    """
+    _cache = get_client().persistent_cache
+    _conditional_headers = _cache.get_conditional_headers(_url)
+    _response = _request_with_retries('GET', _url, _verify_ssl, _retry_policy, headers=_conditional_headers)
+    if _response.status_code == 304 and _conditional_headers:
+        _entry = _cache.mark_revalidated(_url)
+        if _entry is not None:
+            _cached_response = _create_response(_response.url, 200, _entry['headers'], _entry['body'])
+            _cached_response.request, _cached_response.elapsed = _response.request, _response.elapsed
+            _response = _cached_response
+    elif _is_cacheable_response(_response):
+        _cache.set(_url, _response.headers, _response.content)
+    return _response
+
+
+def _wait_for_rate_limit(_rate_limiter, _method, _url, _event=None, _attempt=0):
+    """This function waits for a token from the client-side rate limiter before an API request is attempted.
+
+    .. versionadded:: 3.3.0
+
+    :param _rate_limiter: The rate limiter of the active client
+    :type _rate_limiter: :py:class:`khorosjx.utils.rate_limit.TokenBucket`
+    :param _method: The HTTP method for the request (e.g. ``GET``)
+    :type _method: str
+    :param _url: The URL being requested
+    :type _url: str
+    :param _event: The event dictionary for the request (Optional)
+    :type _event: dict, None
+    :param _attempt: The number of retries that were performed
+    :type _attempt: int
+    :returns: None
+    :raises: :py:exc:`khorosjx.errors.exceptions.DeadlineExceededError`
+    """
+    _wait_time = _rate_limiter.reserve(get_remaining_time())
+    if _wait_time is None:
+        _raise_deadline_exceeded(_method, _url, _event, _attempt)
+    time.sleep(_wait_time)
+    return
+
+
+def _get_attempt_time(_method, _url, _event=None, _attempt=0):
+    """This function returns the time remaining before the deadline (if any) in which an attempt can be performed.
+
+    .. versionadded:: 3.3.0
+
+    :param _method: The HTTP method for the request (e.g. ``GET``)
+    :type _method: str
+    :param _url: The URL being requested
+    :type _url: str
+    :param _event: The event dictionary for the request (Optional)
+    :type _event: dict, None
+    :param _attempt: The number of retries that were performed
+    :type _attempt: int
+    :returns: The number of seconds remaining or ``None`` if no deadline has been defined
+    :raises: :py:exc:`khorosjx.errors.exceptions.DeadlineExceededError`
+    """
+    _remaining_time = get_remaining_time()
+    if _remaining_time is not None and _remaining_time <= 0:
+        _raise_deadline_exceeded(_method, _url, _event, _attempt)
+    return _remaining_time
+
+
+def _is_final_response(_policy, _method, _url, _response, _event=None, _attempt=0):
+    """This function invalidates the cached responses for a resource following a PUT, POST or DELETE request and
+       identifies whether or not a response should be returned without being retried.
+
+    .. versionadded:: 3.3.0
+
+    The request event is finished when the response is final.
+
+    :param _policy: The retry policy for the request
+    :type _policy: :py:class:`khorosjx.utils.retry.RetryPolicy`
+    :param _method: The HTTP method for the request (e.g. ``GET``)
+    :type _method: str
+    :param _url: The URL that was requested
+    :type _url: str
+    :param _response: The API response
+    :param _event: The event dictionary for the request (Optional)
+    :type _event: dict, None
+    :param _attempt: The number of retries that were performed
+    :type _attempt: int
+    :returns: Boolean value indicating if the response does not have a retryable status code
+    """
+    if _method != 'GET':
+        _invalidate_cached_responses(_url)
+    if _policy.is_retryable_status(_response.status_code, _method):
+        return False
+    _finish_request_event(_event, _response, _attempt)
+    return True
+
+
+def _get_retry_delay(_policy, _method, _url, _response, _error_msg, _start_time, _event=None, _attempt=0):
+    """This function returns the number of seconds to wait before a failed API request is retried.
+
+    .. versionadded:: 3.3.0
+
+    When the request should not be retried the request event is finished, and an exception is raised unless a
+    response was received. An exception is also raised when the retry could not start before the deadline (if any).
+
+    :param _policy: The retry policy for the request
+    :type _policy: :py:class:`khorosjx.utils.retry.RetryPolicy`
+    :param _method: The HTTP method for the request (e.g. ``GET``)
+    :type _method: str
+    :param _url: The URL that was requested
+    :type _url: str
+    :param _response: The API response or ``None`` if the request failed with an exception
+    :param _error_msg: The message describing why the request failed
+    :type _error_msg: str
+    :param _start_time: The :py:func:`time.monotonic` value when the first attempt was started
+    :type _start_time: float
+    :param _event: The event dictionary for the request (Optional)
+    :type _event: dict, None
+    :param _attempt: The number of retries that were performed
+    :type _attempt: int
+    :returns: The number of seconds to wait or ``None`` if the response should be returned without a retry
+    :raises: :py:exc:`khorosjx.errors.exceptions.APIConnectionError`,
+             :py:exc:`khorosjx.errors.exceptions.DeadlineExceededError`
+    """
+    _delay = _policy.get_delay(_attempt, _response, time.monotonic() - _start_time)
+    if _delay is None:
+        if _response is not None:
+            _finish_request_event(_event, _response, _attempt)
+            return None
+        _finish_request_event(_event, None, _attempt, _error_msg)
+        _failure_msg = f"The {_method} request was unable to complete successfully after {_attempt + 1} " + \
+                       "attempt(s) due to API timeouts and/or failures. Please call the function again or " + \
+                       "contact Khoros Support."
+        raise errors.exceptions.APIConnectionError(_failure_msg)
+    _remaining_time = get_remaining_time()
+    if _remaining_time is not None and _delay >= _remaining_time:
+        _raise_deadline_exceeded(_method, _url, _event, _attempt)
+    return _delay
+
+
+def _request_with_retries(_method, _url, _verify_ssl=True, _retry_policy=None, **_kwargs):
+    """This function performs an API request and retries it according to a retry policy, waiting for the client-side
+       rate limit (if defined) before each attempt and invalidating any cached responses for the resource following
+       a PUT, POST or DELETE request.
+
+    .. versionadded:: 3.3.0
+
+    The request is recorded in the request metrics and passed to any request hooks once it has completed. Each
+    attempt is performed with the connect and read timeouts of the active client, and when a deadline has been
+    defined with :py:func:`khorosjx.core.request_deadline` the timeouts are shortened to the time remaining and no
+    attempt or retry is started that cannot complete before the deadline.
+
+    :param _method: The HTTP method for the request (e.g. ``GET``)
+    :type _method: str
+    :param _url: The absolute URL to be requested
+    :type _url: str
+    :param _verify_ssl: Determines if API calls should verify SSL certificates (``True`` by default)
+    :type _verify_ssl: bool
+    :param _retry_policy: The retry policy to use rather than the default :py:data:`khorosjx.core.retry_policy`
+    :type _retry_policy: :py:class:`khorosjx.utils.retry.RetryPolicy`, None
+    :returns: The API response (which may still have a retryable status code once the retries are exhausted)
+    :raises: :py:exc:`khorosjx.errors.exceptions.APIConnectionError`,
+             :py:exc:`khorosjx.errors.exceptions.DeadlineExceededError`
+    """
+    _client = get_client()
+    _policy = _retry_policy or _client.retry_policy
+    _start_time, _attempt = time.monotonic(), 0
+    _event = _start_request_event(_method, _url)
+    while True:
+        _response = None
+        if _client.rate_limiter is not None:
+            _wait_for_rate_limit(_client.rate_limiter, _method, _url, _event, _attempt)
+        _remaining_time = _get_attempt_time(_method, _url, _event, _attempt)
+        try:
+            _response = get_session().request(_method, _url, verify=_verify_ssl,
+                                              timeout=_get_request_timeout(_remaining_time), **_kwargs)
+            if _is_final_response(_policy, _method, _url, _response, _event, _attempt):
+                return _response
+            _error_msg = f"The {_method} request returned a {_response.status_code} status code."
+        except requests.exceptions.RequestException as _exc:
+            _exc_type = type(_exc).__name__
+            _error_msg = f"The {_method} request failed with the following exception: {_exc_type} - {_exc}"
+
+        # Determine if and when the request should be retried
+        _delay = _get_retry_delay(_policy, _method, _url, _response, _error_msg, _start_time, _event, _attempt)
+        if _delay is None:
+            return _response
+        _attempt += 1
+        print(f"{_error_msg} Retrying in {_delay:.1f} seconds. (Retry {_attempt} of {_policy.max_retries})")
+        time.sleep(_delay)
+
+
+def _get_coalesced_response(_query_url, _verify_ssl, _get_function):
+    """This function performs a GET request unless an identical request is already in flight, in which case it
+       waits for that request and returns its response.
+
+    .. versionadded:: 3.3.0
+
+    Requests are identical when they have the same normalized URL, credentials and ``verify_ssl`` value. A caller
+    that is waiting for another caller's request is bound by its own deadline (if any), and performs the request
+    itself if the other caller's deadline expired before the request could be completed.
+
+    :param _query_url: The absolute URL to be queried
+    :type _query_url: str
+    :param _verify_ssl: Determines if API calls should verify SSL certificates (``True`` by default)
+    :type _verify_ssl: bool
+    :param _get_function: Function that accepts no arguments and performs the GET request
+    :type _get_function: function
+    :returns: The API response from the GET request
+    :raises: :py:exc:`khorosjx.errors.exceptions.APIConnectionError`,
+             :py:exc:`khorosjx.errors.exceptions.DeadlineExceededError`
+    """
+    _client = get_client()
+    if _client.in_flight_requests is None:
+        return _get_function()
+
+    # Return rather than raise the deadline exception so that waiting callers can identify whose deadline expired
+    def _get_response_or_deadline_error():
+        try:
+            return _get_function()
+        except errors.exceptions.DeadlineExceededError as _exc:
+            return _exc
+
+    _key = (normalize_url(_query_url), _client.api_credentials, _verify_ssl)
+    try:
+        _response, _shared = _client.in_flight_requests.do(_key, _get_response_or_deadline_error,
+                                                           get_remaining_time())
+    except TimeoutError:
+        _raise_deadline_exceeded('GET', _query_url)
+    if isinstance(_response, errors.exceptions.DeadlineExceededError):
+        _remaining_time = get_remaining_time()
+        if _shared and (_remaining_time is None or _remaining_time > 0):
+            return _get_function()
+        raise _response
+    return _response
+
+
+def get_request_with_retries(query_url, return_json=False, verify_ssl=True, retry_policy=None, use_cache=True):
+    """This function performs a GET request and retries it in case of timeouts, connection issues or retryable
+       status codes.
+
+    .. versionchanged:: 3.3.0
+       The request is now performed using the shared HTTP session from :py:func:`khorosjx.core.get_session` and is
+       retried with exponential backoff according to a retry policy. Successful JSON responses are also served
+       from the response cache when it has been enabled with :py:func:`khorosjx.core.set_response_cache` and
+       revalidated using conditional requests when the persistent cache has been enabled with
+       :py:func:`khorosjx.core.set_persistent_cache`. Concurrent identical requests are coalesced into a single
+       API request unless disabled with :py:func:`khorosjx.core.set_request_coalescing`. The ``retry_policy`` and
+       ``use_cache`` arguments were also added.
 
     .. versionchanged:: 3.2.0
        The query URL is now made into an absolute URL as necessary before performing the API request.
@@ -264,6 +1501,10 @@ def get_request_with_retries(query_url, return_json=False, verify_ssl=True):
     :type return_json: bool
     :param verify_ssl: Determines if API calls should verify SSL certificates (``True`` by default)
     :type verify_ssl: bool
+    :param retry_policy: The retry policy to use rather than the default :py:data:`khorosjx.core.retry_policy`
+    :type retry_policy: :py:class:`khorosjx.utils.retry.RetryPolicy`, None
+    :param use_cache: Determines if the response cache (when enabled) should be used (``True`` by default)
+    :type use_cache: bool
     :returns: The API response from the GET request (optionally in JSON format)
     :raises: :py:exc:`ValueError`, :py:exc:`TypeError`, :py:exc:`khorosjx.errors.exceptions.APIConnectionError`
     """
@@ -273,21 +1514,20 @@ def get_request_with_retries(query_url, return_json=False, verify_ssl=True):
     # Prepare the query URL
     query_url = ensure_absolute_url(query_url)
 
-    # Perform the GET request
-    retries, response = 0, None
-    while retries <= 5:
-        try:
-            response = requests.get(query_url, auth=api_credentials, verify=verify_ssl)
-            break
-        except Exception as e:
-            current_attempt = f"(Attempt {retries} of 5)"
-            error_msg = f"The GET request failed with the exception below. {current_attempt}"
-            print(f"{error_msg}\n{e}\n")
-            retries += 1
-    if retries == 6:
-        failure_msg = "The API call was unable to complete successfully after five consecutive API timeouts " + \
-                      "and/or failures. Please call the function again or contact Khoros Support."
-        raise errors.exceptions.APIConnectionError(failure_msg)
+    # Check the response cache (if enabled) before performing the GET request
+    client = get_client()
+    cache = client.response_cache if use_cache else None
+    response = cache.get(query_url) if cache is not None else None
+    if response is None:
+        def _get_response():
+            if use_cache and client.persistent_cache is not None:
+                _response = _get_with_revalidation(query_url, verify_ssl, retry_policy)
+            else:
+                _response = _request_with_retries('GET', query_url, verify_ssl, retry_policy)
+            if cache is not None and _is_cacheable_response(_response):
+                cache.set(query_url, _response)
+            return _response
+        response = _get_coalesced_response(query_url, verify_ssl, _get_response)
 
     # Convert to JSON if specified
     response = response.json() if return_json else response
@@ -297,6 +1537,10 @@ def get_request_with_retries(query_url, return_json=False, verify_ssl=True):
 def get_base_url(api_base=True):
     """This function returns the base URL of the environment with or without the ``/api/core/v3/`` path appended.
 
+    .. versionchanged:: 3.3.0
+       The base URL of the active :py:class:`khorosjx.core.Client` object is returned, and the stored base URL is no
+       longer replaced with the domain URL when the ``api_base`` argument is ``False``.
+
     .. versionchanged:: 3.1.0
        Refactored the function to properly utilize the ``base_url`` global variable.
 
@@ -305,8 +1549,7 @@ def get_base_url(api_base=True):
     :returns: The base URL for the Khoros JX or Jive-n environment
     """
     verify_connection()
-    global base_url
-    base_url = '' if not base_url else base_url
+    base_url = get_client().base_url
     if not api_base:
         base_url = base_url.split('/api')[0]
     return base_url
@@ -333,7 +1576,7 @@ def get_query_url(pre_endpoint, asset_id="", post_endpoint=""):
     # Construct and return the query URL
     if pre_endpoint[-1:] == '/':
         pre_endpoint = pre_endpoint[:-1]
-    query_url = f"{base_url}/{pre_endpoint}"
+    query_url = f"{get_client().base_url}/{pre_endpoint}"
     for section in (asset_id, post_endpoint):
         if not isinstance(section, str):
             section = str(section)
@@ -345,10 +1588,76 @@ def get_query_url(pre_endpoint, asset_id="", post_endpoint=""):
     return query_url
 
 
+def _get_data_query_url(_endpoint, _lookup_value, _identifier='id', _ignore_exceptions=False, _all_fields=False):
+    """This function constructs the query URL used to retrieve data for a specific API endpoint.
+
+    .. versionadded:: 3.3.0
+
+    :param _endpoint: The API endpoint against which to request data (e.g. ``people``, ``contents``, etc.)
+    :type _endpoint: str
+    :param _lookup_value: The value to use to look up the endpoint data
+    :type _lookup_value: int, str
+    :param _identifier: The type of lookup value used to look up the endpoint data (Default: ``id``)
+    :type _identifier: str
+    :param _ignore_exceptions: Determines whether nor not exceptions should be ignored (Default: ``False``)
+    :type _ignore_exceptions: bool
+    :param _all_fields: Determines whether or not the ``fields=@all`` query should be included (Default: ``False``)
+    :type _all_fields: bool
+    :returns: The query URL
+    :raises: :py:exc:`khorosjx.errors.exceptions.InvalidEndpointError`,
+             :py:exc:`khorosjx.errors.exceptions.InvalidLookupTypeError`
+    """
+    # Define the endpoint if an appropriate one is supplied
+    _available_endpoints = ['abuseReports', 'acclaim', 'actions', 'activities', 'addOns', 'announcements',
+                            'attachments', 'calendar', 'checkpoints', 'collaborations', 'comments', 'contents',
+                            'deletedObjects', 'dms', 'events', 'eventTypes', 'executeBatch', 'extprops',
+                            'extstreamDefs', 'extstreams', 'ideaVotes', 'images', 'inbox', 'invites', 'members',
+                            'mentions', 'messages', 'moderation', 'oembed', 'outcomes', 'pages', 'people', 'places',
+                            'placeTemplateCategories', 'placeTemplates', 'placeTopics', 'profileImages',
+                            'publications', 'questions', 'rsvp', 'search', 'sections', 'securityGroups', 'shares',
+                            'slides', 'stages', 'statics', 'streamEntries', 'streams', 'tags', 'tileDefs', 'tiles',
+                            'urls', 'versions', 'videos', 'vitals', 'votes', 'webhooks'
+                            ]
+    _query_url = f"{get_client().base_url}/{_endpoint}" if _endpoint in _available_endpoints else None
+    if not _query_url:
+        raise errors.exceptions.InvalidEndpointError()
+
+    # Define the identifier type for the lookup value
+    if _identifier == "id":
+        _query_url += f"/{_lookup_value}"
+    elif _identifier == "email" or _identifier == "username":
+        _invalid_endpoint_msg = f"The identifier '{_identifier}' is only accepted with the people endpoint."
+        if _endpoint != "people":
+            raise errors.exceptions.InvalidLookupTypeError(_invalid_endpoint_msg)
+        else:
+            if _identifier == "email":
+                _query_url += f"/email/{_lookup_value}"
+            elif _identifier == "username":
+                _query_url += f"/username/{_lookup_value}"
+    else:
+        _unrecognized_endpoint_msg = f"The identifier '{_identifier}' is unrecognized."
+        if not _ignore_exceptions:
+            raise errors.exceptions.InvalidLookupTypeError(_unrecognized_endpoint_msg)
+        _unrecognized_endpoint_retry_msg = f"{_unrecognized_endpoint_msg} " + \
+                                           "The function will attempt to use the default 'id' identifier."
+        eprint(_unrecognized_endpoint_retry_msg)
+        _query_url += f"/{_lookup_value}"
+
+    # Append the fields=@all query if requested
+    if _all_fields:
+        _query_url += "?fields=@all"
+    return _query_url
+
+
 def get_data(endpoint, lookup_value, identifier='id', return_json=False, ignore_exceptions=False, all_fields=False,
-             verify_ssl=True):
+             verify_ssl=True, use_cache=True):
     """This function returns data for a specific API endpoint.
 
+    .. versionchanged:: 3.3.0
+       The query URL is now constructed by the private :py:func:`khorosjx.core._get_data_query_url` function and
+       the base query URL is no longer duplicated when the ``all_fields`` argument is ``False``. The ``use_cache``
+       argument was also added.
+
     .. versionchanged:: 3.1.0
        Fixed how the ``query_url`` variable is defined to proactively avoid raising any :py:exc:`NameError` exceptions.
 
@@ -369,53 +1678,19 @@ def get_data(endpoint, lookup_value, identifier='id', return_json=False, ignore_
     :type all_fields: bool
     :param verify_ssl: Determines if API calls should verify SSL certificates (``True`` by default)
     :type verify_ssl: bool
+    :param use_cache: Determines if the response cache (when enabled) should be used (``True`` by default)
+    :type use_cache: bool
     :returns: The API response either as a requests response or in JSON format depending on the ``return_json`` value
     :raises: :py:exc:`khorosjx.errors.exceptions.GETRequestError`
     """
     # Verify that the connection has been established
     verify_connection()
 
-    # Define the endpoint if an appropriate one is supplied
-    available_endpoints = ['abuseReports', 'acclaim', 'actions', 'activities', 'addOns', 'announcements', 'attachments',
-                           'calendar', 'checkpoints', 'collaborations', 'comments', 'contents', 'deletedObjects', 'dms',
-                           'events', 'eventTypes', 'executeBatch', 'extprops', 'extstreamDefs', 'extstreams',
-                           'ideaVotes', 'images', 'inbox', 'invites', 'members', 'mentions', 'messages', 'moderation',
-                           'oembed', 'outcomes', 'pages', 'people', 'places', 'placeTemplateCategories',
-                           'placeTemplates', 'placeTopics', 'profileImages', 'publications', 'questions', 'rsvp',
-                           'search', 'sections', 'securityGroups', 'shares', 'slides', 'stages', 'statics',
-                           'streamEntries', 'streams', 'tags', 'tileDefs', 'tiles', 'urls', 'versions', 'videos',
-                           'vitals', 'votes', 'webhooks'
-                           ]
-    query_url = f"{base_url}/{endpoint}" if endpoint in available_endpoints else None
-    if not query_url:
-        raise errors.exceptions.InvalidEndpointError()
-
-    # Define the identifier type for the lookup value
-    if identifier == "id":
-        query_url += f"/{lookup_value}"
-    elif identifier == "email" or identifier == "username":
-        invalid_endpoint_msg = f"The identifier '{identifier}' is only accepted with the people endpoint."
-        if endpoint != "people":
-            raise errors.exceptions.InvalidLookupTypeError(invalid_endpoint_msg)
-        else:
-            if identifier == "email":
-                query_url += f"/email/{lookup_value}"
-            elif identifier == "username":
-                query_url += f"/username/{lookup_value}"
-    else:
-        unrecognized_endpoint_msg = f"The identifier '{identifier}' is unrecognized."
-        if not ignore_exceptions:
-            raise errors.exceptions.InvalidLookupTypeError(unrecognized_endpoint_msg)
-        unrecognized_endpoint_retry_msg = f"{unrecognized_endpoint_msg} " + \
-                                          "The function will attempt to use the default 'id' identifier."
-        eprint(unrecognized_endpoint_retry_msg)
-        query_url += f"/{lookup_value}"
-
-    # Append the fields=@all query if requested
-    query_url += "?fields=@all" if all_fields else query_url
+    # Construct the query URL for the endpoint and lookup value
+    query_url = _get_data_query_url(endpoint, lookup_value, identifier, ignore_exceptions, all_fields)
 
     # Perform the GET request with retries to account for any timeouts
-    response = get_request_with_retries(query_url, verify_ssl=verify_ssl)
+    response = get_request_with_retries(query_url, verify_ssl=verify_ssl, use_cache=use_cache)
 
     # Error out if the response isn't successful
     if response.status_code != 200:
@@ -432,9 +1707,167 @@ def get_data(endpoint, lookup_value, identifier='id', return_json=False, ignore_
     return response
 
 
-def _api_request_with_payload(_url, _json_payload, _request_type, _verify_ssl=True):
+def _post_batch(_batch, _verify_ssl=True, _retry_policy=None):
+    """This function performs a single ``executeBatch`` API call and returns the responses mapped to their keys.
+
+    .. versionadded:: 3.3.0
+
+    :param _batch: A list of tuples containing the key, HTTP method and relative endpoint of each request
+    :type _batch: list
+    :param _verify_ssl: Determines if API calls should verify SSL certificates (``True`` by default)
+    :type _verify_ssl: bool
+    :param _retry_policy: The retry policy to use rather than the default :py:data:`khorosjx.core.retry_policy`
+    :type _retry_policy: :py:class:`khorosjx.utils.retry.RetryPolicy`, None
+    :returns: A dictionary mapping each key to a tuple with the status code and data of its response
+    :raises: :py:exc:`khorosjx.errors.exceptions.POSTRequestError`,
+             :py:exc:`khorosjx.errors.exceptions.APIConnectionError`
+    """
+    _payload = [{'key': _key, 'request': {'method': _method, 'endpoint': _endpoint}}
+                for _key, _method, _endpoint in _batch]
+
+    # The executeBatch call only reads data when every request is a GET request so it can be retried like one
+    if all(_method == 'GET' for _, _method, _ in _batch):
+        _retry_policy = (_retry_policy or get_client().retry_policy).copy(retry_non_idempotent=True)
+    _query_url = f"{get_client().base_url}/executeBatch"
+    _response = _api_request_with_payload(_query_url, _payload, 'post', _verify_ssl, _retry_policy)
+    if _response.status_code != 200:
+        _error_msg = f"The executeBatch request failed with a {_response.status_code} status code and the " + \
+                     f"following error: {_response.text}"
+        raise errors.exceptions.POSTRequestError(_error_msg)
+    _results = {}
+    for _item in _response.json():
+        _data = _item['data'] if 'data' in _item else _item.get('error')
+        _results[_item.get('key')] = (_item.get('status'), _data)
+    return _results
+
+
+def execute_batch(endpoints, method='GET', batch_size=None, max_workers=4, verify_ssl=True, retry_policy=None):
+    """This function performs many API requests by packing them into concurrent ``executeBatch`` API calls.
+
+    .. versionadded:: 3.3.0
+
+    :param endpoints: A dictionary mapping a unique key to the endpoint of each request relative to the base URL
+                      (e.g. ``{'jdoe': '/people/username/jdoe'}``), where the keys may be any hashable values
+                      (e.g. both ``1`` and ``'1'``) and are returned unchanged
+    :type endpoints: dict
+    :param method: The HTTP method used for every request in the batch (Default: ``GET``)
+    :type method: str
+    :param batch_size: The number of requests to include in each ``executeBatch`` call (Default:
+                       :py:data:`khorosjx.core.max_batch_size`)
+    :type batch_size: int, None
+    :param max_workers: The maximum number of ``executeBatch`` calls to perform concurrently (Default: ``4``)
+    :type max_workers: int
+    :param verify_ssl: Determines if API calls should verify SSL certificates (``True`` by default)
+    :type verify_ssl: bool
+    :param retry_policy: The retry policy to use rather than the default :py:data:`khorosjx.core.retry_policy`
+    :type retry_policy: :py:class:`khorosjx.utils.retry.RetryPolicy`, None
+    :returns: A dictionary mapping each key to a tuple with the status code and data of its response
+    :raises: :py:exc:`ValueError`, :py:exc:`khorosjx.errors.exceptions.POSTRequestError`,
+             :py:exc:`khorosjx.errors.exceptions.APIConnectionError`
+    """
+    # Verify that the connection has been established
+    verify_connection()
+
+    # Split the requests into batches no larger than the maximum batch size
+    batch_size = min(batch_size or max_batch_size, max_batch_size)
+    if batch_size < 1 or max_workers < 1:
+        raise ValueError("The batch_size and max_workers values must be at least one.")
+    # Identify each request in the payload by its position so that distinct keys with the same string do not collide
+    original_keys = list(endpoints)
+    requests_list = [(str(idx), method.upper(), endpoints[key]) for idx, key in enumerate(original_keys)]
+    batches = [requests_list[idx:idx + batch_size] for idx in range(0, len(requests_list), batch_size)]
+
+    # Perform the batches concurrently and map the responses back to the original keys
+    results = {}
+    if len(batches) > 1 and max_workers > 1:
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(batches))) as executor:
+            futures = [executor.submit(contextvars.copy_context().run, _post_batch, batch, verify_ssl, retry_policy)
+                       for batch in batches]
+            for future in futures:
+                results.update(future.result())
+    else:
+        for batch in batches:
+            results.update(_post_batch(batch, verify_ssl, retry_policy))
+    return {key: results.get(str(idx), (None, None)) for idx, key in enumerate(original_keys)}
+
+
+def get_data_many(endpoint, lookup_values, identifier='id', ignore_exceptions=False, all_fields=False,
+                  verify_ssl=True, use_cache=True, batch_size=None, max_workers=4):
+    """This function returns data for many lookup values of a specific API endpoint using ``executeBatch`` calls.
+
+    .. versionadded:: 3.3.0
+
+    :param endpoint: The API endpoint against which to request data (e.g. ``people``, ``contents``, etc.)
+    :type endpoint: str
+    :param lookup_values: The values to use to look up the endpoint data
+    :type lookup_values: list, tuple, set
+    :param identifier: The type of lookup value used to look up the endpoint data (Default: ``id``)
+    :type identifier: str
+    :param ignore_exceptions: Determines whether nor not exceptions should be ignored, in which case failed lookups
+                              are returned as empty dictionaries (Default: ``False``)
+    :type ignore_exceptions: bool
+    :param all_fields: Determines whether or not the ``fields=@all`` query should be included (Default: ``False``)
+    :type all_fields: bool
+    :param verify_ssl: Determines if API calls should verify SSL certificates (``True`` by default)
+    :type verify_ssl: bool
+    :param use_cache: Determines if the response cache (when enabled) should be used (``True`` by default)
+    :type use_cache: bool
+    :param batch_size: The number of lookups to include in each ``executeBatch`` call (Default:
+                       :py:data:`khorosjx.core.max_batch_size`)
+    :type batch_size: int, None
+    :param max_workers: The maximum number of ``executeBatch`` calls to perform concurrently (Default: ``4``)
+    :type max_workers: int
+    :returns: A dictionary mapping each lookup value (exactly as supplied) to its data in JSON format
+    :raises: :py:exc:`khorosjx.errors.exceptions.GETRequestError`,
+             :py:exc:`khorosjx.errors.exceptions.POSTRequestError`,
+             :py:exc:`khorosjx.errors.exceptions.InvalidEndpointError`,
+             :py:exc:`khorosjx.errors.exceptions.InvalidLookupTypeError`
+    """
+    # Verify that the connection has been established
+    verify_connection()
+
+    # Construct the query URLs and retrieve any responses already in the response cache
+    client = get_client()
+    cache = client.response_cache if use_cache else None
+    data, query_urls = {}, {}
+    for lookup_value in dict.fromkeys(lookup_values):
+        query_url = _get_data_query_url(endpoint, lookup_value, identifier, ignore_exceptions, all_fields)
+        cached_response = cache.get(query_url) if cache is not None else None
+        if cached_response is not None:
+            data[lookup_value] = cached_response.json()
+        else:
+            query_urls[lookup_value] = query_url
+
+    # Perform the remaining lookups in batches and store the successful responses in the response cache
+    endpoints = {lookup_value: query_url[len(client.base_url):] for lookup_value, query_url in query_urls.items()}
+    failures = []
+    for lookup_value, (status_code, lookup_data) in execute_batch(endpoints, 'GET', batch_size, max_workers,
+                                                                  verify_ssl).items():
+        if status_code == 200:
+            data[lookup_value] = lookup_data
+            if cache is not None:
+                cache.set(query_urls[lookup_value], _create_response(query_urls[lookup_value], 200, {
+                    'Content-Type': 'application/json'}, json.dumps(lookup_data).encode('utf-8')))
+        else:
+            failures.append(f"{lookup_value} ({status_code})")
+            data[lookup_value] = {}
+
+    # Report or raise an exception for any failed lookups
+    if failures:
+        error_msg = f"The {endpoint} lookup failed for the following values: {', '.join(map(str, failures))}"
+        if not ignore_exceptions:
+            raise errors.exceptions.GETRequestError(error_msg)
+        print(error_msg)
+    return {lookup_value: data[lookup_value] for lookup_value in dict.fromkeys(lookup_values)}
+
+
+def _api_request_with_payload(_url, _json_payload, _request_type, _verify_ssl=True, _retry_policy=None):
     """This function performs an API request while supplying a JSON payload.
 
+    .. versionchanged:: 3.3.0
+       The request is now performed using the shared HTTP session from :py:func:`khorosjx.core.get_session` and is
+       retried with exponential backoff according to a retry policy. The ``_retry_policy`` argument was also added.
+
     .. versionchanged:: 3.2.0
        The query URL is now made into an absolute URL as necessary before performing the API request.
 
@@ -452,44 +1885,32 @@ def _api_request_with_payload(_url, _json_payload, _request_type, _verify_ssl=Tr
     :type _request_type: str
     :param _verify_ssl: Determines if API calls should verify SSL certificates (``True`` by default)
     :type _verify_ssl: bool
+    :param _retry_policy: The retry policy to use rather than the default :py:data:`khorosjx.core.retry_policy`
+    :type _retry_policy: :py:class:`khorosjx.utils.retry.RetryPolicy`, None
     :returns: The API response
     :raises: :py:exc:`khorosjx.errors.exceptions.InvalidRequestTypeError`,
              :py:exc:`khorosjx.errors.exceptions.APIConnectionError`
     """
-    # Prepare the query URL
+    # Verify the request type and prepare the query URL
+    if _request_type.lower() not in ('put', 'post'):
+        raise errors.exceptions.InvalidRequestTypeError()
     _url = ensure_absolute_url(_url)
 
     # Perform the API request
-    _retries, _response = 0, None
-    while _retries <= 5:
-        try:
-            _headers = {"Content-Type": "application/json", "Accept": "application/json"}
-            if _request_type.lower() == "put":
-                _response = requests.put(_url, data=json.dumps(_json_payload, default=str), auth=api_credentials,
-                                         headers=_headers, verify=_verify_ssl)
-            elif _request_type.lower() == "post":
-                _response = requests.post(_url, data=json.dumps(_json_payload, default=str), auth=api_credentials,
-                                          headers=_headers, verify=_verify_ssl)
-            else:
-                raise errors.exceptions.InvalidRequestTypeError()
-            break
-        except Exception as _api_exception:
-            _exc_type = type(_api_exception).__name__
-            _current_attempt = f"(Attempt {_retries} of 5)"
-            _error_msg = f"The {_request_type.upper()} request has failed with the following exception: " + \
-                         f"{_exc_type} - {_api_exception} {_current_attempt}"
-            print(_error_msg)
-            _retries += 1
-            pass
-    if _retries == 6:
-        _failure_msg = "The script was unable to complete successfully after five consecutive API timeouts. " + \
-                       "Please run the script again or contact Khoros or Aurea Support for further assistance."
-        raise errors.exceptions.APIConnectionError(_failure_msg)
+    _headers = {"Content-Type": "application/json", "Accept": "application/json"}
+    _response = _request_with_retries(_request_type.upper(), _url, _verify_ssl, _retry_policy, headers=_headers,
+                                      data=json.dumps(_json_payload, default=str))
     return _response
 
 
-def post_request_with_retries(url, json_payload, verify_ssl=True):
-    """This function performs a POST request with a total of 5 retries in case of timeouts or connection issues.
+def post_request_with_retries(url, json_payload, verify_ssl=True, retry_policy=None):
+    """This function performs a POST request and retries it in case of timeouts, connection issues or retryable
+       status codes.
+
+    .. versionchanged:: 3.3.0
+       The request is now retried with exponential backoff according to a retry policy and the ``retry_policy``
+       argument was added. Unless the ``retry_non_idempotent`` value of the retry policy is ``True``, the request
+       is only retried when it raises a connection exception or returns a ``429`` status code.
 
     .. versionchanged:: 3.2.0
        The query URL is now made into an absolute URL as necessary before performing the API request.
@@ -503,17 +1924,25 @@ def post_request_with_retries(url, json_payload, verify_ssl=True):
     :type json_payload: dict
     :param verify_ssl: Determines if API calls should verify SSL certificates (``True`` by default)
     :type verify_ssl: bool
+    :param retry_policy: The retry policy to use rather than the default :py:data:`khorosjx.core.retry_policy`
+    :type retry_policy: :py:class:`khorosjx.utils.retry.RetryPolicy`, None
     :returns: The API response from the POST request
     :raises: :py:exc:`ValueError`, :py:exc:`khorosjx.errors.exceptions.APIConnectionError`,
              :py:exc:`khorosjx.errors.exceptions.POSTRequestError`
     """
     url = ensure_absolute_url(url)
-    response = _api_request_with_payload(url, json_payload, 'post', verify_ssl)
+    response = _api_request_with_payload(url, json_payload, 'post', verify_ssl, retry_policy)
     return response
 
 
-def put_request_with_retries(url, json_payload, verify_ssl=True):
-    """This function performs a PUT request with a total of 5 retries in case of timeouts or connection issues.
+def put_request_with_retries(url, json_payload, verify_ssl=True, retry_policy=None):
+    """This function performs a PUT request and retries it in case of timeouts, connection issues or retryable
+       status codes.
+
+    .. versionchanged:: 3.3.0
+       The request is now retried with exponential backoff according to a retry policy and the ``retry_policy``
+       argument was added. Unless the ``retry_non_idempotent`` value of the retry policy is ``True``, the request
+       is only retried when it raises a connection exception or returns a ``429`` status code.
 
     .. versionchanged:: 3.2.0
        The query URL is now made into an absolute URL as necessary before performing the API request.
@@ -527,18 +1956,24 @@ def put_request_with_retries(url, json_payload, verify_ssl=True):
     :type json_payload: dict
     :param verify_ssl: Determines if API calls should verify SSL certificates (``True`` by default)
     :type verify_ssl: bool
+    :param retry_policy: The retry policy to use rather than the default :py:data:`khorosjx.core.retry_policy`
+    :type retry_policy: :py:class:`khorosjx.utils.retry.RetryPolicy`, None
     :returns: The API response from the PUT request
     :raises: :py:exc:`ValueError`, :py:exc:`khorosjx.errors.exceptions.APIConnectionError`,
              :py:exc:`khorosjx.errors.exceptions.PUTRequestError`
     """
     url = ensure_absolute_url(url)
-    response = _api_request_with_payload(url, json_payload, 'put', verify_ssl)
+    response = _api_request_with_payload(url, json_payload, 'put', verify_ssl, retry_policy)
     return response
 
 
-def delete(uri, return_json=False, verify_ssl=True):
+def delete(uri, return_json=False, verify_ssl=True, retry_policy=None):
     """This function performs a DELETE request against the Core API.
 
+    .. versionchanged:: 3.3.0
+       The request is now performed using the shared HTTP session from :py:func:`khorosjx.core.get_session` and is
+       retried with exponential backoff according to a retry policy. The ``retry_policy`` argument was also added.
+
     .. versionchanged:: 3.2.0
        The query URL is now made into an absolute URL as necessary before performing the API request.
 
@@ -551,10 +1986,13 @@ def delete(uri, return_json=False, verify_ssl=True):
     :type return_json: bool
     :param verify_ssl: Determines if API calls should verify SSL certificates (``True`` by default)
     :type verify_ssl: bool
+    :param retry_policy: The retry policy to use rather than the default :py:data:`khorosjx.core.retry_policy`
+    :type retry_policy: :py:class:`khorosjx.utils.retry.RetryPolicy`, None
     :returns: The API response from the DELETE request (optionally in JSON format)
+    :raises: :py:exc:`khorosjx.errors.exceptions.APIConnectionError`
     """
     uri = ensure_absolute_url(uri)
-    response = requests.delete(uri, auth=api_credentials, verify=verify_ssl)
+    response = _request_with_retries('DELETE', uri, verify_ssl, retry_policy)
     if return_json:
         response = response.json()
     return response
@@ -563,6 +2001,11 @@ def delete(uri, return_json=False, verify_ssl=True):
 def get_fields_from_api_response(json_data, dataset, return_fields=None, quiet=False):
     """This function parses and retrieves fields from an API response from a specific dataset.
 
+    .. versionchanged:: 3.3.0
+       The fields are now retrieved using accessor functions compiled once per field list by the
+       :py:mod:`khorosjx.utils.field_paths` module, which adds support for arbitrary dotted and indexed field
+       paths. (e.g. ``author.id`` or ``jive.externalIdentities[1].identity``)
+
     .. versionchanged:: 3.1.0
        Changed the default ``return_fields`` value to ``None`` and adjusted the function accordingly.
 
@@ -583,9 +2026,6 @@ def get_fields_from_api_response(json_data, dataset, return_fields=None, quiet=F
     :returns: A dictionary with the field names and corresponding values
     :raises: :py:exc:`khorosjx.errors.exceptions.InvalidDatasetError`
     """
-    # Define the empty dictionary for data to return
-    fields_data = {}
-
     # Define the fields that should be returned for the data
     fields_to_return = return_fields if return_fields else []
     if not fields_to_return:
@@ -596,57 +2036,94 @@ def get_fields_from_api_response(json_data, dataset, return_fields=None, quiet=F
         fields_to_return = Content.datasets.get(dataset)
 
     # Get and return the fields and corresponding values
-    for field in fields_to_return:
-        field_not_found = False
-        try:
-            if field in json_data:
-                fields_data[field] = json_data[field]
-            elif field == "email.value":
-                fields_data[field] = json_data['emails'][0]['value']
-            elif field == "name.formatted":
-                fields_data[field] = json_data['name']['formatted']
-            elif field == "jive.lastAuthenticated":
-                fields_data[field] = json_data['jive']['lastAuthenticated']
-            elif field == "jive.externalIdentities.identityType":
-                fields_data[field] = json_data['jive']['externalIdentities'][0]['identityType']
-            elif field == "jive.externalIdentities.identity":
-                fields_data[field] = json_data['jive']['externalIdentities'][0]['identity']
-            elif field == "jive.username":
-                fields_data[field] = json_data['jive']['username']
-            elif field == "jive.status":
-                fields_data[field] = json_data['jive']['status']
-            elif field == "resources.html.ref":
-                fields_data[field] = json_data['resources']['html']['ref']
-            else:
-                field_not_found = True
-        except (IndexError, KeyError):
-            field_not_found = True
-        if field_not_found and not quiet:
-            eprint(f"Unable to locate the '{field}' field in the API response data.")
+    missing_fields = None if quiet else []
+    fields_data = extract_fields(json_data, fields_to_return, missing_fields)
+    for field in missing_fields or ():
+        eprint(f"Unable to locate the '{field}' field in the API response data.")
     return fields_data
 
 
+def get_fields_filter(return_fields=None, query_all=True):
+    """This function returns the ``fields`` query string parameter used to limit the fields returned by the API.
+
+    .. versionadded:: 3.3.0
+
+    When specific return fields are requested, only their top-level API fields are requested (e.g.
+    ``fields=id,jive`` for the ``id`` and ``jive.username`` fields) so that the API does not return data that would
+    be discarded when the response is parsed. Otherwise the ``fields=@all`` parameter is returned if requested.
+
+    :param return_fields: The fields that will be retrieved from the API response (Optional)
+    :type return_fields: list, tuple, None
+    :param query_all: Determines if ``fields=@all`` should be returned when no return fields are defined
+                      (Default: ``True``)
+    :type query_all: bool
+    :returns: The ``fields`` query string parameter or an empty string
+    :raises: :py:exc:`ValueError`
+    """
+    if return_fields:
+        return_fields = return_fields if isinstance(return_fields, tuple) else tuple(return_fields)
+        return f"fields={','.join(get_field_projection(return_fields))}"
+    return "fields=@all" if query_all else ""
+
+
 def _get_filter_syntax(_filter_info, _prefix=True):
-    """This function retrieves the proper filter syntax for an API call."""
+    """This function retrieves the proper filter syntax for an API call.
+
+    .. versionchanged:: 3.3.0
+       Fixed an issue where only the last filter was included when a list of multiple filters was supplied and an
+       exception was raised when an empty list was supplied.
+    """
     if type(_filter_info) != tuple and type(_filter_info) != list:
         raise TypeError("Filter information must be provided as a tuple (element, criteria) or a list of tuples.")
     elif type(_filter_info) == tuple:
         _filter_info = [_filter_info]
     _syntax = ""
-    if len(_filter_info[0]) > 0:
+    if _filter_info and len(_filter_info[0]) > 0:
         _define_prefix = {True: '&', False: ''}
         _syntax_prefix = _define_prefix.get(_prefix)
-        for _filter_tuple in _filter_info:
-            _element, _criteria = _filter_tuple
-            _syntax = f"{_syntax_prefix}filter={_element}({_criteria})&"
-        _syntax = _syntax[:-1]
+        _syntax = _syntax_prefix + '&'.join(f"filter={_element}({_criteria})" for _element, _criteria in _filter_info)
     return _syntax
 
 
+def _get_paginated_query_url(_query, _start_index=0, _filter_info=(), _query_all=True, _return_fields=None,
+                             _count=100):
+    """This function constructs the full query URL for a single paginated response up to 100 records.
+
+    .. versionadded:: 3.3.0
+
+    :param _query: The API query without the query string
+    :type _query: str
+    :param _start_index: The startIndex value in the API query string (``0`` by default)
+    :type _start_index: int, str
+    :param _filter_info: A tuple of list of tuples containing the filter element and criteria (Optional)
+    :type _filter_info: tuple, list
+    :param _query_all: Determines if ``fields=@all`` filter should be included in the query string (Default: ``True``)
+    :type _query_all: bool
+    :param _return_fields: The fields that will be retrieved from the API response, which are requested in place
+                           of ``fields=@all`` when defined (Optional)
+    :type _return_fields: list, tuple, None
+    :param _count: The maximum number of records to return in the response (``100`` by default)
+    :type _count: int
+    :returns: The full query URL
+    :raises: :py:exc:`TypeError`, :py:exc:`ValueError`
+    """
+    _fields_filter = get_fields_filter(_return_fields, _query_all)
+    _fields_filter = f"{_fields_filter}&" if _fields_filter else ""
+    if '?' in _query:
+        # Strip out the query string if present to prevent interference with the query string to be added
+        _query = _query.split("?")[0]
+    _other_filters = _get_filter_syntax(_filter_info, _prefix=True)
+    return f"{_query}?{_fields_filter}count={_count}&startIndex={_start_index}{_other_filters}"
+
+
 def get_paginated_results(query, response_data_type, start_index=0, filter_info=(), query_all=True,
                           return_fields=None, ignore_exceptions=False, quiet=False, verify_ssl=True):
     """This function performs a GET request for a single paginated response up to 100 records.
 
+    .. versionchanged:: 3.3.0
+       When ``return_fields`` is defined, only the fields needed to populate them are requested from the API
+       rather than ``fields=@all``.
+
     .. versionchanged:: 3.1.0
        Changed the default ``return_fields`` value to ``None`` and adjusted the function accordingly.
 
@@ -678,14 +2155,7 @@ def get_paginated_results(query, response_data_type, start_index=0, filter_info=
     aggregate_data = []
 
     # Construct the full API query
-    fields_filter = ""
-    if query_all:
-        fields_filter = "fields=@all&"
-    if '?' in query:
-        # Strip out the query string if present to prevent interference with the query string to be added
-        query = query.split("?")[0]
-    other_filters = _get_filter_syntax(filter_info, _prefix=True)
-    full_query = f"{query}?{fields_filter}count=100&startIndex={start_index}{other_filters}"
+    full_query = _get_paginated_query_url(query, start_index, filter_info, query_all, return_fields)
 
     # Perform the API query to retrieve the information
     response = get_request_with_retries(full_query, verify_ssl=verify_ssl)
@@ -700,3 +2170,332 @@ def get_paginated_results(query, response_data_type, start_index=0, filter_info=
             parsed_data = get_fields_from_api_response(data, response_data_type, return_fields, quiet)
             aggregate_data.append(parsed_data)
     return aggregate_data
+
+
+def iter_pages(page_function, max_workers=1, start_index=0, page_size=100):
+    """This function lazily yields each page of a paginated query, optionally fetching several pages concurrently.
+
+    .. versionadded:: 3.3.0
+
+    The ``page_function`` is called with a ``startIndex`` value and must return the list of records for that page.
+    Up to ``max_workers`` pages are requested at once from a bounded thread pool and are yielded in their original
+    order, and no further pages are requested once a page with fewer than ``page_size`` records has been returned.
+    Only the pages currently in flight are held in memory.
+
+    :param page_function: Function that accepts a ``startIndex`` value and returns a list of records for that page
+    :type page_function: function
+    :param max_workers: The maximum number of pages to request concurrently (Default: ``1``)
+    :type max_workers: int
+    :param start_index: The startIndex value of the first page to retrieve (``0`` by default)
+    :type start_index: int
+    :param page_size: The number of records returned in a full page (``100`` by default)
+    :type page_size: int
+    :returns: A generator that yields the list of records for each page
+    """
+    if not max_workers or max_workers <= 1:
+        while True:
+            page = page_function(start_index)
+            yield page
+            if len(page) < page_size:
+                return
+            start_index += page_size
+
+    # Keep a sliding window of in-flight page requests and consume them in order
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        pending_pages = deque()
+        try:
+            for _ in range(max_workers):
+                pending_pages.append(executor.submit(contextvars.copy_context().run, page_function, start_index))
+                start_index += page_size
+            while pending_pages:
+                page = pending_pages.popleft().result()
+                if len(page) == page_size:
+                    pending_pages.append(executor.submit(contextvars.copy_context().run, page_function, start_index))
+                    start_index += page_size
+                yield page
+                if len(page) < page_size:
+                    return
+        finally:
+            # Cancel any requests that are no longer needed (e.g. short page, exception or abandoned generator)
+            for future in pending_pages:
+                future.cancel()
+
+
+def get_all_pages(page_function, max_workers=1, start_index=0, page_size=100):
+    """This function retrieves every page of a paginated query, optionally fetching several pages concurrently.
+
+    .. versionadded:: 3.3.0
+
+    See :py:func:`khorosjx.core.iter_pages` for details on how the pages are requested.
+
+    :param page_function: Function that accepts a ``startIndex`` value and returns a list of records for that page
+    :type page_function: function
+    :param max_workers: The maximum number of pages to request concurrently (Default: ``1``)
+    :type max_workers: int
+    :param start_index: The startIndex value of the first page to retrieve (``0`` by default)
+    :type start_index: int
+    :param page_size: The number of records returned in a full page (``100`` by default)
+    :type page_size: int
+    :returns: A single list containing the records from every page in order
+    """
+    all_results = []
+    for page in iter_pages(page_function, max_workers, start_index, page_size):
+        all_results.extend(page)
+    return all_results
+
+
+def get_next_link(json_data):
+    """This function returns the URL of the next page from the ``links.next`` value of a paginated API response.
+
+    .. versionadded:: 3.3.0
+
+    :param json_data: The JSON data from a paginated API response
+    :type json_data: dict
+    :returns: The URL of the next page or ``None`` if the response does not include one
+    """
+    links = json_data.get('links') if isinstance(json_data, dict) else None
+    return links.get('next') if isinstance(links, dict) else None
+
+
+def _get_start_index_url(_query_url, _page_length):
+    """This function returns the URL of the page that follows a page by incrementing its ``startIndex`` value.
+
+    .. versionadded:: 3.3.0
+
+    :param _query_url: The full query URL of the current page
+    :type _query_url: str
+    :param _page_length: The number of records in the current page
+    :type _page_length: int
+    :returns: The full query URL of the next page
+    """
+    _match = re.search(r'([?&])startIndex=(\d+)', _query_url)
+    if _match is None:
+        return f"{_query_url}{'&' if '?' in _query_url else '?'}startIndex={_page_length}"
+    _start_index = int(_match.group(2)) + _page_length
+    return f"{_query_url[:_match.start()]}{_match.group(1)}startIndex={_start_index}{_query_url[_match.end():]}"
+
+
+def iter_linked_pages(query_url, parse_function=None, ignore_exceptions=False, verify_ssl=True, page_size=100,
+                      check_function=None):
+    """This function lazily yields each page of a paginated query by following the ``links.next`` URLs in each
+       response.
+
+    .. versionadded:: 3.3.0
+
+    Unlike :py:func:`khorosjx.core.iter_pages`, the URL of each subsequent page is taken from the server rather than
+    being constructed with an incremented ``startIndex`` value. No further pages are requested once a response
+    contains fewer than ``page_size`` records, and when a full page has no ``links.next`` value the next page is
+    requested with an incremented ``startIndex`` value instead so that the results are not cut short.
+
+    :param query_url: The full query URL for the first page (including the ``count`` and any filters)
+    :type query_url: str
+    :param parse_function: Function that is applied to each record in the ``list`` of the response (Optional)
+    :type parse_function: function, None
+    :param ignore_exceptions: Determines whether nor not exceptions should be ignored (Default: ``False``)
+    :type ignore_exceptions: bool
+    :param verify_ssl: Determines if API calls should verify SSL certificates (``True`` by default)
+    :type verify_ssl: bool
+    :param page_size: The number of records returned in a full page (``100`` by default)
+    :type page_size: int
+    :param check_function: Function that is called with each response before its status code is checked
+                           (e.g. to raise a more specific exception) (Optional)
+    :type check_function: function, None
+    :returns: A generator that yields the list of records for each page
+    :raises: :py:exc:`khorosjx.errors.exceptions.GETRequestError`
+    """
+    while True:
+        response = get_request_with_retries(query_url, verify_ssl=verify_ssl)
+        if check_function is not None:
+            check_function(response)
+        if not errors.handlers.check_api_response(response, ignore_exceptions=ignore_exceptions):
+            return
+        json_data = response.json()
+        page = json_data.get('list', [])
+        yield [parse_function(record) for record in page] if parse_function else page
+        if len(page) < page_size:
+            return
+        query_url = get_next_link(json_data) or _get_start_index_url(query_url, len(page))
+
+
+def _iter_result_pages(_query, _response_data_type, _filter_info=(), _query_all=True, _return_fields=None,
+                       _ignore_exceptions=False, _quiet=False, _verify_ssl=True, _max_workers=1):
+    """This function lazily yields each page of parsed records for a paginated query.
+
+    .. versionadded:: 3.3.0
+
+    When the pages are retrieved sequentially the ``links.next`` URLs provided by the server are followed using
+    :py:func:`khorosjx.core.iter_linked_pages`, and otherwise the pages are requested concurrently by ``startIndex``
+    value using :py:func:`khorosjx.core.iter_pages`.
+
+    :param _query: The API query without the query string
+    :type _query: str
+    :param _response_data_type: The dataset of fields that will be in the API response (e.g. ``group_members``)
+    :type _response_data_type: str
+    :param _filter_info: A tuple of list of tuples containing the filter element and criteria (Optional)
+    :type _filter_info: tuple, list
+    :param _query_all: Determines if ``fields=@all`` filter should be included in the query string
+    :type _query_all: bool
+    :param _return_fields: The fields that should be returned from the API response (Optional)
+    :type _return_fields: list, None
+    :param _ignore_exceptions: Determines whether nor not exceptions should be ignored
+    :type _ignore_exceptions: bool
+    :param _quiet: Silences any errors about being unable to locate API fields
+    :type _quiet: bool
+    :param _verify_ssl: Determines if API calls should verify SSL certificates
+    :type _verify_ssl: bool
+    :param _max_workers: The maximum number of pages to request concurrently
+    :type _max_workers: int
+    :returns: A generator that yields the list of parsed records for each page
+    :raises: :py:exc:`khorosjx.errors.exceptions.GETRequestError`
+    """
+    if not _max_workers or _max_workers <= 1:
+        def _parse_function(_data):
+            return get_fields_from_api_response(_data, _response_data_type, _return_fields, _quiet)
+        _query_url = _get_paginated_query_url(_query, 0, _filter_info, _query_all, _return_fields)
+        yield from iter_linked_pages(_query_url, _parse_function, _ignore_exceptions, _verify_ssl)
+        return
+
+    def _page_function(_start_index):
+        return get_paginated_results(_query, _response_data_type, _start_index, _filter_info, _query_all,
+                                     _return_fields, _ignore_exceptions, _quiet, _verify_ssl)
+    yield from iter_pages(_page_function, _max_workers)
+
+
+def iter_paginated_results(query, response_data_type, filter_info=(), query_all=True, return_fields=None,
+                           ignore_exceptions=False, quiet=False, verify_ssl=True, max_workers=1):
+    """This function lazily yields the parsed records for every page of a paginated query.
+
+    .. versionadded:: 3.3.0
+
+    When the pages are retrieved sequentially the ``links.next`` URLs provided by the server are followed using
+    :py:func:`khorosjx.core.iter_linked_pages`, and otherwise the pages are requested concurrently by ``startIndex``
+    value using :py:func:`khorosjx.core.iter_pages`.
+
+    :param query: The API query without the query string
+    :type query: str
+    :param response_data_type: The dataset of fields that will be in the API response (e.g. ``group_members``)
+    :type response_data_type: str
+    :param filter_info: A tuple of list of tuples containing the filter element and criteria (Optional)
+    :type filter_info: tuple, list
+    :param query_all: Determines if ``fields=@all`` filter should be included in the query string (Default: ``True``)
+    :type query_all: bool
+    :param return_fields: The fields that should be returned from the API response (Default: all fields in dataset)
+    :type return_fields: list, None
+    :param ignore_exceptions: Determines whether nor not exceptions should be ignored (Default: ``False``)
+    :type ignore_exceptions: bool
+    :param quiet: Silences any errors about being unable to locate API fields (``False`` by default)
+    :type quiet: bool
+    :param verify_ssl: Determines if API calls should verify SSL certificates (``True`` by default)
+    :type verify_ssl: bool
+    :param max_workers: The maximum number of pages to request concurrently (Default: ``1``)
+    :type max_workers: int
+    :returns: A generator that yields a dictionary for each record
+    :raises: :py:exc:`khorosjx.errors.exceptions.GETRequestError`
+    """
+    for page in _iter_result_pages(query, response_data_type, filter_info, query_all, return_fields,
+                                   ignore_exceptions, quiet, verify_ssl, max_workers):
+        yield from page
+
+
+def get_all_paginated_results(query, response_data_type, filter_info=(), query_all=True, return_fields=None,
+                              ignore_exceptions=False, quiet=False, verify_ssl=True, max_workers=1, deadline=None,
+                              return_partial=False):
+    """This function performs GET requests for every page of a paginated query and returns the combined results.
+
+    .. versionadded:: 3.3.0
+
+    :param query: The API query without the query string
+    :type query: str
+    :param response_data_type: The dataset of fields that will be in the API response (e.g. ``group_members``)
+    :type response_data_type: str
+    :param filter_info: A tuple of list of tuples containing the filter element and criteria (Optional)
+    :type filter_info: tuple, list
+    :param query_all: Determines if ``fields=@all`` filter should be included in the query string (Default: ``True``)
+    :type query_all: bool
+    :param return_fields: The fields that should be returned from the API response (Default: all fields in dataset)
+    :type return_fields: list, None
+    :param ignore_exceptions: Determines whether nor not exceptions should be ignored (Default: ``False``)
+    :type ignore_exceptions: bool
+    :param quiet: Silences any errors about being unable to locate API fields (``False`` by default)
+    :type quiet: bool
+    :param verify_ssl: Determines if API calls should verify SSL certificates (``True`` by default)
+    :type verify_ssl: bool
+    :param max_workers: The maximum number of pages to request concurrently (Default: ``1``)
+    :type max_workers: int
+    :param deadline: The number of seconds in which every page must be retrieved (Default: no deadline)
+    :type deadline: int, float, None
+    :param return_partial: Returns the records retrieved before the deadline expired as a
+                           :py:class:`khorosjx.core.PartialResults` list rather than raising an exception
+    :type return_partial: bool
+    :returns: The queried data as a list comprised of dictionaries
+    :raises: :py:exc:`khorosjx.errors.exceptions.GETRequestError`,
+             :py:exc:`khorosjx.errors.exceptions.DeadlineExceededError`
+    """
+    all_results = iter_paginated_results(query, response_data_type, filter_info, query_all, return_fields,
+                                         ignore_exceptions, quiet, verify_ssl, max_workers)
+    return collect_results(all_results, deadline=deadline, return_partial=return_partial)
+
+
+def _get_result_count_at_index(_query, _start_index, _filter_info=(), _verify_ssl=True, _count=1):
+    """This function returns the number of records (up to the ``_count`` value) that a paginated query returns at a
+       specific ``startIndex`` value, requesting only the ``id`` field of each record.
+
+    .. versionadded:: 3.3.0
+
+    :param _query: The API query without the query string
+    :type _query: str
+    :param _start_index: The startIndex value to check
+    :type _start_index: int
+    :param _filter_info: A tuple of list of tuples containing the filter element and criteria (Optional)
+    :type _filter_info: tuple, list
+    :param _verify_ssl: Determines if API calls should verify SSL certificates (``True`` by default)
+    :type _verify_ssl: bool
+    :param _count: The maximum number of records to request (``1`` by default)
+    :type _count: int
+    :returns: The number of records returned in integer format
+    :raises: :py:exc:`khorosjx.errors.exceptions.GETRequestError`
+    """
+    _query_url = _get_paginated_query_url(_query, _start_index, _filter_info, False, ('id',), _count=_count)
+    _response = get_request_with_retries(_query_url, verify_ssl=_verify_ssl)
+    errors.handlers.check_api_response(_response)
+    return len(_response.json().get('list', []))
+
+
+def count_results(query, filter_info=(), verify_ssl=True):
+    """This function returns the total number of records for a paginated query without retrieving them.
+
+    .. versionadded:: 3.3.0
+
+    The first 100 IDs are requested to count small result sets with a single request. Beyond that the total is
+    identified by requesting a single record (with only its ``id`` field) at exponentially increasing ``startIndex``
+    values until no record is returned and then performing a binary search between the last two values, which
+    requires roughly ``2 * log2(n)`` small requests rather than one full request per 100 records.
+
+    :param query: The API query without the query string (e.g. ``https://example.com/api/core/v3/contents``)
+    :type query: str
+    :param filter_info: A tuple of list of tuples containing the filter element and criteria (Optional)
+    :type filter_info: tuple, list
+    :param verify_ssl: Determines if API calls should verify SSL certificates (``True`` by default)
+    :type verify_ssl: bool
+    :returns: The total number of records in integer format
+    :raises: :py:exc:`khorosjx.errors.exceptions.GETRequestError`
+    """
+    page_size = 100
+    first_page_count = _get_result_count_at_index(query, 0, filter_info, verify_ssl, page_size)
+    if first_page_count < page_size:
+        return first_page_count
+
+    # Double the index until an index without a record is found
+    lower_index, upper_index = page_size - 1, page_size * 2
+    while _get_result_count_at_index(query, upper_index - 1, filter_info, verify_ssl):
+        lower_index, upper_index = upper_index - 1, upper_index * 2
+
+    # Perform a binary search for the last index with a record, which is one less than the total
+    upper_index -= 1
+    while upper_index - lower_index > 1:
+        middle_index = (lower_index + upper_index) // 2
+        if _get_result_count_at_index(query, middle_index, filter_info, verify_ssl):
+            lower_index = middle_index
+        else:
+            upper_index = middle_index
+    return lower_index + 1
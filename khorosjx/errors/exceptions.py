@@ -6,7 +6,7 @@
 :Example:       ``raise khorosjx.errors.exceptions.BadCredentialsError``
 :Created By:    Jeff Shurtliff
 :Last Modified: Jeff Shurtliff
-:Modified Date: 23 Sep 2021
+:Modified Date: 17 Oct 2026
 """
 
 
@@ -40,6 +40,15 @@ class InvalidKhorosJXModuleError(KhorosJXError, ModuleNotFoundError):
         super().__init__(*args)
 
 
+class MissingDependencyError(KhorosJXError, ImportError):
+    """This exception is used when an optional dependency required for a specific feature is not installed."""
+    def __init__(self, *args, **kwargs):
+        default_msg = "An optional dependency required for this feature is not installed."
+        if not (args or kwargs):
+            args = (default_msg,)
+        super().__init__(*args)
+
+
 # -------------------------
 # Authentication Exceptions
 # -------------------------
@@ -207,6 +216,18 @@ class APIConnectionError(KhorosJXError):
         super().__init__(*args)
 
 
+class DeadlineExceededError(KhorosJXError, TimeoutError):
+    """This exception is used when an API request or bulk operation could not be completed before its deadline.
+
+    .. versionadded:: 3.3.0
+    """
+    def __init__(self, *args, **kwargs):
+        default_msg = "The API request could not be completed before the deadline expired."
+        if not (args or kwargs):
+            args = (default_msg,)
+        super().__init__(*args)
+
+
 class NotFoundResponseError(KhorosJXError):
     """This exception is used when an API query returns a 404 response and there isn't a more specific class."""
     def __init__(self, *args, **kwargs):
@@ -264,6 +285,24 @@ class CurrentlyUnsupportedError(KhorosJXError):
             args = (default_msg,)
         super().__init__(*args)
 
+
+class ExportCheckpointError(KhorosJXError, ValueError):
+    """This exception is used when an export checkpoint does not match the export that is being resumed."""
+    def __init__(self, *args, **kwargs):
+        default_msg = "The export checkpoint does not match the export and cannot be used to resume it."
+        if not (args or kwargs):
+            args = (default_msg,)
+        super().__init__(*args)
+
+
+class ExportSchemaError(KhorosJXError, ValueError):
+    """This exception is used when the values being exported cannot be converted to the type of their column."""
+    def __init__(self, *args, **kwargs):
+        default_msg = "The values being exported cannot be converted to the type defined in the export schema."
+        if not (args or kwargs):
+            args = (default_msg,)
+        super().__init__(*args)
+
 # -----------------
 # Helper Exceptions
 # -----------------
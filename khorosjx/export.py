@@ -0,0 +1,671 @@
+# -*- coding: utf-8 -*-
+"""
+:Module:            khorosjx.export
+:Synopsis:          Streaming export sinks and resumable export runners which write paginated API results to files
+:Usage:             ``from khorosjx import export``
+:Example:           ``export.export_all_groups('/tmp/groups.parquet', max_workers=4)``
+:Created By:        Jeff Shurtliff
+:Last Modified:     Jeff Shurtliff
+:Modified Date:     17 Oct 2026
+"""
+
+import os
+import abc
+import gzip
+import json
+
+from . import core, errors
+from .utils.classes import Content
+from .utils.core_utils import eprint
+
+try:
+    import pyarrow
+    import pyarrow.ipc
+    import pyarrow.parquet
+except ImportError:
+    pyarrow = None
+
+# Define the file formats supported by the export functions
+file_formats = ('parquet', 'arrow', 'ndjson')
+
+
+def _verify_pyarrow():
+    """This function verifies that the optional ``pyarrow`` package is installed.
+
+    .. versionadded:: 3.3.0
+
+    :returns: None
+    :raises: :py:exc:`khorosjx.errors.exceptions.MissingDependencyError`
+    """
+    if pyarrow is None:
+        raise errors.exceptions.MissingDependencyError(
+            "The pyarrow package is required to export Parquet and Arrow files. (e.g. pip install khorosjx[export])")
+    return
+
+
+def _get_dataset_fields(_dataset=None, _fields=None):
+    """This function returns the fields to export for a dataset or list of fields.
+
+    .. versionadded:: 3.3.0
+
+    :param _dataset: The nickname of a dataset in :py:data:`khorosjx.utils.classes.Content.datasets` (Optional)
+    :type _dataset: str, None
+    :param _fields: Specific fields to export which take precedence over the dataset fields (Optional)
+    :type _fields: list, tuple, None
+    :returns: A list of field names or ``None`` if the fields should be identified from the first page
+    :raises: :py:exc:`khorosjx.errors.exceptions.InvalidDatasetError`
+    """
+    if _fields:
+        return list(_fields)
+    if _dataset is None:
+        return None
+    if _dataset not in Content.datasets:
+        raise errors.exceptions.InvalidDatasetError(f"The supplied value '{_dataset}' is not a valid dataset.")
+    return list(Content.datasets.get(_dataset))
+
+
+class ArrowSink(abc.ABC):
+    """This class is the abstract base class for export sinks which write each page of records as an Arrow record
+       batch.
+
+    .. versionadded:: 3.3.0
+
+    The columns are fixed by the supplied ``fields`` (or the fields in the first page) and their types are taken from
+    the ``schema`` when supplied or inferred from the first page otherwise, where columns that only contain missing
+    values are stored as strings. The values in later pages are cast to the types in the schema, so a string column
+    also accepts numbers and Boolean values, and an exception is raised for values that cannot be cast, in which case
+    the pages written before it remain readable once the sink is closed. Nested values such as dictionaries and
+    lists are stored as JSON strings. Only the page currently being written is held in memory.
+    """
+    file_format = None
+
+    def __init__(self, file_path, fields=None, schema=None):
+        """This method instantiates the sink.
+
+        :param file_path: The path to the file that will be written
+        :type file_path: str
+        :param fields: The fields (i.e. columns) to write (Default: the fields in the first page)
+        :type fields: list, tuple, None
+        :param schema: The :py:class:`pyarrow.Schema` to use rather than inferring it from the first page (Optional)
+        :type schema: :py:class:`pyarrow.Schema`, None
+        :raises: :py:exc:`khorosjx.errors.exceptions.MissingDependencyError`
+        """
+        _verify_pyarrow()
+        self.file_path = file_path
+        self.fields = list(schema.names) if schema is not None else (list(fields) if fields else None)
+        self.schema = schema
+        self.row_count = 0
+        self._writer = None
+
+    def __repr__(self):
+        return f"{type(self).__name__}(file_path={self.file_path!r}, rows={self.row_count})"
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def _get_columns(self, records):
+        """This method converts a page of records into a dictionary of column values.
+
+        :param records: The records in the page
+        :type records: list
+        :returns: A dictionary mapping each field name to a list of its values
+        """
+        columns = {}
+        for field in self.fields:
+            values = [record.get(field) for record in records]
+            columns[field] = [json.dumps(value, default=str) if isinstance(value, (dict, list)) else value
+                              for value in values]
+        return columns
+
+    def _infer_schema(self, columns):
+        """This method infers the schema from the columns of the first page.
+
+        :param columns: A dictionary mapping each field name to a list of its values
+        :type columns: dict
+        :returns: The inferred :py:class:`pyarrow.Schema`
+        """
+        schema_fields = []
+        for field, values in columns.items():
+            field_type = pyarrow.array(values).type
+            schema_fields.append(pyarrow.field(field, pyarrow.string() if pyarrow.types.is_null(field_type)
+                                               else field_type))
+        return pyarrow.schema(schema_fields)
+
+    def _get_batch(self, columns):
+        """This method converts the columns of a page into a record batch, casting each column to the schema.
+
+        :param columns: A dictionary mapping each field name to a list of its values
+        :type columns: dict
+        :returns: The :py:class:`pyarrow.RecordBatch` for the page
+        :raises: :py:exc:`khorosjx.errors.exceptions.ExportSchemaError`
+        """
+        arrays = []
+        for field in self.schema:
+            try:
+                arrays.append(pyarrow.array(columns[field.name], type=field.type))
+            except (pyarrow.ArrowInvalid, pyarrow.ArrowTypeError):
+                try:
+                    arrays.append(pyarrow.array(columns[field.name]).cast(field.type))
+                except (pyarrow.ArrowInvalid, pyarrow.ArrowTypeError, pyarrow.ArrowNotImplementedError) as exc:
+                    raise errors.exceptions.ExportSchemaError(
+                        f"The values of the '{field.name}' field in row {self.row_count + 1} onward cannot be "
+                        f"converted to the {field.type} type of its column. (Supply a schema to define the type of "
+                        f"the column)") from exc
+        return pyarrow.RecordBatch.from_arrays(arrays, schema=self.schema)
+
+    @abc.abstractmethod
+    def _open_writer(self):
+        """This method opens the file writer once the schema has been defined."""
+
+    def _write_batch(self, batch):
+        """This method writes a single record batch to the file."""
+        self._writer.write_batch(batch)
+
+    def write_page(self, records):
+        """This method writes a page of records to the file.
+
+        :param records: The records (i.e. dictionaries) in the page
+        :type records: list
+        :returns: The number of records that were written
+        """
+        if not records:
+            return 0
+        if self.fields is None:
+            self.fields = list(dict.fromkeys(field for record in records for field in record))
+        columns = self._get_columns(records)
+        if self.schema is None:
+            self.schema = self._infer_schema(columns)
+        if self._writer is None:
+            self._open_writer()
+        self._write_batch(self._get_batch(columns))
+        self.row_count += len(records)
+        return len(records)
+
+    def close(self):
+        """This method closes the file, writing an empty file with the schema if no records were written.
+
+        :returns: None
+        """
+        if self._writer is None and self.fields is not None:
+            self.schema = self.schema or pyarrow.schema([pyarrow.field(field, pyarrow.string())
+                                                         for field in self.fields])
+            self._open_writer()
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+        return
+
+
+class ParquetSink(ArrowSink):
+    """This class is an export sink which writes each page of records as a row group in a Parquet file.
+
+    .. versionadded:: 3.3.0
+    """
+    file_format = 'parquet'
+
+    def __init__(self, file_path, fields=None, schema=None, compression='snappy'):
+        """This method instantiates the sink.
+
+        :param file_path: The path to the Parquet file that will be written
+        :type file_path: str
+        :param fields: The fields (i.e. columns) to write (Default: the fields in the first page)
+        :type fields: list, tuple, None
+        :param schema: The :py:class:`pyarrow.Schema` to use rather than inferring it from the first page (Optional)
+        :type schema: :py:class:`pyarrow.Schema`, None
+        :param compression: The compression codec for the file (Default: ``snappy``)
+        :type compression: str, None
+        :raises: :py:exc:`khorosjx.errors.exceptions.MissingDependencyError`
+        """
+        super().__init__(file_path, fields, schema)
+        self.compression = compression
+
+    def _open_writer(self):
+        """This method opens the Parquet file writer."""
+        self._writer = pyarrow.parquet.ParquetWriter(self.file_path, self.schema, compression=self.compression)
+
+    def _write_batch(self, batch):
+        """This method writes a record batch to the Parquet file as a row group."""
+        self._writer.write_table(pyarrow.Table.from_batches([batch]))
+
+
+class ArrowIPCSink(ArrowSink):
+    """This class is an export sink which writes each page of records as a record batch in an Arrow IPC file.
+
+    .. versionadded:: 3.3.0
+    """
+    file_format = 'arrow'
+
+    def _open_writer(self):
+        """This method opens the Arrow IPC file writer."""
+        self._writer = pyarrow.ipc.new_file(self.file_path, self.schema)
+
+
+class NDJSONSink(object):
+    """This class is an export sink which writes each page of records as newline-delimited JSON (NDJSON).
+
+    .. versionadded:: 3.3.0
+
+    When compression is enabled each page is written as a separate gzip member, which standard gzip readers treat as
+    a single continuous stream. Every page is flushed and synced to disk before :py:meth:`write_page` returns so that
+    the :py:attr:`file_offset` value can be recorded in a checkpoint, and a sink opened at that offset will discard
+    any partial page that was written after it.
+    """
+    file_format = 'ndjson'
+
+    def __init__(self, file_path, fields=None, compress=None, file_offset=None):
+        """This method instantiates the sink.
+
+        :param file_path: The path to the NDJSON file that will be written
+        :type file_path: str
+        :param fields: The fields to write for each record (Default: all fields in each record)
+        :type fields: list, tuple, None
+        :param compress: Determines if the file should be gzip-compressed (Default: when the path ends in ``.gz``)
+        :type compress: bool, None
+        :param file_offset: The offset at which to continue writing an existing file (Default: a new file is created)
+        :type file_offset: int, None
+        """
+        self.file_path = file_path
+        self.fields = list(fields) if fields else None
+        self.compress = file_path.endswith('.gz') if compress is None else compress
+        self.row_count = 0
+        if file_offset is None:
+            self._file = open(file_path, 'wb')
+        else:
+            self._file = open(file_path, 'r+b')
+            self._file.truncate(file_offset)
+            self._file.seek(file_offset)
+        self.file_offset = self._file.tell()
+
+    def __repr__(self):
+        return f"{type(self).__name__}(file_path={self.file_path!r}, rows={self.row_count})"
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def write_page(self, records):
+        """This method writes a page of records to the file and syncs it to disk.
+
+        :param records: The records (i.e. dictionaries) in the page
+        :type records: list
+        :returns: The number of records that were written
+        """
+        if not records:
+            return 0
+        if self.fields is not None:
+            records = [{field: record.get(field) for field in self.fields} for record in records]
+        data = ''.join(f"{json.dumps(record, default=str)}\n" for record in records).encode('utf-8')
+        self._file.write(gzip.compress(data) if self.compress else data)
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self.file_offset = self._file.tell()
+        self.row_count += len(records)
+        return len(records)
+
+    def close(self):
+        """This method closes the file.
+
+        :returns: None
+        """
+        if not self._file.closed:
+            self._file.close()
+        return
+
+
+def get_sink(file_path, file_format='parquet', dataset=None, fields=None, schema=None):
+    """This function returns the export sink for a file format.
+
+    .. versionadded:: 3.3.0
+
+    :param file_path: The path to the file that will be written
+    :type file_path: str
+    :param file_format: The format of the file (``parquet``, ``arrow`` or ``ndjson``) (Default: ``parquet``)
+    :type file_format: str
+    :param dataset: The nickname of the dataset (e.g. ``security_group``) used to define the fields (Optional)
+    :type dataset: str, None
+    :param fields: Specific fields to export which take precedence over the dataset fields (Optional)
+    :type fields: list, tuple, None
+    :param schema: The :py:class:`pyarrow.Schema` to use rather than inferring it from the first page (Optional)
+    :type schema: :py:class:`pyarrow.Schema`, None
+    :returns: The export sink object
+    :raises: :py:exc:`ValueError`, :py:exc:`khorosjx.errors.exceptions.InvalidDatasetError`,
+             :py:exc:`khorosjx.errors.exceptions.MissingDependencyError`
+    """
+    sinks = {'parquet': ParquetSink, 'arrow': ArrowIPCSink}
+    if file_format not in file_formats:
+        raise ValueError(f"The file format '{file_format}' is not supported. "
+                         f"(Valid formats: {', '.join(file_formats)})")
+    if file_format == 'ndjson':
+        return NDJSONSink(file_path, _get_dataset_fields(dataset, fields))
+    return sinks[file_format](file_path, _get_dataset_fields(dataset, fields), schema)
+
+
+def write_pages(pages, file_path, file_format='parquet', dataset=None, fields=None, schema=None):
+    """This function writes a stream of pages (e.g. from :py:func:`khorosjx.core.iter_pages`) to a file.
+
+    .. versionadded:: 3.3.0
+
+    :param pages: An iterable that yields each page as a list of records
+    :type pages: generator, list
+    :param file_path: The path to the file that will be written
+    :type file_path: str
+    :param file_format: The format of the file (``parquet``, ``arrow`` or ``ndjson``) (Default: ``parquet``)
+    :type file_format: str
+    :param dataset: The nickname of the dataset (e.g. ``security_group``) used to define the fields (Optional)
+    :type dataset: str, None
+    :param fields: Specific fields to export which take precedence over the dataset fields (Optional)
+    :type fields: list, tuple, None
+    :param schema: The :py:class:`pyarrow.Schema` to use rather than inferring it from the first page (Optional)
+    :type schema: :py:class:`pyarrow.Schema`, None
+    :returns: The number of records that were written
+    :raises: :py:exc:`ValueError`, :py:exc:`khorosjx.errors.exceptions.InvalidDatasetError`,
+             :py:exc:`khorosjx.errors.exceptions.MissingDependencyError`
+    """
+    with get_sink(file_path, file_format, dataset, fields, schema) as sink:
+        for page in pages:
+            sink.write_page(page)
+    return sink.row_count
+
+
+def write_records(records, file_path, file_format='parquet', dataset=None, fields=None, schema=None, page_size=100):
+    """This function writes a stream of records (e.g. from an ``iter_*`` function) to a file one page at a time.
+
+    .. versionadded:: 3.3.0
+
+    :param records: An iterable that yields each record as a dictionary
+    :type records: generator, list
+    :param file_path: The path to the file that will be written
+    :type file_path: str
+    :param file_format: The format of the file (``parquet``, ``arrow`` or ``ndjson``) (Default: ``parquet``)
+    :type file_format: str
+    :param dataset: The nickname of the dataset (e.g. ``security_group``) used to define the fields (Optional)
+    :type dataset: str, None
+    :param fields: Specific fields to export which take precedence over the dataset fields (Optional)
+    :type fields: list, tuple, None
+    :param schema: The :py:class:`pyarrow.Schema` to use rather than inferring it from the first page (Optional)
+    :type schema: :py:class:`pyarrow.Schema`, None
+    :param page_size: The number of records to write in each row group or record batch (Default: ``100``)
+    :type page_size: int
+    :returns: The number of records that were written
+    :raises: :py:exc:`ValueError`, :py:exc:`khorosjx.errors.exceptions.InvalidDatasetError`,
+             :py:exc:`khorosjx.errors.exceptions.MissingDependencyError`
+    """
+    def _iter_record_pages():
+        _page = []
+        for _record in records:
+            _page.append(_record)
+            if len(_page) == page_size:
+                yield _page
+                _page = []
+        if _page:
+            yield _page
+    return write_pages(_iter_record_pages(), file_path, file_format, dataset, fields, schema)
+
+
+def export_paginated_results(query, response_data_type, file_path, file_format='parquet', filter_info=(),
+                             query_all=True, return_fields=None, ignore_exceptions=False, quiet=False,
+                             verify_ssl=True, max_workers=1, schema=None):
+    """This function writes every page of a paginated query to a file as each page is retrieved.
+
+    .. versionadded:: 3.3.0
+
+    :param query: The API query without the query string
+    :type query: str
+    :param response_data_type: The dataset of fields that will be in the API response (e.g. ``group_members``)
+    :type response_data_type: str
+    :param file_path: The path to the file that will be written
+    :type file_path: str
+    :param file_format: The format of the file (``parquet``, ``arrow`` or ``ndjson``) (Default: ``parquet``)
+    :type file_format: str
+    :param filter_info: A tuple of list of tuples containing the filter element and criteria (Optional)
+    :type filter_info: tuple, list
+    :param query_all: Determines if ``fields=@all`` filter should be included in the query string (Default: ``True``)
+    :type query_all: bool
+    :param return_fields: The fields that should be exported (Default: all fields in dataset)
+    :type return_fields: list, None
+    :param ignore_exceptions: Determines whether nor not exceptions should be ignored (Default: ``False``)
+    :type ignore_exceptions: bool
+    :param quiet: Silences any errors about being unable to locate API fields (``False`` by default)
+    :type quiet: bool
+    :param verify_ssl: Determines if API calls should verify SSL certificates (``True`` by default)
+    :type verify_ssl: bool
+    :param max_workers: The maximum number of pages to request concurrently (Default: ``1``)
+    :type max_workers: int
+    :param schema: The :py:class:`pyarrow.Schema` to use rather than inferring it from the first page (Optional)
+    :type schema: :py:class:`pyarrow.Schema`, None
+    :returns: The number of records that were written
+    :raises: :py:exc:`ValueError`, :py:exc:`khorosjx.errors.exceptions.GETRequestError`,
+             :py:exc:`khorosjx.errors.exceptions.InvalidDatasetError`,
+             :py:exc:`khorosjx.errors.exceptions.MissingDependencyError`
+    """
+    pages = core._iter_result_pages(query, response_data_type, filter_info, query_all, return_fields,
+                                    ignore_exceptions, quiet, verify_ssl, max_workers)
+    return write_pages(pages, file_path, file_format, response_data_type, return_fields, schema)
+
+
+def export_all_groups(file_path, file_format='parquet', return_fields=None, ignore_exceptions=False, max_workers=1,
+                      schema=None):
+    """This function writes information on all security groups to a file as each page is retrieved.
+
+    .. versionadded:: 3.3.0
+
+    :param file_path: The path to the file that will be written
+    :type file_path: str
+    :param file_format: The format of the file (``parquet``, ``arrow`` or ``ndjson``) (Default: ``parquet``)
+    :type file_format: str
+    :param return_fields: Specific fields to export if not all of the default fields are needed (Optional)
+    :type return_fields: list, None
+    :param ignore_exceptions: Determines whether nor not exceptions should be ignored (Default: ``False``)
+    :type ignore_exceptions: bool
+    :param max_workers: The maximum number of pages to request concurrently (Default: ``1``)
+    :type max_workers: int
+    :param schema: The :py:class:`pyarrow.Schema` to use rather than inferring it from the first page (Optional)
+    :type schema: :py:class:`pyarrow.Schema`, None
+    :returns: The number of groups that were written
+    :raises: :py:exc:`ValueError`, :py:exc:`khorosjx.errors.exceptions.MissingDependencyError`
+    """
+    from . import groups
+    return write_records(groups.iter_all_groups(return_fields, ignore_exceptions, max_workers), file_path,
+                         file_format, 'security_group', return_fields, schema)
+
+
+def export_subscribers(publication_id, subscription_id, file_path, file_format='parquet', return_fields=None,
+                       ignore_exceptions=False, max_workers=1, schema=None):
+    """This function writes the subscribers for a subscription within a publication to a file as each page is
+       retrieved.
+
+    .. versionadded:: 3.3.0
+
+    :param publication_id: The ID of the publication where the subscription resides
+    :type publication_id: int, str
+    :param subscription_id: The ID of the subscription in which to identify the subscribers
+    :type subscription_id: int, str
+    :param file_path: The path to the file that will be written
+    :type file_path: str
+    :param file_format: The format of the file (``parquet``, ``arrow`` or ``ndjson``) (Default: ``parquet``)
+    :type file_format: str
+    :param return_fields: Specific fields to export if not all of the default fields are needed (Optional)
+    :type return_fields: list, None
+    :param ignore_exceptions: Determines whether nor not exceptions should be ignored (Default: ``False``)
+    :type ignore_exceptions: bool
+    :param max_workers: The maximum number of pages to request concurrently (Default: ``1``)
+    :type max_workers: int
+    :param schema: The :py:class:`pyarrow.Schema` to use rather than inferring it from the first page (Optional)
+    :type schema: :py:class:`pyarrow.Schema`, None
+    :returns: The number of subscribers that were written
+    :raises: :py:exc:`ValueError`, :py:exc:`khorosjx.errors.exceptions.MissingDependencyError`
+    """
+    from . import news
+    subscribers = news.iter_subscribers(publication_id, subscription_id, False, return_fields, ignore_exceptions,
+                                        max_workers)
+    return write_records(subscribers, file_path, file_format, 'people', return_fields, schema)
+
+
+def export_space_content_permissions(id_value, file_path, id_type='browse_id', file_format='parquet',
+                                     max_workers=1, schema=None):
+    """This function writes the permissions (aka ``appliedEntitlements``) for a space to a file as each page is
+       retrieved.
+
+    .. versionadded:: 3.3.0
+
+    The columns are the known permission fields in :py:data:`khorosjx.utils.classes.FieldLists.permission_fields`
+    (or the fields in the ``schema`` when supplied), so that a field missing from the first page is not dropped
+    from the later pages.
+
+    :param id_value: The space identifier as a Browse ID (default), Place ID or Space ID
+    :type id_value: int, str
+    :param file_path: The path to the file that will be written
+    :type file_path: str
+    :param id_type: Determines if the ``id_value`` is a ``browse_id`` (Default), ``place_id`` or ``space_id``
+    :type id_type: str
+    :param file_format: The format of the file (``parquet``, ``arrow`` or ``ndjson``) (Default: ``parquet``)
+    :type file_format: str
+    :param max_workers: The maximum number of pages to request concurrently (Default: ``1``)
+    :type max_workers: int
+    :param schema: The :py:class:`pyarrow.Schema` to use rather than inferring it from the first page (Optional)
+    :type schema: :py:class:`pyarrow.Schema`, None
+    :returns: The number of permissions that were written
+    :raises: :py:exc:`ValueError`, :py:exc:`khorosjx.errors.exceptions.SpaceNotFoundError`,
+             :py:exc:`khorosjx.errors.exceptions.MissingDependencyError`
+    """
+    from .places import spaces
+    permissions = spaces.iter_space_content_permissions(id_value, id_type, max_workers)
+    return write_records(permissions, file_path, file_format, 'permission', schema=schema)
+
+
+def load_checkpoint(checkpoint_file):
+    """This function loads an export checkpoint file.
+
+    .. versionadded:: 3.3.0
+
+    :param checkpoint_file: The path to the checkpoint file
+    :type checkpoint_file: str
+    :returns: A dictionary with the checkpoint data or ``None`` if the checkpoint file does not exist
+    """
+    if not os.path.isfile(checkpoint_file):
+        return None
+    with open(checkpoint_file, 'r') as file:
+        return json.load(file)
+
+
+def _save_checkpoint(_checkpoint_file, _checkpoint):
+    """This function atomically writes an export checkpoint file and syncs it to disk.
+
+    .. versionadded:: 3.3.0
+
+    :param _checkpoint_file: The path to the checkpoint file
+    :type _checkpoint_file: str
+    :param _checkpoint: The checkpoint data
+    :type _checkpoint: dict
+    :returns: None
+    """
+    _temp_file = f"{_checkpoint_file}.tmp"
+    with open(_temp_file, 'w') as _file:
+        json.dump(_checkpoint, _file)
+        _file.flush()
+        os.fsync(_file.fileno())
+    os.replace(_temp_file, _checkpoint_file)
+    return
+
+
+def export_paginated_results_to_ndjson(query, response_data_type, file_path, checkpoint_file=None, compress=None,
+                                       filter_info=(), query_all=True, return_fields=None, ignore_exceptions=False,
+                                       quiet=False, verify_ssl=True, max_workers=1, resume=True):
+    """This function streams every page of a paginated query to an NDJSON file with a checkpoint after each page.
+
+    .. versionadded:: 3.3.0
+
+    After each page has been synced to disk a checkpoint containing the query, filters, next ``startIndex`` value and
+    file offset is atomically written to the checkpoint file. When the function is called again for the same export
+    it continues from the checkpoint, discarding anything written after the last completed page, rather than
+    starting again from the first page. A checkpoint for an export that has already completed is left in place so
+    that calling the function again returns immediately.
+
+    The export is only marked as complete once a page with fewer than 100 records has been returned. When a request
+    fails the exception is raised or, when ``ignore_exceptions`` is ``True``, an error is printed and the records
+    written so far are returned, and in either case the checkpoint is left at the ``startIndex`` value of the failed
+    page so that the export can be resumed.
+
+    :param query: The API query without the query string (e.g. ``people``)
+    :type query: str
+    :param response_data_type: The dataset of fields that will be in the API response (e.g. ``people``)
+    :type response_data_type: str
+    :param file_path: The path to the NDJSON file that will be written
+    :type file_path: str
+    :param checkpoint_file: The path to the checkpoint file (Default: the ``file_path`` with a ``.checkpoint`` suffix)
+    :type checkpoint_file: str, None
+    :param compress: Determines if the file should be gzip-compressed (Default: when the path ends in ``.gz``)
+    :type compress: bool, None
+    :param filter_info: A tuple of list of tuples containing the filter element and criteria (Optional)
+    :type filter_info: tuple, list
+    :param query_all: Determines if ``fields=@all`` filter should be included in the query string (Default: ``True``)
+    :type query_all: bool
+    :param return_fields: The fields that should be exported (Default: all fields in dataset)
+    :type return_fields: list, None
+    :param ignore_exceptions: Determines if a failed request should stop the export without raising an exception
+                              (Default: ``False``)
+    :type ignore_exceptions: bool
+    :param quiet: Silences any errors about being unable to locate API fields (``False`` by default)
+    :type quiet: bool
+    :param verify_ssl: Determines if API calls should verify SSL certificates (``True`` by default)
+    :type verify_ssl: bool
+    :param max_workers: The maximum number of pages to request concurrently (Default: ``1``)
+    :type max_workers: int
+    :param resume: Determines if an existing checkpoint should be used to resume the export (``True`` by default)
+    :type resume: bool
+    :returns: The total number of records in the file
+    :raises: :py:exc:`khorosjx.errors.exceptions.ExportCheckpointError`,
+             :py:exc:`khorosjx.errors.exceptions.GETRequestError`
+    """
+    checkpoint_file = checkpoint_file or f"{file_path}.checkpoint"
+    export_info = json.loads(json.dumps({
+        'query': query,
+        'response_data_type': response_data_type,
+        'filter_info': filter_info,
+        'query_all': query_all,
+        'return_fields': return_fields,
+        'file_path': os.path.abspath(file_path)
+    }))
+
+    # Identify where to continue the export from the checkpoint if one exists
+    checkpoint = load_checkpoint(checkpoint_file) if resume else None
+    if checkpoint is not None:
+        if any(checkpoint.get(key) != value for key, value in export_info.items()):
+            raise errors.exceptions.ExportCheckpointError(
+                f"The checkpoint '{checkpoint_file}' was created for a different export and cannot be used to resume "
+                f"this export. (Use resume=False to start the export again)")
+        if checkpoint.get('complete'):
+            return checkpoint['record_count']
+        if not os.path.isfile(file_path):
+            raise errors.exceptions.ExportCheckpointError(
+                f"The file '{file_path}' referenced by the checkpoint '{checkpoint_file}' could not be found.")
+    else:
+        checkpoint = dict(export_info, start_index=0, record_count=0, file_offset=None, complete=False)
+
+    # Always raise failed requests so that an empty error page is never mistaken for the end of the data
+    def _page_function(_start_index):
+        return core.get_paginated_results(query, response_data_type, _start_index, filter_info, query_all,
+                                          return_fields, False, quiet, verify_ssl)
+
+    # Write each page and then record its completion in the checkpoint
+    page_size = 100
+    with NDJSONSink(file_path, return_fields, compress, checkpoint['file_offset']) as sink:
+        try:
+            for page in core.iter_pages(_page_function, max_workers, checkpoint['start_index'], page_size):
+                sink.write_page(page)
+                checkpoint['start_index'] += page_size
+                checkpoint['record_count'] += len(page)
+                checkpoint['file_offset'] = sink.file_offset
+                checkpoint['complete'] = len(page) < page_size
+                _save_checkpoint(checkpoint_file, checkpoint)
+        except errors.exceptions.KhorosJXError as exc:
+            if not ignore_exceptions:
+                raise
+            eprint(f"The export was stopped at startIndex {checkpoint['start_index']} and can be resumed from the "
+                   f"checkpoint '{checkpoint_file}'. ({type(exc).__name__}: {exc})")
+    return checkpoint['record_count']
@@ -6,24 +6,38 @@
 :Example:        ``group_info = groups.get_group_info(1051)``
 :Created By:     Jeff Shurtliff
 :Last Modified:  Jeff Shurtliff
-:Modified Date:  22 Sep 2021
+:Modified Date:  17 Oct 2026
 """
 
-import requests
-
 from . import core, users, errors
-from .utils.classes import Groups
+from .utils.classes import Groups, Content
 from .utils.core_utils import eprint
-from .utils import core_utils, df_utils
 
-# Define global variables
-base_url, api_credentials = '', None
+
+def __getattr__(name):
+    """This function forwards the deprecated ``base_url`` and ``api_credentials`` global variables to the active client.
+
+    .. versionadded:: 3.3.0
+
+    .. deprecated:: 3.3.0
+       Use :py:data:`khorosjx.core.base_url` and :py:data:`khorosjx.core.api_credentials` instead.
+
+    :param name: The name of the attribute being accessed
+    :type name: str
+    :returns: The value of the connection setting of the active :py:class:`khorosjx.core.Client` object
+    :raises: :py:exc:`AttributeError`
+    """
+    return core._get_deprecated_connection_attribute(__name__, name)
 
 
 # Define function to verify the connection in the core module
 def verify_core_connection():
     """This function verifies that the core connection information (Base URL and API credentials) has been defined.
 
+    .. versionchanged:: 3.3.0
+       The connection information of the active :py:class:`khorosjx.core.Client` object is now verified rather than
+       the global variables of this module so that each thread or asyncio task can use a different client.
+
     .. versionchanged:: 3.1.0
        Refactored the function to be more pythonic and to avoid depending on a try/except block.
 
@@ -31,13 +45,17 @@ def verify_core_connection():
     :raises: :py:exc:`khorosjx.errors.exceptions.KhorosJXError`,
              :py:exc:`khorosjx.errors.exceptions.NoCredentialsError`
     """
-    if not base_url or not api_credentials:
-        retrieve_connection_info()
+    core.verify_connection()
     return
 
 
 def retrieve_connection_info():
-    """This function initializes and defines the global variables for the connection information.
+    """This function verifies the connection information of the active client.
+
+    .. deprecated:: 3.3.0
+       The global variables of this module are no longer defined by this function, as the connection information is
+       stored in the active :py:class:`khorosjx.core.Client` object. Use :py:func:`khorosjx.core.get_connection_info`
+       instead.
 
     .. versionchanged:: 3.1.0
        Refactored the function to be more efficient.
@@ -46,10 +64,7 @@ def retrieve_connection_info():
     :raises: :py:exc:`khorosjx.errors.exceptions.KhorosJXError`,
              :py:exc:`khorosjx.errors.exceptions.NoCredentialsError`
     """
-    # Define the global variables at this module level
-    global base_url
-    global api_credentials
-    base_url, api_credentials = core.get_connection_info()
+    core._retrieve_deprecated_connection_info(__name__)
     return
 
 
@@ -57,6 +72,9 @@ def retrieve_connection_info():
 def get_group_info(group_id, return_fields=None, ignore_exceptions=False):
     """This function obtains the group information for a given Group ID.
 
+    .. versionchanged:: 3.3.0
+       Only the fields needed to populate the ``return_fields`` are requested from the API when they are defined.
+
     .. versionchanged:: 3.1.0
        Changed the default ``return_fields`` value to ``None`` and adjusted the function accordingly.
 
@@ -77,7 +95,7 @@ def get_group_info(group_id, return_fields=None, ignore_exceptions=False):
     group_info = {}
 
     # Perform the API query to retrieve the group information
-    query_uri = f"{base_url}/securityGroups/{group_id}?fields=@all"
+    query_uri = f"{core.base_url}/securityGroups/{group_id}?{core.get_fields_filter(return_fields)}"
     response = core.get_request_with_retries(query_uri)
 
     # Verify that the query was successful
@@ -91,9 +109,27 @@ def get_group_info(group_id, return_fields=None, ignore_exceptions=False):
     return group_info
 
 
+def _get_paginated_groups_url(_return_fields, _start_index):
+    """This function returns the query URL for a page of security groups.
+
+    .. versionadded:: 3.3.0
+
+    :param _return_fields: Specific fields to return if not all of the default fields are needed (Optional)
+    :type _return_fields: list, None
+    :param _start_index: The startIndex API value
+    :type _start_index: int, str
+    :returns: The full query URL for the page
+    """
+    return f"{core.base_url}/securityGroups?{core.get_fields_filter(_return_fields)}&count=100&" + \
+           f"startIndex={_start_index}"
+
+
 def _get_paginated_groups(_return_fields, _ignore_exceptions, _start_index):
     """This function returns paginated group information. (Up to 100 records at a time)
 
+    .. versionchanged:: 3.3.0
+       Only the fields needed to populate the ``_return_fields`` are requested from the API when they are defined.
+
     .. versionchanged:: 3.1.0
        Adjusted a dictionary lookup to proactively avoid raising a :py:exc:`KeyError` exception.
 
@@ -109,7 +145,7 @@ def _get_paginated_groups(_return_fields, _ignore_exceptions, _start_index):
     _groups = []
 
     # Perform the API query to retrieve the group information
-    _query_uri = f"{base_url}/securityGroups?fields=@all&count=100&startIndex={_start_index}"
+    _query_uri = _get_paginated_groups_url(_return_fields, _start_index)
     _response = core.get_request_with_retries(_query_uri)
 
     # Verify that the query was successful
@@ -124,10 +160,52 @@ def _get_paginated_groups(_return_fields, _ignore_exceptions, _start_index):
     return _groups
 
 
+# Define function to lazily iterate through all security groups
+def iter_all_groups(return_fields=None, ignore_exceptions=False, max_workers=1):
+    """This function lazily yields information on each security group found within the environment.
+
+    .. versionadded:: 3.3.0
+
+    When the pages are retrieved sequentially the ``links.next`` URLs provided by the server are followed, and
+    otherwise the pages are requested concurrently by ``startIndex`` value.
+
+    :param return_fields: Specific fields to return if not all of the default fields are needed (Optional)
+    :type return_fields: list, None
+    :param ignore_exceptions: Determines whether nor not exceptions should be ignored (Default: ``False``)
+    :type ignore_exceptions: bool
+    :param max_workers: The maximum number of pages to request concurrently (Default: ``1``)
+    :type max_workers: int
+    :returns: A generator that yields a dictionary with the information for each group
+    :raises: :py:exc:`khorosjx.errors.exceptions.InvalidDatasetError`
+    """
+    # Verify that the core connection has been established
+    verify_core_connection()
+
+    # Retrieve and yield each page of groups, following the next page links when retrieved sequentially
+    if not max_workers or max_workers <= 1:
+        def _parse_function(_group_data):
+            return core.get_fields_from_api_response(_group_data, 'security_group', return_fields)
+        query_url = _get_paginated_groups_url(return_fields, 0)
+        for groups in core.iter_linked_pages(query_url, _parse_function, ignore_exceptions):
+            yield from groups
+        return
+
+    def _page_function(_start_index):
+        return _get_paginated_groups(return_fields, ignore_exceptions, _start_index)
+    for groups in core.iter_pages(_page_function, max_workers):
+        yield from groups
+
+
 # Define function to get information on all security groups
-def get_all_groups(return_fields=None, return_type='list', ignore_exceptions=False):
+def get_all_groups(return_fields=None, return_type='list', ignore_exceptions=False, max_workers=1, deadline=None,
+                   return_partial=False):
     """This function returns information on all security groups found within the environment.
 
+    .. versionchanged:: 3.3.0
+       Added the ``max_workers`` parameter and leveraged the :py:func:`khorosjx.groups.iter_all_groups` function so
+       that multiple pages can be retrieved concurrently. Dataframes are now built column by column as each page
+       is retrieved. Added the ``deadline`` and ``return_partial`` parameters.
+
     .. versionchanged:: 3.1.0
        Changed the default ``return_fields`` value to ``None`` and adjusted the function accordingly.
 
@@ -137,36 +215,32 @@ def get_all_groups(return_fields=None, return_type='list', ignore_exceptions=Fal
     :type return_type: str
     :param ignore_exceptions: Determines whether nor not exceptions should be ignored (Default: ``False``)
     :type ignore_exceptions: bool
+    :param max_workers: The maximum number of pages to request concurrently (Default: ``1``)
+    :type max_workers: int
+    :param deadline: The number of seconds in which every group must be retrieved (Default: no deadline)
+    :type deadline: int, float, None
+    :param return_partial: Returns the groups retrieved before the deadline expired as a
+                           :py:class:`khorosjx.core.PartialResults` list rather than raising an exception
+    :type return_partial: bool
     :returns: A list of dictionaries or a dataframe containing information for each group
-    :raises: :py:exc:`khorosjx.errors.exceptions.InvalidDatasetError`
+    :raises: :py:exc:`khorosjx.errors.exceptions.InvalidDatasetError`,
+             :py:exc:`khorosjx.errors.exceptions.DeadlineExceededError`
     """
-    # Verify that the core connection has been established
-    verify_core_connection()
-
-    # Initialize the empty list for the group information
-    all_groups = []
-
-    # Perform the first query to get up to the first 100 groups
-    start_index = 0
-    groups = _get_paginated_groups(return_fields, ignore_exceptions, start_index)
-    all_groups = core_utils.add_to_master_list(groups, all_groups)
-
-    # Continue querying for groups until none are returned
-    while groups:
-        start_index += 100
-        groups = _get_paginated_groups(return_fields, ignore_exceptions, start_index)
-        all_groups = core_utils.add_to_master_list(groups, all_groups)
+    all_groups = iter_all_groups(return_fields, ignore_exceptions, max_workers)
 
     # Return the data as a master list of group dictionaries or a pandas dataframe
-    if return_type == "dataframe":
-        all_groups = df_utils.convert_dict_list_to_dataframe(all_groups)
-    return all_groups
+    column_names = return_fields or Content.datasets.get('security_group')
+    return core.collect_results(all_groups, return_type, column_names, deadline, return_partial)
 
 
 # Define function to obtain and return a list of the security group memberships for a user
-def get_user_memberships(user_lookup, return_values='name', ignore_exceptions=False):
+def get_user_memberships(user_lookup, return_values='name', ignore_exceptions=False, user_id_map=None):
     """This function returns the security group memberships for a given user.
 
+    .. versionchanged:: 3.3.0
+       Added the ``user_id_map`` argument to supply User IDs resolved with
+       :py:func:`khorosjx.users.resolve_user_ids`.
+
     .. versionchanged:: 3.1.0
        Refactored the function to be more efficient.
 
@@ -176,6 +250,9 @@ def get_user_memberships(user_lookup, return_values='name', ignore_exceptions=Fa
     :type return_values: str
     :param ignore_exceptions: Determines whether nor not exceptions should be ignored (Default: ``False``)
     :type ignore_exceptions: bool
+    :param user_id_map: A dictionary mapping email addresses to User IDs (e.g. from
+                        :py:func:`khorosjx.users.resolve_user_ids`) used before querying the API (Optional)
+    :type user_id_map: dict, None
     :returns: A list of group memberships for the user
     :raises: :py:exc:`khorosjx.errors.exceptions.UserQueryError`
     """
@@ -188,7 +265,7 @@ def get_user_memberships(user_lookup, return_values='name', ignore_exceptions=Fa
     # Get the User ID if the user lookup value is an email address
     if not isinstance(user_lookup, int) and user_lookup.isdigit() is False:
         if '@' in user_lookup:
-            user_lookup = users.get_user_id(user_lookup)
+            user_lookup = _get_mapped_user_id(user_lookup, user_id_map)
         else:
             # TODO: Allow a username to be supplied and utilized as a lookup value
             error_msg = f"{user_lookup} is not a valid lookup value to obtain user memberships."
@@ -199,7 +276,7 @@ def get_user_memberships(user_lookup, return_values='name', ignore_exceptions=Fa
                 raise errors.exceptions.UserQueryError(error_msg)
 
     # Perform the API query and convert the response to JSON if possible
-    query = f"{base_url}/people/{user_lookup}/securityGroups"
+    query = f"{core.base_url}/people/{user_lookup}/securityGroups"
     response = core.get_request_with_retries(query)
     if response.status_code != 200:
         error_msg = f"The attempt to get group membership for the user {user_lookup} " + \
@@ -286,11 +363,38 @@ def check_user_membership(user_memberships, groups_to_check, scope='any', ignore
     return result
 
 
+def _get_mapped_user_id(_email_address, _user_id_map=None):
+    """This function returns the User ID for an email address using a mapping of resolved User IDs when possible.
+
+    .. versionadded:: 3.3.0
+
+    :param _email_address: The email address of the user
+    :type _email_address: str
+    :param _user_id_map: A dictionary mapping email addresses to User IDs (Optional)
+    :type _user_id_map: dict, None
+    :returns: The User ID for the user
+    :raises: :py:exc:`khorosjx.errors.exceptions.UserNotFoundError`,
+             :py:exc:`khorosjx.errors.exceptions.GETRequestError`
+    """
+    if _user_id_map and _email_address in _user_id_map:
+        _user_id = _user_id_map[_email_address]
+        if _user_id is None:
+            raise errors.exceptions.UserNotFoundError(f"The user with the email address {_email_address} could " +
+                                                      "not be found by the Core API.")
+        return _user_id
+    return users.get_user_id(_email_address)
+
+
 # Define function to add a user to a security group
 def add_user_to_group(group_id, user_value, lookup_type="id", return_mode="none", print_results=True,
-                      ignore_exceptions=True):
+                      ignore_exceptions=True, user_id_map=None):
     """This function adds a user to a security group.
 
+    .. versionchanged:: 3.3.0
+       The POST request is now performed via :py:func:`khorosjx.core.post_request_with_retries` to leverage the
+       shared HTTP session. The ``user_id_map`` argument was also added to supply User IDs resolved with
+       :py:func:`khorosjx.users.resolve_user_ids`.
+
     .. versionchanged:: 3.1.0
        Parenthesis were added to the exception classes and the function was refactored to be more efficient.
 
@@ -306,6 +410,9 @@ def add_user_to_group(group_id, user_value, lookup_type="id", return_mode="none"
     :type print_results: bool
     :param ignore_exceptions: Determines whether nor not exceptions should be ignored (Default: ``True``)
     :type ignore_exceptions: bool
+    :param user_id_map: A dictionary mapping email addresses to User IDs (e.g. from
+                        :py:func:`khorosjx.users.resolve_user_ids`) used before querying the API (Optional)
+    :type user_id_map: dict, None
     :returns: The resulting status code, a Boolean value indicating the success of the operation, or nothing
     :raises: :py:exc:`khorosjx.errors.exceptions.POSTRequestError`
     """
@@ -322,15 +429,14 @@ def add_user_to_group(group_id, user_value, lookup_type="id", return_mode="none"
         else:
             raise errors.exceptions.InvalidLookupTypeError()
     if lookup_type == "email":
-        user_value = users.get_user_id(user_value)
+        user_value = _get_mapped_user_id(user_value, user_id_map)
 
     # Define the query parameters
-    query_uri = f"{base_url}/securityGroups/{group_id}/members"
-    user_uri = f'["{base_url}/people/{user_value}"]'
+    query_uri = f"{core.base_url}/securityGroups/{group_id}/members"
+    user_uri = f"{core.base_url}/people/{user_value}"
 
     # Add the user to the group
-    response = requests.post(query_uri, data=user_uri, auth=api_credentials,
-                             headers={"Content-Type": "application/json", "Accept": "application/json"})
+    response = core.post_request_with_retries(query_uri, [user_uri])
     added_to_group = errors.handlers.check_api_response(response, 'post', ignore_exceptions=ignore_exceptions)
 
     # The remainder of the function assumes exceptions are being ignored
@@ -358,41 +464,68 @@ def add_user_to_group(group_id, user_value, lookup_type="id", return_mode="none"
         return
 
 
-def _add_paginated_members(_base_query_uri, _response_data_type, _start_index,
-                           _ignore_exceptions, _return_fields, _all_users, _quiet=False):
-    """This function retrieves a paginated list of users and then adds them to a master list.
+def _get_membership_query(_group_id, _user_type):
+    """This function returns the base query URI and the response data type for a security group membership query.
 
-    .. versionchanged:: 2.5.3
-       Added the optional ``_quiet`` argument to silence missing API field errors.
+    .. versionadded:: 3.3.0
 
-    :param _base_query_uri: The API query without the query string
-    :type _base_query_uri: str
-    :param _response_data_type: The dataset of fields that will be in the API response (e.g. ``group_members``)
-    :type _response_data_type: str
-    :param _start_index: The startIndex value in the API query string (``0`` by default)
-    :type _start_index: int, str
-    :param _ignore_exceptions: Determines whether nor not exceptions should be ignored (Default: ``False``)
-    :type _ignore_exceptions: bool
-    :param _return_fields: The fields that should be returned from the API response (Default: all fields in dataset)
-    :type _return_fields: list
-    :param _all_users: The master list of group members
-    :type _all_users: list
-    :param _quiet: Silences any errors about being unable to locate API fields (``False`` by default)
-    :type _quiet: bool
-    :returns: The master list of group members and the number of members found during this API call
-    :raises: :py:exc:`khorosjx.errors.exceptions.GETRequestError`
+    :param _group_id: The Group ID for the security group
+    :type _group_id: int, str
+    :param _user_type: Determines if the query is for ``admin`` or ``member`` users
+    :type _user_type: str
+    :returns: The base query URI and the response data type
+    :raises: :py:exc:`ValueError`
+    """
+    if _user_type not in Groups.membership_types:
+        raise ValueError(f"The '{_user_type}' value is not a valid user type.")
+    _membership_type = Groups.membership_types.get(_user_type)
+    _base_query_uri = f"{core.base_url}/securityGroups/{_group_id}/{_membership_type}?fields=@all"
+    _response_data_type = Groups.user_type_mapping.get(_user_type)
+    return _base_query_uri, _response_data_type
+
+
+def iter_group_memberships(group_id, user_type="member", only_id=True, ignore_exceptions=False, quiet=False,
+                           max_workers=1):
+    """This function lazily yields the memberships (including administrator membership) for a security group.
+
+    .. versionadded:: 3.3.0
+
+    :param group_id: The Group ID for the security group
+    :type group_id: int, str
+    :param user_type: Determines if the function should return ``admin`` or ``member`` users (Default: ``member``)
+    :type user_type: str
+    :param only_id: Determines if only the User ID for the members should be yielded or full data (Default: ``True``)
+    :type only_id: bool
+    :param ignore_exceptions: Determines whether nor not exceptions should be ignored (Default: ``False``)
+    :type ignore_exceptions: bool
+    :param quiet: Silences any errors about being unable to locate API fields (``False`` by default)
+    :type quiet: bool
+    :param max_workers: The maximum number of pages to request concurrently (Default: ``1``)
+    :type max_workers: int
+    :returns: A generator that yields the User ID or a dictionary of user data for each member
+    :raises: :py:exc:`ValueError`
     """
-    _paginated_users = core.get_paginated_results(_base_query_uri, _response_data_type, _start_index,
-                                                  ignore_exceptions=_ignore_exceptions,
-                                                  return_fields=_return_fields, quiet=_quiet)
-    _all_users = core_utils.add_to_master_list(_paginated_users, _all_users)
-    return _all_users, len(_paginated_users)
+    # Verify that the core connection has been established
+    verify_core_connection()
+
+    # Retrieve and yield each member or admin
+    base_query_uri, response_data_type = _get_membership_query(group_id, user_type)
+    return_fields = ['id'] if only_id else []
+    for user in core.iter_paginated_results(base_query_uri, response_data_type, ignore_exceptions=ignore_exceptions,
+                                            return_fields=return_fields, quiet=quiet, max_workers=max_workers):
+        yield user.get('id') if only_id else user
 
 
 def get_group_memberships(group_id, user_type="member", only_id=True, return_type="list",
-                          ignore_exceptions=False, quiet=False):
+                          ignore_exceptions=False, quiet=False, max_workers=1, deadline=None, return_partial=False):
     """This function gets the memberships (including administrator membership) for a specific security group.
 
+    .. versionchanged:: 3.3.0
+       Added the ``max_workers`` parameter and leveraged the :py:func:`khorosjx.core.get_all_paginated_results`
+       function so that multiple pages can be retrieved concurrently. Only the ``id`` field is now requested from
+       the API when ``only_id`` is ``True``, and dataframes are now built column by column as each page is
+       retrieved. Added the ``deadline`` and ``return_partial`` parameters.
+
     .. versionchanged:: 2.5.3
        Added the optional ``_quiet`` argument to silence missing API field errors.
 
@@ -411,43 +544,31 @@ def get_group_memberships(group_id, user_type="member", only_id=True, return_typ
     :type ignore_exceptions: bool
     :param quiet: Silences any errors about being unable to locate API fields (``False`` by default)
     :type quiet: bool
+    :param max_workers: The maximum number of pages to request concurrently (Default: ``1``)
+    :type max_workers: int
+    :param deadline: The number of seconds in which every membership must be retrieved (Default: no deadline)
+    :type deadline: int, float, None
+    :param return_partial: Returns the memberships retrieved before the deadline expired as a
+                           :py:class:`khorosjx.core.PartialResults` list rather than raising an exception
+    :type return_partial: bool
     :returns: A list or dataframe of security group memberships
-    :raises: :py:exc:`ValueError`
+    :raises: :py:exc:`ValueError`, :py:exc:`khorosjx.errors.exceptions.DeadlineExceededError`
     """
     # Verify that the core connection has been established
     verify_core_connection()
 
-    # Initiate an empty list for the user data
-    all_users = []
-    return_fields = []
-
-    # Define the base query URI
-    if user_type in Groups.membership_types:
-        base_query_uri = f"{base_url}/securityGroups/{group_id}/{Groups.membership_types.get(user_type)}?fields=@all"
-    else:
-        raise ValueError(f"The '{user_type}' value is not a valid user type.")
+    # Define the base query URI and the response data type
+    base_query_uri, response_data_type = _get_membership_query(group_id, user_type)
 
     # Determine if only the User IDs should be returned
-    if only_id:
-        return_fields.append('id')
-
-    # Get the response data type
-    response_data_type = Groups.user_type_mapping.get(user_type)
-
-    # Perform the first query to get up to the first 100 members or admins
-    start_index = 0
-    all_users, users_returned = _add_paginated_members(base_query_uri, response_data_type, start_index,
-                                                       ignore_exceptions, return_fields, all_users, quiet)
+    return_fields = ['id'] if only_id else []
 
-    # Continue querying for groups until none are returned
-    while users_returned > 0:
-        start_index += 100
-        all_users, users_returned = _add_paginated_members(base_query_uri, response_data_type, start_index,
-                                                           ignore_exceptions, return_fields, all_users, quiet)
+    # Retrieve every page of members or admins
+    all_users = core.iter_paginated_results(base_query_uri, response_data_type, ignore_exceptions=ignore_exceptions,
+                                            return_fields=return_fields, quiet=quiet, max_workers=max_workers)
 
     # Return the data as a master list of group dictionaries or a pandas dataframe
-    if return_type == "dataframe":
-        all_users = df_utils.convert_dict_list_to_dataframe(all_users)
-    elif return_type == "list" and only_id is True:
-        all_users = core_utils.convert_single_pair_dict_list(all_users)
-    return all_users
+    if return_type == "list" and only_id is True:
+        all_users = (user_id for user in all_users for user_id in user.values())
+    column_names = return_fields or Content.datasets.get(response_data_type)
+    return core.collect_results(all_users, return_type, column_names, deadline, return_partial)
@@ -6,20 +6,37 @@
 :Example:        ``all_publication = khorosjx.news.get_all_publications()``
 :Created By:     Jeff Shurtliff
 :Last Modified:  Jeff Shurtliff
-:Modified Date:  22 Sep 2021
+:Modified Date:  17 Oct 2026
 """
 
 from . import core, errors
-from .utils import core_utils, df_utils
+from .utils.classes import Content
 
-# Define global variables
-base_url, api_credentials = '', None
+
+def __getattr__(name):
+    """This function forwards the deprecated ``base_url`` and ``api_credentials`` global variables to the active client.
+
+    .. versionadded:: 3.3.0
+
+    .. deprecated:: 3.3.0
+       Use :py:data:`khorosjx.core.base_url` and :py:data:`khorosjx.core.api_credentials` instead.
+
+    :param name: The name of the attribute being accessed
+    :type name: str
+    :returns: The value of the connection setting of the active :py:class:`khorosjx.core.Client` object
+    :raises: :py:exc:`AttributeError`
+    """
+    return core._get_deprecated_connection_attribute(__name__, name)
 
 
 # Define function to verify the connection in the core module
 def verify_core_connection():
     """This function verifies that the core connection information (Base URL and API credentials) has been defined.
 
+    .. versionchanged:: 3.3.0
+       The connection information of the active :py:class:`khorosjx.core.Client` object is now verified rather than
+       the global variables of this module so that each thread or asyncio task can use a different client.
+
     .. versionchanged:: 3.1.0
        Refactored the function to be more pythonic and to avoid depending on a try/except block.
 
@@ -27,13 +44,17 @@ def verify_core_connection():
     :raises: :py:exc:`khorosjx.errors.exceptions.KhorosJXError`,
              :py:exc:`khorosjx.errors.exceptions.NoCredentialsError`
     """
-    if not base_url or not api_credentials:
-        retrieve_connection_info()
+    core.verify_connection()
     return
 
 
 def retrieve_connection_info():
-    """This function initializes and defines the global variables for the connection information.
+    """This function verifies the connection information of the active client.
+
+    .. deprecated:: 3.3.0
+       The global variables of this module are no longer defined by this function, as the connection information is
+       stored in the active :py:class:`khorosjx.core.Client` object. Use :py:func:`khorosjx.core.get_connection_info`
+       instead.
 
     .. versionchanged:: 3.1.0
        Refactored the function to be more efficient.
@@ -42,52 +63,68 @@ def retrieve_connection_info():
     :raises: :py:exc:`khorosjx.errors.exceptions.KhorosJXError`,
              :py:exc:`khorosjx.errors.exceptions.NoCredentialsError`
     """
-    # Define the global variables at this module level
-    global base_url
-    global api_credentials
-    base_url, api_credentials = core.get_connection_info()
+    core._retrieve_deprecated_connection_info(__name__)
     return
 
 
-def get_all_publications(return_fields=None, return_type='list', ignore_exceptions=False):
-    """This function retrieves all publications within an environment.
+def iter_all_publications(return_fields=None, ignore_exceptions=False, max_workers=1):
+    """This function lazily yields each publication within an environment.
 
-    .. versionchanged:: 3.1.0
-       Changed the default ``return_fields`` value to ``None`` and adjusted the function accordingly.
+    .. versionadded:: 3.3.0
 
     :param return_fields: Specific fields to return if not all of the default fields are needed (Optional)
     :type return_fields: list, None
-    :param return_type: Determines if the data should be returned in a list or a pandas dataframe (Default: ``list``)
-    :type return_type: str
     :param ignore_exceptions: Determines whether nor not exceptions should be ignored (Default: ``False``)
     :type ignore_exceptions: bool
-    :returns: A list of dictionaries or a dataframe containing information for each publication
+    :param max_workers: The maximum number of pages to request concurrently (Default: ``1``)
+    :type max_workers: int
+    :returns: A generator that yields a dictionary with the information for each publication
     :raises: :py:exc:`khorosjx.errors.exceptions.InvalidDatasetError`
     """
     # Verify that the core connection has been established
     verify_core_connection()
 
-    # Initialize the empty list for the subscription information
-    all_publications = []
+    # Retrieve and yield each publication
+    query = f'{core.base_url}/publications'
+    yield from core.iter_paginated_results(query, 'publication', return_fields=return_fields,
+                                           ignore_exceptions=ignore_exceptions, max_workers=max_workers)
+
 
-    # Perform the first query to get up to the first 100 groups
-    query = f'{base_url}/publications'
-    start_index = 0
-    publications = core.get_paginated_results(query, 'publication', start_index, return_fields=return_fields,
-                                              ignore_exceptions=ignore_exceptions)
-    all_publications = core_utils.add_to_master_list(publications, all_publications)
+def get_all_publications(return_fields=None, return_type='list', ignore_exceptions=False, max_workers=1, deadline=None,
+                         return_partial=False):
+    """This function retrieves all publications within an environment.
 
-    # Continue querying for groups until none are returned
-    while publications:
-        start_index += 100
-        publications = core.get_paginated_results(query, 'publication', start_index, return_fields=return_fields,
-                                                  ignore_exceptions=ignore_exceptions)
-        all_publications = core_utils.add_to_master_list(publications, all_publications)
+    .. versionchanged:: 3.3.0
+       Added the ``max_workers`` parameter and leveraged the :py:func:`khorosjx.news.iter_all_publications`
+       function so that multiple pages can be retrieved concurrently. Dataframes are now built column by column as
+       each page is retrieved. Added the ``deadline`` and ``return_partial`` parameters.
+
+    .. versionchanged:: 3.1.0
+       Changed the default ``return_fields`` value to ``None`` and adjusted the function accordingly.
+
+    :param return_fields: Specific fields to return if not all of the default fields are needed (Optional)
+    :type return_fields: list, None
+    :param return_type: Determines if the data should be returned in a list or a pandas dataframe (Default: ``list``)
+    :type return_type: str
+    :param ignore_exceptions: Determines whether nor not exceptions should be ignored (Default: ``False``)
+    :type ignore_exceptions: bool
+    :param max_workers: The maximum number of pages to request concurrently (Default: ``1``)
+    :type max_workers: int
+    :param deadline: The number of seconds in which every publication must be retrieved (Default: no deadline)
+    :type deadline: int, float, None
+    :param return_partial: Returns the publications retrieved before the deadline expired as a
+                           :py:class:`khorosjx.core.PartialResults` list rather than raising an exception
+    :type return_partial: bool
+    :returns: A list of dictionaries or a dataframe containing information for each publication
+    :raises: :py:exc:`khorosjx.errors.exceptions.InvalidDatasetError`,
+             :py:exc:`khorosjx.errors.exceptions.DeadlineExceededError`
+    """
+    # Retrieve every page of publications
+    all_publications = iter_all_publications(return_fields, ignore_exceptions, max_workers)
 
     # Return the data as a master list of publication dictionaries or a pandas dataframe
-    if return_type == "dataframe":
-        all_publications = df_utils.convert_dict_list_to_dataframe(all_publications)
-    return all_publications
+    column_names = return_fields or Content.datasets.get('publication')
+    return core.collect_results(all_publications, return_type, column_names, deadline, return_partial)
 
 
 def get_publication(pub_id, return_fields=None, ignore_exceptions=False):
@@ -130,7 +167,7 @@ def delete_publication(pub_id, return_json=False):
     verify_core_connection()
 
     # Delete the publication
-    publication_uri = f"{base_url}/publications/{pub_id}"
+    publication_uri = f"{core.base_url}/publications/{pub_id}"
     response = core.delete(publication_uri, return_json=return_json)
     return response
 
@@ -240,10 +277,49 @@ def get_subscriber_ids(subscribers):
     return subscriber_ids
 
 
+def iter_subscribers(publication_id, subscription_id, only_id=True, return_fields=None, ignore_exceptions=False,
+                     max_workers=1):
+    """This function lazily yields the individual subscribers (i.e. users) for a subscription within a publication.
+
+    .. versionadded:: 3.3.0
+
+    :param publication_id: The ID of the publication where the subscription resides
+    :type publication_id: int, str
+    :param subscription_id: The ID of the subscription in which to identify the subscribers
+    :type subscription_id: int, str
+    :param only_id: Determines if only the ID of each user should be yielded (default) or a dict with all user data
+    :type only_id: bool
+    :param return_fields: Specific fields to return if not all of the default fields are needed (Optional)
+    :type return_fields: list, None
+    :param ignore_exceptions: Determines whether nor not exceptions should be ignored (Default: ``False``)
+    :type ignore_exceptions: bool
+    :param max_workers: The maximum number of pages to request concurrently (Default: ``1``)
+    :type max_workers: int
+    :returns: A generator that yields the ID or a dictionary of user data for each subscriber
+    """
+    # Verify that the core connection has been established
+    verify_core_connection()
+
+    # Overwrite the return_fields list if the only_id value is True
+    if only_id:
+        return_fields = ['id']
+
+    # Retrieve and yield each subscriber
+    query = f"{core.base_url}/publications/{publication_id}/subscriptions/{subscription_id}/subscribers"
+    for subscriber in core.iter_paginated_results(query, 'people', return_fields=return_fields,
+                                                  ignore_exceptions=ignore_exceptions, max_workers=max_workers):
+        yield subscriber['id'] if only_id else subscriber
+
+
 def get_subscribers(publication_id, subscription_id, return_type='list', only_id=True, return_fields=None,
-                    ignore_exceptions=False):
+                    ignore_exceptions=False, max_workers=1, deadline=None, return_partial=False):
     """This function retrieves the individual subscribers (i.e. users) for a given subscription within a publication.
 
+    .. versionchanged:: 3.3.0
+       Added the ``max_workers`` parameter and leveraged the :py:func:`khorosjx.news.iter_subscribers` function so
+       that multiple pages can be retrieved concurrently. Dataframes are now built column by column as each page
+       is retrieved. Added the ``deadline`` and ``return_partial`` parameters.
+
     .. versionchanged:: 3.1.0
        Changed the default ``return_fields`` value to ``None`` and adjusted the function accordingly.
 
@@ -259,40 +335,26 @@ def get_subscribers(publication_id, subscription_id, return_type='list', only_id
     :type return_fields: list, None
     :param ignore_exceptions: Determines whether nor not exceptions should be ignored (Default: ``False``)
     :type ignore_exceptions: bool
+    :param max_workers: The maximum number of pages to request concurrently (Default: ``1``)
+    :type max_workers: int
+    :param deadline: The number of seconds in which every subscriber must be retrieved (Default: no deadline)
+    :type deadline: int, float, None
+    :param return_partial: Returns the subscribers retrieved before the deadline expired as a
+                           :py:class:`khorosjx.core.PartialResults` list rather than raising an exception
+    :type return_partial: bool
     :returns: A list or pandas dataframe with the subscriber information
+    :raises: :py:exc:`khorosjx.errors.exceptions.DeadlineExceededError`
     """
-    # Verify that the core connection has been established
-    verify_core_connection()
-
-    # Initialize the empty list for the subscription information
-    all_subscribers = []
-
-    # Overwrite the return_fields list if the only_id value is True
-    if only_id:
+    # Retrieve every subscriber
+    only_ids = only_id and return_type == 'list'
+    if only_id and not only_ids:
         return_fields = ['id']
-
-    # Perform the first query to get up to the first 100 groups
-    query = f"{base_url}/publications/{publication_id}/subscriptions/{subscription_id}/subscribers"
-    start_index = 0
-    subscribers = core.get_paginated_results(query, 'people', start_index, return_fields=return_fields,
-                                             ignore_exceptions=ignore_exceptions)
-    if only_id and return_type == 'list':
-        subscribers = get_subscriber_ids(subscribers)
-    all_subscribers = core_utils.add_to_master_list(subscribers, all_subscribers)
-
-    # Continue querying for groups until none are returned
-    while subscribers:
-        start_index += 100
-        subscribers = core.get_paginated_results(query, 'people', start_index, return_fields=return_fields,
-                                                 ignore_exceptions=ignore_exceptions)
-        if only_id and return_type == 'list':
-            subscribers = get_subscriber_ids(subscribers)
-        all_subscribers = core_utils.add_to_master_list(subscribers, all_subscribers)
+    all_subscribers = iter_subscribers(publication_id, subscription_id, only_ids, return_fields, ignore_exceptions,
+                                       max_workers)
 
     # Return the data as a master list of publication dictionaries or a pandas dataframe
-    if return_type == "dataframe":
-        all_subscribers = df_utils.convert_dict_list_to_dataframe(all_subscribers)
-    return all_subscribers
+    column_names = return_fields or Content.datasets.get('people')
+    return core.collect_results(all_subscribers, return_type, column_names, deadline, return_partial)
 
 
 def rebuild_publication(publication_id):
@@ -307,7 +369,7 @@ def rebuild_publication(publication_id):
     verify_core_connection()
 
     # Perform the PUT request to rebuild the publication
-    query = f"{base_url}/publications/{publication_id}/rebuild"
+    query = f"{core.base_url}/publications/{publication_id}/rebuild"
     payload = {}
     response = core.put_request_with_retries(query, payload)
     return response
@@ -327,7 +389,7 @@ def update_publication(publication_id, payload):
     verify_core_connection()
 
     # Perform the PUT request to update the publication
-    query = f"{base_url}/publications/{publication_id}"
+    query = f"{core.base_url}/publications/{publication_id}"
     response = core.put_request_with_retries(query, payload)
     return response
 
@@ -373,7 +435,7 @@ def update_stream(stream_id, payload):
     verify_core_connection()
 
     # Perform the PUT request to update the publication
-    query = f"{base_url}/streams/{stream_id}"
+    query = f"{core.base_url}/streams/{stream_id}"
     response = core.put_request_with_retries(query, payload)
     return response
 
@@ -391,7 +453,7 @@ def delete_stream(stream_id, return_json=False):
     verify_core_connection()
 
     # Delete the publication
-    stream_uri = f"{base_url}/streams/{stream_id}"
+    stream_uri = f"{core.base_url}/streams/{stream_id}"
     response = core.delete(stream_uri, return_json=return_json)
     return response
 
@@ -6,10 +6,36 @@
 :Example:        TBD
 :Created By:     Jeff Shurtliff
 :Last Modified:  Jeff Shurtliff
-:Modified Date:  14 Jan 2020
+:Modified Date:  17 Oct 2026
 """
+
+import importlib
+
 # Define all modules that will be imported with the "import *" method
 __all__ = ['base', 'blogs', 'spaces']
 
-# Always import the places base module
-from . import base, blogs, spaces
+# Always import the places base module (the other modules are imported the first time they are accessed)
+from . import base
+
+
+def __getattr__(name):
+    """This function imports the lazily-loaded submodules the first time they are accessed.
+
+    .. versionadded:: 3.3.0
+
+    :param name: The name of the attribute being accessed
+    :type name: str
+    :returns: The imported submodule
+    :raises: :py:exc:`AttributeError`
+    """
+    if name in __all__:
+        return importlib.import_module(f".{name}", __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    """This function includes the lazily-loaded submodules when listing the attributes of the package.
+
+    .. versionadded:: 3.3.0
+    """
+    return sorted(set(globals()) | set(__all__))
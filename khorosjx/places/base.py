@@ -6,19 +6,36 @@
 :Example:           ``place_info = khorosjx.spaces.core.get_place_info(browse_id)``
 :Created By:        Jeff Shurtliff
 :Last Modified:     Jeff Shurtliff
-:Modified Date:     22 Sep 2021
+:Modified Date:     17 Oct 2026
 """
 
 from .. import core, errors
 from ..utils import core_utils, df_utils
 
-# Define global variables
-base_url, api_credentials = '', None
+
+def __getattr__(name):
+    """This function forwards the deprecated ``base_url`` and ``api_credentials`` global variables to the active client.
+
+    .. versionadded:: 3.3.0
+
+    .. deprecated:: 3.3.0
+       Use :py:data:`khorosjx.core.base_url` and :py:data:`khorosjx.core.api_credentials` instead.
+
+    :param name: The name of the attribute being accessed
+    :type name: str
+    :returns: The value of the connection setting of the active :py:class:`khorosjx.core.Client` object
+    :raises: :py:exc:`AttributeError`
+    """
+    return core._get_deprecated_connection_attribute(__name__, name)
 
 
 def verify_core_connection():
     """This function verifies that the core connection information (Base URL and API credentials) has been defined.
 
+    .. versionchanged:: 3.3.0
+       The connection information of the active :py:class:`khorosjx.core.Client` object is now verified rather than
+       the global variables of this module so that each thread or asyncio task can use a different client.
+
     .. versionchanged:: 3.1.0
        Refactored the function to be more pythonic and to avoid depending on a try/except block.
 
@@ -26,13 +43,17 @@ def verify_core_connection():
     :raises: :py:exc:`khorosjx.errors.exceptions.KhorosJXError`,
              :py:exc:`khorosjx.errors.exceptions.NoCredentialsError`
     """
-    if not base_url or not api_credentials:
-        retrieve_connection_info()
+    core.verify_connection()
     return
 
 
 def retrieve_connection_info():
-    """This function initializes and defines the global variables for the connection information.
+    """This function verifies the connection information of the active client.
+
+    .. deprecated:: 3.3.0
+       The global variables of this module are no longer defined by this function, as the connection information is
+       stored in the active :py:class:`khorosjx.core.Client` object. Use :py:func:`khorosjx.core.get_connection_info`
+       instead.
 
     .. versionadded:: 3.1.0
 
@@ -40,10 +61,7 @@ def retrieve_connection_info():
     :raises: :py:exc:`khorosjx.errors.exceptions.KhorosJXError`,
              :py:exc:`khorosjx.errors.exceptions.NoCredentialsError`
     """
-    # Define the global variables at this module level
-    global base_url
-    global api_credentials
-    base_url, api_credentials = core.get_connection_info()
+    core._retrieve_deprecated_connection_info(__name__)
     return
 
 
@@ -51,6 +69,9 @@ def retrieve_connection_info():
 def get_place_info(place_id, return_fields=None, ignore_exceptions=False):
     """This function obtains the place information for a given Place ID. (aka Browse ID)
 
+    .. versionchanged:: 3.3.0
+       Only the fields needed to populate the ``return_fields`` are requested from the API when they are defined.
+
     .. versionchanged:: 3.1.0
        Changed the default ``return_fields`` value to ``None`` and adjusted the function accordingly.
 
@@ -70,7 +91,7 @@ def get_place_info(place_id, return_fields=None, ignore_exceptions=False):
     place_info = {}
 
     # Perform the API query to retrieve the space information
-    query_uri = f"{base_url}/places/{place_id}?fields=@all"
+    query_uri = f"{core.base_url}/places/{place_id}?{core.get_fields_filter(return_fields)}"
     response = core.get_request_with_retries(query_uri)
 
     # Verify that the query was successful
@@ -84,6 +105,34 @@ def get_place_info(place_id, return_fields=None, ignore_exceptions=False):
     return place_info
 
 
+def get_places_info(place_ids, return_fields=None, ignore_exceptions=False):
+    """This function obtains the place information for many Place IDs (aka Browse IDs) using batched API calls.
+
+    .. versionadded:: 3.3.0
+
+    :param place_ids: The Place IDs (aka Browse IDs) of the places whose information will be requested
+    :type place_ids: list, tuple, set
+    :param return_fields: Specific fields to return if not all of the default fields are needed (Optional)
+    :type return_fields: list, None
+    :param ignore_exceptions: Determines whether nor not exceptions should be ignored, in which case the information
+                              for places that could not be retrieved is an empty dictionary (Default: ``False``)
+    :type ignore_exceptions: bool
+    :returns: A dictionary mapping each Place ID to a dictionary with the place information
+    :raises: :py:exc:`khorosjx.errors.exceptions.GETRequestError`,
+             :py:exc:`khorosjx.errors.exceptions.InvalidDatasetError`
+    """
+    # Verify that the core connection has been established
+    verify_core_connection()
+
+    # Retrieve the places in batches and parse the data for each place that was found
+    places_data = core.get_data_many('places', place_ids, ignore_exceptions=ignore_exceptions, all_fields=True)
+    places_info = {}
+    for place_id, place_json in places_data.items():
+        places_info[place_id] = core.get_fields_from_api_response(place_json, 'place', return_fields) \
+            if place_json else {}
+    return places_info
+
+
 # Define function to get the Place ID for a place
 def get_place_id(container_id, return_type='str'):
     """This function retrieves the Place ID (aka Browse ID) for a place given its Container ID.
@@ -102,7 +151,7 @@ def get_place_id(container_id, return_type='str'):
     verify_core_connection()
 
     # Perform the API query to retrieve the information
-    query_uri = f"{base_url}/places?filter=entityDescriptor(14,{container_id})&fields=@all"
+    query_uri = f"{core.base_url}/places?filter=entityDescriptor(14,{container_id})&fields=@all"
     response = core.get_request_with_retries(query_uri)
 
     # Verify that the query was successful and raise an exception if not
@@ -160,7 +209,7 @@ def get_uri_for_id(destination_id, browse_id=True):
     verify_core_connection()
     if not browse_id:
         destination_id = get_browse_id(destination_id)
-    uri = f"{base_url}/places/{destination_id}"
+    uri = f"{core.base_url}/places/{destination_id}"
     return uri
 
 
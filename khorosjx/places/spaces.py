@@ -6,23 +6,39 @@
 :Example:           ``space_info = khorosjx.places.spaces.get_space_info(browse_id)``
 :Created By:        Jeff Shurtliff
 :Last Modified:     Jeff Shurtliff
-:Modified Date:     22 Sep 2021
+:Modified Date:     17 Oct 2026
 """
 
 import warnings
 
 from .. import core, errors
 from . import base as places_core
-from ..utils import core_utils, df_utils
 
-# Define global variables
-base_url, api_credentials = '', None
+
+def __getattr__(name):
+    """This function forwards the deprecated ``base_url`` and ``api_credentials`` global variables to the active client.
+
+    .. versionadded:: 3.3.0
+
+    .. deprecated:: 3.3.0
+       Use :py:data:`khorosjx.core.base_url` and :py:data:`khorosjx.core.api_credentials` instead.
+
+    :param name: The name of the attribute being accessed
+    :type name: str
+    :returns: The value of the connection setting of the active :py:class:`khorosjx.core.Client` object
+    :raises: :py:exc:`AttributeError`
+    """
+    return core._get_deprecated_connection_attribute(__name__, name)
 
 
 # Define function to verify the connection in the core module
 def verify_core_connection():
     """This function verifies that the core connection information (Base URL and API credentials) has been defined.
 
+    .. versionchanged:: 3.3.0
+       The connection information of the active :py:class:`khorosjx.core.Client` object is now verified rather than
+       the global variables of this module so that each thread or asyncio task can use a different client.
+
     .. versionchanged:: 3.1.0
        Refactored the function to be more pythonic and to avoid depending on a try/except block.
 
@@ -30,13 +46,17 @@ def verify_core_connection():
     :raises: :py:exc:`khorosjx.errors.exceptions.KhorosJXError`,
              :py:exc:`khorosjx.errors.exceptions.NoCredentialsError`
     """
-    if not base_url or not api_credentials:
-        retrieve_connection_info()
+    core.verify_connection()
     return
 
 
 def retrieve_connection_info():
-    """This function initializes and defines the global variables for the connection information.
+    """This function verifies the connection information of the active client.
+
+    .. deprecated:: 3.3.0
+       The global variables of this module are no longer defined by this function, as the connection information is
+       stored in the active :py:class:`khorosjx.core.Client` object. Use :py:func:`khorosjx.core.get_connection_info`
+       instead.
 
     .. versionchanged:: 3.1.0
        Refactored the function to be more efficient.
@@ -45,10 +65,7 @@ def retrieve_connection_info():
     :raises: :py:exc:`khorosjx.errors.exceptions.KhorosJXError`,
              :py:exc:`khorosjx.errors.exceptions.NoCredentialsError`
     """
-    # Define the global variables at this module level
-    global base_url
-    global api_credentials
-    base_url, api_credentials = core.get_connection_info()
+    core._retrieve_deprecated_connection_info(__name__)
     return
 
 
@@ -98,7 +115,7 @@ def get_permitted_content_types(id_value, id_type='browse_id', return_type='list
     id_value = places_core.__verify_browse_id(id_value, id_type)
 
     # Get the permitted content types
-    query_url = f"{base_url}/places/{id_value}/permissions"
+    query_url = f"{core.base_url}/places/{id_value}/permissions"
     space_permissions = core.get_request_with_retries(query_url, return_json=True)
 
     # Check for an error in the response
@@ -113,6 +130,20 @@ def get_permitted_content_types(id_value, id_type='browse_id', return_type='list
     return content_types
 
 
+def __get_paginated_content_permissions_url(_browse_id, _start_index):
+    """This function returns the query URL for a single page of permissions results for a given space.
+
+    .. versionadded:: 3.3.0
+
+    :param _browse_id: The Browse ID of the space to be queried
+    :type _browse_id: int, str
+    :param _start_index: The ``startIndex`` value to be used in the API query string
+    :returns: The full query URL for the page
+    """
+    return f"{core.base_url}/places/{_browse_id}/appliedEntitlements?fields=@all&count=100&" + \
+           f"startIndex={_start_index}"
+
+
 def __get_paginated_content_permissions(_browse_id, _start_index):
     """This function returns a single page of permissions results for a given space.
 
@@ -122,8 +153,7 @@ def __get_paginated_content_permissions(_browse_id, _start_index):
     :returns: A list of JSON dictionaries with the API query results
     :raises: :py:exc:`khorosjx.errors.exceptions.GETRequestError`
     """
-    _query_uri = f"{base_url}/places/{_browse_id}/appliedEntitlements?fields=@all&count=100&" + \
-                 f"startIndex={_start_index}"
+    _query_uri = __get_paginated_content_permissions_url(_browse_id, _start_index)
     _permissions_json = core.get_request_with_retries(_query_uri, return_json=True)
     errors.handlers.check_json_for_error(_permissions_json, 'space')
     _permissions_list = _permissions_json['list']
@@ -152,16 +182,21 @@ def get_space_permissions(id_value, id_type='browse_id', return_type='list'):
     return get_space_content_permissions(id_value, id_type, return_type)
 
 
-def get_space_content_permissions(id_value, id_type='browse_id', return_type='list'):
-    """This function returns all of the defined permissions (aka ``appliedEntitlements``) for a specific space.
+def iter_space_content_permissions(id_value, id_type='browse_id', max_workers=1):
+    """This function lazily yields each of the defined permissions (aka ``appliedEntitlements``) for a specific space.
+
+    .. versionadded:: 3.3.0
+
+    When the pages are retrieved sequentially the ``links.next`` URLs provided by the server are followed, and
+    otherwise the pages are requested concurrently by ``startIndex`` value.
 
     :param id_value: The space identifier as a Browse ID (default), Place ID or Space ID
     :type id_value: int, str
     :param id_type: Determines if the ``id_value`` is a ``browse_id`` (Default), ``place_id`` or ``space_id``
     :type id_type: str
-    :param return_type: Determines if the result should be returned as a ``list`` (Default) or pandas ``dataframe``
-    :type return_type: str
-    :returns: The list or dataframe with the space permissions
+    :param max_workers: The maximum number of pages to request concurrently (Default: ``1``)
+    :type max_workers: int
+    :returns: A generator that yields a dictionary for each permission
     :raises: :py:exc:`khorosjx.errors.exceptions.SpaceNotFoundError`,
              :py:exc:`khorosjx.errors.exceptions.GETRequestError`
     """
@@ -171,61 +206,51 @@ def get_space_content_permissions(id_value, id_type='browse_id', return_type='li
     # Get the appropriate ID for the space to check
     id_value = places_core.__verify_browse_id(id_value, id_type)
 
-    # Initialize the empty list for the permissions information
-    all_permissions = []
-
-    # Perform the first query to get up to the first 100 groups
-    start_index = 0
-    permissions = __get_paginated_content_permissions(id_value, start_index)
-    all_permissions = core_utils.add_to_master_list(permissions, all_permissions)
+    # Retrieve and yield each page of permissions, following the next page links when retrieved sequentially
+    if not max_workers or max_workers <= 1:
+        def _check_function(_response):
+            errors.handlers.check_json_for_error(_response.json(), 'space')
+        query_url = __get_paginated_content_permissions_url(id_value, 0)
+        for permissions in core.iter_linked_pages(query_url, check_function=_check_function):
+            yield from permissions
+        return
 
-    # Continue querying for groups until none are returned
-    while len(permissions) > 0:
-        start_index += 100
-        permissions = __get_paginated_content_permissions(id_value, start_index)
-        all_permissions = core_utils.add_to_master_list(permissions, all_permissions)
+    def _page_function(_start_index):
+        return __get_paginated_content_permissions(id_value, _start_index)
+    for permissions in core.iter_pages(_page_function, max_workers):
+        yield from permissions
 
-    # Return the data as a master list of group dictionaries or a pandas dataframe
-    if return_type == "dataframe":
-        all_permissions = __generate_permissions_dataframe(all_permissions)
-    return all_permissions
 
+def get_space_content_permissions(id_value, id_type='browse_id', return_type='list', max_workers=1, deadline=None,
+                                  return_partial=False):
+    """This function returns all of the defined permissions (aka ``appliedEntitlements``) for a specific space.
 
-# Define function to get the unique fields for the permissions data
-def __get_unique_permission_fields(_permissions_dict_list):
-    """This function gets the unique fields from a space permissions list from the ``get_space_permissions`` function.
+    .. versionchanged:: 3.3.0
+       Added the ``max_workers`` parameter and leveraged the
+       :py:func:`khorosjx.places.spaces.iter_space_content_permissions` function so that multiple pages can be
+       retrieved concurrently. Dataframes are now built column by column as each page is retrieved. Added the
+       ``deadline`` and ``return_partial`` parameters.
 
-    :param _permissions_dict_list: A list of dictionaries containing space permissions
-    :type _permissions_dict_list: list
-    :returns: List of unique field names
+    :param id_value: The space identifier as a Browse ID (default), Place ID or Space ID
+    :type id_value: int, str
+    :param id_type: Determines if the ``id_value`` is a ``browse_id`` (Default), ``place_id`` or ``space_id``
+    :type id_type: str
+    :param return_type: Determines if the result should be returned as a ``list`` (Default) or pandas ``dataframe``
+    :type return_type: str
+    :param max_workers: The maximum number of pages to request concurrently (Default: ``1``)
+    :type max_workers: int
+    :param deadline: The number of seconds in which every permission must be retrieved (Default: no deadline)
+    :type deadline: int, float, None
+    :param return_partial: Returns the permissions retrieved before the deadline expired as a
+                           :py:class:`khorosjx.core.PartialResults` list rather than raising an exception
+    :type return_partial: bool
+    :returns: The list or dataframe with the space permissions
+    :raises: :py:exc:`khorosjx.errors.exceptions.SpaceNotFoundError`,
+             :py:exc:`khorosjx.errors.exceptions.GETRequestError`,
+             :py:exc:`khorosjx.errors.exceptions.DeadlineExceededError`
     """
-    _unique_fields = []
-    for _permissions_dict in _permissions_dict_list:
-        for _permission_field in _permissions_dict.keys():
-            if _permission_field not in _unique_fields:
-                _unique_fields.append(_permission_field)
-    return _unique_fields
-
+    # Retrieve every page of permissions
+    all_permissions = iter_space_content_permissions(id_value, id_type, max_workers)
 
-# Define function to generate a dataframe with the space permissions
-def __generate_permissions_dataframe(_permissions_dict_list):
-    """This function converts a list of dictionaries containing space permissions into a pandas dataframe.
-
-    :param _permissions_dict_list: A list of dictionaries containing space permissions
-    :type _permissions_dict_list: list
-    :returns: A pandas dataframe with the permissions data
-    """
-    # Get the unique field names to act as the dataframe columns
-    _unique_permission_fields = __get_unique_permission_fields(_permissions_dict_list)
-
-    # Loop through the dictionaries in the original list
-    for _permissions_dict in _permissions_dict_list:
-        # Loop through the unique permission fields to see if they are all present
-        for _unique_field in _unique_permission_fields:
-            if _unique_field not in _permissions_dict.keys():
-                # Add the field if it does not exist
-                _permissions_dict[_unique_field] = ''
-
-    # Convert the dictionary list to a pandas dataframe
-    _permissions_data = df_utils.convert_dict_list_to_dataframe(_permissions_dict_list, _unique_permission_fields)
-    return _permissions_data
+    # Return the data as a master list of group dictionaries or a pandas dataframe with a column for every field
+    return core.collect_results(all_permissions, return_type, None, deadline, return_partial)
@@ -6,7 +6,7 @@
 :Example:           ``space_info = khorosjx.spaces.get_space_info(1234)``
 :Created By:        Jeff Shurtliff
 :Last Modified:     Jeff Shurtliff
-:Modified Date:     24 Mar 2020
+:Modified Date:     17 Oct 2026
 """
 
 import warnings
@@ -186,43 +186,3 @@ def get_space_permissions(id_value, id_type='browse_id', return_type='list'):
     )
     all_permissions = spaces.get_space_permissions(id_value, id_type, return_type)
     return all_permissions
-
-
-# Define function to get the unique fields for the permissions data
-def __get_unique_permission_fields(_permissions_dict_list):
-    """This function gets the unique fields from a space permissions list.
-
-    .. deprecated:: 2.0.0
-       The :py:func:`khorosjx.places.spaces.__get_unique_permission_fields` function should be used.
-
-    :param _permissions_dict_list: A list of dictionaries containing space permissions
-    :type _permissions_dict_list: list
-    :returns: List of unique field names
-    """
-    warnings.warn(
-        "The khorosjx.spaces.__get_unique_permission_fields function is deprecated and will be removed " +
-        "in v3.0.0. Use khorosjx.places.spaces.__get_unique_permission_fields instead.",
-        DeprecationWarning
-    )
-    _unique_fields = spaces.__get_unique_permission_fields(_permissions_dict_list)
-    return _unique_fields
-
-
-# Define function to generate a dataframe with the space permissions
-def __generate_permissions_dataframe(_permissions_dict_list):
-    """This function converts a list of dictionaries containing space permissions into a pandas dataframe.
-
-    .. deprecated:: 2.0.0
-       The :py:func:`khorosjx.places.spaces.__generate_permissions_dataframe` function should be used.
-
-    :param _permissions_dict_list: A list of dictionaries containing space permissions
-    :type _permissions_dict_list: list
-    :returns: A pandas dataframe with the permissions data
-    """
-    warnings.warn(
-        "The khorosjx.spaces.__generate_permissions_dataframe function is deprecated and will be removed " +
-        "in v3.0.0. Use khorosjx.places.spaces.__generate_permissions_dataframe instead.",
-        DeprecationWarning
-    )
-    _permissions_data = spaces.__generate_permissions_dataframe(_permissions_dict_list)
-    return _permissions_data
@@ -6,25 +6,43 @@
 :Example:        ``user_info = khorosjx.users.get_people_followed(user_id)``
 :Created By:     Jeff Shurtliff
 :Last Modified:  Jeff Shurtliff
-:Modified Date:  22 Sep 2021
+:Modified Date:  17 Oct 2026
 """
 
-import json
-
 from . import core
 from . import errors
 from .utils import core_utils
 from .utils.classes import Users
 from .utils.core_utils import eprint
 
-# Define global variables
-base_url, api_credentials = '', None
+
+def __getattr__(name):
+    """This function returns the :py:data:`khorosjx.users.user_id_cache` dictionary of the active client.
+
+    .. versionadded:: 3.3.0
+
+    The dictionary stores the resolved User IDs (or ``None`` for users who were not found) keyed by the base URL,
+    lookup type and normalized lookup value, and each :py:class:`khorosjx.core.Client` object has its own. The
+    deprecated ``base_url`` and ``api_credentials`` global variables are also forwarded to the active client.
+
+    :param name: The name of the attribute being accessed
+    :type name: str
+    :returns: The dictionary of resolved User IDs or the value of the connection setting
+    :raises: :py:exc:`AttributeError`
+    """
+    if name == 'user_id_cache':
+        return core.get_client().user_id_cache
+    return core._get_deprecated_connection_attribute(__name__, name)
 
 
 # Define function to verify the connection in the core module
 def verify_core_connection():
     """This function verifies that the core connection information (Base URL and API credentials) has been defined.
 
+    .. versionchanged:: 3.3.0
+       The connection information of the active :py:class:`khorosjx.core.Client` object is now verified rather than
+       the global variables of this module so that each thread or asyncio task can use a different client.
+
     .. versionchanged:: 3.1.0
        Refactored the function to be more pythonic and to avoid depending on a try/except block.
 
@@ -32,13 +50,17 @@ def verify_core_connection():
     :raises: :py:exc:`khorosjx.errors.exceptions.KhorosJXError`,
              :py:exc:`khorosjx.errors.exceptions.NoCredentialsError`
     """
-    if not base_url or not api_credentials:
-        retrieve_connection_info()
+    core.verify_connection()
     return
 
 
 def retrieve_connection_info():
-    """This function initializes and defines the global variables for the connection information.
+    """This function verifies the connection information of the active client.
+
+    .. deprecated:: 3.3.0
+       The global variables of this module are no longer defined by this function, as the connection information is
+       stored in the active :py:class:`khorosjx.core.Client` object. Use :py:func:`khorosjx.core.get_connection_info`
+       instead.
 
     .. versionchanged:: 3.1.0
        Refactored the function to be more efficient.
@@ -47,10 +69,7 @@ def retrieve_connection_info():
     :raises: :py:exc:`khorosjx.errors.exceptions.KhorosJXError`,
              :py:exc:`khorosjx.errors.exceptions.NoCredentialsError`
     """
-    # Define the global variables at this module level
-    global base_url
-    global api_credentials
-    base_url, api_credentials = core.get_connection_info()
+    core._retrieve_deprecated_connection_info(__name__)
     return
 
 
@@ -125,6 +144,10 @@ def parse_user_fields(json_data):
 def get_user_id(lookup_value, lookup_type='email'):
     """This function obtains the User ID for a user by querying the API against the user's email address or username.
 
+    .. versionchanged:: 3.3.0
+       User IDs that have already been resolved are now returned from the :py:data:`khorosjx.users.user_id_cache`
+       dictionary, and the email address validation is only performed when the lookup type is ``email``.
+
     .. versionchanged:: 3.1.0
        Updated the :py:func:`khorosjx.users._validate_lookup_type` function call to use the new function name.
 
@@ -137,14 +160,136 @@ def get_user_id(lookup_value, lookup_type='email'):
              :py:exc:`khorosjx.errors.exceptions.GETRequestError`
     """
     lookup_type = _validate_lookup_type(lookup_type)
-    if '@' not in lookup_value:
+    if lookup_type == 'email' and '@' not in lookup_value:
         exception_msg = f"The lookup type is 'email' but '{lookup_value}' is not a valid email address."
         raise errors.exceptions.LookupMismatchError(exception_msg)
-    user_data = core.get_data('people', lookup_value, lookup_type, return_json=True)
-    user_id = user_data['id']
+    user_id_cache = core.get_client().user_id_cache
+    user_id = user_id_cache.get(_get_user_id_cache_key(lookup_value, lookup_type))
+    if user_id is None:
+        user_data = core.get_data('people', lookup_value, lookup_type, return_json=True)
+        user_id = user_data['id']
+        user_id_cache[_get_user_id_cache_key(lookup_value, lookup_type)] = user_id
     return user_id
 
 
+def _normalize_lookup_value(_lookup_value, _lookup_type):
+    """This function normalizes an email address or username so that equivalent lookup values are resolved once.
+
+    .. versionadded:: 3.3.0
+
+    :param _lookup_value: The email address or username of the user
+    :type _lookup_value: str
+    :param _lookup_type: Determines if the lookup value is an ``email`` or ``username``
+    :type _lookup_type: str
+    :returns: The lookup value without surrounding whitespace (and in lowercase for email addresses)
+    """
+    _lookup_value = str(_lookup_value).strip()
+    return _lookup_value.lower() if _lookup_type == 'email' else _lookup_value
+
+
+def _get_user_id_cache_key(_lookup_value, _lookup_type):
+    """This function returns the key used to store a resolved User ID in the :py:data:`user_id_cache` dictionary.
+
+    .. versionadded:: 3.3.0
+
+    :param _lookup_value: The email address or username of the user
+    :type _lookup_value: str
+    :param _lookup_type: Determines if the lookup value is an ``email`` or ``username``
+    :type _lookup_type: str
+    :returns: A tuple with the base URL of the active client, the lookup type and the normalized lookup value
+    """
+    return core.base_url, _lookup_type, _normalize_lookup_value(_lookup_value, _lookup_type)
+
+
+def resolve_user_ids(lookup_values, lookup_type='email', ignore_exceptions=False, max_workers=4):
+    """This function resolves many email addresses or usernames to their User IDs using batched API calls.
+
+    .. versionadded:: 3.3.0
+
+    Duplicate lookup values are only resolved once, and the results (including users who could not be found) are
+    stored in the :py:data:`khorosjx.users.user_id_cache` dictionary of the active client so that they are not looked
+    up again by subsequent calls to this function or to :py:func:`khorosjx.users.get_user_id`.
+
+    :param lookup_values: The email addresses or usernames of the users
+    :type lookup_values: list, tuple, set
+    :param lookup_type: Determines if the lookup values are an ``email`` or ``username`` (Default: ``email``)
+    :type lookup_type: str
+    :param ignore_exceptions: Determines whether nor not exceptions should be ignored, in which case the lookup values
+                              that could not be resolved are mapped to ``None`` (Default: ``False``)
+    :type ignore_exceptions: bool
+    :param max_workers: The maximum number of ``executeBatch`` calls to perform concurrently (Default: ``4``)
+    :type max_workers: int
+    :returns: A dictionary mapping each lookup value to its User ID, or ``None`` if the user was not found
+    :raises: :py:exc:`khorosjx.errors.exceptions.InvalidLookupTypeError`,
+             :py:exc:`khorosjx.errors.exceptions.UserQueryError`
+    """
+    # Verify that the core connection has been established
+    verify_core_connection()
+
+    # Identify the unique lookup values that have not already been resolved
+    lookup_type = _validate_lookup_type(lookup_type)
+    user_id_cache = core.get_client().user_id_cache
+    cache_keys, pending_values = {}, {}
+    for lookup_value in lookup_values:
+        normalized_value = _normalize_lookup_value(lookup_value, lookup_type)
+        cache_keys[lookup_value] = cache_key = _get_user_id_cache_key(normalized_value, lookup_type)
+        if cache_key not in user_id_cache:
+            pending_values[cache_key] = normalized_value
+    endpoints = {cache_key: f"/people/{lookup_type}/{value}" for cache_key, value in pending_values.items()}
+
+    # Resolve the remaining lookup values and store the results (including users who were not found)
+    failures = []
+    for cache_key, (status_code, user_data) in core.execute_batch(endpoints, max_workers=max_workers).items():
+        if status_code == 200:
+            user_id_cache[cache_key] = user_data.get('id')
+        elif status_code == 404:
+            user_id_cache[cache_key] = None
+        else:
+            failures.append(f"{pending_values[cache_key]} ({status_code})")
+    if failures:
+        error_msg = f"The User IDs could not be resolved for the following users: {', '.join(failures)}"
+        if not ignore_exceptions:
+            raise errors.exceptions.UserQueryError(error_msg)
+        eprint(error_msg)
+    return {lookup_value: user_id_cache.get(cache_key) for lookup_value, cache_key in cache_keys.items()}
+
+
+def clear_user_id_cache():
+    """This function removes all resolved User IDs from the :py:data:`khorosjx.users.user_id_cache` dictionary of the
+       active client.
+
+    .. versionadded:: 3.3.0
+
+    :returns: None
+    """
+    core.get_client().user_id_cache.clear()
+    return
+
+
+def get_users_data(lookup_values, lookup_type='id', all_fields=False, ignore_exceptions=False):
+    """This function retrieves the data for many users using batched API calls.
+
+    .. versionadded:: 3.3.0
+
+    :param lookup_values: The User IDs, email addresses or usernames of the users
+    :type lookup_values: list, tuple, set
+    :param lookup_type: Determines if the lookup values are User IDs (``id``), email addresses (``email``) or
+                        usernames (``username``) (Default: ``id``)
+    :type lookup_type: str
+    :param all_fields: Determines whether or not the ``fields=@all`` query should be included (Default: ``False``)
+    :type all_fields: bool
+    :param ignore_exceptions: Determines whether nor not exceptions should be ignored, in which case the data for
+                              users who could not be found is an empty dictionary (Default: ``False``)
+    :type ignore_exceptions: bool
+    :returns: A dictionary mapping each lookup value to the data for the user in JSON format
+    :raises: :py:exc:`khorosjx.errors.exceptions.InvalidLookupTypeError`,
+             :py:exc:`khorosjx.errors.exceptions.GETRequestError`
+    """
+    if lookup_type not in ('id', 'email', 'username'):
+        raise errors.exceptions.InvalidLookupTypeError()
+    return core.get_data_many('people', lookup_values, lookup_type, ignore_exceptions, all_fields)
+
+
 # Define internal function to validate the lookup type for a GET request function call
 def _validate_lookup_type(_lookup_type, _retrieval_value='id'):
     """This function validates a lookup type to ensure that it is acceptable to the primary function call.
@@ -237,67 +382,38 @@ def get_profile_url(lookup_value, lookup_type="id"):
         username = lookup_value
     else:
         username = get_username(lookup_value, lookup_type)
-    profile_url = f"{base_url}/people/{username}"
+    profile_url = f"{core.base_url}/people/{username}"
     return profile_url
 
 
-def _get_paginated_content_count(_user_uri, _start_index, _count=100):
-    """This function identifies the content count for an individual REST API call.
-
-    .. versionchanged:: 3.1.0
-       Renamed the function to only have a single underscore prefix.
-
-    :param _user_uri: The URI for the user using the ``people`` API endpoint
-    :type _user_uri: str
-    :param _start_index: The startIndex value in the REST API call
-    :type _start_index: int
-    :param _count:  The number of results to return from the API (Default: ``100``)
-    :type _count: int
-    :returns: The count of content found for the individual REST API call in integer format
-    """
-    _content_uri = f"{base_url}/contents?filter=author({_user_uri})&count={_count}&startIndex={_start_index}"
-    _response = core.get_request_with_retries(_content_uri)
-    if _response.status_code == 200:
-        _response_json = _response.json()
-        _content_count = len(_response_json.get('list'))
-    else:
-        _content_count = 0
-    return _content_count
-
-
 # Define function to get the count of content created by a user
 def get_user_content_count(user_id, start_index=0):
     """This function obtains the number of content items created by a particular user.
 
-    .. versionchanged:: 3.1.0
-       Updated the :py:func:`khorosjx.users._get_paginated_content_count` function call to use the new function name.
+    .. versionchanged:: 3.3.0
+       The count is now identified with :py:func:`khorosjx.core.count_results`, which probes for the total using a
+       small number of single-record requests rather than retrieving every content item.
 
     :param user_id: The User ID of the user
     :type user_id: int
     :param start_index: The startIndex value in the REST API call (Default: ``0``)
     :type start_index: int
     :returns: The count of content found for the user in integer format
+    :raises: :py:exc:`khorosjx.errors.exceptions.GETRequestError`
     """
-    # Define the variable to track the total content count and structure the user URI
-    total_count = 0
-    user_uri = f"{base_url}/people/{user_id}"
-
-    # Get the content count for the first 100 results and increment the total count accordingly
-    content_count = _get_paginated_content_count(user_uri, start_index)
-    total_count += content_count
-
-    # Continue rolling through the user content until all assets have been identified
-    while content_count > 0:
-        start_index += 100
-        content_count = _get_paginated_content_count(user_uri, start_index)
-        total_count += content_count
-    return total_count
+    user_uri = f"{core.base_url}/people/{user_id}"
+    total_count = core.count_results(f"{core.base_url}/contents", ('author', user_uri))
+    return max(total_count - start_index, 0)
 
 
 # Define function to get the people followed by a particular user
 def get_people_followed(user_id, ignore_exceptions=False, return_type=list, start_index=0):
     """This function returns a list of users followed by a particular user.
 
+    .. versionchanged:: 3.3.0
+       The subsequent pages are now retrieved by following the ``links.next`` URL in each response and the
+       ``start_index`` value is now applied to the initial API call.
+
     :param user_id: The User ID for the user against which to check
     :type user_id: int
     :param ignore_exceptions: Determines whether non-200 API responses should raise an exception (Default: ``False``)
@@ -308,9 +424,12 @@ def get_people_followed(user_id, ignore_exceptions=False, return_type=list, star
     :type start_index: int
     :returns: The User IDs of all people followed by the queried user
     """
-    def _get_followed(_user_id, _ignore_exceptions=False, _start_index=0, _count=100):
+    def _get_followed(_user_id, _ignore_exceptions=False, _start_index=0, _count=100, _following_url=None):
         """This function performs the API call to get the users followed from a single GET request.
 
+        .. versionchanged:: 3.3.0
+           Added the ``_following_url`` parameter to request a URL provided in the ``links.next`` value.
+
         .. versionchanged:: 3.1.0
            Renamed the function to only have a single underscore prefix and added parenthesis to the exception
            classes.
@@ -323,12 +442,15 @@ def get_people_followed(user_id, ignore_exceptions=False, return_type=list, star
         :type _start_index: int
         :param _count: The maximum number of results to return in the API call (Default: ``100``)
         :type _count: int
+        :param _following_url: The full URL to request in place of constructing it from the other values (Optional)
+        :type _following_url: str, None
         :returns: The data from the @following sub-endpoint in JSON format
         :raises: :py:exc:`khorosjx.errors.exceptions.UserQueryError`,
                  :py:exc:`khorosjx.errors.exceptions.UserNotFoundError`,
         """
-        _following_url = f"{base_url}/people/{_user_id}/@following?count={_count}" + \
-                         f"&startIndex={_start_index}"
+        if not _following_url:
+            _following_url = f"{core.base_url}/people/{_user_id}/@following?count={_count}" + \
+                             f"&startIndex={_start_index}"
         _response = core.get_request_with_retries(_following_url)
         if _response.status_code == 200:
             _following_data = _response.json()
@@ -348,17 +470,19 @@ def get_people_followed(user_id, ignore_exceptions=False, return_type=list, star
 
     # Perform the initial API call
     people_followed = []
-    following_data = _get_followed(user_id, ignore_exceptions)
+    following_data = _get_followed(user_id, ignore_exceptions, start_index)
 
-    # Continue looping through the data from subsequent calls until an empty list is found in the JSON response
+    # Continue following the next page links until a page with fewer than 100 users is found in the JSON response
     while following_data.get('list'):
         for user_followed in following_data.get('list'):
             # Append reach User ID to the list
             people_followed.append(user_followed.get('id'))
 
         # Perform the next API call for the next 100 users
-        start_index += 100
-        following_data = _get_followed(user_id, ignore_exceptions, start_index)
+        next_url = core.get_next_link(following_data)
+        if len(following_data.get('list')) < 100 or not next_url:
+            break
+        following_data = _get_followed(user_id, ignore_exceptions, _following_url=next_url)
 
     # Convert the list to a comma-separated string and return the value
     if return_type == str:
@@ -381,7 +505,7 @@ def get_recent_logins(count=100, start_index=0):
     verify_core_connection()
 
     # Perform and parse the query
-    query_url = f"{base_url}/people?sort=lastLoggedIn&" + \
+    query_url = f"{core.base_url}/people?sort=lastLoggedIn&" + \
                 f"fields=jive,emails,name&count={count}&startIndex={start_index}"
     response = core.get_request_with_retries(query_url)
     if response.status_code != 200:
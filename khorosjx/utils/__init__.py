@@ -6,7 +6,34 @@
 :Example:        ``json_data = core_utils.convert_dict_to_json(dict_data)``
 :Created By:     Jeff Shurtliff
 :Last Modified:  Jeff Shurtliff
-:Modified Date:  07 Jan 2020
+:Modified Date:  17 Oct 2026
 """
+
+import importlib
+
 # Define all modules that will be imported with the "import *" method
-__all__ = ['classes', 'core_utils', 'df_utils', 'helper']
+__all__ = ['cache', 'classes', 'core_utils', 'df_utils', 'field_paths', 'helper', 'metrics', 'rate_limit', 'retry',
+           'singleflight']
+
+
+def __getattr__(name):
+    """This function imports the lazily-loaded submodules the first time they are accessed.
+
+    .. versionadded:: 3.3.0
+
+    :param name: The name of the attribute being accessed
+    :type name: str
+    :returns: The imported submodule
+    :raises: :py:exc:`AttributeError`
+    """
+    if name in __all__:
+        return importlib.import_module(f".{name}", __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    """This function includes the lazily-loaded submodules when listing the attributes of the package.
+
+    .. versionadded:: 3.3.0
+    """
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,370 @@
+# -*- coding: utf-8 -*-
+"""
+:Module:         khorosjx.utils.cache
+:Synopsis:       In-process TTL/LRU cache and persistent conditional cache for API responses
+:Usage:          ``from khorosjx.utils.cache import ResponseCache, PersistentResponseCache``
+:Example:        ``cache = ResponseCache(max_size=2048, default_ttl=300, endpoint_ttls={'people': 900})``
+:Created By:     Jeff Shurtliff
+:Last Modified:  Jeff Shurtliff
+:Modified Date:  17 Oct 2026
+"""
+
+import re
+import json
+import time
+import sqlite3
+import threading
+from collections import OrderedDict
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode, unquote
+
+# Define the pattern used to identify the API base path within a URL path (e.g. /api/core/v3)
+API_BASE_PATH = re.compile(r'^.*?/api/core/v\d+(?=/|$)')
+
+
+def normalize_url(url):
+    """This function normalizes a URL so that equivalent URLs produce the same cache key.
+
+    .. versionadded:: 3.3.0
+
+    The scheme and host are lowercased, duplicate and trailing slashes are removed from the path, the fragment is
+    dropped and the query string parameters are sorted.
+
+    :param url: The URL to normalize
+    :type url: str
+    :returns: The normalized URL
+    """
+    parts = urlsplit(url)
+    path = '/'.join(segment for segment in unquote(parts.path).split('/') if segment)
+    query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)), safe='@,()')
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), f"/{path}", query, ''))
+
+
+def get_invalidation_paths(url):
+    """This function identifies the paths whose cached responses should be invalidated when a resource is modified.
+
+    .. versionadded:: 3.3.0
+
+    :param url: The URL of the resource that was modified
+    :type url: str
+    :returns: The lowercase host, the path of the resource and a set of the paths of its parent resources
+    """
+    parts = urlsplit(normalize_url(url))
+    path = parts.path.rstrip('/')
+    base_path = API_BASE_PATH.match(path)
+    base_path = base_path.group(0) if base_path else ''
+    resource_path, parent_paths = path, set()
+    while path.rfind('/') > len(base_path):
+        path = path[:path.rfind('/')]
+        parent_paths.add(path)
+    return parts.netloc, resource_path, parent_paths
+
+
+class ResponseCache(object):
+    """This class is a thread-safe, size-bounded LRU cache of API responses whose entries expire after a TTL.
+
+    .. versionadded:: 3.3.0
+
+    Entries are keyed by their normalized URL. The TTL of an entry is determined by its endpoint (i.e. the first
+    path segment after the ``/api/core/v3`` base path such as ``people`` or ``contents``) using the
+    ``endpoint_ttls`` mapping, falling back to the ``default_ttl`` value. An endpoint with a TTL of ``0`` is never
+    cached.
+    """
+    def __init__(self, max_size=1024, default_ttl=300.0, endpoint_ttls=None):
+        """This method instantiates the response cache.
+
+        :param max_size: The maximum number of responses to store before evicting the least recently used entry
+                         (Default: ``1024``)
+        :type max_size: int
+        :param default_ttl: The number of seconds that a response remains valid (Default: ``300.0``)
+        :type default_ttl: int, float
+        :param endpoint_ttls: A mapping of endpoint names to their TTL in seconds (e.g. ``{'people': 900}``)
+        :type endpoint_ttls: dict, None
+        :raises: :py:exc:`ValueError`
+        """
+        if max_size < 1 or default_ttl < 0:
+            raise ValueError("The max_size value must be at least one and the default_ttl cannot be negative.")
+        self.max_size = int(max_size)
+        self.default_ttl = default_ttl
+        self.endpoint_ttls = dict(endpoint_ttls or {})
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {'hits': 0, 'misses': 0, 'evictions': 0, 'invalidations': 0}
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __repr__(self):
+        return f"ResponseCache(max_size={self.max_size}, default_ttl={self.default_ttl}, " + \
+               f"endpoint_ttls={self.endpoint_ttls})"
+
+    @staticmethod
+    def _split_path(key):
+        """This method splits the path of a normalized URL into the API base path and the relative path."""
+        path = urlsplit(key).path.rstrip('/')
+        base_path = API_BASE_PATH.match(path)
+        base_path = base_path.group(0) if base_path else ''
+        return base_path, path[len(base_path):]
+
+    def get_ttl(self, url):
+        """This method returns the TTL in seconds that applies to a given URL.
+
+        :param url: The URL of the API request
+        :type url: str
+        :returns: The TTL in seconds
+        """
+        endpoint = self._split_path(normalize_url(url))[1].strip('/').split('/')[0]
+        return self.endpoint_ttls.get(endpoint, self.default_ttl)
+
+    def get(self, url):
+        """This method returns the cached response for a URL if it exists and has not expired.
+
+        :param url: The URL of the API request
+        :type url: str
+        :returns: The cached response or ``None`` if no valid response is cached
+        """
+        key = normalize_url(url)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > time.monotonic():
+                self._entries.move_to_end(key)
+                self._stats['hits'] += 1
+                return entry[1]
+            if entry is not None:
+                del self._entries[key]
+            self._stats['misses'] += 1
+        return None
+
+    def set(self, url, response):
+        """This method stores a response for a URL, evicting the least recently used entries as necessary.
+
+        :param url: The URL of the API request
+        :type url: str
+        :param response: The API response to cache
+        :returns: None
+        """
+        ttl = self.get_ttl(url)
+        if ttl <= 0:
+            return
+        key = normalize_url(url)
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, response)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self._stats['evictions'] += 1
+        return
+
+    def invalidate(self, url):
+        """This method removes the cached responses for a resource, its sub-resources and its parent resources.
+
+        For example, invalidating ``/contents/1234`` removes the cached responses for ``/contents/1234``,
+        ``/contents/1234?fields=@all`` and ``/contents/1234/attachments`` as well as ``/contents``.
+
+        :param url: The URL of the resource that was modified
+        :type url: str
+        :returns: The number of cached responses that were removed
+        """
+        netloc, resource_path, parent_paths = get_invalidation_paths(url)
+        removed = 0
+        with self._lock:
+            for entry_key in list(self._entries):
+                key_parts = urlsplit(entry_key)
+                if key_parts.netloc != netloc:
+                    continue
+                key_path = key_parts.path.rstrip('/')
+                if key_path == resource_path or key_path.startswith(f"{resource_path}/") or key_path in parent_paths:
+                    del self._entries[entry_key]
+                    removed += 1
+            self._stats['invalidations'] += removed
+        return removed
+
+    def clear(self):
+        """This method removes every cached response.
+
+        :returns: None
+        """
+        with self._lock:
+            self._entries.clear()
+        return
+
+    def get_stats(self):
+        """This method returns the cache statistics.
+
+        :returns: A dictionary with the ``hits``, ``misses``, ``evictions``, ``invalidations``, ``size`` and
+                  ``hit_rate`` values
+        """
+        with self._lock:
+            stats = dict(self._stats)
+            stats['size'] = len(self._entries)
+        lookups = stats['hits'] + stats['misses']
+        stats['hit_rate'] = stats['hits'] / lookups if lookups else 0.0
+        return stats
+
+    def reset_stats(self):
+        """This method resets the hit, miss, eviction and invalidation counters.
+
+        :returns: None
+        """
+        with self._lock:
+            self._stats = {'hits': 0, 'misses': 0, 'evictions': 0, 'invalidations': 0}
+        return
+
+
+class PersistentResponseCache(object):
+    """This class is a persistent cache of API responses stored in a SQLite database which are revalidated using
+       conditional requests.
+
+    .. versionadded:: 3.3.0
+
+    The body, headers, ``ETag`` and ``Last-Modified`` values of successful responses are stored on disk so that
+    subsequent requests for the same URL (including those made by later processes) can include the
+    ``If-None-Match`` and ``If-Modified-Since`` headers. When the API returns a ``304 Not Modified`` response, the
+    stored body is used rather than downloading it again.
+    """
+    def __init__(self, file_path='khorosjx_cache.db', max_entries=None):
+        """This method instantiates the persistent cache and creates the database table if necessary.
+
+        :param file_path: The path to the SQLite database file (Default: ``khorosjx_cache.db``)
+        :type file_path: str
+        :param max_entries: The maximum number of responses to store before the least recently used responses are
+                            removed, or ``None`` for no limit (Default: ``None``)
+        :type max_entries: int, None
+        :raises: :py:exc:`sqlite3.Error`
+        """
+        self.file_path = file_path
+        self.max_entries = max_entries
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._stats = {'revalidated': 0, 'misses': 0, 'stores': 0, 'invalidations': 0}
+        with self._connect() as connection:
+            connection.execute("CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY, netloc TEXT NOT NULL, "
+                               "path TEXT NOT NULL, headers TEXT NOT NULL, body BLOB NOT NULL, etag TEXT, "
+                               "last_modified TEXT, accessed REAL NOT NULL)")
+            connection.execute("CREATE INDEX IF NOT EXISTS responses_path ON responses (netloc, path)")
+
+    def __repr__(self):
+        return f"PersistentResponseCache(file_path={self.file_path!r}, max_entries={self.max_entries})"
+
+    def _connect(self):
+        """This method returns the SQLite connection for the current thread, opening it if necessary."""
+        connection = getattr(self._local, 'connection', None)
+        if connection is None:
+            connection = sqlite3.connect(self.file_path, timeout=30)
+            connection.execute("PRAGMA journal_mode=WAL")
+            self._local.connection = connection
+        return connection
+
+    def _increment(self, stat_name, value=1):
+        """This method increments one of the cache statistics."""
+        with self._lock:
+            self._stats[stat_name] += value
+
+    def get(self, url):
+        """This method returns the stored response data for a URL.
+
+        :param url: The URL of the API request
+        :type url: str
+        :returns: A dictionary with the ``headers``, ``body``, ``etag`` and ``last_modified`` values or ``None``
+        """
+        row = self._connect().execute("SELECT headers, body, etag, last_modified FROM responses WHERE key = ?",
+                                      (normalize_url(url),)).fetchone()
+        if row is None:
+            return None
+        return {'headers': json.loads(row[0]), 'body': row[1], 'etag': row[2], 'last_modified': row[3]}
+
+    def get_conditional_headers(self, url):
+        """This method returns the conditional request headers for a URL based on its stored response.
+
+        :param url: The URL of the API request
+        :type url: str
+        :returns: A dictionary with the ``If-None-Match`` and/or ``If-Modified-Since`` headers (which may be empty)
+        """
+        entry = self.get(url)
+        headers = {}
+        if entry is not None:
+            if entry['etag']:
+                headers['If-None-Match'] = entry['etag']
+            if entry['last_modified']:
+                headers['If-Modified-Since'] = entry['last_modified']
+        if not headers:
+            self._increment('misses')
+        return headers
+
+    def mark_revalidated(self, url):
+        """This method records that the stored response for a URL was confirmed to be current by the API.
+
+        :param url: The URL of the API request
+        :type url: str
+        :returns: A dictionary with the ``headers`` and ``body`` values or ``None`` if the response is not stored
+        """
+        entry = self.get(url)
+        if entry is not None:
+            with self._connect() as connection:
+                connection.execute("UPDATE responses SET accessed = ? WHERE key = ?", (time.time(), normalize_url(url)))
+            self._increment('revalidated')
+        return entry
+
+    def set(self, url, headers, body):
+        """This method stores a successful response if it includes an ``ETag`` or ``Last-Modified`` header.
+
+        :param url: The URL of the API request
+        :type url: str
+        :param headers: The headers of the API response
+        :param body: The raw body of the API response
+        :type body: bytes
+        :returns: Boolean value indicating whether or not the response was stored
+        """
+        headers = {str(name): str(value) for name, value in dict(headers).items()}
+        lowercase_headers = {name.lower(): value for name, value in headers.items()}
+        etag, last_modified = lowercase_headers.get('etag'), lowercase_headers.get('last-modified')
+        if not etag and not last_modified:
+            return False
+        key = normalize_url(url)
+        parts = urlsplit(key)
+        with self._connect() as connection:
+            connection.execute("INSERT OR REPLACE INTO responses (key, netloc, path, headers, body, etag, "
+                               "last_modified, accessed) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                               (key, parts.netloc, parts.path.rstrip('/'), json.dumps(headers), sqlite3.Binary(body),
+                                etag, last_modified, time.time()))
+            if self.max_entries:
+                connection.execute("DELETE FROM responses WHERE key NOT IN "
+                                   "(SELECT key FROM responses ORDER BY accessed DESC LIMIT ?)", (self.max_entries,))
+        self._increment('stores')
+        return True
+
+    def invalidate(self, url):
+        """This method removes the stored responses for a resource, its sub-resources and its parent resources.
+
+        :param url: The URL of the resource that was modified
+        :type url: str
+        :returns: The number of stored responses that were removed
+        """
+        netloc, resource_path, parent_paths = get_invalidation_paths(url)
+        paths = [resource_path] + sorted(parent_paths)
+        placeholders = ', '.join('?' for _ in paths)
+        escaped_path = resource_path.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+        with self._connect() as connection:
+            cursor = connection.execute(f"DELETE FROM responses WHERE netloc = ? AND (path IN ({placeholders}) OR "
+                                        "path LIKE ? ESCAPE '\\')", [netloc] + paths + [f"{escaped_path}/%"])
+        removed = max(cursor.rowcount, 0)
+        self._increment('invalidations', removed)
+        return removed
+
+    def clear(self):
+        """This method removes every stored response.
+
+        :returns: None
+        """
+        with self._connect() as connection:
+            connection.execute("DELETE FROM responses")
+        return
+
+    def get_stats(self):
+        """This method returns the cache statistics.
+
+        :returns: A dictionary with the ``revalidated``, ``misses``, ``stores``, ``invalidations`` and ``size`` values
+        """
+        with self._lock:
+            stats = dict(self._stats)
+        stats['size'] = self._connect().execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+        return stats
@@ -22,6 +22,7 @@ class FieldLists:
                    'commentCount', 'published', 'updated', 'tags', 'contentID', 'author.id', 'author.name.formatted',
                    'author.email.value', 'content.text', 'parent', 'status', 'visibleToExternalContributors',
                    'type','typeCode','lastActivityDate','score','stage','authorshipPolicy']
+    permission_fields = ['id', 'type', 'entitlements', 'subject', 'object', 'subjectType', 'objectType']
     people_fields = ['id', 'followerCount', 'published', 'updated', 'displayName', 'mentionName',
                      'name.formatted', 'email.value', 'followingCount', 'directReportCount',
                      'initialLogin', 'jive.lastAuthenticated', 'jive.externalIdentities.identityType',
@@ -85,6 +86,7 @@ class Content:
         'group_members': FieldLists.people_fields,
         'idea': FieldLists.idea_fields,
         'people': FieldLists.people_fields,
+        'permission': FieldLists.permission_fields,
         'place': FieldLists.place_fields,
         'publication': FieldLists.publication_fields,
         'security_group': FieldLists.security_group_fields,
@@ -6,7 +6,7 @@
 :Example:           ``timestamp = khorosjx.utils.core_utils.get_timestamp(time_format="delimited")``
 :Created By:        Jeff Shurtliff
 :Last Modified:     Jeff Shurtliff
-:Modified Date:      Dec 2019
+:Modified Date:     17 Oct 2026
 """
 
 import sys
@@ -114,13 +114,16 @@ def convert_dict_to_json(data):
 
 
 # Define function to convert a list of dictionaries to a pandas dataframe
-def convert_dict_list_to_dataframe(dict_list, column_names=[]):
+def convert_dict_list_to_dataframe(dict_list, column_names=None):
     """This function converts a list of dictionaries into a pandas dataframe.
 
+    .. versionchanged:: 3.3.0
+       The default ``column_names`` value was changed to ``None`` to avoid sharing a mutable default value.
+
     :param dict_list: List of dictionaries
     :type dict_list: list
     :param column_names: The column names for the dataframe (Optional)
-    :type column_names: list
+    :type column_names: list, None
     :returns: A pandas dataframe of the data
     """
     warnings.warn(
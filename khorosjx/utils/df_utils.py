@@ -3,40 +3,126 @@
 :Module:        khorosjx.utils.df_utils
 :Synopsis:      Useful tools and utilities to assist in importing, manipulating and exporting pandas dataframes
 :Usage:         ``from khorosjx import df_utils``
-:Example:       TBD
+:Example:       ``dataframe = df_utils.convert_dict_list_to_dataframe(groups.iter_all_groups())``
 :Created By:    Jeff Shurtliff
 :Last Modified: Jeff Shurtliff
-:Modified Date: 18 Dec 2019
+:Modified Date: 17 Oct 2026
 """
 
-import pandas as pd
+# Define the global variable for the pandas package which is imported the first time a dataframe is needed
+pd = None
+
+
+def import_pandas():
+    """This function imports the pandas package the first time it is needed so that it is not loaded at startup.
+
+    .. versionadded:: 3.3.0
+
+    :returns: The imported :py:mod:`pandas` package
+    """
+    global pd
+    if pd is None:
+        import pandas as pd
+    return pd
+
+
+class ColumnarFrameBuilder(object):
+    """This class accumulates records directly into per-column lists and builds a pandas dataframe from them once.
+
+    .. versionadded:: 3.3.0
+
+    When ``column_names`` are supplied the schema is fixed and any other fields in the records are ignored.
+    Otherwise a column is added the first time a field is encountered and is back-filled for the records that
+    preceded it. Fields that are missing from a record are stored as missing values (i.e. ``NaN`` or ``<NA>``)
+    rather than being shifted into another column.
+    """
+    def __init__(self, column_names=None, dtypes=None):
+        """This method instantiates the builder.
+
+        :param column_names: The fixed column names (i.e. field names) for the dataframe (Optional)
+        :type column_names: list, tuple, None
+        :param dtypes: A dictionary mapping column names to the pandas dtypes they should be converted to (Optional)
+        :type dtypes: dict, None
+        """
+        self.fixed_schema = column_names is not None
+        self.columns = {column_name: [] for column_name in (column_names or ())}
+        self.dtypes = dict(dtypes) if dtypes else {}
+        self.row_count = 0
+
+    def __len__(self):
+        return self.row_count
+
+    def __repr__(self):
+        return f"ColumnarFrameBuilder(columns={list(self.columns)}, rows={self.row_count})"
+
+    def append(self, record):
+        """This method appends a single record (i.e. dictionary) to the columns.
+
+        :param record: The record to append
+        :type record: dict
+        :returns: None
+        """
+        if not self.fixed_schema and record.keys() - self.columns.keys():
+            for field_name in record:
+                if field_name not in self.columns:
+                    self.columns[field_name] = [None] * self.row_count
+        get_value = record.get
+        for column_name, column_values in self.columns.items():
+            column_values.append(get_value(column_name))
+        self.row_count += 1
+        return
+
+    def extend(self, records):
+        """This method appends multiple records (e.g. a page of API results) to the columns.
+
+        :param records: The records to append
+        :type records: list, tuple, generator
+        :returns: None
+        """
+        for record in records:
+            self.append(record)
+        return
+
+    def to_dataframe(self):
+        """This method builds a pandas dataframe from the accumulated columns.
+
+        :returns: A pandas dataframe of the data
+        """
+        pd = import_pandas()
+        dataframe = pd.DataFrame(self.columns, columns=list(self.columns))
+        dtypes = {column_name: dtype for column_name, dtype in self.dtypes.items() if column_name in self.columns}
+        if dtypes:
+            dataframe = dataframe.astype(dtypes)
+        return dataframe
 
 
 # Define function to convert a list of dictionaries to a pandas dataframe
-def convert_dict_list_to_dataframe(dict_list, column_names=[]):
+def convert_dict_list_to_dataframe(dict_list, column_names=None, fields=None, dtypes=None):
     """This function converts a list of dictionaries into a pandas dataframe.
 
-    :param dict_list: List of dictionaries
-    :type dict_list: list
-    :param column_names: The column names for the dataframe (Optional)
-    :type column_names: list
+    .. versionchanged:: 3.3.0
+       The dataframe is now built by the :py:class:`khorosjx.utils.df_utils.ColumnarFrameBuilder` class, which
+       aligns each value by its field name and stores missing fields as missing values, and any iterable of
+       dictionaries (such as a generator) can be supplied. The default ``column_names`` value was changed to
+       ``None`` so that the column names are no longer retained between calls, and the ``fields`` and ``dtypes``
+       arguments were added.
+
+    :param dict_list: List (or other iterable) of dictionaries
+    :type dict_list: list, tuple, generator
+    :param column_names: The column names which relabel the columns of the dataframe by position (Optional)
+    :type column_names: list, tuple, None
+    :param fields: The fields to include as columns in the dataframe (Default: every field in the data)
+    :type fields: list, tuple, None
+    :param dtypes: A dictionary mapping field names to the pandas dtypes they should be converted to (Optional)
+    :type dtypes: dict, None
     :returns: A pandas dataframe of the data
+    :raises: :py:exc:`ValueError`
     """
-    # Identify the dataframe column names
-    if len(column_names) == 0:
-        for field_name in dict_list[0].keys():
-            column_names.append(field_name)
-
-    # Identify the data for each column
-    df_data = []
-    for idx in range(0, len(dict_list)):
-        row_data = []
-        for field_value in dict_list[idx].values():
-            row_data.append(field_value)
-        df_data.append(row_data)
-
-    # Create and return the dataframe
-    dataframe = pd.DataFrame(df_data, columns=column_names)
+    builder = ColumnarFrameBuilder(fields, dtypes)
+    builder.extend(dict_list)
+    dataframe = builder.to_dataframe()
+    if column_names:
+        dataframe.columns = list(column_names)
     return dataframe
 
 
@@ -56,6 +142,7 @@ def import_csv(file_path, delimiter=",", column_names=[], columns_to_return=[],
     :raises: FileNotFoundError, TypeError
     """
     # Determine the appropriate use case and then import and return the dataframe
+    pd = import_pandas()
     if has_headers is False and len(column_names) == 0:
         if len(columns_to_return) == 0:                                             # Use Case: Headless
             dataframe = pd.read_csv(file_path, sep=delimiter, header=None)
@@ -93,6 +180,7 @@ def import_excel(file_path, excel_sheet='', use_first_sheet=False,
     :raises: FileNotFoundError, TypeError
     """
     # Determine the appropriate use case and then import and return the dataframe
+    pd = import_pandas()
     if excel_sheet != "" and use_first_sheet is False:
         if has_headers is False and len(column_names) == 0:
             if columns_to_return == 0:                                                  # Use Case: Headless
@@ -0,0 +1,158 @@
+# -*- coding: utf-8 -*-
+"""
+:Module:         khorosjx.utils.field_paths
+:Synopsis:       Compiles dotted and indexed field paths into cached accessor functions for parsing API responses
+:Usage:          ``from khorosjx.utils.field_paths import compile_fields``
+:Example:        ``values = extract_fields(user_json, ['id', 'name.formatted', 'emails[0].value'])``
+:Created By:     Jeff Shurtliff
+:Last Modified:  Jeff Shurtliff
+:Modified Date:  17 Oct 2026
+"""
+
+import re
+from functools import lru_cache
+
+# Define the pattern used to parse a path segment with optional list indices (e.g. emails[0])
+SEGMENT_PATTERN = re.compile(r'^([^\[\]]*)((?:\[-?\d+\])*)$')
+
+# Map the singular field names used in field lists to the plural keys used in the API response
+FIELD_ALIASES = {
+    'email': 'emails'
+}
+
+# Define the exceptions raised when a field path cannot be resolved
+LOOKUP_ERRORS = (KeyError, IndexError, TypeError)
+
+
+def parse_field_path(field):
+    """This function parses a dotted field path into a tuple of dictionary keys and list indices.
+
+    .. versionadded:: 3.3.0
+
+    Each segment of the path is separated by a period and may be followed by one or more list indices in square
+    brackets. (e.g. ``jive.externalIdentities[0].identity``)
+
+    :param field: The field path to parse
+    :type field: str
+    :returns: A tuple of steps where strings are dictionary keys and integers are list indices
+    :raises: :py:exc:`ValueError`
+    """
+    steps = []
+    for segment in field.split('.'):
+        match = SEGMENT_PATTERN.match(segment)
+        if not match or not match.group(1):
+            raise ValueError(f"The field path '{field}' is not valid.")
+        steps.append(match.group(1))
+        steps.extend(int(index) for index in re.findall(r'-?\d+', match.group(2)))
+    return tuple(steps)
+
+
+@lru_cache(maxsize=1024)
+def get_field_projection(fields):
+    """This function returns the top-level API fields required to retrieve a sequence of field paths.
+
+    .. versionadded:: 3.3.0
+
+    The result can be supplied in the ``fields`` query string parameter so that the API only returns the data that
+    is needed, where the parent of any nested field path (e.g. ``jive`` for ``jive.username``) is requested and
+    aliased names are converted to their API field names. (e.g. ``emails`` for ``email.value``)
+
+    :param fields: The field paths that will be retrieved from the API response
+    :type fields: tuple
+    :returns: A tuple of the unique top-level API field names in their original order
+    :raises: :py:exc:`ValueError`
+    """
+    projection = {}
+    for field in fields:
+        steps = parse_field_path(field)
+        top_level_field = FIELD_ALIASES.get(steps[0], steps[0]) if len(steps) > 1 else steps[0]
+        projection[top_level_field] = None
+    return tuple(projection)
+
+
+@lru_cache(maxsize=None)
+def compile_field_path(field):
+    """This function compiles a field path into a function which retrieves the field value from JSON data.
+
+    .. versionadded:: 3.3.0
+
+    A field that exists as a top-level key is always returned directly. Otherwise the path is followed one step at
+    a time, where a dictionary key applied to a list uses the first item in the list and the singular names in
+    :py:data:`khorosjx.utils.field_paths.FIELD_ALIASES` fall back to their plural keys. (e.g. the ``email.value``
+    field retrieves the ``emails[0].value`` value) The compiled functions are cached so that each field path is
+    only parsed once.
+
+    :param field: The field path to compile
+    :type field: str
+    :returns: A function which accepts the JSON data and returns the field value or raises a :py:exc:`KeyError`,
+              :py:exc:`IndexError` or :py:exc:`TypeError` exception if the field cannot be found
+    :raises: :py:exc:`ValueError`
+    """
+    steps = parse_field_path(field)
+    if len(steps) == 1:
+        def _get_top_level_value(json_data):
+            return json_data[field]
+        return _get_top_level_value
+
+    # Store each step with its alias and whether a list should be replaced with its first item before the step
+    path = tuple((step, FIELD_ALIASES.get(step), index > 0) if isinstance(step, str) else (step, None, False)
+                 for index, step in enumerate(steps))
+
+    def _get_field_value(json_data):
+        if field in json_data:
+            return json_data[field]
+        value = json_data
+        for step, alias, use_first_item in path:
+            if use_first_item and value.__class__ is list:
+                value = value[0]
+            value = value[alias] if alias is not None and step not in value else value[step]
+        return value
+    return _get_field_value
+
+
+@lru_cache(maxsize=1024)
+def compile_fields(fields):
+    """This function compiles a sequence of field paths into a single function which extracts all of the fields.
+
+    .. versionadded:: 3.3.0
+
+    Each field path is compiled once with :py:func:`khorosjx.utils.field_paths.compile_field_path` so that no field
+    path is parsed again when the fields are extracted from each record.
+
+    :param fields: The field paths to compile
+    :type fields: tuple
+    :returns: A function which accepts the JSON data and an optional list to which any missing field paths are
+              appended, and returns a dictionary with the field paths and corresponding values
+    :raises: :py:exc:`ValueError`
+    """
+    extractors = tuple((field, compile_field_path(field)) for field in dict.fromkeys(fields))
+
+    def _extract_fields(json_data, missing_fields=None):
+        fields_data = {}
+        for field, get_field_value in extractors:
+            try:
+                fields_data[field] = get_field_value(json_data)
+            except LOOKUP_ERRORS:
+                if missing_fields is not None:
+                    missing_fields.append(field)
+        return fields_data
+    return _extract_fields
+
+
+def extract_fields(json_data, fields, missing_fields=None):
+    """This function retrieves the values of multiple field paths from JSON data.
+
+    .. versionadded:: 3.3.0
+
+    :param json_data: The JSON data from which to retrieve the fields
+    :type json_data: dict
+    :param fields: The field paths to retrieve
+    :type fields: list, tuple
+    :param missing_fields: A list to which the field paths that could not be found will be appended (Optional)
+    :type missing_fields: list, None
+    :returns: A dictionary with the field paths and corresponding values for the fields that were found
+    :raises: :py:exc:`ValueError`
+    """
+    if fields.__class__ is not tuple:
+        fields = tuple(fields)
+    return compile_fields(fields)(json_data, missing_fields)
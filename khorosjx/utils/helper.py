@@ -6,7 +6,7 @@
 :Example:        ``helper_cfg = helper.import_yaml_file('/path/to/jxhelper.yml')``
 :Created By:     Jeff Shurtliff
 :Last Modified:  Jeff Shurtliff
-:Modified Date:  29 Apr 2020
+:Modified Date:  17 Oct 2026
 """
 
 import importlib
@@ -38,12 +38,20 @@ def import_yaml_file(file_path):
 def parse_helper_cfg(helper_cfg, file_type='yaml'):
     """This is the primary function used to parse the helper config file.
 
+    .. versionchanged:: 3.3.0
+       The optional HTTP session, retry, rate limit and cache settings are now parsed from the ``connection``
+       section.
+
     :param helper_cfg: The raw data loaded from the config file
     :param file_type: Indicates the type of configuration file (Default: ``yaml``)
     :returns: None (Defines global variables)
     :raises: CredentialsUnpackingError, InvalidHelperArgumentsError, HelperFunctionNotFoundError
     """
     _get_connection_info(helper_cfg, file_type)
+    _get_session_settings(helper_cfg, file_type)
+    _get_retry_settings(helper_cfg, file_type)
+    _get_rate_limit_settings(helper_cfg, file_type)
+    _get_cache_settings(helper_cfg, file_type)
     _get_console_color_settings(helper_cfg, file_type)
     _get_modules_to_import(helper_cfg, file_type)
     return
@@ -105,6 +113,101 @@ def _get_connection_info(_helper_cfg, _file_type='yaml'):
     return
 
 
+def _get_session_settings(_helper_cfg, _file_type='yaml'):
+    """This function retrieves the optional HTTP session and connection pool settings from the helper file.
+
+    .. versionadded:: 3.3.0
+    """
+    global helper_session_settings
+    helper_session_settings = {}
+    _session_cfg = _helper_cfg['connection'].get('session') or {}
+    for _setting_name, _setting_value in _session_cfg.items():
+        if _setting_name not in HelperParsing.session_settings:
+            _error_msg = f"The '{_setting_name}' value is not a valid option for the 'session' setting. " + \
+                         "The entry will be ignored."
+            eprint(_error_msg)
+        elif _setting_name in ('pool_block', 'keep_alive'):
+            helper_session_settings[_setting_name] = _convert_yaml_to_bool(_setting_value)
+        elif _setting_name == 'headers':
+            helper_session_settings[_setting_name] = dict(_setting_value) if _setting_value else {}
+        else:
+            helper_session_settings[_setting_name] = int(_setting_value)
+    return
+
+
+def _get_retry_settings(_helper_cfg, _file_type='yaml'):
+    """This function retrieves the optional retry policy settings from the helper file.
+
+    .. versionadded:: 3.3.0
+    """
+    global helper_retry_settings
+    helper_retry_settings = {}
+    _retry_cfg = _helper_cfg['connection'].get('retries') or {}
+    for _setting_name, _setting_value in _retry_cfg.items():
+        if _setting_name not in HelperParsing.retry_settings:
+            _error_msg = f"The '{_setting_name}' value is not a valid option for the 'retries' setting. " + \
+                         "The entry will be ignored."
+            eprint(_error_msg)
+        elif _setting_name in ('respect_retry_after', 'retry_non_idempotent'):
+            helper_retry_settings[_setting_name] = _convert_yaml_to_bool(_setting_value)
+        elif _setting_name == 'retry_statuses':
+            helper_retry_settings[_setting_name] = [int(_status_code) for _status_code in _setting_value or []]
+        elif _setting_name == 'max_retries':
+            helper_retry_settings[_setting_name] = int(_setting_value)
+        elif _setting_name == 'total_timeout' and _setting_value in (None, 'none', 'None'):
+            helper_retry_settings[_setting_name] = float('inf')
+        else:
+            helper_retry_settings[_setting_name] = float(_setting_value)
+    return
+
+
+def _get_rate_limit_settings(_helper_cfg, _file_type='yaml'):
+    """This function retrieves the optional client-side rate limit settings from the helper file.
+
+    .. versionadded:: 3.3.0
+    """
+    global helper_rate_limit_settings
+    helper_rate_limit_settings = {}
+    _rate_limit_cfg = _helper_cfg['connection'].get('rate_limit') or {}
+    for _setting_name, _setting_value in _rate_limit_cfg.items():
+        if _setting_name not in HelperParsing.rate_limit_settings:
+            _error_msg = f"The '{_setting_name}' value is not a valid option for the 'rate_limit' setting. " + \
+                         "The entry will be ignored."
+            eprint(_error_msg)
+        elif _setting_name in ('shared_file', 'bucket_name'):
+            helper_rate_limit_settings[_setting_name] = str(_setting_value) if _setting_value else None
+        elif _setting_value is not None:
+            helper_rate_limit_settings[_setting_name] = float(_setting_value)
+    return
+
+
+def _get_cache_settings(_helper_cfg, _file_type='yaml'):
+    """This function retrieves the optional response cache settings from the helper file.
+
+    .. versionadded:: 3.3.0
+    """
+    global helper_cache_settings
+    helper_cache_settings = {}
+    _cache_cfg = _helper_cfg['connection'].get('cache') or {}
+    for _setting_name, _setting_value in _cache_cfg.items():
+        if _setting_name not in HelperParsing.cache_settings:
+            _error_msg = f"The '{_setting_name}' value is not a valid option for the 'cache' setting. " + \
+                         "The entry will be ignored."
+            eprint(_error_msg)
+        elif _setting_name == 'enabled':
+            helper_cache_settings[_setting_name] = _convert_yaml_to_bool(_setting_value)
+        elif _setting_name == 'endpoint_ttls':
+            helper_cache_settings[_setting_name] = {str(_endpoint): float(_ttl) for _endpoint, _ttl in
+                                                    (_setting_value or {}).items()}
+        elif _setting_name == 'persistent_file':
+            helper_cache_settings[_setting_name] = str(_setting_value) if _setting_value else None
+        elif _setting_name in ('max_size', 'persistent_max_entries'):
+            helper_cache_settings[_setting_name] = int(_setting_value) if _setting_value else None
+        else:
+            helper_cache_settings[_setting_name] = float(_setting_value)
+    return
+
+
 # Define function to get the API credentials from a module and function
 def _get_credentials_from_module(_helper_cfg):
     # Define the module and function information
@@ -175,11 +278,19 @@ def _get_console_color_settings(_helper_cfg, _file_type='yaml'):
 def retrieve_helper_settings():
     """This function returns a dictionary of the defined helper settings.
 
+    .. versionchanged:: 3.3.0
+       The dictionary now includes the ``session_settings``, ``retry_settings``, ``rate_limit_settings`` and
+       ``cache_settings`` keys.
+
     :returns: Dictionary of helper variables with nicknames
     """
     helper_settings = {
         'base_url': helper_base_url,
         'api_credentials': helper_api_credentials,
+        'session_settings': helper_session_settings,
+        'retry_settings': helper_retry_settings,
+        'rate_limit_settings': helper_rate_limit_settings,
+        'cache_settings': helper_cache_settings,
         'use_console_colors': helper_console_colors,
         'modules_to_import': modules_to_import
     }
@@ -201,3 +312,17 @@ class HelperParsing:
     accepted_import_modules = ['all_modules', 'admin', 'blogs', 'content', 'content.base', 'docs', 'events', 'groups',
                                'ideas', 'places', 'places.spaces', 'spaces', 'threads', 'users', 'videos']
     all_modules = ['admin', 'content', 'groups', 'places', 'users']
+
+    # Define the acceptable fields within the 'session' subsection of the 'connection' section
+    session_settings = ['pool_connections', 'pool_maxsize', 'pool_block', 'keep_alive', 'headers']
+
+    # Define the acceptable fields within the 'retries' subsection of the 'connection' section
+    retry_settings = ['max_retries', 'backoff_factor', 'max_backoff', 'total_timeout', 'retry_statuses',
+                      'respect_retry_after', 'retry_non_idempotent']
+
+    # Define the acceptable fields within the 'rate_limit' subsection of the 'connection' section
+    rate_limit_settings = ['requests_per_second', 'burst', 'shared_file', 'bucket_name']
+
+    # Define the acceptable fields within the 'cache' subsection of the 'connection' section
+    cache_settings = ['enabled', 'max_size', 'default_ttl', 'endpoint_ttls', 'persistent_file',
+                      'persistent_max_entries']
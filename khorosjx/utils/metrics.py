@@ -0,0 +1,192 @@
+# -*- coding: utf-8 -*-
+"""
+:Module:         khorosjx.utils.metrics
+:Synopsis:       Per-endpoint request metrics and latency histograms used to instrument API requests
+:Usage:          ``from khorosjx.utils.metrics import RequestMetrics``
+:Example:        ``metrics.record('GET', 'people/{id}', 0.125, 200, 2048)``
+:Created By:     Jeff Shurtliff
+:Last Modified:  Jeff Shurtliff
+:Modified Date:  17 Oct 2026
+"""
+
+import re
+import math
+import threading
+from bisect import bisect_left
+from urllib.parse import urlsplit
+
+# Define the boundaries of the latency histogram buckets in seconds (0.1 ms to ~10 minutes in 5% increments)
+BUCKET_GROWTH = 1.05
+BUCKET_BOUNDS = tuple(0.0001 * BUCKET_GROWTH ** index for index in range(int(math.log(6e6, BUCKET_GROWTH)) + 2))
+
+# Define the pattern for the API path and the URL segments that follow a lookup type
+API_PATH_PATTERN = re.compile(r'^/api/core/v\d+')
+LOOKUP_SEGMENTS = {'email', 'username', 'externalIdentity'}
+
+
+def get_endpoint_template(url):
+    """This function converts an API request URL into an endpoint template without identifiers or query strings.
+
+    .. versionadded:: 3.3.0
+
+    Numeric segments are replaced with ``{id}`` and lookup values (e.g. email addresses and usernames) are replaced
+    with ``{value}`` so that requests for different resources of the same type are grouped together.
+    (e.g. ``https://example.com/api/core/v3/people/email/john@example.com`` becomes ``people/email/{value}``)
+
+    :param url: The URL of the API request
+    :type url: str
+    :returns: The endpoint template in string format
+    """
+    path = API_PATH_PATTERN.sub('', urlsplit(url).path)
+    segments, previous_segment = [], None
+    for segment in path.strip('/').split('/'):
+        if segment.isdigit():
+            segment = '{id}'
+        elif previous_segment in LOOKUP_SEGMENTS or '@' in segment:
+            segment = '{value}'
+        segments.append(segment)
+        previous_segment = segment
+    return '/'.join(segments)
+
+
+class LatencyHistogram(object):
+    """This class is a histogram with logarithmic buckets which estimates latency percentiles in constant memory.
+
+    .. versionadded:: 3.3.0
+
+    Each duration is counted in the bucket whose upper bound is the first one greater than or equal to it, so the
+    estimated percentiles are within 5% of the actual values while the minimum and maximum are exact.
+    """
+    def __init__(self):
+        """This method instantiates the empty histogram."""
+        self.counts = [0] * (len(BUCKET_BOUNDS) + 1)
+        self.count, self.total = 0, 0.0
+        self.minimum, self.maximum = None, None
+
+    def __repr__(self):
+        return f"{type(self).__name__}(count={self.count})"
+
+    def record(self, duration):
+        """This method records a duration.
+
+        :param duration: The duration in seconds
+        :type duration: int, float
+        :returns: None
+        """
+        self.counts[bisect_left(BUCKET_BOUNDS, duration)] += 1
+        self.count += 1
+        self.total += duration
+        self.minimum = duration if self.minimum is None else min(self.minimum, duration)
+        self.maximum = duration if self.maximum is None else max(self.maximum, duration)
+
+    def get_percentile(self, percentile):
+        """This method estimates the duration at a percentile.
+
+        :param percentile: The percentile between ``0`` and ``100`` (e.g. ``95``)
+        :type percentile: int, float
+        :returns: The estimated duration in seconds or ``None`` if no durations have been recorded
+        """
+        if not self.count:
+            return None
+        target, cumulative = max(1, math.ceil(self.count * percentile / 100)), 0
+        for index, bucket_count in enumerate(self.counts):
+            cumulative += bucket_count
+            if cumulative >= target:
+                upper_bound = BUCKET_BOUNDS[index] if index < len(BUCKET_BOUNDS) else self.maximum
+                return min(max(upper_bound, self.minimum), self.maximum)
+        return self.maximum
+
+    @property
+    def mean(self):
+        """The mean duration in seconds or ``None`` if no durations have been recorded."""
+        return self.total / self.count if self.count else None
+
+
+class RequestMetrics(object):
+    """This class is a thread-safe collection of request counts, errors, retries, bytes and latency histograms for
+       each combination of HTTP method and endpoint template.
+
+    .. versionadded:: 3.3.0
+    """
+    def __init__(self):
+        """This method instantiates the empty metrics collection."""
+        self._endpoints = {}
+        self._lock = threading.Lock()
+
+    def __repr__(self):
+        return f"{type(self).__name__}(endpoints={len(self._endpoints)})"
+
+    def record(self, method, endpoint, duration, status_code=None, response_bytes=0, retries=0, error=None):
+        """This method records a completed API request.
+
+        :param method: The HTTP method of the request (e.g. ``GET``)
+        :type method: str
+        :param endpoint: The endpoint template of the request (e.g. ``people/{id}``)
+        :type endpoint: str
+        :param duration: The duration of the request including any retries in seconds
+        :type duration: int, float
+        :param status_code: The status code of the final response or ``None`` if no response was received
+        :type status_code: int, None
+        :param response_bytes: The size of the final response body in bytes
+        :type response_bytes: int
+        :param retries: The number of retries that were performed
+        :type retries: int
+        :param error: The error message if the request failed without a response (Optional)
+        :type error: str, None
+        :returns: None
+        """
+        with self._lock:
+            stats = self._endpoints.get((method, endpoint))
+            if stats is None:
+                stats = self._endpoints[(method, endpoint)] = {
+                    'requests': 0, 'errors': 0, 'retries': 0, 'bytes': 0, 'statuses': {},
+                    'latency': LatencyHistogram()
+                }
+            stats['requests'] += 1
+            stats['retries'] += retries
+            stats['bytes'] += response_bytes
+            if error is not None or status_code is None or status_code >= 400:
+                stats['errors'] += 1
+            stats['statuses'][status_code] = stats['statuses'].get(status_code, 0) + 1
+            stats['latency'].record(duration)
+
+    def snapshot(self, reset=False):
+        """This method returns a summary of the metrics for each endpoint.
+
+        :param reset: Determines if the metrics should be cleared after the snapshot is taken (``False`` by default)
+        :type reset: bool
+        :returns: A dictionary mapping each ``METHOD endpoint`` string to a dictionary of its metrics, where the
+                  latency values are in milliseconds
+        """
+        def _to_milliseconds(_seconds):
+            return None if _seconds is None else round(_seconds * 1000, 3)
+
+        with self._lock:
+            snapshot = {}
+            for (method, endpoint), stats in sorted(self._endpoints.items(), key=lambda item: item[0][::-1]):
+                latency = stats['latency']
+                snapshot[f"{method} {endpoint}"] = {
+                    'requests': stats['requests'],
+                    'errors': stats['errors'],
+                    'retries': stats['retries'],
+                    'bytes': stats['bytes'],
+                    'statuses': dict(stats['statuses']),
+                    'mean_ms': _to_milliseconds(latency.mean),
+                    'min_ms': _to_milliseconds(latency.minimum),
+                    'p50_ms': _to_milliseconds(latency.get_percentile(50)),
+                    'p95_ms': _to_milliseconds(latency.get_percentile(95)),
+                    'p99_ms': _to_milliseconds(latency.get_percentile(99)),
+                    'max_ms': _to_milliseconds(latency.maximum),
+                    'total_ms': _to_milliseconds(latency.total)
+                }
+            if reset:
+                self._endpoints.clear()
+        return snapshot
+
+    def reset(self):
+        """This method clears all of the metrics.
+
+        :returns: None
+        """
+        with self._lock:
+            self._endpoints.clear()
@@ -0,0 +1,163 @@
+# -*- coding: utf-8 -*-
+"""
+:Module:         khorosjx.utils.rate_limit
+:Synopsis:       Token bucket rate limiters used to limit the rate of API requests across threads and processes
+:Usage:          ``from khorosjx.utils.rate_limit import TokenBucket``
+:Example:        ``limiter = TokenBucket(requests_per_second=10, burst=20)``
+:Created By:     Jeff Shurtliff
+:Last Modified:  Jeff Shurtliff
+:Modified Date:  17 Oct 2026
+"""
+
+import time
+import sqlite3
+import threading
+
+
+class TokenBucket(object):
+    """This class is a thread-safe token bucket which limits the rate of API requests within a single process.
+
+    .. versionadded:: 3.3.0
+
+    The bucket holds up to ``burst`` tokens and is refilled at ``requests_per_second`` tokens per second. Each API
+    request reserves a token, and when the bucket is empty the reservation returns how long the caller must wait
+    for its token to become available. Reservations are granted in the order they are made, and a reservation that
+    would need to wait longer than the caller is able to (e.g. before a deadline) is refused without consuming a
+    token.
+    """
+    def __init__(self, requests_per_second, burst=None):
+        """This method instantiates the token bucket.
+
+        :param requests_per_second: The sustained number of requests permitted per second
+        :type requests_per_second: int, float
+        :param burst: The maximum number of requests that can be made at once (Default: ``requests_per_second``)
+        :type burst: int, float, None
+        :raises: :py:exc:`ValueError`
+        """
+        if requests_per_second <= 0:
+            raise ValueError("The requests_per_second value must be greater than zero.")
+        burst = requests_per_second if burst is None else burst
+        if burst < 1:
+            raise ValueError("The burst value must be at least one.")
+        self.requests_per_second = float(requests_per_second)
+        self.burst = float(burst)
+        self._tokens = self.burst
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def __repr__(self):
+        return f"{type(self).__name__}(requests_per_second={self.requests_per_second}, burst={self.burst})"
+
+    def _reserve_token(self, tokens, updated, now):
+        """This method calculates the state of the bucket after reserving a token.
+
+        :param tokens: The number of tokens in the bucket when it was last updated
+        :type tokens: float
+        :param updated: The time when the bucket was last updated
+        :type updated: float
+        :param now: The current time
+        :type now: float
+        :returns: The remaining number of tokens and the number of seconds to wait before using the reserved token
+        """
+        tokens = min(self.burst, tokens + max(0.0, now - updated) * self.requests_per_second) - 1
+        delay = 0.0 if tokens >= 0 else -tokens / self.requests_per_second
+        return tokens, delay
+
+    def reserve(self, max_wait=None):
+        """This method reserves a token and returns the number of seconds to wait before it may be used.
+
+        :param max_wait: The number of seconds the caller is able to wait, where a token that would not be available
+                         in less time is not reserved (Default: ``None``, no limit)
+        :type max_wait: int, float, None
+        :returns: The number of seconds to wait before performing the request or ``None`` if no token was reserved
+        """
+        with self._lock:
+            now = time.monotonic()
+            tokens, delay = self._reserve_token(self._tokens, self._updated, now)
+            if max_wait is not None and delay >= max_wait:
+                return None
+            self._tokens, self._updated = tokens, now
+        return delay
+
+    def acquire(self):
+        """This method reserves a token and blocks until it may be used.
+
+        :returns: The number of seconds that were spent waiting
+        """
+        delay = self.reserve()
+        if delay > 0:
+            time.sleep(delay)
+        return delay
+
+
+class SharedTokenBucket(TokenBucket):
+    """This class is a token bucket whose state is stored in a SQLite database so it can be shared across processes.
+
+    .. versionadded:: 3.3.0
+
+    Every process that uses the same ``file_path`` and ``name`` draws from the same bucket, which allows multiple
+    worker processes to share a single API rate limit. The bucket is updated within an exclusive SQLite
+    transaction so that reservations remain consistent between processes.
+    """
+    def __init__(self, requests_per_second, burst=None, file_path='khorosjx_rate_limit.db', name='default'):
+        """This method instantiates the shared token bucket.
+
+        :param requests_per_second: The sustained number of requests permitted per second
+        :type requests_per_second: int, float
+        :param burst: The maximum number of requests that can be made at once (Default: ``requests_per_second``)
+        :type burst: int, float, None
+        :param file_path: The path to the SQLite database file used to store the bucket
+                          (Default: ``khorosjx_rate_limit.db``)
+        :type file_path: str
+        :param name: The name of the bucket within the database file (Default: ``default``)
+        :type name: str
+        :raises: :py:exc:`ValueError`, :py:exc:`sqlite3.Error`
+        """
+        super().__init__(requests_per_second, burst)
+        self.file_path = file_path
+        self.name = name
+        self._local = threading.local()
+        with self._connect() as connection:
+            connection.execute("CREATE TABLE IF NOT EXISTS token_buckets "
+                               "(name TEXT PRIMARY KEY, tokens REAL NOT NULL, updated REAL NOT NULL)")
+
+    def __repr__(self):
+        return f"{type(self).__name__}(requests_per_second={self.requests_per_second}, burst={self.burst}, " + \
+               f"file_path={self.file_path!r}, name={self.name!r})"
+
+    def _connect(self):
+        """This method returns the SQLite connection for the current thread, opening it if necessary."""
+        connection = getattr(self._local, 'connection', None)
+        if connection is None:
+            connection = sqlite3.connect(self.file_path, timeout=30)
+            self._local.connection = connection
+        return connection
+
+    def reserve(self, max_wait=None):
+        """This method reserves a token from the shared bucket and returns the number of seconds to wait before it
+           may be used.
+
+        :param max_wait: The number of seconds the caller is able to wait, where a token that would not be available
+                         in less time is not reserved (Default: ``None``, no limit)
+        :type max_wait: int, float, None
+        :returns: The number of seconds to wait before performing the request or ``None`` if no token was reserved
+        :raises: :py:exc:`sqlite3.Error`
+        """
+        connection = self._connect()
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            now = time.time()
+            row = connection.execute("SELECT tokens, updated FROM token_buckets WHERE name = ?",
+                                     (self.name,)).fetchone()
+            tokens, updated = row if row else (self.burst, now)
+            tokens, delay = self._reserve_token(tokens, updated, now)
+            if max_wait is not None and delay >= max_wait:
+                connection.rollback()
+                return None
+            connection.execute("INSERT OR REPLACE INTO token_buckets (name, tokens, updated) VALUES (?, ?, ?)",
+                               (self.name, tokens, now))
+            connection.commit()
+        except Exception:
+            connection.rollback()
+            raise
+        return delay
@@ -0,0 +1,162 @@
+# -*- coding: utf-8 -*-
+"""
+:Module:         khorosjx.utils.retry
+:Synopsis:       Retry policy used to determine when and how long to wait before retrying an API request
+:Usage:          ``from khorosjx.utils.retry import RetryPolicy``
+:Example:        ``policy = RetryPolicy(max_retries=8, backoff_factor=1.0, total_timeout=300)``
+:Created By:     Jeff Shurtliff
+:Last Modified:  Jeff Shurtliff
+:Modified Date:  17 Oct 2026
+"""
+
+import random
+import email.utils
+from datetime import datetime, timezone
+
+
+class RetryPolicy(object):
+    """This class defines how failed API requests are retried using exponential backoff with full jitter.
+
+    .. versionadded:: 3.3.0
+
+    A request is retried when it raises a connection exception or returns one of the ``retry_statuses`` status
+    codes. The delay before each retry is a random value between zero and ``backoff_factor * 2 ** attempt``
+    (capped at ``max_backoff``) unless the response includes a ``Retry-After`` header, in which case the delay
+    requested by the server is used instead. Retries stop once ``max_retries`` has been reached or when the next
+    retry would exceed the ``total_timeout`` budget.
+
+    The ``POST`` and ``PUT`` requests performed with a payload may already have been applied by the server when an
+    error status code is returned, so unless ``retry_non_idempotent`` is ``True`` they are only retried when they
+    raise a connection exception or return a ``429`` status code (when it is one of the ``retry_statuses``).
+    """
+    default_retry_statuses = (429, 502, 503, 504)
+    non_idempotent_methods = ('POST', 'PUT')
+    non_idempotent_retry_statuses = (429,)
+
+    def __init__(self, max_retries=5, backoff_factor=0.5, max_backoff=30.0, total_timeout=120.0,
+                 retry_statuses=None, respect_retry_after=True, retry_non_idempotent=False):
+        """This method instantiates the retry policy.
+
+        :param max_retries: The maximum number of retries after the initial attempt (Default: ``5``)
+        :type max_retries: int
+        :param backoff_factor: The base number of seconds used to calculate the backoff (Default: ``0.5``)
+        :type backoff_factor: int, float
+        :param max_backoff: The maximum number of seconds to wait between attempts (Default: ``30.0``)
+        :type max_backoff: int, float
+        :param total_timeout: The total number of seconds that may be spent on a request including retries, or
+                              ``None`` for no limit (Default: ``120.0``)
+        :type total_timeout: int, float, None
+        :param retry_statuses: The HTTP status codes that should be retried (Default: ``429``, ``502``, ``503``
+                               and ``504``)
+        :type retry_statuses: tuple, list, set, None
+        :param respect_retry_after: Determines if the ``Retry-After`` response header should be honored
+                                    (Default: ``True``)
+        :type respect_retry_after: bool
+        :param retry_non_idempotent: Determines if ``POST`` and ``PUT`` requests should be retried for every status
+                                     code in ``retry_statuses`` rather than only ``429`` (Default: ``False``)
+        :type retry_non_idempotent: bool
+        :raises: :py:exc:`ValueError`
+        """
+        if max_retries < 0 or backoff_factor < 0 or max_backoff < 0:
+            raise ValueError("The max_retries, backoff_factor and max_backoff values cannot be negative.")
+        self.max_retries = int(max_retries)
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.total_timeout = total_timeout
+        if retry_statuses is None:
+            retry_statuses = self.default_retry_statuses
+        self.retry_statuses = frozenset(int(status_code) for status_code in retry_statuses)
+        self.respect_retry_after = respect_retry_after
+        self.retry_non_idempotent = retry_non_idempotent
+
+    def __repr__(self):
+        return f"RetryPolicy(max_retries={self.max_retries}, backoff_factor={self.backoff_factor}, " + \
+               f"max_backoff={self.max_backoff}, total_timeout={self.total_timeout}, " + \
+               f"retry_statuses={sorted(self.retry_statuses)}, respect_retry_after={self.respect_retry_after}, " + \
+               f"retry_non_idempotent={self.retry_non_idempotent})"
+
+    def copy(self, **kwargs):
+        """This method returns a copy of the policy with any supplied settings replaced.
+
+        :returns: A new :py:class:`khorosjx.utils.retry.RetryPolicy` object
+        """
+        settings = {
+            'max_retries': self.max_retries,
+            'backoff_factor': self.backoff_factor,
+            'max_backoff': self.max_backoff,
+            'total_timeout': self.total_timeout,
+            'retry_statuses': self.retry_statuses,
+            'respect_retry_after': self.respect_retry_after,
+            'retry_non_idempotent': self.retry_non_idempotent
+        }
+        settings.update({key: val for key, val in kwargs.items() if val is not None})
+        return RetryPolicy(**settings)
+
+    def is_retryable_status(self, status_code, method=None):
+        """This method determines if a response status code should be retried.
+
+        :param status_code: The HTTP status code of the response
+        :type status_code: int
+        :param method: The HTTP method of the request (e.g. ``POST``) which determines if only the ``429`` status
+                       code is retried for non-idempotent requests (Optional)
+        :type method: str, None
+        :returns: Boolean value indicating whether or not the status code is retryable
+        """
+        if status_code not in self.retry_statuses:
+            return False
+        if self.retry_non_idempotent or method is None or method.upper() not in self.non_idempotent_methods:
+            return True
+        return status_code in self.non_idempotent_retry_statuses
+
+    def get_backoff(self, attempt):
+        """This method returns a randomized (full jitter) exponential backoff for a given retry attempt.
+
+        :param attempt: The zero-based number of the retry attempt
+        :type attempt: int
+        :returns: The number of seconds to wait
+        """
+        return random.uniform(0, min(self.max_backoff, self.backoff_factor * (2 ** attempt)))
+
+    @staticmethod
+    def parse_retry_after(headers):
+        """This method returns the number of seconds requested by a ``Retry-After`` response header.
+
+        :param headers: The headers of the API response
+        :returns: The number of seconds to wait or ``None`` if the header is missing or invalid
+        """
+        retry_after = headers.get('Retry-After') if headers else None
+        if retry_after is None:
+            return None
+        retry_after = str(retry_after).strip()
+        if retry_after.isdigit():
+            return float(retry_after)
+        try:
+            retry_date = email.utils.parsedate_to_datetime(retry_after)
+        except (TypeError, ValueError, IndexError):
+            return None
+        if retry_date is None:
+            return None
+        if retry_date.tzinfo is None:
+            retry_date = retry_date.replace(tzinfo=timezone.utc)
+        return max(0.0, (retry_date - datetime.now(timezone.utc)).total_seconds())
+
+    def get_delay(self, attempt, response=None, elapsed=0.0):
+        """This method returns the number of seconds to wait before the next retry or ``None`` to stop retrying.
+
+        :param attempt: The zero-based number of the retry attempt about to be performed
+        :type attempt: int
+        :param response: The retryable API response, or ``None`` if the request raised an exception
+        :param elapsed: The number of seconds that have already been spent on the request
+        :type elapsed: int, float
+        :returns: The number of seconds to wait or ``None`` if the request should not be retried
+        """
+        if attempt >= self.max_retries:
+            return None
+        delay = None
+        if self.respect_retry_after and response is not None:
+            delay = self.parse_retry_after(response.headers)
+        if delay is None:
+            delay = self.get_backoff(attempt)
+        if self.total_timeout is not None and elapsed + delay > self.total_timeout:
+            return None
+        return delay
@@ -0,0 +1,100 @@
+# -*- coding: utf-8 -*-
+"""
+:Module:         khorosjx.utils.singleflight
+:Synopsis:       Coalesces concurrent identical calls so that only one of them is performed at a time
+:Usage:          ``from khorosjx.utils.singleflight import SingleFlight``
+:Example:        ``response, shared = in_flight.do(key, lambda: session.get(url))``
+:Created By:     Jeff Shurtliff
+:Last Modified:  Jeff Shurtliff
+:Modified Date:  17 Oct 2026
+"""
+
+import threading
+
+
+class _Call(object):
+    """This class holds the outcome of a call that is in flight for one or more callers."""
+    __slots__ = ('done', 'result', 'error')
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result, self.error = None, None
+
+
+class SingleFlight(object):
+    """This class is a thread-safe map of in-flight calls which coalesces concurrent calls that share the same key.
+
+    .. versionadded:: 3.3.0
+
+    The first caller for a key performs the call while any caller that arrives with the same key before the call
+    completes waits for it and receives the same result (or exception). The key is removed once the call completes,
+    so the results are never reused by later callers.
+    """
+    def __init__(self):
+        """This method instantiates the empty map of in-flight calls."""
+        self._calls = {}
+        self._lock = threading.Lock()
+        self._stats = {'calls': 0, 'shared': 0}
+
+    def __len__(self):
+        return len(self._calls)
+
+    def __repr__(self):
+        return f"{type(self).__name__}(in_flight={len(self._calls)})"
+
+    def do(self, key, function, timeout=None):
+        """This method performs a call unless an identical call is already in flight, in which case it waits for it.
+
+        :param key: The hashable key which identifies identical calls
+        :type key: tuple, str
+        :param function: The function (which accepts no arguments) that performs the call
+        :type function: function
+        :param timeout: The maximum number of seconds to wait for a call performed by another caller (Optional)
+        :type timeout: int, float, None
+        :returns: The value returned by the function and a Boolean value indicating if it was performed by another
+                  caller
+        :raises: :py:exc:`TimeoutError`
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            if call is None:
+                call = self._calls[key] = _Call()
+                self._stats['calls'] += 1
+                leader = True
+            else:
+                self._stats['shared'] += 1
+                leader = False
+
+        if not leader:
+            if not call.done.wait(timeout):
+                raise TimeoutError("The identical call in flight did not complete within the timeout.")
+            if call.error is not None:
+                raise call.error
+            return call.result, True
+
+        try:
+            call.result = function()
+        except BaseException as exc:
+            call.error = exc
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result, False
+
+    def get_stats(self):
+        """This method returns the number of calls performed and the number of callers that shared a call.
+
+        :returns: A dictionary with the ``calls``, ``shared`` and ``in_flight`` statistics
+        """
+        with self._lock:
+            return dict(self._stats, in_flight=len(self._calls))
+
+    def reset_stats(self):
+        """This method resets the statistics.
+
+        :returns: None
+        """
+        with self._lock:
+            self._stats = {'calls': 0, 'shared': 0}
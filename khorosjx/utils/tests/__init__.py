@@ -1 +1,3 @@
-__all__ = ['test_init_module']
\ No newline at end of file
+__all__ = ['test_aio', 'test_batch', 'test_cache', 'test_connection_info', 'test_deadlines', 'test_df_utils',
+           'test_export', 'test_field_paths', 'test_init_module', 'test_metrics', 'test_pagination', 'test_retry',
+           'test_singleflight', 'test_users']
@@ -0,0 +1,37 @@
+# -*- coding: utf-8 -*-
+"""
+:Module:         khorosjx.utils.tests.conftest
+:Synopsis:       This module defines the pytest fixtures which run the tests against a local Jive API stand-in
+:Created By:     Jeff Shurtliff
+:Last Modified:  Jeff Shurtliff
+:Modified Date:  17 Oct 2026
+"""
+
+import os
+import sys
+
+import pytest
+
+# Make the API stand-in from the benchmarks directory importable when running from a source checkout
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..', 'benchmarks')))
+mock_server = pytest.importorskip('mock_server')
+
+
+@pytest.fixture(scope='session')
+def api_server():
+    """This fixture starts the API stand-in once for the test session."""
+    with mock_server.MockJiveServer(people=250, groups=30, places=10, contents=30, entitlements=30,
+                                    members_per_group=40) as server:
+        yield server
+
+
+@pytest.fixture
+def mock_api(api_server):
+    """This fixture activates a new client connected to the API stand-in for the duration of a test."""
+    from khorosjx import core
+    api_server.faults, api_server.latency = None, 0.0
+    api_server.reset_stats()
+    client = core.Client(api_server.url, ('pytest', 'pytest'))
+    with client.activate():
+        yield api_server
+    client.close()
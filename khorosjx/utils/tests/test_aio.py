@@ -0,0 +1,113 @@
+# -*- coding: utf-8 -*-
+"""
+:Module:         khorosjx.utils.tests.test_aio
+:Synopsis:       This module is used by pytest to verify the asynchronous HTTP sessions and rate limiting
+:Created By:     Jeff Shurtliff
+:Last Modified:  Jeff Shurtliff
+:Modified Date:  17 Oct 2026
+"""
+
+import asyncio
+import threading
+
+import pytest
+
+from khorosjx import core
+
+pytest.importorskip('aiohttp')
+from khorosjx import aio  # noqa: E402
+
+
+def test_session_of_a_closed_event_loop_is_closed(mock_api):
+    """This function tests that the session created in an event loop which has closed is closed and replaced."""
+    first_session = asyncio.run(aio.get_session())
+    assert not first_session.closed
+
+    async def _get_second_session():
+        _session = await aio.get_session()
+        await aio.close_session()
+        return _session
+    second_session = asyncio.run(_get_second_session())
+    assert first_session.closed and second_session.closed
+    assert first_session is not second_session
+    assert core.get_client().aio_sessions == {}
+
+
+def test_session_is_replaced_when_credentials_change(mock_api):
+    """This function tests that the session is closed and replaced when the credentials change."""
+    async def _get_sessions():
+        _original_session = await aio.get_session()
+        core.set_credentials(('other', 'other'))
+        _new_session = await aio.get_session()
+        await aio.close_session()
+        return _original_session, _new_session
+    original_session, new_session = asyncio.run(_get_sessions())
+    assert original_session is not new_session and original_session.closed
+    assert new_session.auth.login == 'other'
+
+
+def test_shared_rate_limit_does_not_block_event_loop(mock_api, tmp_path):
+    """This function tests that tokens from a shared rate limiter are reserved outside of the event loop thread."""
+    core.set_rate_limit(1000, shared_file=str(tmp_path / 'rate_limit.db'))
+    reserve, reserve_threads = core.rate_limiter.reserve, []
+
+    def _reserve(*args):
+        reserve_threads.append(threading.current_thread())
+        return reserve(*args)
+    core.rate_limiter.reserve = _reserve
+
+    async def _get_people():
+        _response = await aio.get_request_with_retries(f"{core.base_url}/people?count=1")
+        await aio.close_session()
+        return _response.status_code
+    assert asyncio.run(_get_people()) == 200
+    assert reserve_threads and threading.main_thread() not in reserve_threads
+
+
+def test_sequential_pagination_follows_next_links(mock_api, monkeypatch):
+    """This function tests that sequential asynchronous pagination follows the next links provided by the server."""
+    get_next_link, next_links = core.get_next_link, []
+
+    def _get_next_link(_json_data):
+        next_links.append(get_next_link(_json_data))
+        return next_links[-1]
+    monkeypatch.setattr(core, 'get_next_link', _get_next_link)
+
+    async def _get_people():
+        _records = [_record async for _record in aio.iter_paginated_results(f"{core.base_url}/people", 'people',
+                                                                            return_fields=['id'])]
+        await aio.close_session()
+        return _records
+    records = asyncio.run(_get_people())
+    assert [record['id'] for record in records] == [str(index) for index in range(1, 251)]
+    assert len(next_links) == 2 and all(next_links)
+    assert mock_api.request_counts['GET people'] == 3
+
+
+def test_session_options_are_stored_per_client(mock_api):
+    """This function tests that the asynchronous session settings only apply to the active client."""
+    other_client = core.Client('https://other.example.com', ('other', 'other'))
+    with other_client.activate():
+        aio.set_session_options(limit=5, max_concurrency=2)
+        assert aio.core.session_settings['limit'] == 5
+    assert core.get_client().aio_session_settings['limit'] == 100
+    assert other_client.aio_session_settings == {'limit': 5, 'limit_per_host': 0, 'max_concurrency': 2}
+
+
+def test_iter_pages_awaits_cancelled_requests():
+    """This function tests that the pending page requests have finished once the generator is closed."""
+    tasks = []
+
+    async def _page_function(_start_index):
+        tasks.append(asyncio.current_task())
+        if _start_index:
+            await asyncio.sleep(10)
+        return list(range(100))
+
+    async def _get_first_page():
+        _pages = aio.iter_pages(_page_function, max_workers=4)
+        _page = await _pages.__anext__()
+        await _pages.aclose()
+        return _page, all(_task.done() for _task in tasks)
+    first_page, requests_finished = asyncio.run(_get_first_page())
+    assert len(first_page) == 100 and requests_finished
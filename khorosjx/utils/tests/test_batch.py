@@ -0,0 +1,40 @@
+# -*- coding: utf-8 -*-
+"""
+:Module:         khorosjx.utils.tests.test_batch
+:Synopsis:       This module is used by pytest to verify the requests packed into executeBatch API calls
+:Created By:     Jeff Shurtliff
+:Last Modified:  Jeff Shurtliff
+:Modified Date:  17 Oct 2026
+"""
+
+import pytest
+
+from khorosjx import core, errors
+from khorosjx.utils.retry import RetryPolicy
+
+mock_server = pytest.importorskip('mock_server')
+
+
+@pytest.mark.parametrize('batch_size', [1, 25])
+def test_execute_batch_keeps_keys_with_the_same_string(mock_api, batch_size):
+    """This function tests that keys which have the same string value are returned separately and unchanged."""
+    results = core.execute_batch({1: '/people/1', '1': '/people/2', 3: '/people/999999'}, batch_size=batch_size)
+    assert list(results) == [1, '1', 3]
+    assert results[1][0] == 200 and results[1][1]['id'] == '1'
+    assert results['1'][0] == 200 and results['1'][1]['id'] == '2'
+    assert results[3][0] == 404
+
+
+def test_get_data_many_is_keyed_by_the_original_lookup_values(mock_api):
+    """This function tests that the data is keyed by each lookup value exactly as it was supplied."""
+    data = core.get_data_many('people', [1, '1', 2], use_cache=False)
+    assert list(data) == [1, '1', 2]
+    assert data[1]['id'] == '1' and data['1']['id'] == '1' and data[2]['id'] == '2'
+
+
+def test_execute_batch_of_get_requests_is_retried(mock_api):
+    """This function tests that an executeBatch call containing only GET requests is retried after a server error."""
+    mock_api.faults = mock_server.FaultProfile(error_rate=1.0, error_statuses=(503,))
+    with pytest.raises(errors.exceptions.POSTRequestError):
+        core.execute_batch({1: '/people/1'}, retry_policy=RetryPolicy(max_retries=2, backoff_factor=0))
+    assert mock_api.request_counts['POST executeBatch'] == 3
@@ -0,0 +1,52 @@
+# -*- coding: utf-8 -*-
+"""
+:Module:         khorosjx.utils.tests.test_cache
+:Synopsis:       This module is used by pytest to verify the response cache and its invalidation on writes
+:Created By:     Jeff Shurtliff
+:Last Modified:  Jeff Shurtliff
+:Modified Date:  17 Oct 2026
+"""
+
+from khorosjx import core
+from khorosjx.utils.cache import normalize_url
+
+
+def test_normalize_url():
+    """This function tests that equivalent URLs are normalized to the same cache key."""
+    assert normalize_url('HTTPS://Example.com//api/core/v3/people/1/?b=2&a=1#top') == \
+        normalize_url('https://example.com/api/core/v3/people/1?a=1&b=2')
+
+
+def test_get_requests_are_served_from_the_cache(mock_api):
+    """This function tests that repeated GET requests are only sent to the API once while cached."""
+    core.set_response_cache()
+    for _ in range(3):
+        assert core.get_data('people', 11, return_json=True)['id'] == '11'
+    assert mock_api.request_counts['GET people/{lookup}'] == 1
+    assert core.get_cache_stats()['hits'] == 2
+
+
+def test_put_invalidates_the_resource_and_its_parents(mock_api):
+    """This function tests that a PUT request removes the cached responses for the resource and its parents."""
+    core.set_response_cache()
+    person_url, people_url = f"{mock_api.base_url}/people/12", f"{mock_api.base_url}/people?count=5"
+    original_name = core.get_request_with_retries(person_url, return_json=True)['displayName']
+    core.get_request_with_retries(people_url)
+    try:
+        core.put_request_with_retries(person_url, {'displayName': 'Renamed User'})
+        assert core.get_request_with_retries(person_url, return_json=True)['displayName'] == 'Renamed User'
+        core.get_request_with_retries(people_url)
+        assert mock_api.request_counts['GET people/{lookup}'] == 2
+        assert mock_api.request_counts['GET people'] == 2
+    finally:
+        core.put_request_with_retries(person_url, {'displayName': original_name})
+
+
+def test_delete_invalidates_the_resource(mock_api):
+    """This function tests that a DELETE request removes the cached responses for the resource."""
+    core.set_response_cache()
+    person_url = f"{mock_api.base_url}/people/13"
+    core.get_request_with_retries(person_url)
+    assert core.delete(person_url).status_code == 204
+    core.get_request_with_retries(person_url)
+    assert mock_api.request_counts['GET people/{lookup}'] == 2
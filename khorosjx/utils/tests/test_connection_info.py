@@ -0,0 +1,43 @@
+# -*- coding: utf-8 -*-
+"""
+:Module:         khorosjx.utils.tests.test_connection_info
+:Synopsis:       This module is used by pytest to verify the deprecated module-level connection information
+:Created By:     Jeff Shurtliff
+:Last Modified:  Jeff Shurtliff
+:Modified Date:  17 Oct 2026
+"""
+
+import pytest
+
+from khorosjx import core, groups, users
+from khorosjx.places import spaces
+
+
+def test_deprecated_globals_return_active_client_settings(mock_api):
+    """This function tests that the deprecated global variables return the settings of the active client."""
+    with pytest.warns(DeprecationWarning):
+        assert groups.base_url == core.base_url
+    with pytest.warns(DeprecationWarning):
+        assert spaces.api_credentials == ('pytest', 'pytest')
+
+
+def test_deprecated_globals_follow_the_active_client(mock_api):
+    """This function tests that the deprecated global variables are not bound to the client active at import."""
+    other_client = core.Client('https://other.example.com', ('other', 'other'))
+    with other_client.activate():
+        with pytest.warns(DeprecationWarning):
+            assert users.base_url == other_client.base_url
+    with pytest.warns(DeprecationWarning):
+        assert users.base_url == core.base_url
+
+
+def test_retrieve_connection_info_is_deprecated(mock_api):
+    """This function tests that the deprecated ``retrieve_connection_info`` function verifies the connection."""
+    with pytest.warns(DeprecationWarning):
+        assert groups.retrieve_connection_info() is None
+
+
+def test_unknown_module_attributes_raise_attribute_error():
+    """This function tests that attributes which are not deprecated global variables are still missing."""
+    with pytest.raises(AttributeError):
+        getattr(groups, 'missing_attribute')
@@ -0,0 +1,69 @@
+# -*- coding: utf-8 -*-
+"""
+:Module:         khorosjx.utils.tests.test_deadlines
+:Synopsis:       This module is used by pytest to verify the request deadlines carried into bulk operations
+:Created By:     Jeff Shurtliff
+:Last Modified:  Jeff Shurtliff
+:Modified Date:  17 Oct 2026
+"""
+
+import time
+
+import pytest
+
+from khorosjx import core, errors, groups
+
+
+def test_request_deadline_can_only_be_shortened():
+    """This function tests that a nested deadline cannot extend the deadline already in effect."""
+    assert core.get_remaining_time() is None
+    with core.request_deadline(5):
+        with core.request_deadline(60):
+            assert core.get_remaining_time() <= 5
+        with core.request_deadline(1):
+            assert core.get_remaining_time() <= 1
+    assert core.get_remaining_time() is None
+
+
+@pytest.mark.parametrize('max_workers', [1, 4])
+def test_bulk_getter_raises_promptly(mock_api, max_workers):
+    """This function tests that a bulk getter raises an exception once its deadline expires."""
+    mock_api.latency = 0.3
+    start_time = time.monotonic()
+    with pytest.raises(errors.exceptions.DeadlineExceededError):
+        groups.get_group_memberships(1, deadline=0.2, max_workers=max_workers)
+    assert time.monotonic() - start_time < 1
+
+
+def test_bulk_getter_returns_partial_results(mock_api):
+    """This function tests that the records retrieved before the deadline are returned when requested."""
+    mock_api.latency = 0.15
+    records = core.get_all_paginated_results(f"{mock_api.base_url}/people", 'people', return_fields=['id'],
+                                             deadline=0.4, return_partial=True)
+    assert isinstance(records, core.PartialResults) and records.complete is False
+    assert isinstance(records.error, errors.exceptions.DeadlineExceededError)
+    assert [record['id'] for record in records] == [str(index) for index in range(1, len(records) + 1)]
+    assert 0 < len(records) < 250
+
+
+def test_bulk_getter_returns_complete_results(mock_api):
+    """This function tests that a list is returned when every record is retrieved before the deadline."""
+    members = groups.get_group_memberships(1, deadline=30, return_partial=True)
+    assert type(members) is list and len(members) == 40
+    dataframe = groups.get_all_groups(return_type='dataframe', deadline=30, return_partial=True)
+    assert len(dataframe) == 30 and dataframe.attrs['partial'] is False
+
+
+@pytest.mark.parametrize('shared', [False, True])
+def test_rate_limit_token_is_kept_when_deadline_expires(mock_api, tmp_path, shared):
+    """This function tests that a request refused by its deadline does not consume a rate limit token."""
+    core.set_rate_limit(1, burst=1, shared_file=str(tmp_path / 'rate_limit.db') if shared else None)
+    assert core.rate_limiter.reserve() == 0
+    mock_api.reset_stats()
+    with pytest.raises(errors.exceptions.DeadlineExceededError):
+        with core.request_deadline(0.5):
+            core.get_request_with_retries(f"{core.base_url}/people?count=1")
+    assert mock_api.total_requests == 0
+
+    # The next token should still become available one second after the first rather than two
+    assert core.rate_limiter.reserve() < 1.5
@@ -0,0 +1,51 @@
+# -*- coding: utf-8 -*-
+"""
+:Module:         khorosjx.utils.tests.test_df_utils
+:Synopsis:       This module is used by pytest to verify the conversion of records into pandas dataframes
+:Created By:     Jeff Shurtliff
+:Last Modified:  Jeff Shurtliff
+:Modified Date:  17 Oct 2026
+"""
+
+import pytest
+
+from khorosjx.utils import df_utils
+
+pd = pytest.importorskip('pandas')
+
+RECORDS = [{'id': 1, 'name': 'first'}, {'name': 'second', 'id': 2, 'email': 'second@example.com'}, {'id': 3}]
+
+
+def test_columnar_frame_builder_aligns_values_by_field_name():
+    """This function tests that values are aligned by field name and new fields are back-filled."""
+    builder = df_utils.ColumnarFrameBuilder()
+    builder.extend(RECORDS)
+    dataframe = builder.to_dataframe()
+    assert len(builder) == 3
+    assert list(dataframe.columns) == ['id', 'name', 'email']
+    assert dataframe['id'].tolist() == [1, 2, 3]
+    assert dataframe['name'].tolist()[:2] == ['first', 'second'] and pd.isna(dataframe['name'][2])
+    assert pd.isna(dataframe['email'][0]) and dataframe['email'][1] == 'second@example.com'
+
+
+def test_columnar_frame_builder_with_fixed_schema_and_dtypes():
+    """This function tests that a fixed schema ignores other fields and the dtypes are applied."""
+    builder = df_utils.ColumnarFrameBuilder(['id', 'email'], dtypes={'id': 'string'})
+    builder.extend(RECORDS)
+    dataframe = builder.to_dataframe()
+    assert list(dataframe.columns) == ['id', 'email']
+    assert dataframe['id'].tolist() == ['1', '2', '3'] and dataframe['id'].dtype == 'string'
+
+
+def test_convert_dict_list_to_dataframe_relabels_columns_by_position():
+    """This function tests that the ``column_names`` relabel the columns by position."""
+    dataframe = df_utils.convert_dict_list_to_dataframe(RECORDS[:2], ['ID', 'Name', 'Email'])
+    assert list(dataframe.columns) == ['ID', 'Name', 'Email']
+    assert dataframe['Name'].tolist() == ['first', 'second']
+
+
+def test_convert_dict_list_to_dataframe_selects_fields():
+    """This function tests that the ``fields`` select the columns and can be relabeled by the ``column_names``."""
+    dataframe = df_utils.convert_dict_list_to_dataframe(RECORDS, ['Name'], fields=['name'])
+    assert list(dataframe.columns) == ['Name']
+    assert dataframe['Name'].tolist()[:2] == ['first', 'second']
@@ -0,0 +1,188 @@
+# -*- coding: utf-8 -*-
+"""
+:Module:         khorosjx.utils.tests.test_export
+:Synopsis:       This module is used by pytest to verify that interrupted NDJSON exports resume from their checkpoint
+:Created By:     Jeff Shurtliff
+:Last Modified:  Jeff Shurtliff
+:Modified Date:  17 Oct 2026
+"""
+
+import json
+
+import pytest
+
+from khorosjx import core, errors, export
+
+
+class InterruptedExport(Exception):
+    """This exception is raised to simulate an export that is interrupted partway through."""
+
+
+def interrupt_at_index(monkeypatch, interrupt_index):
+    """This function causes the request for a page at the supplied startIndex value to be interrupted once."""
+    get_paginated_results = core.get_paginated_results
+    interrupted = []
+
+    def _get_paginated_results(query, response_data_type, start_index=0, *args, **kwargs):
+        if start_index == interrupt_index and not interrupted:
+            interrupted.append(start_index)
+            raise InterruptedExport()
+        return get_paginated_results(query, response_data_type, start_index, *args, **kwargs)
+    monkeypatch.setattr(core, 'get_paginated_results', _get_paginated_results)
+
+
+def fail_at_index(monkeypatch, failed_index):
+    """This function causes the request for a page at the supplied startIndex value to fail once as it would when
+       the API returns an error response."""
+    get_paginated_results = core.get_paginated_results
+    failed = []
+
+    def _get_paginated_results(query, response_data_type, start_index=0, filter_info=(), query_all=True,
+                               return_fields=None, ignore_exceptions=False, *args, **kwargs):
+        if start_index == failed_index and not failed:
+            failed.append(start_index)
+            if ignore_exceptions:
+                return []
+            raise errors.exceptions.GETRequestError()
+        return get_paginated_results(query, response_data_type, start_index, filter_info, query_all, return_fields,
+                                     ignore_exceptions, *args, **kwargs)
+    monkeypatch.setattr(core, 'get_paginated_results', _get_paginated_results)
+
+
+def read_ids(file_path):
+    """This function returns the IDs of the records in an NDJSON file."""
+    with open(file_path, 'r') as file:
+        return [json.loads(line)['id'] for line in file]
+
+
+def test_ndjson_export_resumes_from_checkpoint(mock_api, monkeypatch, tmp_path):
+    """This function tests that an interrupted export continues after the last completed page."""
+    file_path = str(tmp_path / 'people.ndjson')
+    interrupt_at_index(monkeypatch, 200)
+    with pytest.raises(InterruptedExport):
+        export.export_paginated_results_to_ndjson('people', 'people', file_path, return_fields=['id'])
+    checkpoint = export.load_checkpoint(f"{file_path}.checkpoint")
+    assert (checkpoint['start_index'], checkpoint['record_count'], checkpoint['complete']) == (200, 200, False)
+    assert len(read_ids(file_path)) == 200
+
+    # Resuming the export should only request the remaining page
+    mock_api.reset_stats()
+    assert export.export_paginated_results_to_ndjson('people', 'people', file_path, return_fields=['id']) == 250
+    assert mock_api.request_counts['GET people'] == 1
+    assert read_ids(file_path) == [str(index) for index in range(1, 251)]
+    assert export.load_checkpoint(f"{file_path}.checkpoint")['complete'] is True
+
+    # Calling the function again for a completed export should not perform any requests
+    mock_api.reset_stats()
+    assert export.export_paginated_results_to_ndjson('people', 'people', file_path, return_fields=['id']) == 250
+    assert mock_api.total_requests == 0
+
+
+@pytest.mark.parametrize('ignore_exceptions', [False, True])
+def test_ndjson_export_failed_page_is_resumable(mock_api, monkeypatch, tmp_path, ignore_exceptions):
+    """This function tests that a failed page is never mistaken for the end of the data."""
+    file_path = str(tmp_path / 'people.ndjson')
+    fail_at_index(monkeypatch, 100)
+    if ignore_exceptions:
+        assert export.export_paginated_results_to_ndjson('people', 'people', file_path, return_fields=['id'],
+                                                         ignore_exceptions=True) == 100
+    else:
+        with pytest.raises(errors.exceptions.GETRequestError):
+            export.export_paginated_results_to_ndjson('people', 'people', file_path, return_fields=['id'])
+    checkpoint = export.load_checkpoint(f"{file_path}.checkpoint")
+    assert (checkpoint['start_index'], checkpoint['record_count'], checkpoint['complete']) == (100, 100, False)
+
+    # Resuming the export should continue from the failed page
+    assert export.export_paginated_results_to_ndjson('people', 'people', file_path, return_fields=['id'],
+                                                     ignore_exceptions=ignore_exceptions) == 250
+    assert read_ids(file_path) == [str(index) for index in range(1, 251)]
+    assert export.load_checkpoint(f"{file_path}.checkpoint")['complete'] is True
+
+
+def test_ndjson_export_discards_partial_pages(mock_api, tmp_path):
+    """This function tests that anything written after the last checkpoint is discarded when resuming."""
+    file_path = str(tmp_path / 'people.ndjson')
+    checkpoint_file = f"{file_path}.checkpoint"
+    export.export_paginated_results_to_ndjson('people', 'people', file_path, return_fields=['id'])
+
+    # Simulate an export that was interrupted while writing the final page
+    checkpoint = export.load_checkpoint(checkpoint_file)
+    with open(file_path, 'r') as file:
+        file_offset = sum(len(line) for line in file.readlines()[:200])
+    checkpoint.update(start_index=200, record_count=200, file_offset=file_offset, complete=False)
+    with open(checkpoint_file, 'w') as file:
+        json.dump(checkpoint, file)
+    with open(file_path, 'a') as file:
+        file.write('{"id": "partial"')
+
+    assert export.export_paginated_results_to_ndjson('people', 'people', file_path, return_fields=['id']) == 250
+    assert read_ids(file_path) == [str(index) for index in range(1, 251)]
+
+
+def test_ndjson_checkpoint_for_a_different_export(mock_api, tmp_path):
+    """This function tests that a checkpoint created for a different export is not used to resume."""
+    file_path = str(tmp_path / 'people.ndjson')
+    export.export_paginated_results_to_ndjson('people', 'people', file_path, return_fields=['id'])
+    with pytest.raises(errors.exceptions.ExportCheckpointError):
+        export.export_paginated_results_to_ndjson('people', 'people', file_path, return_fields=['id', 'displayName'])
+
+
+def test_arrow_sink_is_abstract():
+    """This function tests that the base Arrow sink cannot be instantiated without a file writer."""
+    pytest.importorskip('pyarrow')
+    with pytest.raises(TypeError):
+        export.ArrowSink('records.arrow')
+
+
+@pytest.mark.parametrize('file_format', ['parquet', 'arrow'])
+def test_arrow_sink_casts_later_pages_to_schema(tmp_path, file_format):
+    """This function tests that a column with only missing values in the first page accepts values in later pages."""
+    pyarrow = pytest.importorskip('pyarrow')
+    file_path = str(tmp_path / f"records.{file_format}")
+    pages = [[{'id': 1, 'status': None}], [{'id': 2, 'status': 7}], [{'id': 3.0, 'status': True}]]
+    assert export.write_pages(pages, file_path, file_format) == 3
+    if file_format == 'parquet':
+        table = pyarrow.parquet.read_table(file_path)
+    else:
+        table = pyarrow.ipc.open_file(file_path).read_all()
+    assert table.column('status').to_pylist() == [None, '7', 'true']
+    assert table.column('id').to_pylist() == [1, 2, 3]
+
+
+def test_space_permissions_export_streams_known_fields(monkeypatch, tmp_path):
+    """This function tests that the permissions are written a page at a time using the known permission fields."""
+    pyarrow = pytest.importorskip('pyarrow')
+    from khorosjx.places import spaces
+    from khorosjx.utils.classes import FieldLists
+    yielded, yielded_at_write = [], []
+
+    def _iter_permissions(*args):
+        for _index in range(150):
+            yielded.append(_index)
+            _permission = {'id': str(_index), 'type': 'appliedEntitlement'}
+            if _index == 120:
+                _permission['subject'] = {'id': '7', 'type': 'securityGroup'}
+            yield _permission
+    write_page = export.ParquetSink.write_page
+
+    def _write_page(self, records):
+        yielded_at_write.append(len(yielded))
+        return write_page(self, records)
+    monkeypatch.setattr(spaces, 'iter_space_content_permissions', _iter_permissions)
+    monkeypatch.setattr(export.ParquetSink, 'write_page', _write_page)
+    file_path = str(tmp_path / 'permissions.parquet')
+    assert export.export_space_content_permissions(1234, file_path) == 150
+    assert yielded_at_write == [100, 150]
+    table = pyarrow.parquet.read_table(file_path)
+    assert table.column_names == FieldLists.permission_fields
+    assert json.loads(table.column('subject').to_pylist()[120]) == {'id': '7', 'type': 'securityGroup'}
+
+
+def test_arrow_sink_type_conflict_raises_export_schema_error(tmp_path):
+    """This function tests that values which conflict with the type inferred from an earlier page are reported."""
+    pyarrow = pytest.importorskip('pyarrow')
+    file_path = str(tmp_path / 'records.parquet')
+    records = iter([{'id': 1, 'x': 2}, {'id': 2, 'x': 'abc'}])
+    with pytest.raises(errors.exceptions.ExportSchemaError, match="'x' field"):
+        export.write_records(records, file_path, 'parquet', page_size=1)
+    assert pyarrow.parquet.read_table(file_path).to_pylist() == [{'id': 1, 'x': 2}]
@@ -0,0 +1,69 @@
+# -*- coding: utf-8 -*-
+"""
+:Module:         khorosjx.utils.tests.test_field_paths
+:Synopsis:       This module is used by pytest to verify the compiled field path extractors
+:Created By:     Jeff Shurtliff
+:Last Modified:  Jeff Shurtliff
+:Modified Date:  17 Oct 2026
+"""
+
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+
+from khorosjx import core
+from khorosjx.utils.field_paths import parse_field_path, get_field_projection, extract_fields
+
+RECORD = {
+    'id': '1',
+    'author': {'id': 5, 'displayName': 'User 5'},
+    'emails': [{'value': 'user5@example.com'}],
+    'content': {'text': '<p>Idea</p>'}
+}
+
+
+def test_parse_field_path():
+    """This function tests that dotted and indexed field paths are parsed into keys and indices."""
+    assert parse_field_path('emails[0].value') == ('emails', 0, 'value')
+    assert parse_field_path('jive.externalIdentities[-1].identity') == ('jive', 'externalIdentities', -1, 'identity')
+    with pytest.raises(ValueError):
+        parse_field_path('author..id')
+
+
+def test_get_field_projection():
+    """This function tests that only the unique top-level fields are requested from the API."""
+    assert get_field_projection(('author.id', 'id', 'emails[0].value', 'author.displayName')) == \
+        ('author', 'id', 'emails')
+
+
+def test_extract_fields_reports_missing_fields():
+    """This function tests that nested fields are extracted and missing field paths are reported."""
+    missing_fields = []
+    fields = ('author.id', 'emails[0].value', 'content.text', 'missing.field', 'emails[3].value')
+    assert extract_fields(RECORD, fields, missing_fields) == {
+        'author.id': 5, 'emails[0].value': 'user5@example.com', 'content.text': '<p>Idea</p>'
+    }
+    assert missing_fields == ['missing.field', 'emails[3].value']
+
+
+@pytest.fixture
+def requested_fields(mock_api):
+    """This fixture registers a request hook which collects the ``fields`` values of the requested URLs."""
+    fields_values = []
+
+    def _collect_fields(_event):
+        fields_values.append(parse_qs(urlsplit(_event['url']).query).get('fields'))
+    core.add_request_hook(_collect_fields, 'pre')
+    yield fields_values
+    core.remove_request_hook(_collect_fields)
+
+
+@pytest.mark.parametrize('return_fields, expected_fields', [
+    (('id',), ['id']),
+    (('jive.username', 'email.value'), ['jive,emails']),
+    (None, ['@all']),
+])
+def test_paginated_query_requests_the_field_projection(requested_fields, return_fields, expected_fields):
+    """This function tests that the ``fields`` parameter sent to the API only requests the top-level fields."""
+    core.get_paginated_results(f"{core.base_url}/people", 'people', return_fields=return_fields, quiet=True)
+    assert requested_fields == [expected_fields]
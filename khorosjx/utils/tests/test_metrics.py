@@ -0,0 +1,74 @@
+# -*- coding: utf-8 -*-
+"""
+:Module:         khorosjx.utils.tests.test_metrics
+:Synopsis:       This module is used by pytest to verify the request hooks and per-endpoint request metrics
+:Created By:     Jeff Shurtliff
+:Last Modified:  Jeff Shurtliff
+:Modified Date:  17 Oct 2026
+"""
+
+import pytest
+
+from khorosjx import core
+from khorosjx.utils.metrics import LatencyHistogram
+
+
+@pytest.fixture
+def request_events(mock_api):
+    """This fixture registers ``pre`` and ``post`` request hooks which collect the request information."""
+    events = {'pre': [], 'post': []}
+
+    def _pre_hook(_event):
+        events['pre'].append(dict(_event))
+
+    def _post_hook(_event):
+        events['post'].append(dict(_event))
+    core.add_request_hook(_pre_hook, 'pre')
+    core.add_request_hook(_post_hook, 'post')
+    core.reset_request_metrics()
+    yield events
+    core.remove_request_hook(_pre_hook)
+    core.remove_request_hook(_post_hook)
+    core.reset_request_metrics()
+
+
+def test_registered_request_hooks_are_called(request_events):
+    """This function tests that the registered hooks are called before and after a request with its information."""
+    response = core.get_request_with_retries(f"{core.base_url}/people/1")
+    assert response.status_code == 200
+    assert [event['endpoint'] for event in request_events['pre']] == ['people/{id}']
+    post_event = request_events['post'][0]
+    assert (post_event['method'], post_event['endpoint'], post_event['status']) == ('GET', 'people/{id}', 200)
+    assert post_event['bytes'] == len(response.content) and post_event['retries'] == 0
+    assert post_event['duration'] > 0 and post_event['error'] is None
+
+
+def test_cleared_request_hooks_are_not_called(request_events):
+    """This function tests that the hooks are no longer called once they have been cleared."""
+    core.clear_request_hooks()
+    core.get_request_with_retries(f"{core.base_url}/people/1")
+    assert request_events == {'pre': [], 'post': []}
+
+
+def test_latency_histogram_records_a_sample_per_request(request_events):
+    """This function tests that the latency of each request is recorded for its endpoint."""
+    for person_id in (1, 2):
+        core.get_request_with_retries(f"{core.base_url}/people/{person_id}")
+    core.get_request_with_retries(f"{core.base_url}/securityGroups/1")
+    metrics = core.get_request_metrics()
+    assert set(metrics) == {'GET people/{id}', 'GET securityGroups/{id}'}
+    assert metrics['GET people/{id}']['requests'] == 2 and metrics['GET securityGroups/{id}']['requests'] == 1
+    people_durations = [event['duration'] for event in request_events['post'] if event['endpoint'] == 'people/{id}']
+    assert metrics['GET people/{id}']['total_ms'] == round(sum(people_durations) * 1000, 3)
+    assert metrics['GET people/{id}']['min_ms'] == round(min(people_durations) * 1000, 3)
+    assert metrics['GET people/{id}']['max_ms'] == round(max(people_durations) * 1000, 3)
+
+
+def test_latency_histogram_percentiles_are_within_the_bucket_growth():
+    """This function tests that the estimated percentiles are within 5% of the actual values."""
+    histogram = LatencyHistogram()
+    for duration in range(1, 1001):
+        histogram.record(duration / 1000)
+    assert histogram.count == 1000 and histogram.minimum == 0.001 and histogram.maximum == 1.0
+    for percentile in (50, 95, 99):
+        assert abs(histogram.get_percentile(percentile) - percentile / 100) <= 0.05 * percentile / 100
@@ -0,0 +1,89 @@
+# -*- coding: utf-8 -*-
+"""
+:Module:         khorosjx.utils.tests.test_pagination
+:Synopsis:       This module is used by pytest to verify the pagination stop conditions and result counting
+:Created By:     Jeff Shurtliff
+:Last Modified:  Jeff Shurtliff
+:Modified Date:  17 Oct 2026
+"""
+
+import threading
+
+import pytest
+
+from khorosjx import core
+
+
+def get_page_function(total_records, page_size=100):
+    """This function returns a page function for a synthetic result set along with the list of requested indexes."""
+    requested_indexes, lock = [], threading.Lock()
+
+    def _page_function(_start_index):
+        with lock:
+            requested_indexes.append(_start_index)
+        return list(range(_start_index, min(_start_index + page_size, total_records)))
+    return _page_function, requested_indexes
+
+
+@pytest.mark.parametrize('max_workers', [1, 4])
+@pytest.mark.parametrize('total_records', [0, 1, 99, 100, 250, 1000])
+def test_iter_pages_stops_after_the_last_page(total_records, max_workers):
+    """This function tests that every record is yielded in order and pagination stops after the last page."""
+    page_function, requested_indexes = get_page_function(total_records)
+    records = [record for page in core.iter_pages(page_function, max_workers) for record in page]
+    assert records == list(range(total_records))
+
+    # Sequential pagination only requests an empty page when the total is an exact multiple of the page size
+    if max_workers == 1:
+        assert requested_indexes == list(range(0, total_records // 100 * 100 + 1, 100))
+    assert max(requested_indexes) <= total_records // 100 * 100 + (max_workers - 1) * 100
+
+
+def test_iter_pages_stops_when_abandoned():
+    """This function tests that no further pages are requested once the generator is closed."""
+    page_function, requested_indexes = get_page_function(10000)
+    pages = core.iter_pages(page_function, max_workers=4)
+    next(pages)
+    pages.close()
+    assert len(requested_indexes) <= 5
+
+
+def test_get_all_paginated_results_follows_next_links(mock_api):
+    """This function tests that sequential pagination follows the next links and stops on the short page."""
+    records = core.get_all_paginated_results(f"{mock_api.base_url}/people", 'people', return_fields=['id'])
+    assert [record['id'] for record in records] == [str(index) for index in range(1, 251)]
+    assert mock_api.request_counts['GET people'] == 3
+
+
+def test_get_all_paginated_results_concurrently(mock_api):
+    """This function tests that concurrent pagination returns the same records as sequential pagination."""
+    records = core.get_all_paginated_results(f"{mock_api.base_url}/people", 'people', return_fields=['id'],
+                                             max_workers=4)
+    assert [record['id'] for record in records] == [str(index) for index in range(1, 251)]
+
+
+@pytest.mark.parametrize('endpoint, expected_count', [('people', 250), ('securityGroups', 30), ('places', 10)])
+def test_count_results(mock_api, endpoint, expected_count):
+    """This function tests that the total number of records is identified without retrieving every record."""
+    assert core.count_results(f"{mock_api.base_url}/{endpoint}") == expected_count
+    assert mock_api.total_requests <= 2 * expected_count.bit_length() + 1
+
+
+def test_iter_linked_pages_falls_back_to_start_index_url(mock_api, monkeypatch):
+    """This function tests that a full page without a next link is followed by the next ``startIndex`` URL."""
+    monkeypatch.setattr(core, 'get_next_link', lambda _json_data: None)
+    records = core.get_all_paginated_results(f"{mock_api.base_url}/people", 'people', return_fields=['id'])
+    assert [record['id'] for record in records] == [str(index) for index in range(1, 251)]
+    assert mock_api.request_counts['GET people'] == 3
+
+
+@pytest.mark.parametrize('query_url, expected_url', [
+    ('https://example.com/api/core/v3/people?count=100',
+     'https://example.com/api/core/v3/people?count=100&startIndex=100'),
+    ('https://example.com/api/core/v3/people?startIndex=100&count=100',
+     'https://example.com/api/core/v3/people?startIndex=200&count=100'),
+    ('https://example.com/api/core/v3/people', 'https://example.com/api/core/v3/people?startIndex=100'),
+])
+def test_get_start_index_url(query_url, expected_url):
+    """This function tests that the ``startIndex`` value of a query URL is advanced by the length of the page."""
+    assert core._get_start_index_url(query_url, 100) == expected_url
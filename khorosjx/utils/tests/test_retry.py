@@ -0,0 +1,89 @@
+# -*- coding: utf-8 -*-
+"""
+:Module:         khorosjx.utils.tests.test_retry
+:Synopsis:       This module is used by pytest to verify the retry policy and its handling of Retry-After headers
+:Created By:     Jeff Shurtliff
+:Last Modified:  Jeff Shurtliff
+:Modified Date:  17 Oct 2026
+"""
+
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+
+import pytest
+
+from khorosjx import core
+from khorosjx.utils.retry import RetryPolicy
+
+mock_server = pytest.importorskip('mock_server')
+
+
+class RetryableResponse(object):
+    """This class resembles a retryable API response with the supplied headers."""
+    status_code = 429
+
+    def __init__(self, headers=None):
+        self.headers = headers or {}
+
+
+def test_parse_retry_after_seconds_and_dates():
+    """This function tests that Retry-After headers are parsed in both the seconds and HTTP date formats."""
+    assert RetryPolicy.parse_retry_after({'Retry-After': '7'}) == 7.0
+    retry_date = format_datetime(datetime.now(timezone.utc) + timedelta(seconds=30), usegmt=True)
+    assert 25 <= RetryPolicy.parse_retry_after({'Retry-After': retry_date}) <= 30
+    assert RetryPolicy.parse_retry_after({'Retry-After': 'soon'}) is None
+    assert RetryPolicy.parse_retry_after({}) is None
+
+
+def test_get_delay_honors_retry_after():
+    """This function tests that the delay requested by the server replaces the backoff when it is honored."""
+    response = RetryableResponse({'Retry-After': '4'})
+    assert RetryPolicy(backoff_factor=0).get_delay(0, response) == 4.0
+    assert RetryPolicy(backoff_factor=0, respect_retry_after=False).get_delay(0, response) == 0.0
+    assert RetryPolicy().get_delay(0, response, elapsed=118.0) is None
+    assert RetryPolicy(max_retries=2).get_delay(2, response) is None
+
+
+def test_get_delay_caps_the_backoff():
+    """This function tests that the randomized backoff never exceeds the maximum backoff."""
+    policy = RetryPolicy(max_retries=10, backoff_factor=1, max_backoff=2, total_timeout=None)
+    assert all(0 <= policy.get_delay(attempt) <= 2 for attempt in range(10))
+
+
+def test_throttled_requests_are_retried(mock_api):
+    """This function tests that 429 responses are retried according to the policy and returned once exhausted."""
+    mock_api.faults = mock_server.FaultProfile(throttle_rate=1.0, retry_after=0)
+    response = core.get_request_with_retries(f"{mock_api.base_url}/people/1", retry_policy=RetryPolicy(max_retries=2))
+    assert response.status_code == 429
+    assert response.headers['Retry-After'] == '0'
+    assert mock_api.request_counts['GET people/{lookup}'] == 3
+
+
+def test_non_idempotent_statuses():
+    """This function tests that only the 429 status code is retryable for POST and PUT requests by default."""
+    assert RetryPolicy().is_retryable_status(503, 'GET') and RetryPolicy().is_retryable_status(503)
+    assert not RetryPolicy().is_retryable_status(503, 'POST') and not RetryPolicy().is_retryable_status(502, 'put')
+    assert RetryPolicy().is_retryable_status(429, 'POST')
+    assert not RetryPolicy(retry_statuses=[503]).is_retryable_status(429, 'POST')
+    assert RetryPolicy(retry_non_idempotent=True).is_retryable_status(503, 'POST')
+    assert RetryPolicy().copy(retry_non_idempotent=True).retry_non_idempotent
+
+
+@pytest.mark.parametrize('retry_non_idempotent, expected_requests', [(False, 1), (True, 3)])
+def test_post_requests_with_server_errors(mock_api, retry_non_idempotent, expected_requests):
+    """This function tests that POST requests are only retried after a server error when the policy allows it."""
+    mock_api.faults = mock_server.FaultProfile(error_rate=1.0, error_statuses=(503,))
+    policy = RetryPolicy(max_retries=2, backoff_factor=0, retry_non_idempotent=retry_non_idempotent)
+    response = core.post_request_with_retries(f"{mock_api.base_url}/securityGroups/1/members", [],
+                                              retry_policy=policy)
+    assert response.status_code == 503
+    assert mock_api.request_counts['POST securityGroups/{id}/members'] == expected_requests
+
+
+def test_throttled_post_requests_are_retried(mock_api):
+    """This function tests that POST requests which return a 429 status code are still retried by default."""
+    mock_api.faults = mock_server.FaultProfile(throttle_rate=1.0, retry_after=0)
+    response = core.post_request_with_retries(f"{mock_api.base_url}/securityGroups/1/members", [],
+                                              retry_policy=RetryPolicy(max_retries=2))
+    assert response.status_code == 429
+    assert mock_api.request_counts['POST securityGroups/{id}/members'] == 3
@@ -0,0 +1,69 @@
+# -*- coding: utf-8 -*-
+"""
+:Module:         khorosjx.utils.tests.test_singleflight
+:Synopsis:       This module is used by pytest to verify the coalescing of concurrent identical requests
+:Created By:     Jeff Shurtliff
+:Last Modified:  Jeff Shurtliff
+:Modified Date:  17 Oct 2026
+"""
+
+import time
+import threading
+import contextvars
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from khorosjx import core
+from khorosjx.utils.singleflight import SingleFlight
+
+
+def test_concurrent_calls_share_a_single_call():
+    """This function tests that callers with the same key share the result of a single call."""
+    in_flight, release, calls = SingleFlight(), threading.Event(), []
+
+    def _function():
+        calls.append(1)
+        release.wait(5)
+        return 'result'
+
+    with ThreadPoolExecutor(8) as executor:
+        futures = [executor.submit(in_flight.do, 'key', _function) for _ in range(8)]
+        while in_flight.get_stats()['shared'] < 7:
+            time.sleep(0.001)
+        release.set()
+        results = [future.result() for future in futures]
+    assert len(calls) == 1
+    assert sorted(results) == [('result', False)] + [('result', True)] * 7
+    assert in_flight.get_stats() == {'calls': 1, 'shared': 7, 'in_flight': 0}
+
+
+def test_exceptions_are_shared_and_not_cached():
+    """This function tests that an exception is raised for every waiting caller and that the key is then released."""
+    in_flight, release = SingleFlight(), threading.Event()
+
+    def _function():
+        release.wait(5)
+        raise RuntimeError('failed')
+
+    with ThreadPoolExecutor(2) as executor:
+        futures = [executor.submit(in_flight.do, 'key', _function) for _ in range(2)]
+        while in_flight.get_stats()['shared'] < 1:
+            time.sleep(0.001)
+        release.set()
+        for future in futures:
+            with pytest.raises(RuntimeError):
+                future.result()
+    assert in_flight.do('key', lambda: 'retried') == ('retried', False)
+
+
+def test_identical_get_requests_are_coalesced(mock_api):
+    """This function tests that concurrent GET requests for the same resource are sent to the API once."""
+    mock_api.latency = 0.2
+    with ThreadPoolExecutor(8) as executor:
+        futures = [executor.submit(contextvars.copy_context().run, core.get_data, 'people', 21, return_json=True)
+                   for _ in range(8)]
+        records = [future.result() for future in futures]
+    assert [record['id'] for record in records] == ['21'] * 8
+    assert mock_api.request_counts['GET people/{lookup}'] == 1
+    assert len({id(record) for record in records}) == 8
@@ -0,0 +1,62 @@
+# -*- coding: utf-8 -*-
+"""
+:Module:         khorosjx.utils.tests.test_users
+:Synopsis:       This module is used by pytest to verify the bulk User ID resolution in the users module
+:Created By:     Jeff Shurtliff
+:Last Modified:  Jeff Shurtliff
+:Modified Date:  17 Oct 2026
+"""
+
+from khorosjx import users
+
+
+def test_resolve_user_ids_matches_get_user_id(mock_api):
+    """This function tests that the bulk resolution returns the same User IDs as individual lookups."""
+    emails = [f"user{index}@example.com" for index in range(1, 6)]
+    users.clear_user_id_cache()
+    resolved = users.resolve_user_ids(emails)
+    users.clear_user_id_cache()
+    assert resolved == {email: users.get_user_id(email) for email in emails}
+    assert list(resolved.values()) == ['1', '2', '3', '4', '5']
+
+
+def test_resolve_user_ids_deduplicates_lookup_values(mock_api):
+    """This function tests that equivalent lookup values are resolved with a single batched request."""
+    users.clear_user_id_cache()
+    mock_api.reset_stats()
+    lookup_values = ['user1@example.com', 'USER1@example.com ', 'user2@example.com', 'user1@example.com']
+    resolved = users.resolve_user_ids(lookup_values)
+    assert resolved == {'user1@example.com': '1', 'USER1@example.com ': '1', 'user2@example.com': '2'}
+    assert mock_api.request_counts['POST executeBatch'] == 1
+    assert len(users.user_id_cache) == 2
+
+
+def test_resolve_user_ids_caches_users_not_found(mock_api):
+    """This function tests that users who are not found are mapped to and cached as ``None``."""
+    users.clear_user_id_cache()
+    resolved = users.resolve_user_ids(['user3@example.com', 'missing@example.com'])
+    assert resolved == {'user3@example.com': '3', 'missing@example.com': None}
+    assert None in users.user_id_cache.values()
+
+    # Resolving the same users again should not perform any API requests
+    mock_api.reset_stats()
+    assert users.resolve_user_ids(['missing@example.com', 'user3@example.com']) == resolved
+    assert mock_api.total_requests == 0
+
+
+def test_resolve_user_ids_by_username(mock_api):
+    """This function tests that usernames are resolved to their User IDs."""
+    users.clear_user_id_cache()
+    assert users.resolve_user_ids(['user7', 'user8'], 'username') == {'user7': '7', 'user8': '8'}
+
+
+def test_user_id_cache_is_separate_for_each_client(mock_api):
+    """This function tests that each client has its own dictionary of resolved User IDs."""
+    from khorosjx import core
+    users.clear_user_id_cache()
+    users.resolve_user_ids(['user4@example.com'])
+    other_client = core.Client(mock_api.url, ('pytest', 'pytest'))
+    with other_client.activate():
+        assert users.user_id_cache == {}
+    other_client.close()
+    assert len(users.user_id_cache) == 1
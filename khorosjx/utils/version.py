@@ -6,14 +6,26 @@
 :Example:           ``__version__ = version.get_full_version()``
 :Created By:        Jeff Shurtliff
 :Last Modified:     Jeff Shurtliff
-:Modified Date:     23 Sep 2021
+:Modified Date:     17 Oct 2026
 """
 
+import os
+import json
+import time
 import warnings
+import threading
 
 import requests
 
-__version__ = "3.2.0"
+__version__ = "3.3.0"
+
+# Define the settings for checking the latest stable version on PyPI
+pypi_url = 'https://pypi.org/pypi/khorosjx/json'
+version_check_settings = {
+    'cache_file': os.path.join(os.path.expanduser('~'), '.khorosjx', 'version_check.json'),
+    'check_interval': 86400,
+    'timeout': 3.0
+}
 
 
 def get_full_version():
@@ -32,34 +44,130 @@ def get_major_minor_version():
     return ".".join(__version__.split(".")[:2])
 
 
-def get_latest_stable():
+def set_version_check_options(cache_file=None, check_interval=None, timeout=None):
+    """This function defines the settings used when checking for the latest stable version on PyPI.
+
+    .. versionadded:: 3.3.0
+
+    :param cache_file: The file in which the latest stable version is cached (e.g. ``~/.khorosjx/version_check.json``)
+    :type cache_file: str, None
+    :param check_interval: The number of seconds for which a cached version is used before PyPI is checked again
+    :type check_interval: int, float, None
+    :param timeout: The number of seconds to wait for PyPI to respond before giving up on the check
+    :type timeout: int, float, None
+    :returns: None
+    """
+    for setting_name, setting_value in (('cache_file', cache_file), ('check_interval', check_interval),
+                                        ('timeout', timeout)):
+        if setting_value is not None:
+            version_check_settings[setting_name] = setting_value
+    return
+
+
+def _get_cached_version(_cache_file, _check_interval):
+    """This function returns the latest stable version from the cache file if it has not expired.
+
+    .. versionadded:: 3.3.0
+
+    :param _cache_file: The file in which the latest stable version is cached
+    :type _cache_file: str
+    :param _check_interval: The number of seconds for which the cached version is valid
+    :type _check_interval: int, float
+    :returns: The cached version in string format or ``None`` if it is missing or expired
+    """
+    try:
+        with open(_cache_file, 'r') as _file:
+            _cache_data = json.load(_file)
+        if time.time() - _cache_data['checked'] < _check_interval:
+            return _cache_data['version']
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+    return None
+
+
+def _set_cached_version(_cache_file, _latest_version):
+    """This function writes the latest stable version to the cache file, ignoring any errors.
+
+    .. versionadded:: 3.3.0
+
+    :param _cache_file: The file in which the latest stable version is cached
+    :type _cache_file: str
+    :param _latest_version: The latest stable version
+    :type _latest_version: str
+    :returns: None
+    """
+    try:
+        os.makedirs(os.path.dirname(_cache_file) or '.', exist_ok=True)
+        _temp_file = f"{_cache_file}.{os.getpid()}.tmp"
+        with open(_temp_file, 'w') as _file:
+            json.dump({'version': _latest_version, 'checked': time.time()}, _file)
+        os.replace(_temp_file, _cache_file)
+    except OSError:
+        pass
+    return
+
+
+def get_latest_stable(use_cache=True):
     """This function returns the latest stable version of the khorosjx package.
 
+    .. versionchanged:: 3.3.0
+       The request to PyPI is now performed with a timeout and the result is cached on disk for the interval defined
+       in :py:data:`khorosjx.utils.version.version_check_settings`. The ``use_cache`` argument was also added.
+
+    :param use_cache: Determines if a cached version should be used when it has not expired (``True`` by default)
+    :type use_cache: bool
     :returns: The latest stable version in string format
+    :raises: :py:exc:`requests.exceptions.RequestException`
     """
-    pypi_data = requests.get('https://pypi.org/pypi/khorosjx/json').json()
-    return pypi_data['info']['version']
+    cache_file = version_check_settings['cache_file']
+    latest_stable = _get_cached_version(cache_file, version_check_settings['check_interval']) if use_cache else None
+    if latest_stable is None:
+        pypi_data = requests.get(pypi_url, timeout=version_check_settings['timeout']).json()
+        latest_stable = pypi_data['info']['version']
+        if cache_file:
+            _set_cached_version(cache_file, latest_stable)
+    return latest_stable
 
 
-def latest_version():
+def latest_version(use_cache=True):
     """This function defines if the current version matches the latest stable version on PyPI.
 
+    .. versionchanged:: 3.3.0
+       Added the ``use_cache`` argument.
+
+    :param use_cache: Determines if a cached version should be used when it has not expired (``True`` by default)
+    :type use_cache: bool
     :returns: Boolean value indicating if the versions match
     """
-    latest_stable = get_latest_stable()
+    latest_stable = get_latest_stable(use_cache)
     return True if __version__ == latest_stable else False
 
 
-def warn_when_not_latest():
+def warn_when_not_latest(background=False, use_cache=True):
     """This function displays a :py:exc:`RuntimeWarning` if the running version doesn't match the latest stable version.
 
-    :returns: None
+    .. versionchanged:: 3.3.0
+       The function is no longer called when the package is imported unless the ``KHOROSJX_VERSION_CHECK``
+       environment variable is defined, and the ``background`` and ``use_cache`` arguments were added.
+
+    :param background: Determines if the check should be performed in a background thread (``False`` by default)
+    :type background: bool
+    :param use_cache: Determines if a cached version should be used when it has not expired (``True`` by default)
+    :type use_cache: bool
+    :returns: The background thread when ``background`` is ``True``, otherwise ``None``
     """
-    try:
-        if not latest_version():
-            warn_msg = "The latest stable version of khorosjx is not running. " + \
-                       "Consider running 'pip install khorosjx --upgrade' when feasible."
-            warnings.warn(warn_msg, RuntimeWarning)
-    except Exception:
-        pass
+    def _check_version():
+        try:
+            if not latest_version(use_cache):
+                warn_msg = "The latest stable version of khorosjx is not running. " + \
+                           "Consider running 'pip install khorosjx --upgrade' when feasible."
+                warnings.warn(warn_msg, RuntimeWarning)
+        except Exception:
+            pass
+
+    if background:
+        check_thread = threading.Thread(target=_check_version, name='khorosjx-version-check', daemon=True)
+        check_thread.start()
+        return check_thread
+    _check_version()
     return
@@ -27,7 +27,6 @@ setuptools.setup(
         "License :: OSI Approved :: MIT License",
         "Natural Language :: English",
         "Operating System :: OS Independent",
-        "Programming Language :: Python :: 3.6",
         "Programming Language :: Python :: 3.7",
         "Programming Language :: Python :: 3.8",
         "Programming Language :: Python :: 3.9",
@@ -36,7 +35,7 @@ setuptools.setup(
         "Topic :: Internet :: WWW/HTTP :: Dynamic Content :: Message Boards",
         "Topic :: Internet :: WWW/HTTP :: Site Management"
     ],
-    python_requires='>=3.6',
+    python_requires='>=3.7',
     install_requires=[
         "PyYAML>=5.4.1",
         "urllib3>=1.26.6",
@@ -44,4 +43,8 @@ setuptools.setup(
         "pandas>=1.3.3",
         "python-dateutil>=2.8.2",
     ],
+    extras_require={
+        "aio": ["aiohttp>=3.7.4"],
+        "export": ["pyarrow>=3.0.0"],
+    },
 )